@@ -0,0 +1,232 @@
+"""
+두 리비전의 벤치마크 결과 비교.
+
+components.py가 benchmarks/results.jsonl에 쌓은 결과에서 기준(--base)과 비교 대상(--head) 리비전의 기록을 골라
+컴포넌트/모드/입력 크기별로 처리 시간과 최대 RSS를 비교하고 표로 출력합니다.
+같은 리비전을 여러 번 측정한 기록(--repeat 또는 여러 번 실행)은 반복 측정값으로 모읍니다.
+
+- 시간: 중앙값이 --threshold(기본 5%)보다 늘었고, 순열 검정(비교 대상이 더 느리다는 단측 검정)의
+        p-value가 --alpha(기본 0.05) 이하이면 '느려짐'. 양쪽 반복 횟수가 3회 이상이어야 0.05 수준에서 검정할 수 있으며,
+        그보다 적으면 임계값을 넘어도 '표본 부족', 검정할 수 있지만 유의하지 않으면 '유의하지 않음'으로 표시합니다.
+- 메모리: 최대 RSS 중앙값이 --memory-threshold(기본 10%)와 MIN_RSS_DELTA_MB보다 많이 늘면 '메모리 증가'.
+        측정 대상 프로세스의 VmHWM으로 잰 기록(rss_method 'vm_hwm')끼리만 비교하고, 부모의 RSS가 섞일 수 있는
+        ru_maxrss 기록이 한쪽이라도 있으면 '메모리 비교 불가'로 표시합니다.
+- 실행 환경(Python, 플랫폼, CPU 수)이나 함께 실행한 컴포넌트/모드/크기 구성이 다르면 '환경 다름', '실행 구성 다름'을
+  함께 표시합니다. 입력 크기가 다르면 '입력 다름'.
+- main 모드는 metrics.json의 단계별 자체 시간 중 가장 많이 늘어난 단계를 함께 표시합니다.
+
+느려짐 또는 메모리 증가가 하나라도 있으면 종료 코드 1로 끝나므로 CI에서 회귀 검사로 사용할 수 있습니다.
+리비전을 지정하지 않으면 결과 파일에서 가장 최근에 측정한 리비전과 그 직전 리비전을 비교합니다.
+커밋되지 않은 변경을 측정한 기록은 '<해시>-dirty'로 구분됩니다 (예: --base HEAD --head HEAD-dirty).
+
+사용법:
+    python benchmarks/components.py --components csv-join,csv-tokenize --sizes 100000 --repeat 5
+    python benchmarks/compare.py --base main --head HEAD-dirty
+    python benchmarks/compare.py --components csv-join --threshold 0.1 --json compare.json
+"""
+import argparse
+import itertools
+import json
+import math
+import os
+import random
+import statistics
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from results import RESULTS_PATH, load_results, resolve_revision, revision_label  # noqa: E402
+
+# 이 수 이하의 조합은 모두 나열해 정확한 p-value를 계산하고, 넘으면 고정 seed로 무작위 순열을 뽑음
+EXACT_PERMUTATIONS = 20000
+RANDOM_PERMUTATIONS = 20000
+
+# 최대 RSS는 이보다 적게 늘면 비율과 관계없이 메모리 증가로 보지 않음 (작은 입력에서 할당기 차이로 흔들리는 값)
+MIN_RSS_DELTA_MB = 5.0
+
+
+def permutation_pvalue(base: list, head: list) -> float:
+    """
+    head가 base보다 크다(느리다)는 단측 순열 검정의 p-value를 반환합니다.
+
+    두 표본을 합친 뒤 head 크기만큼 나누는 모든 방법(많으면 무작위 RANDOM_PERMUTATIONS개) 중
+    평균 차이가 관측값 이상인 비율입니다. 분포를 가정하지 않으므로 반복 횟수가 적은 벤치마크에도 사용할 수 있습니다.
+
+    Parameters:
+    - base (list): 기준 리비전의 측정값
+    - head (list): 비교 대상 리비전의 측정값
+
+    Returns:
+    - float: p-value (0~1)
+    """
+    pooled = list(base) + list(head)
+    total = sum(pooled)
+    n = len(head)
+    # head 쪽 합이 클수록 평균 차이가 크므로 합으로 비교 (부동소수 오차 허용)
+    observed = sum(head) - 1e-12 * abs(total)
+    if math.comb(len(pooled), n) <= EXACT_PERMUTATIONS:
+        sums = [sum(pooled[i] for i in chosen) for chosen in itertools.combinations(range(len(pooled)), n)]
+        return sum(1 for value in sums if value >= observed) / len(sums)
+    rng = random.Random(0)
+    hits = 0
+    for _ in range(RANDOM_PERMUTATIONS):
+        if sum(rng.sample(pooled, n)) >= observed:
+            hits += 1
+    return (hits + 1) / (RANDOM_PERMUTATIONS + 1)
+
+
+def measured_revisions(records: list) -> list:
+    """결과 파일에 기록된 리비전을 마지막으로 측정한 순서대로 반환합니다 (가장 최근이 마지막)."""
+    order = {}
+    for number, record in enumerate(records):
+        order[revision_label(record)] = number
+    return sorted(order, key=order.get)
+
+
+def matches(record: dict, revision: str) -> bool:
+    label = revision_label(record)
+    # 12자리보다 짧은 해시 앞부분도 허용 (git에 없는 커밋의 기록)
+    if revision.endswith('-dirty') != label.endswith('-dirty'):
+        return False
+    return label.startswith(revision.removesuffix('-dirty'))
+
+
+def group_samples(records: list, revision: str) -> dict:
+    """
+    리비전의 성공한 기록을 (컴포넌트, 모드, 입력 크기)별로 모아 반복 측정값을 반환합니다.
+
+    Returns:
+    - dict: 키 -> seconds, peak_rss_mb(반복별 값 목록), stages(단계 -> 반복별 자체 시간 목록),
+            input_bytes, environments, runs, rss_methods(기록별 값의 집합)
+    """
+    groups = {}
+    for record in records:
+        if record.get('status') != 'ok' or not matches(record, revision):
+            continue
+        key = (record['component'], record['mode'], record['size'])
+        group = groups.setdefault(key, {'seconds': [], 'peak_rss_mb': [], 'stages': {}, 'input_bytes': set(),
+                                        'environments': set(), 'runs': set(), 'rss_methods': set()})
+        group['seconds'] += record.get('samples_seconds', [record['seconds']])
+        group['peak_rss_mb'] += record.get('samples_peak_rss_mb', [record['peak_rss_mb']])
+        for name, seconds in record.get('stages', {}).items():
+            group['stages'].setdefault(name, []).append(seconds)
+        group['input_bytes'].add(record['input_bytes'])
+        group['environments'].add(json.dumps(record.get('environment'), sort_keys=True))
+        group['runs'].add(json.dumps(record.get('run'), sort_keys=True))
+        # rss_method가 없는 기록은 벤치마크 프로세스의 RSS가 섞인 ru_maxrss로 측정한 것
+        group['rss_methods'].add(record.get('rss_method', 'ru_maxrss'))
+    return groups
+
+
+def compare_group(base: dict, head: dict, args) -> dict:
+    """한 (컴포넌트, 모드, 입력 크기)의 두 리비전 측정값을 비교해 변화율, p-value, 판정을 반환합니다."""
+    base_seconds, head_seconds = statistics.median(base['seconds']), statistics.median(head['seconds'])
+    base_rss, head_rss = statistics.median(base['peak_rss_mb']), statistics.median(head['peak_rss_mb'])
+    row = {
+        'base_seconds': base_seconds, 'head_seconds': head_seconds, 'time_change': head_seconds / base_seconds - 1,
+        'base_rss_mb': base_rss, 'head_rss_mb': head_rss, 'rss_change': head_rss / base_rss - 1,
+        'base_runs': len(base['seconds']), 'head_runs': len(head['seconds']),
+        'stage': None, 'status': [],
+    }
+
+    # 반복 횟수로 얻을 수 있는 가장 작은 p-value가 유의수준보다 크면 검정할 수 없음
+    testable = 1 / math.comb(row['base_runs'] + row['head_runs'], row['head_runs']) <= args.alpha
+    row['pvalue'] = permutation_pvalue(base['seconds'], head['seconds'])
+    if row['time_change'] > args.threshold:
+        if not testable:
+            row['status'].append('표본 부족')
+        elif row['pvalue'] <= args.alpha:
+            row['status'].append('느려짐')
+        else:
+            row['status'].append('유의하지 않음')
+    elif row['time_change'] < -args.threshold and testable and permutation_pvalue(head['seconds'], base['seconds']) <= args.alpha:
+        row['status'].append('빨라짐')
+    if row['rss_change'] > args.memory_threshold and head_rss - base_rss > MIN_RSS_DELTA_MB:
+        isolated = base['rss_methods'] == head['rss_methods'] == {'vm_hwm'}
+        row['status'].append('메모리 증가' if isolated else '메모리 비교 불가')
+    if base['input_bytes'] != head['input_bytes']:
+        row['status'].append('입력 다름')
+    if base['environments'] != head['environments']:
+        row['status'].append('환경 다름')
+    if base['runs'] != head['runs']:
+        row['status'].append('실행 구성 다름')
+
+    # 단계별 자체 시간 중 가장 많이 늘어난 단계
+    deltas = {name: statistics.median(head['stages'][name]) - statistics.median(base['stages'][name])
+              for name in head['stages'] if name in base['stages']}
+    if deltas:
+        name = max(deltas, key=deltas.get)
+        if deltas[name] > 0:
+            row['stage'] = (name, deltas[name])
+    return row
+
+
+def print_table(rows: list, base: str, head: str, args):
+    print(f'\n벤치마크 비교: {base} → {head} (시간 임계값 {args.threshold:.0%}, 유의수준 {args.alpha}, '
+          f'메모리 임계값 {args.memory_threshold:.0%})\n')
+    print('| 컴포넌트 | 모드 | 입력 크기 | 시간 (초) | 변화 | p-value | 최대 RSS (MB) | 변화 | 가장 늘어난 단계 (초) | 반복 | 판정 |')
+    print('|---|---|---|---|---|---|---|---|---|---|---|')
+    for row in rows:
+        prefix = f"| {row['component']} | {row['mode']} | {row['size']:,} |"
+        if 'missing' in row:
+            print(f"{prefix} - | - | - | - | - | - | - | {row['missing']} |")
+            continue
+        stage = f"{row['stage'][0]} {row['stage'][1]:+.2f}" if row['stage'] else '-'
+        print(f"{prefix} {row['base_seconds']:.2f} → {row['head_seconds']:.2f} | {row['time_change']:+.1%} | {row['pvalue']:.3f} | "
+              f"{row['base_rss_mb']:.0f} → {row['head_rss_mb']:.0f} | {row['rss_change']:+.1%} | {stage} | "
+              f"{row['base_runs']}/{row['head_runs']} | {', '.join(row['status']) or '변화 없음'} |")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--store', default=RESULTS_PATH, help='components.py가 기록한 JSON Lines 결과 파일')
+    parser.add_argument('--base', default=None, help='기준 리비전 (git ref 또는 해시, 기본값: 직전에 측정한 리비전)')
+    parser.add_argument('--head', default=None, help='비교할 리비전 (기본값: 가장 최근에 측정한 리비전)')
+    parser.add_argument('--components', default=None, help='쉼표로 구분한 컴포넌트 목록 (기본값: 양쪽에 기록된 전체)')
+    parser.add_argument('--threshold', type=float, default=0.05, help='느려짐으로 볼 시간 중앙값 증가율')
+    parser.add_argument('--alpha', type=float, default=0.05, help='순열 검정 유의수준')
+    parser.add_argument('--memory-threshold', type=float, default=0.10, help='메모리 증가로 볼 최대 RSS 중앙값 증가율')
+    parser.add_argument('--json', default=None, help='비교 결과를 저장할 JSON 파일')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.store):
+        raise SystemExit(f'결과 파일이 없습니다: {args.store} (먼저 benchmarks/components.py를 실행하세요)')
+    records = load_results(args.store)
+    revisions = measured_revisions(records)
+    if not revisions:
+        raise SystemExit(f'결과 파일에 기록이 없습니다: {args.store}')
+    head = resolve_revision(args.head) if args.head else revisions[-1]
+    base = resolve_revision(args.base) if args.base else next((label for label in reversed(revisions) if label != head), None)
+    if base is None:
+        raise SystemExit(f'{head} 외에 비교할 리비전이 기록되어 있지 않습니다. --base를 지정하거나 다른 리비전에서 벤치마크를 실행하세요.')
+
+    base_groups, head_groups = group_samples(records, base), group_samples(records, head)
+    for revision, groups in ((base, base_groups), (head, head_groups)):
+        if not groups:
+            raise SystemExit(f'{revision}의 성공한 측정 기록이 없습니다: {args.store}')
+    selected = set(args.components.split(',')) if args.components else None
+    rows = []
+    for key in sorted(set(base_groups) | set(head_groups)):
+        if selected is not None and key[0] not in selected:
+            continue
+        row = {'component': key[0], 'mode': key[1], 'size': key[2]}
+        if key not in base_groups or key not in head_groups:
+            row['missing'] = f"{base if key not in base_groups else head} 기록 없음"
+        else:
+            row.update(compare_group(base_groups[key], head_groups[key], args))
+        rows.append(row)
+    if not rows:
+        raise SystemExit(f'선택한 컴포넌트의 측정 기록이 없습니다: {args.components}')
+
+    print_table(rows, base, head, args)
+    regressions = [row for row in rows if {'느려짐', '메모리 증가'} & set(row.get('status', []))]
+    print(f'\nCompared {len(rows)} benchmarks between {base} and {head}: {len(regressions)} regressions', file=sys.stderr)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'base': base, 'head': head, 'rows': rows}, f, ensure_ascii=False, indent=2)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
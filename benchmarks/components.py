@@ -0,0 +1,565 @@
+"""
+컴포넌트별 처리량/메모리 벤치마크.
+
+datagen.py로 만든 같은 입력을 각 컴포넌트에 넣고, 실행마다 새 프로세스에서 다음 두 경로를 측정합니다.
+
+- solution: algorithm.solution()을 로컬 파일 입출력으로 직접 호출 (알고리즘 자체의 처리량)
+- main: 로컬 S3 호환 서버에 입력을 올린 뒤 production 설정으로 `python main.py` 실행
+        (인터프리터 시작, import, Object Storage 다운로드/업로드, 보고서 저장까지 포함한 처리량)
+
+컴포넌트/모드/입력 크기마다 소요 시간, 행/초, MB/초(입력 크기 기준), 최대 RSS(측정 대상 프로세스의 VmHWM)를
+표로 출력합니다. 기본값은 moto 서버를 별도 프로세스로 띄우며, --endpoint로 MinIO 등 이미 실행 중인 S3 호환 서버를
+지정할 수 있습니다. 설치되지 않은 라이브러리가 필요한 컴포넌트는 상태 칸에 누락된 모듈을 표시하고,
+외부 서비스(VWorld API, REST API, SODAS)에 요청하는 컴포넌트는 건너뜁니다.
+main 모드 결과에는 main.py가 보고서 옆에 저장한 metrics.json의 단계별 자체 시간(stages)이 함께 저장됩니다 (--json).
+
+--repeat로 같은 측정을 여러 번 반복하면 시간, 최대 RSS, 단계별 시간은 중앙값을 표시하고 반복별 값(samples)도 저장합니다.
+결과는 git 리비전, 입력 프로필, 실행 환경과 함께 benchmarks/results.jsonl(--store)에 덧붙여지며,
+compare.py로 두 리비전의 결과를 비교해 느려지거나 메모리가 늘어난 컴포넌트를 찾을 수 있습니다.
+
+사용법:
+    python benchmarks/components.py --sizes 10000,100000
+    python benchmarks/components.py --components csv-regex,csv-sort --mode main --json result.json
+    python benchmarks/components.py --components csv-join,csv-tokenize --sizes 100000 --repeat 5
+    python benchmarks/components.py --endpoint http://127.0.0.1:9000 --access-key minio --secret-key minio123
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from datagen import SEED, dataset, dataset_rows, dataset_size  # noqa: E402
+from results import RESULTS_PATH, append_results  # noqa: E402
+
+BUCKET = 'bucket01'
+# 측정 대상 프로세스의 최대 RSS(/proc/<pid>/status의 VmHWM)를 읽는 간격 (초)
+RSS_POLL_INTERVAL = 0.005
+MODES = ['solution', 'main']
+MARKER = '--bench-result--'
+
+# 컴포넌트별 벤치마크 설정
+# - inputs: 입력 args 키 -> datagen 데이터셋 이름
+# - args: 입력/출력 위치를 제외한 production args (callable이면 데이터셋 경로 dict를 받아 args를 반환)
+# - output: 결과 위치 args 키와 확장자
+# - solution: (solution 함수, 입력 경로 dict, 출력 경로, args)를 받아 solution()을 호출하는 함수
+# - scale, max_rows: 입력 크기에 곱할 비율과 최대 행 수 (계산량이 큰 컴포넌트)
+# - external: 외부 서비스가 필요해 건너뛰는 이유
+SPECS = {
+    'csv-arithmetic-operation': {
+        'inputs': {'input1': 'postings'},
+        'args': {'operands': ['급여', '경력연수'], 'operators': ['/'], 'column_name': '연차당급여'},
+        'solution': lambda run, i, o, a: run(i['input1'], o, a['operands'], a['operators'], a['column_name']),
+    },
+    'csv-change-column-name': {
+        'inputs': {'input1': 'postings'},
+        'args': {'settings': {'input_cols': ['제목', '급여'], 'output_cols': ['title', 'salary']}, 'delete_input': False},
+        'solution': lambda run, i, o, a: run(i['input1'], a['settings']['input_cols'], a['settings']['output_cols'], o),
+    },
+    'csv-column-concat': {
+        'inputs': {'input1': 'postings'},
+        'args': {'settings': {'target_cols': ['지역', '직종'], 'optional_cols': ['주소'], 'delimiter': '_', 'new_col_name': '분류'}},
+        'solution': lambda run, i, o, a: run(i['input1'], o, **a['settings']),
+    },
+    'csv-cosine-similarity': {
+        'inputs': {'query_embeddings_data': 'query_embeddings', 'candidate_embeddings_data': 'candidate_embeddings'},
+        'args': {'settings': {'top_n': 10, 'threshold': 0.5}},
+        'output': ('output1', 'json'),
+        'solution': lambda run, i, o, a: run(i['query_embeddings_data'], i['candidate_embeddings_data'], o,
+                                              a['settings']['top_n'], a['settings']['threshold']),
+        'scale': 0.1,
+    },
+    'csv-date-time-formatter': {
+        'inputs': {'input1': 'postings'},
+        'args': {'input_cols': ['등록일시'], 'display_mode': 'append', 'suffix': '_일자',
+                 'in_format': '%Y-%m-%d %H:%M:%S', 'out_format': '%Y/%m/%d'},
+        'solution': lambda run, i, o, a: run(i['input1'], o, a['input_cols'], a['display_mode'], a['suffix'],
+                                              a['in_format'], a['out_format']),
+    },
+    'csv-delete-missing-value': {
+        'inputs': {'input1': 'postings'},
+        'args': {'subset': ['급여', '상세내용']},
+        'solution': lambda run, i, o, a: run(i['input1'], o, a['subset']),
+    },
+    'csv-embedding': {
+        'inputs': {'input1': 'postings'},
+        'args': {'settings': {'target_column': '상세내용', 'idx_column': 'id', 'model_name': 'jhgan/ko-sroberta-multitask'}},
+        'output': ('output1', 'npz'),
+        'solution': lambda run, i, o, a: run(i['input1'], o, a['settings']['target_column'], a['settings']['idx_column'],
+                                              a['settings']['model_name']),
+        'scale': 0.01,
+    },
+    'csv-from-parquet': {
+        'inputs': {'input1': 'postings_parquet'},
+        'args': {},
+        'solution': lambda run, i, o, a: run(i['input1'], o),
+    },
+    'csv-get-latlon': {
+        'external': 'VWorld 지오코딩 API 필요',
+    },
+    'csv-join': {
+        'inputs': {'left_table': 'postings', 'right_table': 'regions'},
+        'args': {'left_on': ['지역'], 'right_on': ['지역'], 'how': 'left', 'lsuffix': '', 'rsuffix': '_지역', 'sort': False},
+        'output': ('result_table', 'csv'),
+        'solution': lambda run, i, o, a: run(i['left_table'], i['right_table'], o, a['left_on'], a['right_on'], a['how'],
+                                              a['lsuffix'], a['rsuffix'], a['sort']),
+    },
+    'csv-merge': {
+        'inputs': {'input1': 'postings', 'input2': 'postings_parquet'},
+        'args': {'number_of_input': 2, 'delete_input': False},
+        'solution': lambda run, i, o, a: run([i['input1'], i['input2']], o),
+    },
+    'csv-pipeline': {
+        'inputs': {'input1': 'postings'},
+        'args': {'steps': [
+            {'component': 'csv-delete-missing-value', 'args': {'subset': ['상세내용']}},
+            {'component': 'csv-regex', 'args': {'settings': {'target_column': '상세내용', 'regex_pattern': '경력[가-힣]*', 'output_column': '경력'}}},
+            {'component': 'csv-transform', 'args': {'settings': {'target_column': '지역', 'lambda_function': 'lambda x: x[:2]', 'output_column': '지역약칭'}}},
+            {'component': 'csv-wordcount', 'args': {'settings': {'columns': ['경력', '지역약칭'], 'separator': ' '}}},
+        ], 'checkpoint': {}},
+    },
+    'csv-regex': {
+        'inputs': {'input1': 'postings'},
+        'args': {'settings': {'target_column': '상세내용', 'regex_pattern': '경력[가-힣]*', 'output_column': '경력'}, 'delete_input': False},
+        'solution': lambda run, i, o, a: run(i['input1'], a['settings']['target_column'], a['settings']['regex_pattern'],
+                                              a['settings']['output_column'], o),
+    },
+    'csv-sort': {
+        'inputs': {'input1': 'postings'},
+        'args': {'input_cols': ['지역', '급여'], 'is_asc': True},
+        'solution': lambda run, i, o, a: run(i['input1'], o, a['input_cols'], a['is_asc']),
+    },
+    'csv-statistic-summary': {
+        'inputs': {'input1': 'postings'},
+        'args': {'input_cols': ['급여', '경력연수'], 'group_by': ['지역', '직종'], 'statistics': ['mean', 'min', 'max', 'std'],
+                 'percentile_amounts': None, 'trimmed_mean_amounts': None},
+        'solution': lambda run, i, o, a: run(i['input1'], o, a['input_cols'], a['group_by'], a['statistics']),
+    },
+    'csv-to-json': {
+        'inputs': {'input1': 'postings'},
+        'args': {},
+        'output': ('output1', 'json'),
+        'solution': lambda run, i, o, a: run(i['input1'], o),
+    },
+    'csv-tokenize': {
+        'inputs': {'input1': 'postings'},
+        'args': {'settings': {'text_column': '상세내용', 'new_column': 'tokens', 'ignore_words': [], 'remove_stopwords': True,
+                              'keep_tokenized_column_only': True}},
+        'solution': lambda run, i, o, a: run(i['input1'], a['settings']['text_column'], o, new_column='tokens',
+                                              keep_tokenized_column_only=True),
+        'scale': 0.1,
+    },
+    'csv-transform': {
+        'inputs': {'input1': 'postings'},
+        'args': {'settings': {'target_column': '주소', 'lambda_function': 'lambda x: x.split()[1]', 'output_column': '시군구'}, 'delete_input': False},
+        'solution': lambda run, i, o, a: run(i['input1'], a['settings']['target_column'], a['settings']['lambda_function'],
+                                              a['settings']['output_column'], o),
+    },
+    'csv-visualization-barchart': {
+        'inputs': {'input1': 'postings'},
+        'args': {'settings': {'feature_name': '직종'}, 'delete_input': False},
+        'output': ('output1', 'png'),
+        'solution': lambda run, i, o, a: run(i['input1'], a['settings']['feature_name'], o),
+    },
+    'csv-visualization-boxplot': {
+        'inputs': {'input1': 'postings'},
+        'args': {'settings': {'group_by_column': '직종', 'value_column': '급여', 'title': '직종별 급여', 'ylabel': '급여'}, 'delete_input': False},
+        'output': ('output1', 'png'),
+        'solution': lambda run, i, o, a: run(i['input1'], a['settings']['group_by_column'], a['settings']['value_column'], o),
+    },
+    'csv-visualization-histogram': {
+        'inputs': {'input1': 'postings'},
+        'args': {'settings': {'feature_name': '급여'}, 'delete_input': False},
+        'output': ('output1', 'png'),
+        'solution': lambda run, i, o, a: run(i['input1'], a['settings']['feature_name'], o),
+    },
+    'csv-visualization-map': {
+        'inputs': {'input1': 'postings'},
+        'args': {'settings': {'label_column': '직종', 'lat_column': '위도', 'lon_column': '경도'}, 'delete_input': False},
+        'output': ('output1', 'html'),
+        'solution': lambda run, i, o, a: run(i['input1'], a['settings']['label_column'], a['settings']['lat_column'],
+                                              a['settings']['lon_column'], o),
+        'scale': 0.1,
+    },
+    'csv-visualization-pairplot': {
+        'inputs': {'input1': 'postings'},
+        'args': {'feature_names': ['급여', '경력연수', '위도'], 'target_name': '직종'},
+        'output': ('output1', 'png'),
+        'scale': 0.1,
+    },
+    'csv-visualization-piechart': {
+        'inputs': {'input1': 'postings'},
+        'args': {'settings': {'feature_name': '직종', 'chart_title': '직종 비율'}, 'delete_input': False},
+        'output': ('output1', 'png'),
+        'solution': lambda run, i, o, a: run(i['input1'], a['settings']['feature_name'], o, chart_title=a['settings']['chart_title']),
+    },
+    'csv-visualization-wordcloud': {
+        'inputs': {'input1': 'wordcounts'},
+        'args': {'settings': {'word_column': 'word', 'count_column': 'count', 'max_words': 200}},
+        'output': ('output1', 'png'),
+        'solution': lambda run, i, o, a: run(i['input1'], 'word', 'count', o, max_words=a['settings']['max_words']),
+        'scale': 0.1,
+    },
+    'csv-wordcount': {
+        'inputs': {'input1': 'postings'},
+        'args': {'settings': {'columns': ['상세내용'], 'separator': ' '}, 'delete_input': False},
+        'solution': lambda run, i, o, a: run(i['input1'], a['settings']['columns'], a['settings']['separator'], o),
+    },
+    'json-merge': {
+        'inputs': {'input1': 'records', 'input2': 'records'},
+        'args': {'number_of_input': 2, 'delete_input': False},
+        'output': ('output1', 'json'),
+        'solution': lambda run, i, o, a: run([load_json(i['input1']), load_json(i['input2'])], o),
+    },
+    'json-merge-from-directory': {
+        'inputs': {'input1': 'records_dir'},
+        'args': {},
+        'output': ('output1', 'json'),
+        'solution': lambda run, i, o, a: run([load_json(os.path.join(i['input1'], name)) for name in sorted(os.listdir(i['input1']))], o),
+    },
+    'json-to-csv': {
+        'inputs': {'input1': 'records'},
+        'args': {'settings': {}},
+        'solution': lambda run, i, o, a: run(i['input1'], o),
+    },
+    'json-upload': {
+        'inputs': {},
+        # 환경변수 하나의 최대 길이(128 KB)를 넘지 않도록 행 수를 제한
+        'args': lambda paths: {'settings': {'json_data': load_json(dataset('records', SPECS['json-upload']['max_rows'], paths['data_dir']))}},
+        'output': ('output1', 'json'),
+        'solution': lambda run, i, o, a: run(a['settings']['json_data'], o),
+        'max_rows': 100,
+    },
+    'sodas-append-dataset-to-datasetseries': {
+        'external': 'SODAS 서버 필요',
+    },
+    'upload-object-file-to-restapi': {
+        'external': 'REST API 서버 필요',
+    },
+}
+
+
+def load_json(path: str):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def spec_rows(spec: dict, size: int) -> int:
+    rows = max(100, int(size * spec.get('scale', 1)))
+    return min(rows, spec['max_rows']) if 'max_rows' in spec else rows
+
+
+def prepare(component: str, size: int, data_dir: str) -> tuple:
+    """
+    입력 데이터셋을 생성(또는 재사용)하고, 입력 경로, args, 입력 행 수, 입력 바이트 수를 반환합니다.
+    """
+    spec = SPECS[component]
+    rows = spec_rows(spec, size)
+    paths = {key: dataset(name, rows, data_dir) for key, name in spec['inputs'].items()}
+    args = spec['args']({'data_dir': data_dir}) if callable(spec['args']) else spec['args']
+    if spec['inputs']:
+        input_rows = max(dataset_rows(name, rows) for name in spec['inputs'].values())
+        input_bytes = sum(dataset_size(path) for path in paths.values())
+    else:
+        input_rows = rows
+        input_bytes = len(json.dumps(args, ensure_ascii=False).encode('utf-8'))
+    return paths, args, input_rows, input_bytes
+
+
+def vm_hwm(pid: int) -> int:
+    """프로세스의 최대 RSS(KB, /proc/<pid>/status의 VmHWM)를 반환합니다. 읽을 수 없으면 None."""
+    try:
+        with open(f'/proc/{pid}/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def run_measured(command: list, cwd: str, env: dict) -> dict:
+    """
+    자식 프로세스를 실행하고 소요 시간과 최대 RSS(MB), 종료 코드, 출력을 반환합니다.
+
+    wait4의 ru_maxrss는 fork 직후 부모(벤치마크 프로세스)의 RSS를 exec 이후에도 이어받으므로,
+    실행 중인 자식의 VmHWM을 RSS_POLL_INTERVAL마다 읽어 자식 자신의 최대 RSS만 기록합니다.
+    자식이 만든 프로세스(csv-tokenize의 형태소 분석 풀 등)는 포함되지 않습니다.
+    /proc가 없거나 첫 측정 전에 끝난 경우에만 ru_maxrss를 사용합니다.
+    """
+    with tempfile.TemporaryFile('w+') as stdout, tempfile.TemporaryFile('w+') as stderr:
+        start = time.perf_counter()
+        process = subprocess.Popen(command, cwd=cwd, env=env, stdout=stdout, stderr=stderr, text=True)
+        peak_kb = None
+        while True:
+            pid, status, usage = os.wait4(process.pid, os.WNOHANG)
+            if pid:
+                break
+            # VmHWM은 줄지 않으므로 종료 직전에 읽은 값이 최대값 (마지막 간격 동안 늘어난 양만 놓칠 수 있음)
+            peak_kb = vm_hwm(process.pid) or peak_kb
+            time.sleep(RSS_POLL_INTERVAL)
+        elapsed = time.perf_counter() - start
+        process.returncode = os.waitstatus_to_exitcode(status)
+        stdout.seek(0)
+        stderr.seek(0)
+        return {
+            'seconds': elapsed,
+            # Linux에서 VmHWM, ru_maxrss 단위는 KB
+            'peak_rss_mb': (peak_kb or usage.ru_maxrss) / 1024,
+            'rss_method': 'vm_hwm' if peak_kb else 'ru_maxrss',
+            'returncode': process.returncode,
+            'stdout': stdout.read(),
+            'stderr': stderr.read(),
+        }
+
+
+def failure(out: dict) -> str:
+    lines = [line for line in out['stderr'].splitlines() if line.strip()]
+    return lines[-1][:120] if lines else f"exit {out['returncode']}"
+
+
+def run_solution_child(component: str, size: int, data_dir: str):
+    """
+    (자식 프로세스) 컴포넌트 디렉터리에서 algorithm.solution()을 호출하고 소요 시간을 출력합니다.
+    """
+    spec = SPECS[component]
+    paths, args, _, _ = prepare(component, size, data_dir)
+    component_dir = os.path.join(ROOT, component)
+    sys.path[:0] = [component_dir, ROOT]
+    os.chdir(component_dir)
+    import algorithm
+
+    _, extension = spec.get('output', ('output1', 'csv'))
+    with tempfile.TemporaryDirectory() as workdir:
+        output = os.path.join(workdir, f'result.{extension}')
+        start = time.perf_counter()
+        spec['solution'](algorithm.solution, paths, output, args)
+        elapsed = time.perf_counter() - start
+        # solution() 안에서 예외를 출력만 하고 끝나는 컴포넌트가 있으므로 결과 파일로 성공 여부 확인
+        if not os.path.exists(output):
+            raise RuntimeError('결과 파일이 생성되지 않았습니다.')
+        output_bytes = os.path.getsize(output)
+    print(MARKER + json.dumps({'solution_seconds': elapsed, 'output_bytes': output_bytes}))
+
+
+def bench_solution(component: str, size: int, data_dir: str) -> dict:
+    out = run_measured([sys.executable, os.path.abspath(__file__), '--child', component, '--sizes', str(size), '--data-dir', data_dir],
+                       cwd=ROOT, env=dict(os.environ, PYTHONPATH=ROOT, APP_ENV='development'))
+    result_lines = [line for line in out['stdout'].splitlines() if line.startswith(MARKER)]
+    if out['returncode'] != 0 or not result_lines:
+        return {'status': failure(out)}
+    result = json.loads(result_lines[-1][len(MARKER):])
+    # 인터프리터 시작과 import를 뺀 solution() 호출 시간 기준
+    return {'status': 'ok', 'seconds': result['solution_seconds'], 'process_seconds': out['seconds'],
+            'peak_rss_mb': out['peak_rss_mb'], 'rss_method': out['rss_method'], 'output_bytes': result['output_bytes']}
+
+
+def location(endpoint: str, credentials: tuple, object_path: str) -> dict:
+    return {'end_point': endpoint, 'access_key': credentials[0], 'secret_key': credentials[1], 'bucket_name': BUCKET, 'object_path': object_path}
+
+
+def upload_inputs(s3, paths: dict, rows: int) -> dict:
+    """입력 데이터셋을 input/<행 수>/ 아래에 올리고 (이미 있으면 건너뜀) 입력 args 키별 객체 경로를 반환합니다."""
+    bucket = s3.Bucket(BUCKET)
+    keys = {}
+    for key, path in paths.items():
+        name = os.path.basename(path)
+        files = [(os.path.join(path, child), f'input/{rows}/{name}/{child}') for child in sorted(os.listdir(path))] \
+            if os.path.isdir(path) else [(path, f'input/{rows}/{name}')]
+        for local, object_path in files:
+            if not list(bucket.objects.filter(Prefix=object_path, MaxKeys=1)):
+                bucket.upload_file(local, object_path)
+        keys[key] = f'input/{rows}/{name}' + ('/' if os.path.isdir(path) else '')
+    return keys
+
+
+def env_value(value) -> str:
+    # config.py는 문자열 args(column_name, how 등)를 환경변수 값 그대로, 나머지는 JSON으로 읽음
+    return value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+
+
+def bench_main(component: str, size: int, data_dir: str, s3, endpoint: str, credentials: tuple) -> dict:
+    spec = SPECS[component]
+    paths, args, _, _ = prepare(component, size, data_dir)
+    rows = spec_rows(spec, size)
+    output_key, extension = spec.get('output', ('output1', 'csv'))
+    prefix = f'runs/{component}/{rows}'
+    locations = {key: location(endpoint, credentials, object_path) for key, object_path in upload_inputs(s3, paths, rows).items()}
+    locations[output_key] = location(endpoint, credentials, f'{prefix}/result.{extension}')
+    locations['task_report'] = location(endpoint, credentials, f'{prefix}/report.md')
+
+    env = dict(os.environ, APP_ENV='production', PYTHONPATH=ROOT, AWS_DEFAULT_REGION='us-east-1')
+    env.update({key.upper(): json.dumps(value) for key, value in locations.items()})
+    # 값이 None인 args는 환경변수를 지정하지 않아 config.py 기본값을 사용
+    env.update({key.upper(): env_value(value) for key, value in args.items() if value is not None})
+    out = run_measured([sys.executable, 'main.py'], cwd=os.path.join(ROOT, component), env=env)
+    if out['returncode'] != 0:
+        return {'status': failure(out)}
+    output_objects = list(s3.Bucket(BUCKET).objects.filter(Prefix=f'{prefix}/result'))
+    return {'status': 'ok', 'seconds': out['seconds'], 'process_seconds': out['seconds'], 'peak_rss_mb': out['peak_rss_mb'],
+            'rss_method': out['rss_method'], 'output_bytes': sum(obj.size for obj in output_objects), 'stages': stage_seconds(s3, f'{prefix}/report.metrics.json')}
+
+
+def stage_seconds(s3, object_path: str) -> dict:
+    """main.py가 보고서 옆에 저장한 metrics.json에서 단계별 자체 시간(초)을 읽습니다."""
+    try:
+        document = json.loads(s3.Object(BUCKET, object_path).get()['Body'].read())
+    except Exception:
+        return {}
+    return {name: stage['self_seconds'] for name, stage in document.get('stages', {}).items()}
+
+
+def measure_repeated(bench, repeat: int) -> dict:
+    """
+    bench()를 repeat번 실행하고 시간, 최대 RSS, 단계별 시간의 중앙값과 반복별 값을 반환합니다.
+    한 번이라도 실패하면 그 실패 결과를 반환합니다.
+    """
+    runs = []
+    for _ in range(repeat):
+        run = bench()
+        if run['status'] != 'ok':
+            return run
+        runs.append(run)
+    result = dict(runs[0])
+    for key in ('seconds', 'process_seconds', 'peak_rss_mb'):
+        result['samples_' + key] = [run[key] for run in runs]
+        result[key] = statistics.median(result['samples_' + key])
+    if 'stages' in result:
+        names = {name for run in runs for name in run['stages']}
+        result['stages'] = {name: statistics.median(run['stages'].get(name, 0.0) for run in runs) for name in sorted(names)}
+    return result
+
+
+def start_moto(port: int, endpoint: str):
+    """
+    moto 서버를 별도 프로세스로 실행하고 종료 함수를 반환합니다.
+    벤치마크 프로세스 안에서 실행하면 저장한 객체만큼 부모의 RSS가 커지고, 이후 fork한 자식의 측정값을 부풀립니다.
+    """
+    import urllib.error
+    import urllib.request
+    server = subprocess.Popen([sys.executable, '-m', 'moto.server', '-p', str(port)],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    def stop():
+        server.terminate()
+        server.wait()
+
+    deadline = time.time() + 30
+    while True:
+        try:
+            urllib.request.urlopen(endpoint, timeout=1).close()
+            return stop
+        except urllib.error.HTTPError:
+            return stop
+        except OSError:
+            if server.poll() is not None or time.time() > deadline:
+                stop()
+                raise RuntimeError(f'moto 서버를 시작하지 못했습니다 (port {port})')
+            time.sleep(0.1)
+
+
+def start_storage(args) -> tuple:
+    """S3 호환 서버를 준비하고 (s3 리소스, endpoint, 인증 정보, 종료 함수)를 반환합니다."""
+    import boto3
+    stop = lambda: None  # noqa: E731
+    if args.endpoint:
+        endpoint, credentials = args.endpoint, (args.access_key, args.secret_key)
+    else:
+        endpoint, credentials = f'http://127.0.0.1:{args.port}', ('bench', 'bench')
+        stop = start_moto(args.port, endpoint)
+    s3 = boto3.resource('s3', endpoint_url=endpoint, aws_access_key_id=credentials[0], aws_secret_access_key=credentials[1],
+                        region_name='us-east-1')
+    if s3.Bucket(BUCKET).creation_date is None:
+        s3.create_bucket(Bucket=BUCKET)
+    return s3, endpoint, credentials, stop
+
+
+def print_table(results: list):
+    print('\n| 컴포넌트 | 모드 | 입력 행 | 입력 MB | 시간 (초) | 행/초 | MB/초 | 최대 RSS (MB) | 상태 |')
+    print('|---|---|---|---|---|---|---|---|---|')
+    for r in results:
+        size_mb = r['input_bytes'] / 1024 / 1024
+        if r['status'] != 'ok':
+            print(f"| {r['component']} | {r['mode']} | {r['input_rows']:,} | {size_mb:.1f} | - | - | - | - | {r['status']} |")
+            continue
+        print(f"| {r['component']} | {r['mode']} | {r['input_rows']:,} | {size_mb:.1f} | {r['seconds']:.2f} | "
+              f"{r['rows_per_second']:,.0f} | {r['mb_per_second']:.1f} | {r['peak_rss_mb']:.0f} | 성공 |")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='10000,100000', help='쉼표로 구분한 입력 행 수 목록')
+    parser.add_argument('--components', default=None, help='쉼표로 구분한 컴포넌트 목록 (기본값: 전체)')
+    parser.add_argument('--mode', default='solution,main', help='solution, main 또는 둘 다 (쉼표로 구분)')
+    parser.add_argument('--data-dir', default='/tmp/bench-data', help='생성한 입력 데이터를 저장하고 다시 사용할 디렉터리')
+    parser.add_argument('--repeat', type=int, default=1, help='컴포넌트/모드/입력 크기마다 반복 측정할 횟수 (결과는 중앙값)')
+    parser.add_argument('--json', default=None, help='결과를 저장할 JSON 파일')
+    parser.add_argument('--store', default=RESULTS_PATH, help='결과를 리비전과 함께 덧붙일 JSON Lines 파일 (compare.py에서 사용)')
+    parser.add_argument('--no-store', action='store_true', help='결과 파일에 기록하지 않음')
+    parser.add_argument('--endpoint', default=None, help='사용할 S3 호환 서버 주소 (기본값: moto 서버 실행)')
+    parser.add_argument('--access-key', default='minioadmin')
+    parser.add_argument('--secret-key', default='minioadmin')
+    parser.add_argument('--port', type=int, default=5080)
+    parser.add_argument('--child', default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    if args.child:
+        run_solution_child(args.child, sizes[0], args.data_dir)
+        return
+
+    components = args.components.split(',') if args.components else sorted(SPECS)
+    modes = [mode for mode in args.mode.split(',') if mode in MODES]
+    storage = start_storage(args) if 'main' in modes else None
+    results = []
+    try:
+        for component in components:
+            spec = SPECS[component]
+            for size in sizes:
+                for mode in modes:
+                    result = {'component': component, 'mode': mode, 'size': size, 'input_rows': 0, 'input_bytes': 0,
+                              'datasets': spec.get('inputs', {})}
+                    if 'external' in spec:
+                        result['status'] = f"{spec['external']} (건너뜀)"
+                    elif mode == 'solution' and 'solution' not in spec:
+                        result['status'] = 'solution() 없음'
+                    else:
+                        _, _, result['input_rows'], result['input_bytes'] = prepare(component, size, args.data_dir)
+                        if mode == 'solution':
+                            bench = lambda: bench_solution(component, size, args.data_dir)  # noqa: E731
+                        else:
+                            bench = lambda: bench_main(component, size, args.data_dir, *storage[:3])  # noqa: E731
+                        result.update(measure_repeated(bench, args.repeat))
+                    if result['status'] == 'ok':
+                        result['rows_per_second'] = result['input_rows'] / result['seconds']
+                        result['mb_per_second'] = result['input_bytes'] / 1024 / 1024 / result['seconds']
+                    results.append(result)
+                    status = f"{result['seconds']:.2f}초" if result['status'] == 'ok' else result['status']
+                    print(f'- {component} [{mode}, {size:,}]: {status}', file=sys.stderr)
+    finally:
+        if storage:
+            storage[3]()
+
+    repeat = f', {args.repeat}회 반복 중앙값' if args.repeat > 1 else ''
+    print(f"\n컴포넌트별 처리량 (solution: solution() 호출 시간, main: 프로세스 전체 시간, 입력 크기: {args.sizes}{repeat})")
+    print_table(results)
+
+    if not args.no_store:
+        # 같은 실행에서 함께 측정한 컴포넌트/모드/크기 (compare.py가 실행 구성이 다른 기록을 표시)
+        run = {'components': components, 'modes': modes, 'sizes': sizes}
+        append_results(args.store, results, repeat=args.repeat, seed=SEED, run=run)
+        print(f'\nAppended {len(results)} results to {args.store}', file=sys.stderr)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == '__main__':
+    main()
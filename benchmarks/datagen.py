@@ -0,0 +1,257 @@
+"""
+벤치마크용 합성 입력 데이터 생성기.
+
+같은 이름, 행 수, seed로 호출하면 항상 같은 바이트의 파일을 만들므로, 서로 다른 시점/환경의 측정 결과를
+같은 입력으로 비교할 수 있습니다. 생성한 파일은 data_dir에 `<이름>-<행 수>.<확장자>`로 저장하고 다시 사용합니다.
+
+- postings: 채용 공고 CSV (한국어 자유 텍스트, 도로명 주소, 날짜/시간, 결측값이 있는 숫자 컬럼, 위경도)
+- postings_parquet: postings와 같은 내용의 Parquet
+- regions: 지역별 코드/인구 CSV (postings의 지역 컬럼과 조인, 행 수와 관계없이 17행)
+- wordcounts: 단어/빈도 CSV
+- query_embeddings, candidate_embeddings: 임베딩 npz (embeddings: float32 행렬, idxs: 문자열 ID)
+- records: 중첩된 객체와 배열을 가진 JSON 레코드 배열
+- records_dir: records를 여러 JSON 파일로 나눈 디렉터리
+
+사용법:
+    python benchmarks/datagen.py --rows 100000 --data-dir /tmp/bench-data
+"""
+import argparse
+import csv
+import json
+import os
+import random
+from datetime import datetime, timedelta
+
+SEED = 42
+
+SYLLABLES = '가나다라마바사아자차카타파하거너더러머버서어저처커터퍼허고노도로모보소오조초코토포호구누두루무부수우주추쿠투푸후'
+WORDS = ['데이터', '분석', '채용', '근무조건', '연봉제', '월급제', '시급제', '정규직', '계약직', '경력', '신입', '우대사항',
+         '개발', '운영', '서비스', '고객', '관리', '지원', '교육', '복지', '주5일', '재택근무', '야간', '교대']
+PARTICLES = ['은', '는', '이', '가', '을', '를', '에', '에서', '으로', '와', '및', '']
+ENDINGS = ['합니다.', '입니다.', '우대합니다.', '가능합니다.', '모집합니다.', '있습니다.']
+JOBS = ['사무직', '개발자', '디자이너', '영업', '생산직', '간호사', '요리사', '운전원', '상담원', '연구원']
+
+# (시도, 시군구 목록, 지역코드, 인구(천 명), 위도, 경도)
+REGIONS = [
+    ('서울특별시', ['강남구', '마포구', '종로구', '송파구'], 11, 9386, 37.5665, 126.9780),
+    ('부산광역시', ['해운대구', '부산진구', '사하구'], 26, 3293, 35.1796, 129.0756),
+    ('대구광역시', ['수성구', '달서구', '중구'], 27, 2374, 35.8714, 128.6014),
+    ('인천광역시', ['연수구', '남동구', '부평구'], 28, 2997, 37.4563, 126.7052),
+    ('광주광역시', ['북구', '서구', '광산구'], 29, 1419, 35.1595, 126.8526),
+    ('대전광역시', ['유성구', '서구', '중구'], 30, 1446, 36.3504, 127.3845),
+    ('울산광역시', ['남구', '중구', '울주군'], 31, 1103, 35.5384, 129.3114),
+    ('세종특별자치시', ['세종시'], 36, 386, 36.4800, 127.2890),
+    ('경기도', ['수원시', '성남시', '고양시', '용인시'], 41, 13630, 37.2636, 127.0286),
+    ('강원특별자치도', ['춘천시', '원주시', '강릉시'], 51, 1527, 37.8813, 127.7298),
+    ('충청북도', ['청주시', '충주시'], 43, 1591, 36.6424, 127.4890),
+    ('충청남도', ['천안시', '아산시', '공주시'], 44, 2123, 36.8151, 127.1139),
+    ('전북특별자치도', ['전주시', '군산시'], 52, 1754, 35.8242, 127.1480),
+    ('전라남도', ['목포시', '여수시', '순천시'], 46, 1804, 34.8118, 126.3922),
+    ('경상북도', ['포항시', '경주시', '구미시'], 47, 2554, 36.0190, 129.3435),
+    ('경상남도', ['창원시', '김해시', '진주시'], 48, 3251, 35.2279, 128.6811),
+    ('제주특별자치도', ['제주시', '서귀포시'], 50, 675, 33.4996, 126.5312),
+]
+ROADS = ['중앙로', '테헤란로', '세종대로', '번영로', '시청로', '대학로', '해안로', '산업로', '공원로', '역전로']
+
+POSTING_COLUMNS = ['id', '제목', '상세내용', '직종', '지역', '주소', '등록일시', '급여', '경력연수', '위도', '경도']
+
+EXTENSIONS = {
+    'postings': 'csv',
+    'postings_parquet': 'parquet',
+    'regions': 'csv',
+    'wordcounts': 'csv',
+    'query_embeddings': 'npz',
+    'candidate_embeddings': 'npz',
+    'records': 'json',
+    'records_dir': '',
+}
+
+# records_dir를 나눌 파일 수
+RECORD_FILES = 4
+
+
+def korean_word(rng: random.Random) -> str:
+    return rng.choice(WORDS) + ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(0, 3)))
+
+
+def korean_text(rng: random.Random, min_words: int = 10, max_words: int = 40) -> str:
+    """조사와 어미가 붙은 한국어 문장 여러 개로 된 자유 텍스트를 생성합니다."""
+    sentences = []
+    words = rng.randint(min_words, max_words)
+    while words > 0:
+        length = min(words, rng.randint(4, 9))
+        body = ' '.join(korean_word(rng) + rng.choice(PARTICLES) for _ in range(length - 1))
+        sentences.append((f'{body} ' if body else '') + korean_word(rng) + rng.choice(ENDINGS))
+        words -= length
+    return ' '.join(sentences)
+
+
+def address(rng: random.Random, region: tuple) -> str:
+    """도로명 주소를 생성합니다 (예: 서울특별시 강남구 테헤란로 123)."""
+    return f'{region[0]} {rng.choice(region[1])} {rng.choice(ROADS)} {rng.randint(1, 300)}'
+
+
+def posting_rows(rows: int, seed: int = SEED):
+    """채용 공고 행을 순서대로 생성합니다 (급여 10%, 경력연수 5%, 상세내용 2%는 결측)."""
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    for i in range(rows):
+        region = rng.choice(REGIONS)
+        posted = start + timedelta(seconds=rng.randint(0, 365 * 24 * 3600))
+        yield [
+            i,
+            ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(4, 12))) + ' ' + rng.choice(JOBS) + ' 채용',
+            '' if rng.random() < 0.02 else korean_text(rng),
+            rng.choice(JOBS),
+            region[0],
+            address(rng, region),
+            posted.strftime('%Y-%m-%d %H:%M:%S'),
+            '' if rng.random() < 0.1 else rng.randint(2000, 9000) * 10000,
+            '' if rng.random() < 0.05 else rng.randint(0, 20),
+            round(region[4] + rng.uniform(-0.1, 0.1), 6),
+            round(region[5] + rng.uniform(-0.1, 0.1), 6),
+        ]
+
+
+def generate_postings(path: str, rows: int, seed: int = SEED):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(POSTING_COLUMNS)
+        writer.writerows(posting_rows(rows, seed))
+
+
+def generate_postings_parquet(path: str, rows: int, seed: int = SEED):
+    import pandas as pd
+    df = pd.DataFrame(posting_rows(rows, seed), columns=POSTING_COLUMNS)
+    for column in ('급여', '경력연수'):
+        df[column] = pd.to_numeric(df[column]).astype('Int64')
+    df['상세내용'] = df['상세내용'].replace('', None)
+    df.to_parquet(path, index=False)
+
+
+def generate_regions(path: str, rows: int = None, seed: int = SEED):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['지역', '지역코드', '인구'])
+        writer.writerows((name, code, population * 1000) for name, _, code, population, _, _ in REGIONS)
+
+
+def generate_wordcounts(path: str, rows: int, seed: int = SEED):
+    """단어/빈도 CSV를 생성합니다. 빈도는 순위에 반비례합니다 (Zipf 분포와 비슷)."""
+    rng = random.Random(seed)
+    words = set()
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['word', 'count'])
+        while len(words) < rows:
+            word = korean_word(rng)
+            if word in words:
+                word += str(len(words))
+            words.add(word)
+            writer.writerow([word, max(1, 100000 // len(words))])
+
+
+def generate_embeddings(path: str, rows: int, seed: int = SEED, dim: int = 128):
+    """임베딩 npz를 생성합니다. 행들이 몇 개의 중심 근처에 모이도록 만들어 유사도 분포가 실제와 비슷하게 합니다."""
+    import numpy as np
+    rng = np.random.default_rng(seed)
+    centers = np.random.default_rng(SEED).standard_normal((32, dim))
+    embeddings = centers[rng.integers(0, len(centers), rows)] + rng.standard_normal((rows, dim)) * 0.5
+    idxs = np.array([f'{seed}-{i}' for i in range(rows)])
+    np.savez(path, embeddings=embeddings.astype(np.float32), idxs=idxs)
+
+
+def record(rng: random.Random, row: list) -> dict:
+    """채용 공고 한 행을 중첩된 JSON 객체로 바꿉니다."""
+    return {
+        'id': row[0],
+        'title': row[1],
+        'company': {
+            'name': ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 5))) + '(주)',
+            'location': {'address': row[5], 'region': row[4], 'lat': row[9], 'lon': row[10]},
+        },
+        'job': {'category': row[3], 'salary': row[7] if row[7] != '' else None, 'experience': row[8] if row[8] != '' else None},
+        'tags': [korean_word(rng) for _ in range(rng.randint(0, 5))],
+        'posted_at': row[6],
+        'description': row[2],
+    }
+
+
+def generate_records(path: str, rows: int, seed: int = SEED):
+    rng = random.Random(seed)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump([record(rng, row) for row in posting_rows(rows, seed)], f, ensure_ascii=False, indent=2)
+
+
+def generate_records_dir(path: str, rows: int, seed: int = SEED):
+    rng = random.Random(seed)
+    records = [record(rng, row) for row in posting_rows(rows, seed)]
+    os.makedirs(path, exist_ok=True)
+    step = -(-len(records) // RECORD_FILES)
+    for i in range(RECORD_FILES):
+        with open(os.path.join(path, f'part-{i:02d}.json'), 'w', encoding='utf-8') as f:
+            json.dump(records[i * step:(i + 1) * step], f, ensure_ascii=False, indent=2)
+
+
+GENERATORS = {
+    'postings': generate_postings,
+    'postings_parquet': generate_postings_parquet,
+    'regions': generate_regions,
+    'wordcounts': generate_wordcounts,
+    'query_embeddings': lambda path, rows: generate_embeddings(path, rows, seed=1),
+    'candidate_embeddings': lambda path, rows: generate_embeddings(path, rows, seed=2),
+    'records': generate_records,
+    'records_dir': generate_records_dir,
+}
+
+
+def dataset_rows(name: str, rows: int) -> int:
+    """데이터셋의 실제 행 수 (regions는 행 수와 관계없이 고정)."""
+    return len(REGIONS) if name == 'regions' else rows
+
+
+def dataset(name: str, rows: int, data_dir: str) -> str:
+    """
+    data_dir에 데이터셋이 없으면 생성하고 경로를 반환합니다.
+
+    Parameters:
+    - name (str): 데이터셋 이름 (GENERATORS의 키)
+    - rows (int): 행 수
+    - data_dir (str): 생성한 파일을 저장할 디렉터리
+
+    Returns:
+    - str: 파일 또는 디렉터리 경로
+    """
+    rows = dataset_rows(name, rows)
+    extension = EXTENSIONS[name]
+    path = os.path.join(data_dir, f'{name}-{rows}' + (f'.{extension}' if extension else ''))
+    if not os.path.exists(path):
+        os.makedirs(data_dir, exist_ok=True)
+        # 생성 도중 중단되어도 불완전한 파일을 다시 쓰지 않도록 임시 이름으로 만든 뒤 이름을 바꿈
+        partial = os.path.join(data_dir, f'.partial-{name}-{rows}' + (f'.{extension}' if extension else ''))
+        GENERATORS[name](partial, rows)
+        os.replace(partial, path)
+    return path
+
+
+def dataset_size(path: str) -> int:
+    """파일 또는 디렉터리의 전체 바이트 수."""
+    if os.path.isdir(path):
+        return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+    return os.path.getsize(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--data-dir', default='/tmp/bench-data')
+    parser.add_argument('--datasets', default=None, help='쉼표로 구분한 데이터셋 목록 (기본값: 전체)')
+    args = parser.parse_args()
+
+    for name in (args.datasets.split(',') if args.datasets else GENERATORS):
+        path = dataset(name, args.rows, args.data_dir)
+        print(f'- {name}: {path} ({dataset_size(path) / 1024 / 1024:.1f} MB)')
+
+
+if __name__ == '__main__':
+    main()
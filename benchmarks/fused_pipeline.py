@@ -0,0 +1,134 @@
+"""
+단계별 Object Storage 경유 실행과 csv-pipeline 단일 프로세스 실행의 처리 시간 비교.
+
+로컬 S3 호환 서버(moto)를 띄우고 같은 체인을 두 방식으로 실행합니다.
+
+- hops: 단계마다 `python main.py`를 새 프로세스로 실행 (import, 다운로드, 파싱, 직렬화, 업로드 반복)
+- fused: csv-pipeline의 main.py 한 번으로 전체 체인 실행 (중간 결과는 메모리에서 DataFrame으로 전달)
+
+체인: csv-from-parquet -> csv-delete-missing-value -> csv-regex -> csv-transform -> csv-wordcount
+(csv-tokenize, csv-visualization-wordcloud는 JDK/konlpy, wordcloud가 필요하므로 기본 체인에서 제외)
+
+사용법:
+    python benchmarks/fused_pipeline.py --rows 200000
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ingest_memory import generate_csv  # noqa: E402
+
+BUCKET = 'bucket01'
+CHAIN = [
+    {'component': 'csv-from-parquet', 'args': {}},
+    {'component': 'csv-delete-missing-value', 'args': {'subset': ['급여']}},
+    {'component': 'csv-regex', 'args': {'settings': {'target_column': '상세내용', 'regex_pattern': '경력[가-힣]+', 'output_column': '경력'}}},
+    {'component': 'csv-transform', 'args': {'settings': {'target_column': '지역', 'lambda_function': 'lambda x: x[:2]', 'output_column': '지역약칭'}}},
+    {'component': 'csv-wordcount', 'args': {'settings': {'columns': ['경력', '지역약칭'], 'separator': ' '}}},
+]
+
+
+def location(endpoint: str, object_path: str) -> str:
+    return json.dumps({'end_point': endpoint, 'access_key': 'bench', 'secret_key': 'bench', 'bucket_name': BUCKET, 'object_path': object_path})
+
+
+def run_main(component_dir: str, env: dict) -> float:
+    start = time.time()
+    out = subprocess.run([sys.executable, 'main.py'], cwd=component_dir, env=env, capture_output=True, text=True)
+    if out.returncode != 0:
+        raise RuntimeError(f'{os.path.basename(component_dir)} 실패:\n{out.stderr}')
+    return time.time() - start
+
+
+def base_env(endpoint: str) -> dict:
+    env = dict(os.environ, APP_ENV='production', PYTHONPATH=ROOT, AWS_DEFAULT_REGION='us-east-1')
+    env.pop('STEPS', None)
+    return env
+
+
+def run_hops(endpoint: str, source: str) -> tuple:
+    timings = []
+    current = source
+    for i, step in enumerate(CHAIN, 1):
+        target = f'hops/{i:02d}_{step["component"]}.csv'
+        env = base_env(endpoint)
+        env.update(
+            INPUT1=location(endpoint, current),
+            OUTPUT1=location(endpoint, target),
+            TASK_REPORT=location(endpoint, f'hops/{i:02d}_report.md'),
+        )
+        # 컴포넌트 config.py production args는 키 이름을 대문자로 바꾼 환경변수에서 JSON으로 읽음
+        env.update({key.upper(): json.dumps(value) for key, value in step['args'].items()})
+        timings.append((step['component'], run_main(os.path.join(ROOT, step['component']), env)))
+        current = target
+    return timings, current
+
+
+def run_fused(endpoint: str, source: str) -> tuple:
+    target = 'fused/result.csv'
+    env = base_env(endpoint)
+    env.update(
+        INPUT1=location(endpoint, source),
+        OUTPUT1=location(endpoint, target),
+        TASK_REPORT=location(endpoint, 'fused/pipeline_report.md'),
+        STEPS=json.dumps(CHAIN),
+    )
+    return run_main(os.path.join(ROOT, 'csv-pipeline'), env), target
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--port', type=int, default=5070)
+    args = parser.parse_args()
+
+    import boto3
+    import pandas as pd
+    from moto.server import ThreadedMotoServer
+
+    server = ThreadedMotoServer(port=args.port)
+    server.start()
+    endpoint = f'http://127.0.0.1:{args.port}'
+    try:
+        s3 = boto3.resource('s3', endpoint_url=endpoint, aws_access_key_id='bench', aws_secret_access_key='bench', region_name='us-east-1')
+        s3.create_bucket(Bucket=BUCKET)
+        with tempfile.TemporaryDirectory() as workdir:
+            csv_path = os.path.join(workdir, 'input.csv')
+            parquet_path = os.path.join(workdir, 'input.parquet')
+            print(f'- 테스트 데이터 생성: {args.rows:,}행')
+            generate_csv(csv_path, args.rows)
+            pd.read_csv(csv_path).to_parquet(parquet_path)
+            s3.Object(BUCKET, 'input/job_postings.parquet').upload_file(parquet_path)
+            size_mb = os.path.getsize(parquet_path) / 1024 / 1024
+
+        hop_timings, hop_output = run_hops(endpoint, 'input/job_postings.parquet')
+        fused_time, fused_output = run_fused(endpoint, 'input/job_postings.parquet')
+
+        hop_bytes = s3.Object(BUCKET, hop_output).get()['Body'].read()
+        fused_bytes = s3.Object(BUCKET, fused_output).get()['Body'].read()
+        intermediate = sum(s3.Object(BUCKET, f'hops/{i:02d}_{step["component"]}.csv').content_length for i, step in enumerate(CHAIN[:-1], 1))
+    finally:
+        server.stop()
+
+    hop_total = sum(t for _, t in hop_timings)
+    print(f'\n입력: Parquet {size_mb:.1f} MB, {len(CHAIN)}단계\n')
+    print('| 단계 | hops (초) |')
+    print('|---|---|')
+    for component, seconds in hop_timings:
+        print(f'| {component} | {seconds:.2f} |')
+    print(f'| **hops 합계** | **{hop_total:.2f}** |')
+    print(f'| **fused** | **{fused_time:.2f}** |')
+    print(f'\n- 단계 사이 업로드/다운로드된 중간 CSV: {intermediate / 1024 / 1024:.1f} MB (fused는 0)')
+    print(f'- 속도 향상: {hop_total / fused_time:.1f}배')
+    print(f"- 최종 결과 일치 여부: {'일치' if hop_bytes == fused_bytes else '불일치 (중간 결과의 컬럼 타입이 CSV 재파싱 없이 유지됨)'}")
+
+
+if __name__ == '__main__':
+    main()
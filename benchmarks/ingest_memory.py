@@ -0,0 +1,112 @@
+"""
+CSV 수집 경로별 최대 메모리 사용량 비교.
+
+한국어 텍스트 CSV를 생성한 뒤, 각 수집 방식을 별도 프로세스에서 실행하여
+최대 RSS(ru_maxrss)와 소요 시간을 측정합니다.
+
+- stringio: 기존 방식 (bytes 전체 읽기 -> decode -> StringIO -> pd.read_csv)
+- bytes-c: 바이너리 스트림을 C 파서가 직접 읽음 (common.tabular.read_csv 기본값)
+- bytes-pyarrow: 바이너리 스트림을 pyarrow 파서가 직접 읽음 (CSV_ENGINE=pyarrow)
+
+사용법:
+    python benchmarks/ingest_memory.py --rows 500000
+"""
+import argparse
+import io
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+METHODS = ['stringio', 'bytes-c', 'bytes-pyarrow']
+
+SYLLABLES = '가나다라마바사아자차카타파하거너더러머버서어저처커터퍼허고노도로모보소오조초코토포호구누두루무부수우주추쿠투푸후'
+WORDS = ['서울특별시', '경기도', '데이터', '분석', '채용', '근무조건', '연봉제', '월급제', '시급제', '정규직', '계약직', '경력', '신입', '우대사항']
+
+
+def generate_csv(path: str, rows: int, seed: int = 42):
+    """한국어 자유 텍스트와 숫자 컬럼을 가진 CSV 파일을 생성합니다."""
+    rng = random.Random(seed)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('id,제목,상세내용,지역,급여\n')
+        for i in range(rows):
+            title = ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(4, 12)))
+            body = ' '.join(rng.choice(WORDS) + ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 4))) for _ in range(rng.randint(10, 30)))
+            region = rng.choice(WORDS[:2])
+            salary = '' if rng.random() < 0.1 else str(rng.randint(2000, 9000))
+            f.write(f'{i},{title},"{body}",{region},{salary}\n')
+
+
+def peak_rss_mb() -> float:
+    # Linux에서 ru_maxrss 단위는 KB
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_method(method: str, path: str) -> dict:
+    sys.path.insert(0, ROOT)
+    import pandas as pd
+    from common.tabular import read_csv
+
+    baseline = peak_rss_mb()
+    start = time.time()
+    # 네트워크 스트림과 같이 seek 없이 순차적으로만 읽히는 원본을 가정
+    raw = open(path, 'rb', buffering=0)
+    if method == 'stringio':
+        content = raw.read().decode('utf-8')
+        df = pd.read_csv(io.StringIO(content))
+    elif method == 'bytes-c':
+        df = read_csv(io.BufferedReader(raw), engine='c')
+    elif method == 'bytes-pyarrow':
+        df = read_csv(io.BufferedReader(raw), engine='pyarrow')
+    else:
+        raise ValueError(method)
+    elapsed = time.time() - start
+    return {
+        'method': method,
+        'rows': len(df),
+        'baseline_mb': baseline,
+        'peak_mb': peak_rss_mb(),
+        'elapsed': elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=500000)
+    parser.add_argument('--path', default='/tmp/ingest_memory_ko.csv')
+    parser.add_argument('--method', choices=METHODS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.method:
+        print(json.dumps(run_method(args.method, args.path)))
+        return
+
+    if not os.path.exists(args.path):
+        print(f'- 테스트 데이터 생성: {args.path} ({args.rows:,}행)')
+        generate_csv(args.path, args.rows)
+    size_mb = os.path.getsize(args.path) / 1024 / 1024
+
+    results = []
+    for method in METHODS:
+        out = subprocess.run(
+            [sys.executable, __file__, '--path', args.path, '--method', method],
+            capture_output=True, text=True
+        )
+        if out.returncode != 0:
+            print(f'- {method} 실패: {out.stderr.strip().splitlines()[-1]}')
+            continue
+        results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+
+    print(f'\n입력 파일 크기: {size_mb:.1f} MB\n')
+    print('| 방식 | 행 수 | 최대 RSS (MB) | 증가량 (MB) | 소요 시간 (초) |')
+    print('|---|---|---|---|---|')
+    for r in results:
+        print(f"| {r['method']} | {r['rows']:,} | {r['peak_mb']:.1f} | {r['peak_mb'] - r['baseline_mb']:.1f} | {r['elapsed']:.2f} |")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+"""
+CSV / Parquet / Arrow IPC 중간 형식별 5단계 파이프라인 처리 시간 비교.
+
+각 단계 컴포넌트의 algorithm.solution을 순서대로 실행하고, 단계 사이의 중간 결과를
+지정한 형식의 로컬 파일로 주고받습니다. 확장자만 바꾸면 common.tabular가 형식을
+선택하므로 컴포넌트 코드는 동일합니다.
+
+1. csv-delete-missing-value: 금액1 결측 행 제거
+2. csv-arithmetic-operation: 합계 = 금액1 + 금액2
+3. csv-change-column-name: 합계 -> 총액
+4. csv-sort: 총액 기준 정렬
+5. csv-statistic-summary: 지역별 총액 통계
+
+사용법:
+    python benchmarks/interchange_chain.py --rows 500000 --repeat 3
+"""
+import argparse
+import contextlib
+import importlib.util
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+FORMATS = {'csv': '.csv', 'parquet': '.parquet', 'arrow': '.arrow'}
+REGIONS = ['서울특별시', '부산광역시', '대구광역시', '인천광역시', '광주광역시', '대전광역시', '울산광역시', '경기도']
+
+
+def load_solution(component: str):
+    """컴포넌트 디렉터리의 algorithm.solution을 모듈 이름 충돌 없이 불러옵니다."""
+    component_dir = os.path.join(ROOT, component)
+    # 일부 algorithm.py는 컴포넌트의 config 패키지를 import 하므로 해당 디렉터리를 경로에 추가
+    for name in [m for m in sys.modules if m == 'config' or m.startswith('config.')]:
+        del sys.modules[name]
+    sys.path.insert(0, component_dir)
+    try:
+        spec = importlib.util.spec_from_file_location(f'{component.replace("-", "_")}_algorithm', os.path.join(component_dir, 'algorithm.py'))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(component_dir)
+    return module.solution
+
+
+def generate_input(path: str, rows: int, seed: int = 42):
+    """지역, 날짜, 결측값이 섞인 금액 컬럼, 한국어 메모를 가진 CSV 파일을 생성합니다."""
+    rng = random.Random(seed)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('id,지역,일자,금액1,금액2,메모\n')
+        for i in range(rows):
+            amount1 = '' if rng.random() < 0.05 else f'{rng.uniform(0, 100000):.2f}'
+            amount2 = f'{rng.uniform(0, 50000):.2f}'
+            f.write(f'{i},{rng.choice(REGIONS)},2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d},'
+                    f'{amount1},{amount2},메모 {rng.randint(0, 999)}\n')
+
+
+def run_chain(source: str, workdir: str, ext: str) -> list:
+    steps = [
+        ('csv-delete-missing-value', lambda solve, src, dst: solve(src, dst, ['금액1'])),
+        ('csv-arithmetic-operation', lambda solve, src, dst: solve(src, dst, ['금액1', '금액2'], ['+'], '합계')),
+        ('csv-change-column-name', lambda solve, src, dst: solve(src, ['합계'], ['총액'], dst)),
+        ('csv-sort', lambda solve, src, dst: solve(src, dst, ['총액'], True)),
+        ('csv-statistic-summary', lambda solve, src, dst: solve(src, dst, ['총액'], ['지역'], ['mean', 'max', 'min'])),
+    ]
+    timings = []
+    current = source
+    for i, (component, run) in enumerate(steps, 1):
+        solve = load_solution(component)
+        target = os.path.join(workdir, f'step{i}{ext}')
+        start = time.time()
+        with contextlib.redirect_stdout(io.StringIO()):
+            run(solve, current, target)
+        timings.append((component, time.time() - start, os.path.getsize(target)))
+        current = target
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=500000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--formats', default=','.join(FORMATS))
+    args = parser.parse_args()
+
+    import pandas as pd
+    from common.tabular import write_table
+
+    with tempfile.TemporaryDirectory() as workdir:
+        csv_path = os.path.join(workdir, 'input.csv')
+        print(f'- 테스트 데이터 생성: {args.rows:,}행')
+        generate_input(csv_path, args.rows)
+        source_df = pd.read_csv(csv_path)
+
+        results = {}
+        for fmt in args.formats.split(','):
+            ext = FORMATS[fmt]
+            # 첫 단계 입력도 같은 형식으로 준비 (상위 단계가 이미 해당 형식으로 저장했다고 가정)
+            source = os.path.join(workdir, f'input{ext}')
+            write_table(source_df, source)
+            best = None
+            for _ in range(args.repeat):
+                timings = run_chain(source, workdir, ext)
+                total = sum(t for _, t, _ in timings)
+                if best is None or total < best[0]:
+                    best = (total, timings)
+            results[fmt] = best
+
+    print(f'\n5단계 체인 처리 시간 (최소값, {args.repeat}회 반복)\n')
+    fmts = list(results)
+    print('| 단계 | ' + ' | '.join(f'{f} (초)' for f in fmts) + ' | ' + ' | '.join(f'{f} 크기 (MB)' for f in fmts) + ' |')
+    print('|---' * (1 + 2 * len(fmts)) + '|')
+    for i, (component, _, _) in enumerate(results[fmts[0]][1]):
+        seconds = ' | '.join(f'{results[f][1][i][1]:.2f}' for f in fmts)
+        sizes = ' | '.join(f'{results[f][1][i][2] / 1024 / 1024:.1f}' for f in fmts)
+        print(f'| {component} | {seconds} | {sizes} |')
+    print('| **합계** | ' + ' | '.join(f'**{results[f][0]:.2f}**' for f in fmts) + ' |' + ' |' * len(fmts))
+
+
+if __name__ == '__main__':
+    main()
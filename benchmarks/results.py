@@ -0,0 +1,93 @@
+"""
+벤치마크 결과 저장소.
+
+components.py의 측정 결과를 git 리비전, 입력 프로필, 실행 환경과 함께 JSON Lines 파일에 한 줄씩 덧붙입니다.
+같은 리비전을 여러 번 측정하면 기록이 쌓이고, compare.py는 리비전별로 모은 반복 측정값을 비교합니다.
+파일은 로컬 기록용이므로 저장소에 커밋하지 않습니다 (.gitignore).
+"""
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 기본 결과 파일
+RESULTS_PATH = os.path.join(ROOT, 'benchmarks', 'results.jsonl')
+
+# 커밋되지 않은 변경이 있는 작업 트리에서 측정한 리비전에 붙이는 표시
+DIRTY_SUFFIX = '-dirty'
+
+
+def git(*args) -> str:
+    out = subprocess.run(['git', *args], cwd=ROOT, capture_output=True, text=True)
+    return out.stdout.strip() if out.returncode == 0 else None
+
+
+def current_revision() -> dict:
+    """
+    측정한 코드의 git 리비전을 반환합니다. benchmarks/ 밖(컴포넌트, common)에 커밋되지 않은 변경이 있으면 dirty.
+    """
+    commit = git('rev-parse', 'HEAD')
+    changes = git('status', '--porcelain', '--untracked-files=no', '--', '.', ':!benchmarks')
+    return {'revision': commit or 'unknown', 'dirty': bool(changes), 'subject': git('log', '-1', '--format=%s') or ''}
+
+
+def revision_label(record: dict) -> str:
+    return record['revision'][:12] + (DIRTY_SUFFIX if record.get('dirty') else '')
+
+
+def resolve_revision(name: str) -> str:
+    """
+    git ref(HEAD, 브랜치, 커밋 해시 앞부분 등)를 리비전 표시(12자리 해시, dirty 표시 포함)로 바꿉니다.
+    '-dirty'로 끝나면 그 커밋 위의 커밋되지 않은 변경을 측정한 기록을 가리킵니다.
+    git으로 찾을 수 없으면 이름을 그대로 반환합니다 (저장소에 기록된 해시 앞부분으로 비교).
+    """
+    dirty = name.endswith(DIRTY_SUFFIX)
+    ref = name[:-len(DIRTY_SUFFIX)] if dirty else name
+    commit = git('rev-parse', '--verify', '--quiet', ref + '^{commit}')
+    return (commit[:12] if commit else ref) + (DIRTY_SUFFIX if dirty else '')
+
+
+def environment() -> dict:
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def append_results(path: str, results: list, **extra):
+    """
+    결과 목록에 리비전, 실행 환경, 기록 시각과 extra 값을 붙여 path에 한 줄씩 덧붙입니다.
+
+    Parameters:
+    - path (str): JSON Lines 결과 파일
+    - results (list): components.py의 결과 dict 목록
+    - **extra: 기록마다 함께 저장할 값 (예: 반복 횟수)
+    """
+    meta = dict(current_revision(), recorded_at=datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                environment=environment(), **extra)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'a', encoding='utf-8') as f:
+        for result in results:
+            f.write(json.dumps(dict(meta, **result), ensure_ascii=False) + '\n')
+
+
+def load_results(path: str) -> list:
+    """
+    결과 파일의 기록을 저장된 순서대로 반환합니다. 읽을 수 없는 줄(쓰다 중단된 줄 등)은 건너뜁니다.
+    """
+    records = []
+    with open(path, encoding='utf-8') as f:
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                print(f'Skipping unreadable line {number} in {path}', file=sys.stderr)
+    return records
@@ -0,0 +1,128 @@
+"""
+컴포넌트별 시작(import) 시간 비교.
+
+각 컴포넌트의 main.py에서 모듈 수준 import 문만 골라 새 인터프리터에서 실행하고,
+import에 걸린 시간과 `-X importtime` 기록 중 누적 시간이 가장 긴 최상위 import를 표로 출력합니다.
+무거운 라이브러리(torch, matplotlib, konlpy 등)를 필요한 코드 경로에서 불러오도록 바꾼 뒤
+콜드 스타트가 다시 느려지지 않았는지 확인할 때 사용합니다.
+
+--json으로 결과를 저장하고, 다음 측정에서 --baseline으로 넘기면 이전 결과와의 차이를 함께 표시합니다.
+설치되지 않은 라이브러리를 import하는 컴포넌트는 상태 칸에 누락된 모듈을 표시합니다.
+
+사용법:
+    python benchmarks/startup_imports.py --repeat 3 --json startup.json
+    python benchmarks/startup_imports.py --baseline startup.json
+"""
+import argparse
+import ast
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MARKER = '--startup-imports--'
+
+
+def main_imports(component: str) -> str:
+    """main.py의 모듈 수준 import 문만 소스 코드로 반환합니다 (작업은 실행하지 않음)."""
+    path = os.path.join(ROOT, component, 'main.py')
+    with open(path, encoding='utf-8') as f:
+        source = f.read()
+    tree = ast.parse(source)
+    lines = source.splitlines()
+    statements = []
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            statements.append('\n'.join(lines[node.lineno - 1:node.end_lineno]))
+    return '\n'.join(statements)
+
+
+def measure(component: str) -> dict:
+    """새 인터프리터에서 import 문을 실행해 걸린 시간과 최상위 import별 누적 시간을 측정합니다."""
+    code = (
+        'import sys, time\n'
+        f'sys.stderr.write({MARKER!r} + "\\n")\n'
+        'start = time.perf_counter()\n'
+        f'{main_imports(component)}\n'
+        'sys.stdout.write(repr((time.perf_counter() - start, len(sys.modules))))\n'
+    )
+    env = dict(os.environ, PYTHONPATH=ROOT, APP_ENV='development')
+    out = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=os.path.join(ROOT, component),
+                         env=env, capture_output=True, text=True)
+    stderr = out.stderr.split(MARKER, 1)[-1]
+    if out.returncode != 0:
+        error = [line for line in stderr.splitlines() if line and not line.startswith('import time:')]
+        return {'status': error[-1] if error else f'exit {out.returncode}'}
+
+    # "import time: self | cumulative | <들여쓰기>name" 중 들여쓰기가 없는 줄이 최상위 import
+    top_level = []
+    for line in stderr.splitlines():
+        fields = line[len('import time:'):].split('|') if line.startswith('import time:') else []
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        _, cumulative_us, name = fields
+        if not name[1:].startswith(' '):
+            top_level.append((name.strip(), int(cumulative_us) / 1000))
+    seconds, modules = ast.literal_eval(out.stdout.strip().splitlines()[-1])
+    return {
+        'status': 'ok',
+        'seconds': seconds,
+        'modules': modules,
+        'heaviest': sorted(top_level, key=lambda item: item[1], reverse=True)[:3],
+    }
+
+
+def components() -> list:
+    return sorted(
+        name for name in os.listdir(ROOT)
+        if os.path.isfile(os.path.join(ROOT, name, 'main.py')) and os.path.isdir(os.path.join(ROOT, name, 'config'))
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--components', default=None, help='쉼표로 구분한 컴포넌트 목록 (기본값: 전체)')
+    parser.add_argument('--json', default=None, help='결과를 저장할 JSON 파일')
+    parser.add_argument('--baseline', default=None, help='비교할 이전 결과 JSON 파일')
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    results = {}
+    for component in (args.components.split(',') if args.components else components()):
+        best = None
+        for _ in range(args.repeat):
+            result = measure(component)
+            if result['status'] != 'ok':
+                best = result
+                break
+            if best is None or result['seconds'] < best['seconds']:
+                best = result
+        results[component] = best
+        print(f'- {component}: ' + (f"{best['seconds'] * 1000:.0f} ms" if best['status'] == 'ok' else best['status']), file=sys.stderr)
+
+    print(f'\n컴포넌트별 main.py import 시간 (최소값, {args.repeat}회 반복)\n')
+    print('| 컴포넌트 | import (ms) | 이전 대비 (ms) | 모듈 수 | 누적 시간 상위 import (ms) | 상태 |')
+    print('|---|---|---|---|---|---|')
+    for component, result in results.items():
+        if result['status'] != 'ok':
+            print(f'| {component} | - | - | - | - | {result["status"]} |')
+            continue
+        previous = baseline.get(component, {})
+        delta = f"{(result['seconds'] - previous['seconds']) * 1000:+.0f}" if previous.get('status') == 'ok' else '-'
+        heaviest = ', '.join(f'{name} {ms:.0f}' for name, ms in result['heaviest'])
+        print(f"| {component} | {result['seconds'] * 1000:.0f} | {delta} | {result['modules']} | {heaviest} | 성공 |")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == '__main__':
+    main()
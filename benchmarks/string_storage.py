@@ -0,0 +1,128 @@
+"""
+텍스트 컬럼 저장 방식(STRING_STORAGE)별 메모리 사용량과 처리 시간 비교.
+
+한국어 텍스트 CSV를 생성한 뒤, 각 모드를 별도 프로세스에서 실행하여
+읽기, 정규표현식 추출(csv-regex), 단어 분리 집계(csv-wordcount) 시간과
+DataFrame 메모리, 최대 RSS(ru_maxrss)를 측정합니다.
+
+- python: 기존 방식 (object dtype, 셀마다 Python 문자열 객체)
+- pyarrow: STRING_STORAGE=pyarrow (string[pyarrow], Arrow 버퍼에 연속 저장)
+
+사용법:
+    python benchmarks/string_storage.py --rows 1000000
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+MODES = ['python', 'pyarrow']
+
+from ingest_memory import generate_csv, peak_rss_mb  # noqa: E402
+
+
+def run_mode(mode: str, path: str) -> dict:
+    # STRING_STORAGE는 common.tabular import 시점에 읽으므로 먼저 설정
+    os.environ['STRING_STORAGE'] = mode
+    sys.path.insert(0, ROOT)
+    import pandas as pd
+    if mode == 'python':
+        # 운영 환경(pandas 2.x)과 같이 텍스트 컬럼을 object dtype으로 읽음
+        try:
+            pd.set_option('future.infer_string', False)
+        except (KeyError, pd.errors.OptionError):
+            pass
+    from common.tabular import read_table, as_string_storage, arrow_strings_enabled
+
+    baseline = peak_rss_mb()
+    start = time.time()
+    df = read_table(path)
+    load = time.time() - start
+    memory_mb = df.memory_usage(deep=True).sum() / 1024 / 1024
+
+    # csv-regex와 같은 방식으로 첫 번째 매치 추출
+    # (string[pyarrow]의 str.extract는 이 데이터에서 apply보다 느려 컴포넌트는 apply를 유지)
+    start = time.time()
+    pattern = re.compile('경력[가-힣]+')
+    extracted = df['상세내용'].apply(lambda x: (m.group() if (m := pattern.search(x)) else None) if isinstance(x, str) else None)
+    regex = time.time() - start
+
+    # csv-wordcount와 같은 방식으로 공백 기준 단어 집계
+    start = time.time()
+    if arrow_strings_enabled():
+        entries = df['상세내용'].dropna()
+        total = 0
+        for i in range(0, len(entries), 100000):
+            total += entries.iloc[i:i + 100000].str.split(' ', regex=False).explode().value_counts(sort=False).sum()
+        counts = pd.Series([total])
+    else:
+        from collections import Counter
+        counter = Counter()
+        for entry in df['상세내용'].dropna():
+            counter.update(str(entry).split(' '))
+        counts = pd.Series(counter)
+    wordcount = time.time() - start
+
+    # csv-tokenize와 같이 문자열 결과 컬럼을 추가
+    start = time.time()
+    df['추출'] = as_string_storage(extracted)
+    assign = time.time() - start
+
+    return {
+        'mode': mode,
+        'rows': len(df),
+        'words': int(counts.sum()),
+        'memory_mb': memory_mb,
+        'baseline_mb': baseline,
+        'peak_mb': peak_rss_mb(),
+        'load': load,
+        'regex': regex,
+        'wordcount': wordcount,
+        'assign': assign,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--path', default='/tmp/string_storage_ko.csv')
+    parser.add_argument('--mode', choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_mode(args.mode, args.path)))
+        return
+
+    if not os.path.exists(args.path):
+        print(f'- 테스트 데이터 생성: {args.path} ({args.rows:,}행)')
+        generate_csv(args.path, args.rows)
+    size_mb = os.path.getsize(args.path) / 1024 / 1024
+
+    results = []
+    for mode in MODES:
+        out = subprocess.run(
+            [sys.executable, __file__, '--path', args.path, '--mode', mode],
+            capture_output=True, text=True
+        )
+        if out.returncode != 0:
+            print(f'- {mode} 실패: {out.stderr.strip().splitlines()[-1]}')
+            continue
+        results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+
+    print(f'\n입력 파일 크기: {size_mb:.1f} MB\n')
+    print('| 모드 | 행 수 | DataFrame 메모리 (MB) | 최대 RSS (MB) | 읽기 (초) | 정규표현식 (초) | 단어 집계 (초) | 컬럼 추가 (초) |')
+    print('|---|---|---|---|---|---|---|---|')
+    for r in results:
+        print(f"| {r['mode']} | {r['rows']:,} | {r['memory_mb']:.1f} | {r['peak_mb']:.1f} | {r['load']:.2f} | "
+              f"{r['regex']:.2f} | {r['wordcount']:.2f} | {r['assign']:.2f} |")
+    if len(results) == 2 and results[0]['words'] != results[1]['words']:
+        print('\n- 경고: 모드별 단어 수가 다릅니다')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+"""
+컴포넌트를 작업마다 새 프로세스로 실행할 때와 상주 워커(WORKER_PORT)로 실행할 때의 지연 시간 비교.
+
+로컬 S3 호환 서버(moto)를 띄우고 csv-pipeline으로 같은 작업을 여러 번 실행합니다.
+
+- cold: 작업마다 `python main.py`를 새 프로세스로 실행 (인터프리터 시작, import, 모델 로드 반복)
+- warm: `WORKER_PORT`로 워커를 한 번 띄운 뒤 POST /jobs로 같은 args를 전달
+
+워커의 콜드 스타트 시간(/health의 cold_start)과 작업별 처리 시간을 따로 출력합니다.
+기본 체인은 설치 환경에 관계없이 실행되도록 pandas만 사용하는 컴포넌트로 구성하며,
+--steps로 csv-tokenize, csv-embedding 등 시작 비용이 큰 컴포넌트가 포함된 체인을 지정할 수 있습니다.
+
+사용법:
+    python benchmarks/warm_worker.py --rows 20000 --jobs 5
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ingest_memory import generate_csv  # noqa: E402
+from fused_pipeline import BUCKET, base_env, location  # noqa: E402
+
+DEFAULT_STEPS = [
+    {'component': 'csv-regex', 'args': {'settings': {'target_column': '상세내용', 'regex_pattern': '경력[가-힣]+', 'output_column': '경력'}}},
+    {'component': 'csv-wordcount', 'args': {'settings': {'columns': ['경력'], 'separator': ' '}}},
+]
+
+
+def job_args(endpoint: str, steps: list, job: int) -> dict:
+    return {
+        'input1': json.loads(location(endpoint, 'input/job_postings.csv')),
+        'steps': steps,
+        'output1': json.loads(location(endpoint, f'worker/{job:02d}_result.csv')),
+        'checkpoint': {},
+        'task_report': json.loads(location(endpoint, f'worker/{job:02d}_report.md')),
+    }
+
+
+def run_cold(endpoint: str, steps: list, jobs: int) -> list:
+    latencies = []
+    for job in range(1, jobs + 1):
+        env = base_env(endpoint)
+        env.update({key.upper(): json.dumps(value) for key, value in job_args(endpoint, steps, job).items()})
+        start = time.time()
+        out = subprocess.run([sys.executable, 'main.py'], cwd=os.path.join(ROOT, 'csv-pipeline'), env=env, capture_output=True, text=True)
+        if out.returncode != 0:
+            raise RuntimeError(f'cold 실행 실패:\n{out.stderr}')
+        latencies.append(time.time() - start)
+    return latencies
+
+
+def request(url: str, body: dict = None) -> dict:
+    data = json.dumps(body).encode('utf-8') if body is not None else None
+    req = urllib.request.Request(url, data=data, headers={'Content-Type': 'application/json'})
+    with urllib.request.urlopen(req) as res:
+        return json.loads(res.read())
+
+
+def run_warm(endpoint: str, steps: list, jobs: int, port: int) -> tuple:
+    env = base_env(endpoint)
+    env.update(WORKER_PORT=str(port), STEPS=json.dumps(steps))
+    started = time.time()
+    worker = subprocess.Popen([sys.executable, 'main.py'], cwd=os.path.join(ROOT, 'csv-pipeline'), env=env,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    try:
+        while True:
+            if worker.poll() is not None:
+                raise RuntimeError(f'워커 시작 실패:\n{worker.stderr.read()}')
+            try:
+                health = request(f'http://127.0.0.1:{port}/health')
+                break
+            except OSError:
+                time.sleep(0.05)
+        ready = time.time() - started
+        latencies = []
+        for job in range(1, jobs + 1):
+            # 클라이언트가 보는 지연 (HTTP 왕복 포함)과 워커가 측정한 작업 처리 시간
+            start = time.time()
+            result = request(f'http://127.0.0.1:{port}/jobs', job_args(endpoint, steps, jobs + job))
+            latencies.append((time.time() - start, result['latency']))
+    finally:
+        worker.terminate()
+        worker.wait()
+    return health['cold_start'], ready, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--jobs', type=int, default=5)
+    parser.add_argument('--steps', type=json.loads, default=DEFAULT_STEPS, help='csv-pipeline STEPS JSON')
+    parser.add_argument('--port', type=int, default=5071)
+    parser.add_argument('--worker-port', type=int, default=5072)
+    args = parser.parse_args()
+
+    import boto3
+    from moto.server import ThreadedMotoServer
+
+    server = ThreadedMotoServer(port=args.port)
+    server.start()
+    endpoint = f'http://127.0.0.1:{args.port}'
+    try:
+        s3 = boto3.resource('s3', endpoint_url=endpoint, aws_access_key_id='bench', aws_secret_access_key='bench', region_name='us-east-1')
+        s3.create_bucket(Bucket=BUCKET)
+        with tempfile.TemporaryDirectory() as workdir:
+            csv_path = os.path.join(workdir, 'input.csv')
+            print(f'- 테스트 데이터 생성: {args.rows:,}행')
+            generate_csv(csv_path, args.rows)
+            s3.Object(BUCKET, 'input/job_postings.csv').upload_file(csv_path)
+
+        cold = run_cold(endpoint, args.steps, args.jobs)
+        cold_start, ready, warm = run_warm(endpoint, args.steps, args.jobs, args.worker_port)
+        same = all(
+            s3.Object(BUCKET, f'worker/{job:02d}_result.csv').get()['Body'].read()
+            == s3.Object(BUCKET, f'worker/{args.jobs + job:02d}_result.csv').get()['Body'].read()
+            for job in range(1, args.jobs + 1)
+        )
+    finally:
+        server.stop()
+
+    print(f"\n체인: {' -> '.join(step['component'] for step in args.steps)}, 작업 {args.jobs}회\n")
+    print('| 작업 | cold (초) | warm 요청 지연 (초) | warm 작업 처리 (초) |')
+    print('|---|---|---|---|')
+    for job, (c, (w, l)) in enumerate(zip(cold, warm), 1):
+        print(f'| {job} | {c:.2f} | {w:.2f} | {l:.2f} |')
+    print(f'| **합계** | **{sum(cold):.2f}** | **{sum(w for w, _ in warm):.2f}** | **{sum(l for _, l in warm):.2f}** |')
+    print(f'\n- 워커 콜드 스타트 (프로세스 시작 -> 요청 수신 준비, 1회): {cold_start:.2f}초 (health 응답까지 {ready:.2f}초)')
+    print(f'- cold 작업당 평균: {sum(cold) / len(cold):.2f}초, warm 작업당 평균: {sum(w for w, _ in warm) / len(warm):.2f}초')
+    print(f"- 결과 일치 여부: {'일치' if same else '불일치'}")
+
+
+if __name__ == '__main__':
+    main()
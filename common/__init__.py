@@ -0,0 +1,14 @@
+"""
+파이프라인 컴포넌트 공통 모듈.
+
+각 컴포넌트의 main.py에 복사되어 있던 Object Storage 입출력 등의
+공통 기능을 한 곳에서 관리합니다.
+"""
+from common.startup import enable_import_profile
+from common.profiler import start_profile
+
+# STARTUP_PROFILE=true이면 이후 import 시간을 모듈별로 측정 (컴포넌트 main.py는 config 다음에 common을 import)
+enable_import_profile()
+
+# PROFILE이 설정되어 있으면 실행 프로파일 시작 (작업 보고서를 저장할 때 flamegraph와 함께 업로드)
+start_profile()
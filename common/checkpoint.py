@@ -0,0 +1,217 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+import numpy as np
+from common.storage import create_s3_client, head_object, get_object, put_object, delete_object
+from common.memo import component_version, memo_key
+from common.incremental import incremental_row_offset
+
+# true이면 오래 걸리는 컴포넌트가 처리한 결과를 주기적으로 저장하고, 다시 시작하면 이어서 처리
+CHECKPOINT = os.getenv('CHECKPOINT', 'false').lower() == 'true'
+
+# 체크포인트를 저장할 로컬 디렉터리 (영구 볼륨). 지정하지 않으면 output1 옆(<output1 경로>.checkpoint/)에 저장
+CHECKPOINT_DIR = os.getenv('CHECKPOINT_DIR', '')
+
+# 체크포인트 저장 간격 (초)
+CHECKPOINT_INTERVAL = float(os.getenv('CHECKPOINT_INTERVAL', '60'))
+
+PROGRESS = 'progress.json'
+
+_state = {'checkpoint': None}
+
+
+class Checkpoint:
+    """
+    행 단위로 처리하는 컴포넌트의 진행 상황을 구간(segment) 단위로 저장하고 복원하는 객체.
+
+    save는 마지막 저장 이후 새로 처리한 결과만 segment-NNNNN.npz로 저장한 뒤 progress.json을
+    갱신하므로, 저장 도중 중단되어도 progress.json에 기록된 구간까지는 항상 온전합니다.
+    progress.json의 key(입력 ETag, 설정, 컴포넌트 버전의 해시)가 다르면 이전 체크포인트를 버립니다.
+
+    Parameters:
+    - key (str): 입력과 설정을 식별하는 해시
+    - local_dir (str): 로컬 저장 디렉터리 (지정하면 S3 대신 사용)
+    - s3_resource: 체크포인트를 저장할 S3 리소스
+    - bucket_name (str): 버킷 이름
+    - prefix (str): 체크포인트 객체 prefix
+    - interval (float): 저장 간격 (초)
+    """
+
+    def __init__(self, key: str, local_dir: str = None, s3_resource=None, bucket_name: str = None, prefix: str = None,
+                 interval: float = CHECKPOINT_INTERVAL):
+        self.key = key
+        self.local_dir = local_dir
+        self.s3_resource = s3_resource
+        self.bucket_name = bucket_name
+        self.prefix = prefix
+        self.interval = interval
+        self.location = local_dir if local_dir else f'{bucket_name}/{prefix}'
+        self.segments = []
+        self.position = 0
+        self.resumed_from = 0
+        self.state = {}
+        self.saves = 0
+        self.save_time = 0.0
+        self.started = time.time()
+        self._last_save = time.time()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.local_dir, name) if self.local_dir else f'{self.prefix}/{name}'
+
+    def _read(self, name: str, local_file_path: str) -> bool:
+        if self.local_dir:
+            if not os.path.exists(self._path(name)):
+                return False
+            shutil.copyfile(self._path(name), local_file_path)
+            return True
+        if head_object(self.s3_resource, self.bucket_name, self._path(name)) is None:
+            return False
+        with get_object(self.s3_resource, self.bucket_name, self._path(name), mode='rb') as src, open(local_file_path, 'wb') as dst:
+            shutil.copyfileobj(src, dst)
+        return True
+
+    def _write(self, name: str, local_file_path: str):
+        if self.local_dir:
+            # 같은 디렉터리에 쓴 뒤 이름을 바꾸어 중간에 중단되어도 파일이 깨지지 않게 함
+            os.makedirs(self.local_dir, exist_ok=True)
+            shutil.copyfile(local_file_path, self._path(name) + '.tmp')
+            os.replace(self._path(name) + '.tmp', self._path(name))
+        else:
+            put_object(self.s3_resource, local_file_path, self.bucket_name, self._path(name))
+
+    def load(self, workdir: str = './tmp') -> list:
+        """
+        저장된 체크포인트를 읽어 구간별 결과 목록을 반환하고 position, state를 복원합니다.
+
+        Returns:
+        - list: 저장 순서대로 구간별 결과 dict (save에 넘긴 배열 이름 -> numpy 배열)
+        """
+        os.makedirs(workdir, exist_ok=True)
+        local_file_path = os.path.join(workdir, 'checkpoint.json')
+        if not self._read(PROGRESS, local_file_path):
+            return []
+        with open(local_file_path, encoding='utf-8') as f:
+            progress = json.load(f)
+        if progress.get('key') != self.key:
+            print(f'Discarding checkpoint for different input or settings: {self.location}')
+            self.segments = progress.get('segments', [])
+            self.clear()
+            return []
+
+        results = []
+        for segment in progress['segments']:
+            local_segment_path = os.path.join(workdir, segment['file'])
+            self._read(segment['file'], local_segment_path)
+            with np.load(local_segment_path) as data:
+                results.append({name: data[name] for name in data.files})
+            os.remove(local_segment_path)
+        self.segments = progress['segments']
+        self.position = self.resumed_from = progress['position']
+        self.state = progress.get('state', {})
+        print(f'Resuming from checkpoint at row {self.position:,} ({len(self.segments)} segments): {self.location}')
+        return results
+
+    def due(self) -> bool:
+        """
+        마지막 저장 후 저장 간격이 지났는지 반환합니다.
+        """
+        return time.time() - self._last_save >= self.interval
+
+    def save(self, position: int, state: dict = None, workdir: str = './tmp', **arrays):
+        """
+        마지막 저장 이후 처리한 결과를 새 구간으로 저장하고 진행 위치를 기록합니다.
+
+        Parameters:
+        - position (int): 처리를 마친 행 수 (다시 시작하면 이 행부터 처리)
+        - state (dict): 함께 복원할 JSON 직렬화 가능한 값 (통계 카운터 등)
+        - workdir (str): 로컬 작업 디렉터리
+        - arrays: 새 구간의 결과 배열 (문자열은 유니코드 배열로 저장되어 pickle 없이 읽음)
+        """
+        start = time.time()
+        os.makedirs(workdir, exist_ok=True)
+        name = f'segment-{len(self.segments):05d}.npz'
+        local_segment_path = os.path.join(workdir, name)
+        np.savez(local_segment_path, **{key: np.asarray(value) for key, value in arrays.items()})
+        self._write(name, local_segment_path)
+        os.remove(local_segment_path)
+
+        segments = self.segments + [{'file': name, 'start': self.position, 'end': position}]
+        local_file_path = os.path.join(workdir, 'checkpoint.json')
+        with open(local_file_path, 'w', encoding='utf-8') as f:
+            json.dump({'key': self.key, 'position': position, 'segments': segments, 'state': state or {}}, f, ensure_ascii=False)
+        self._write(PROGRESS, local_file_path)
+        self.segments = segments
+        self.position = position
+        self.state = state or {}
+        self.saves += 1
+        self._last_save = time.time()
+        self.save_time += self._last_save - start
+
+    def clear(self):
+        """
+        결과 저장이 끝난 뒤 체크포인트를 삭제합니다 (progress.json을 먼저 지워 남은 구간은 무시되게 함).
+        """
+        names = [PROGRESS] + [segment['file'] for segment in self.segments]
+        if self.local_dir:
+            for name in names:
+                if os.path.exists(self._path(name)):
+                    os.remove(self._path(name))
+        else:
+            for name in names:
+                if head_object(self.s3_resource, self.bucket_name, self._path(name)) is not None:
+                    delete_object(self.s3_resource, self.bucket_name, self._path(name))
+        self.segments = []
+
+
+def open_checkpoint(args: dict, component: str, inputs: list, output_key: str = 'output1', version_paths: list = None) -> Checkpoint:
+    """
+    CHECKPOINT=true이면 이 작업의 체크포인트를 열고, 아니면 None을 반환합니다.
+
+    체크포인트 key는 결과 캐시 키와 같은 방식(입력 ETag, 결과에 영향을 주는 설정, 컴포넌트 버전)에
+    증분 처리 시작 위치를 더해 만듭니다. 저장 위치는 CHECKPOINT_DIR/<key 앞 16자리> 또는 output1 옆입니다.
+
+    Parameters:
+    - args (dict): config.py production args (샤드/증분 실행으로 바뀐 위치 포함)
+    - component (str): 컴포넌트 이름
+    - inputs (list): 결과에 영향을 주는 입력 위치의 args 키 목록
+    - output_key (str): 결과 위치가 들어 있는 args 키
+    - version_paths (list): 컴포넌트 버전에 크기만 반영할 추가 경로 (모델 디렉터리 등)
+
+    Returns:
+    - Checkpoint: 체크포인트 객체 또는 None
+    """
+    _state['checkpoint'] = None
+    if not CHECKPOINT:
+        return None
+    key, _ = memo_key(component, args, inputs, [output_key], component_version(version_paths))
+    key = hashlib.sha256(f'{key}:{incremental_row_offset()}'.encode('utf-8')).hexdigest()
+    if CHECKPOINT_DIR:
+        checkpoint = Checkpoint(key, local_dir=os.path.join(CHECKPOINT_DIR, component, key[:16]))
+    else:
+        output = args[output_key]
+        s3_resource = create_s3_client(output['end_point'], output['access_key'], output['secret_key'])
+        checkpoint = Checkpoint(key, s3_resource=s3_resource, bucket_name=output['bucket_name'], prefix=f"{output['object_path']}.checkpoint")
+    _state['checkpoint'] = checkpoint
+    return checkpoint
+
+
+def checkpoint_report_section() -> str:
+    """
+    체크포인트를 사용했으면 저장 횟수, 저장에 든 시간 비율, 재개 위치를 보고서 섹션으로 생성합니다.
+    """
+    checkpoint = _state['checkpoint']
+    if checkpoint is None:
+        return ''
+    elapsed = time.time() - checkpoint.started
+    ratio = checkpoint.save_time / elapsed * 100 if elapsed else 0.0
+    resumed = f'{checkpoint.resumed_from:,}행부터 재개' if checkpoint.resumed_from else '처음부터 처리'
+    return f"""
+## 체크포인트
+- **저장 위치**: {checkpoint.location}
+- **저장 간격**: {checkpoint.interval:g}초
+- **재개 여부**: {resumed}
+- **저장 횟수**: {checkpoint.saves}회
+- **저장 소요 시간**: {checkpoint.save_time:.2f}초 (작업 시간의 {ratio:.2f}%)
+"""
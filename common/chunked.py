@@ -0,0 +1,266 @@
+import itertools
+import os
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+from common.metrics import span
+from common.overlap import OUTPUT_QUEUE_SIZE, BackgroundWriter, overlap_summary
+from common.resources import chunk_rows
+from common.tabular import CSV_ENGINE, TableBuffer, read_csv, read_table, write_table, table_format, arrow_strings_enabled, _infer_string_context, _apply_string_storage
+
+# 청크 하나에 읽을 CSV 행 수. 0이면 청크로 나누지 않고 전체를 한 번에 읽음.
+# 지정하지 않으면 기본값 안에서 컨테이너 메모리 한도와 입력의 평균 행 크기에 맞춰 줄임 (common.resources)
+CSV_CHUNK_ROWS = int(os.getenv('CSV_CHUNK_ROWS', '100000'))
+_AUTO_CHUNK_ROWS = 'CSV_CHUNK_ROWS' not in os.environ
+
+# 평균 행 크기를 추정할 때 읽는 입력 앞부분 크기
+_ROW_SAMPLE_BYTES = 1024 * 1024
+
+COPY_BUFFER_SIZE = 8 * 1024 * 1024
+
+
+def _common_dtype(a, b):
+    # pandas C 파서가 내부 청크들의 컬럼 타입을 합치는 규칙 (int + float -> float, 그 외 혼합은 object)
+    if a == b:
+        return a
+    if pd.api.types.is_bool_dtype(a) or pd.api.types.is_bool_dtype(b):
+        return np.dtype(object)
+    if pd.api.types.is_numeric_dtype(a) and pd.api.types.is_numeric_dtype(b):
+        return np.result_type(a, b)
+    return np.dtype(object)
+
+
+def _parse_spans(chunks):
+    # 청크를 읽고 파싱한 시간만 파싱 단계로 기록 (청크를 받은 쪽의 처리 시간은 제외)
+    while True:
+        with span('parse'):
+            chunk = next(chunks, None)
+        if chunk is None:
+            return
+        yield chunk
+
+
+class ChunkReader:
+    """
+    CSV 입력을 행 단위 청크로 나누어 읽는 반복자.
+
+    각 청크의 컬럼 타입을 전체 파일을 한 번에 읽었을 때와 같게 맞추므로, 청크별 처리 결과를
+    이어서 저장하면 전체 로드 후 저장한 결과와 같은 바이트가 됩니다. 청크가 둘 이상이면 파일을 한 번 더
+    읽어 청크마다 타입이 달라지는 컬럼을 찾습니다. 정수와 실수가 섞이면(결측값 포함) 전체 로드와 같이
+    float64로, 숫자/불리언과 문자열이 섞이면 '007', '1.50'처럼 숫자로 읽힌 청크의 값이 바뀌지 않도록
+    문자열로 처음부터 다시 읽습니다.
+
+    Object Storage 스트림처럼 다시 읽을 수 없는 입력은 로컬 임시 파일에 먼저 받습니다.
+    Parquet/Arrow 입력, TableBuffer, CSV_ENGINE=pyarrow, CSV_CHUNK_ROWS=0이면 전체를 하나의 청크로 읽습니다.
+
+    Parameters:
+    - data (object): 파일 경로, 바이너리/텍스트 스트림
+    - chunksize (int): 청크당 행 수. 지정하지 않으면 CSV_CHUNK_ROWS 환경변수 값 사용
+    - **kwargs: read_csv에 전달할 추가 옵션
+    """
+
+    def __init__(self, data: object, chunksize: int = None, **kwargs):
+        self.data = data
+        self.chunksize = CSV_CHUNK_ROWS if chunksize is None else chunksize
+        self._auto_chunksize = chunksize is None and _AUTO_CHUNK_ROWS
+        self.kwargs = kwargs
+        self.rows = 0
+        self.chunks = 0
+        self.columns = []
+        self.promoted_columns = []
+        self._spool_path = None
+
+    @property
+    def chunked(self) -> bool:
+        if isinstance(self.data, (TableBuffer, pd.DataFrame)):
+            return False
+        return self.chunksize > 0 and table_format(self.data) == 'csv' and CSV_ENGINE != 'pyarrow'
+
+    def __iter__(self):
+        try:
+            for chunk in (_parse_spans(self._iter_chunks()) if self.chunked else [read_table(self.data, **self.kwargs)]):
+                self.rows += len(chunk)
+                self.chunks += 1
+                self.columns = list(chunk.columns)
+                yield chunk
+        finally:
+            self.close()
+
+    def _read(self, source, **kwargs):
+        if arrow_strings_enabled():
+            with _infer_string_context():
+                return read_csv(source, **kwargs)
+        return read_csv(source, **kwargs)
+
+    def _spool(self) -> str:
+        # 순차 스트림은 두 번 읽을 수 없으므로 임시 파일로 복사 (메모리 사용량은 버퍼 크기로 고정)
+        if isinstance(self.data, (str, os.PathLike)):
+            return self.data
+        name = getattr(self.data, 'name', None)
+        if isinstance(name, str) and os.path.isfile(name) and hasattr(self.data, 'fileno') and self.data.tell() == 0:
+            # 로컬 파일 스트림(샤드 입력 등)은 복사하지 않고 경로로 읽음
+            return name
+        is_text_stream = not hasattr(self.data, 'readinto')
+        fd, self._spool_path = tempfile.mkstemp(prefix='chunks-', suffix='.csv')
+        with span('download'), open(fd, 'w' if is_text_stream else 'wb', encoding='utf-8' if is_text_stream else None) as f:
+            shutil.copyfileobj(self.data, f, COPY_BUFFER_SIZE)
+        return self._spool_path
+
+    def _average_row_bytes(self, source: str) -> float:
+        with open(source, 'rb') as f:
+            sample = f.read(_ROW_SAMPLE_BYTES)
+        lines = sample.count(b'\n')
+        return len(sample) / lines if lines else len(sample)
+
+    def _resolve_dtypes(self, source) -> dict:
+        # 모든 청크의 컬럼 타입을 모아, 청크마다 타입이 다른 컬럼을 다시 읽을 타입을 정함
+        kinds = {}
+        for chunk in self._read(source, chunksize=self.chunksize, **self.kwargs):
+            for col in chunk.columns:
+                kinds.setdefault(col, []).append(chunk[col].dtype)
+        dtypes = {}
+        for col, seen in kinds.items():
+            if all(dtype == seen[0] for dtype in seen):
+                continue
+            resolved = seen[0]
+            for dtype in seen[1:]:
+                resolved = _common_dtype(resolved, dtype)
+            # 숫자끼리 섞이면 전체 로드와 같은 실수 타입, 문자열이 섞이면 원래 텍스트를 유지하도록 문자열
+            dtypes[col] = resolved if pd.api.types.is_float_dtype(resolved) else str
+        return dtypes
+
+    def _iter_chunks(self):
+        source = self._spool()
+        if self._auto_chunksize:
+            self.chunksize = chunk_rows('CSV 청크 행 수', self.chunksize, self._average_row_bytes(source))
+        reader = self._read(source, chunksize=self.chunksize, **self.kwargs)
+        first = next(reader)
+        second = next(reader, None)
+        pending = [first] if second is None else [first, second]
+
+        if second is not None:
+            promoted = self._resolve_dtypes(source)
+            if promoted:
+                # 청크마다 타입이 달라지는 컬럼이 있으면 최종 타입(실수 또는 문자열)으로 처음부터 다시 읽음
+                self.promoted_columns = list(promoted)
+                reader.close()
+                dtype = dict(self.kwargs.get('dtype') or {}, **promoted)
+                reader = self._read(source, chunksize=self.chunksize, **dict(self.kwargs, dtype=dtype))
+                pending = []
+
+        seen = {}
+        for chunk in itertools.chain(pending, reader):
+            # 앞 청크에서 실수였던 컬럼이 뒤 청크에서 정수로 읽히면 실수로 맞춤
+            for col in chunk.columns:
+                dtype = chunk[col].dtype
+                if col in seen and pd.api.types.is_float_dtype(seen[col]) and pd.api.types.is_integer_dtype(dtype):
+                    chunk[col] = chunk[col].astype(seen[col])
+                else:
+                    seen[col] = dtype if col not in seen else _common_dtype(seen[col], dtype)
+            if arrow_strings_enabled():
+                chunk = _apply_string_storage(chunk)
+            yield chunk
+
+    def close(self):
+        if self._spool_path and os.path.exists(self._spool_path):
+            os.remove(self._spool_path)
+        self._spool_path = None
+
+
+class ChunkWriter:
+    """
+    청크 단위 결과를 출력 경로/스트림에 이어서 저장하는 객체.
+
+    CSV 출력은 첫 청크에만 헤더를 쓰고 나머지 청크를 이어 붙이므로 전체 DataFrame을
+    한 번에 to_csv로 저장한 결과와 같습니다. Parquet/Arrow, TableBuffer 출력은 청크를
+    모았다가 close 시점에 write_table로 한 번에 저장합니다.
+
+    CSV 청크는 출력 스레드(BackgroundWriter)가 직렬화하고 업로드하므로, 계산 스레드는 청크를
+    넘긴 뒤 바로 다음 청크를 읽고 처리합니다. write에 넘긴 DataFrame은 출력이 끝날 때까지
+    수정하지 않아야 합니다.
+
+    Parameters:
+    - output (object): 로컬 파일 경로 또는 open_object(..., mode='wb') 스트림
+    - queue_size (int): 출력을 기다리며 쌓아 둘 수 있는 최대 청크 수. 0이면 write에서 바로 저장
+    - **kwargs: to_csv에 전달할 추가 옵션
+    """
+
+    def __init__(self, output: object, queue_size: int = OUTPUT_QUEUE_SIZE, **kwargs):
+        self.output = output
+        self.kwargs = kwargs
+        self.kwargs.pop('mode', None)
+        self.kwargs.pop('header', None)
+        self.rows = 0
+        self.chunks = 0
+        self._format = 'memory' if isinstance(output, TableBuffer) else table_format(output)
+        self._handle = None
+        self._pending = []
+        self.background = BackgroundWriter(self._write_csv, maxsize=queue_size)
+
+    def _write_csv(self, item: tuple):
+        df, header = item
+        if self._handle is None:
+            is_path = isinstance(self.output, (str, os.PathLike))
+            self._handle = open(self.output, 'wb') if is_path else self.output
+        with span('serialize'):
+            df.to_csv(self._handle, index=False, header=header, **self.kwargs)
+
+    def write(self, df: pd.DataFrame):
+        if self._format != 'csv':
+            self._pending.append(df)
+        else:
+            self.background.put((df, self.chunks == 0))
+        self.rows += len(df)
+        self.chunks += 1
+
+    def close(self, discard: bool = False):
+        try:
+            self.background.close(discard=discard)
+            if self._pending and not discard:
+                df = self._pending[0] if len(self._pending) == 1 else pd.concat(self._pending)
+                write_table(df, self.output, **self.kwargs)
+        finally:
+            self._pending = []
+            if self._handle is not None and self._handle is not self.output:
+                self._handle.close()
+            self._handle = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close(discard=exc_type is not None)
+
+
+def read_chunks(data: object, chunksize: int = None, **kwargs) -> ChunkReader:
+    """
+    행 단위로 처리하는 컴포넌트가 입력을 청크로 나누어 읽도록 ChunkReader를 생성합니다.
+
+    Parameters:
+    - data (object): 파일 경로, 바이너리/텍스트 스트림
+    - chunksize (int): 청크당 행 수. 지정하지 않으면 CSV_CHUNK_ROWS 환경변수 값 사용
+    - **kwargs: read_csv에 전달할 추가 옵션
+
+    Returns:
+    - ChunkReader: DataFrame 청크를 순서대로 반환하는 반복자
+    """
+    return ChunkReader(data, chunksize=chunksize, **kwargs)
+
+
+def chunk_report_section(reader: ChunkReader, writer: ChunkWriter = None) -> str:
+    """
+    청크 처리 설정과 결과를 보고서 섹션으로 생성합니다. writer를 주면 출력 대기열 사용 현황도 표시합니다.
+    """
+    mode = f'{reader.chunksize:,}행 단위' if reader.chunked else '전체 로드'
+    promoted = ', '.join(map(str, reader.promoted_columns)) if reader.promoted_columns else '없음'
+    section = f"""
+## 청크 처리
+- **처리 방식**: {mode}
+- **청크 수**: {reader.chunks:,}개
+- **총 행 수**: {reader.rows:,}행
+- **전체 로드 타입으로 다시 읽은 컬럼**: {promoted}
+"""
+    if writer is not None and writer.background.items:
+        section += f'- **출력 대기열**: {overlap_summary(writer.background)}\n'
+    return section
@@ -0,0 +1,163 @@
+"""
+Object Storage 입출력 압축 코덱 (gzip, zstd).
+
+입력은 객체 키 확장자(.gz, .zst) 또는 Content-Encoding으로 코덱을 판별해 스트리밍으로
+해제하고, 출력은 키 확장자 또는 S3_OUTPUT_COMPRESSION 설정에 따라 스트리밍으로 압축합니다.
+"""
+import gzip
+import io
+import os
+import shutil
+
+# 출력 압축 코덱 ('', 'gzip', 'zstd'). 키에 .gz/.zst 확장자가 없는 텍스트 출력에 적용
+S3_OUTPUT_COMPRESSION = os.getenv('S3_OUTPUT_COMPRESSION', '').lower()
+# 압축 레벨. 지정하지 않으면 코덱 기본값 (gzip 6, zstd 3)
+S3_COMPRESSION_LEVEL = os.getenv('S3_COMPRESSION_LEVEL')
+
+EXTENSIONS = {'.gz': 'gzip', '.gzip': 'gzip', '.zst': 'zstd', '.zstd': 'zstd'}
+DEFAULT_LEVELS = {'gzip': 6, 'zstd': 3}
+
+# S3_OUTPUT_COMPRESSION을 적용할 출력 확장자 (이미지 등 이진 결과물은 제외)
+COMPRESSIBLE_EXTENSIONS = ('.csv', '.tsv', '.txt', '.json', '.jsonl')
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError("zstd 압축을 사용하려면 zstandard 패키지가 필요합니다: pip install zstandard") from e
+    return zstandard
+
+
+def detect_codec(object_path: str, content_encoding: str = None) -> str:
+    """
+    객체 키 확장자 또는 Content-Encoding으로 입력 압축 코덱을 판별합니다.
+
+    Parameters:
+    - object_path (str): 객체 경로
+    - content_encoding (str): GetObject 응답의 Content-Encoding
+
+    Returns:
+    - str: 'gzip', 'zstd' 또는 None (비압축)
+    """
+    codec = EXTENSIONS.get(os.path.splitext(object_path)[1].lower())
+    if codec:
+        return codec
+    if content_encoding:
+        encoding = content_encoding.split(',')[-1].strip().lower()
+        return {'gzip': 'gzip', 'x-gzip': 'gzip', 'zstd': 'zstd'}.get(encoding)
+    return None
+
+
+def output_codec(object_path: str) -> tuple:
+    """
+    출력 객체에 적용할 압축 코덱을 결정합니다.
+
+    Returns:
+    - tuple: (코덱, Content-Encoding). 키 확장자로 정해진 경우 Content-Encoding은 None
+    """
+    codec = EXTENSIONS.get(os.path.splitext(object_path)[1].lower())
+    if codec:
+        return codec, None
+    if S3_OUTPUT_COMPRESSION in DEFAULT_LEVELS and object_path.lower().endswith(COMPRESSIBLE_EXTENSIONS):
+        return S3_OUTPUT_COMPRESSION, S3_OUTPUT_COMPRESSION
+    return None, None
+
+
+def compression_level(codec: str) -> int:
+    return int(S3_COMPRESSION_LEVEL) if S3_COMPRESSION_LEVEL else DEFAULT_LEVELS[codec]
+
+
+class DecompressingReader(io.RawIOBase):
+    """압축된 바이너리 스트림을 읽으면서 해제하는 스트림."""
+
+    def __init__(self, stream, codec: str):
+        self._stream = stream
+        if codec == 'gzip':
+            self._decoder = gzip.GzipFile(fileobj=stream, mode='rb')
+        elif codec == 'zstd':
+            self._decoder = _zstandard().ZstdDecompressor().stream_reader(stream, read_across_frames=True)
+        else:
+            raise ValueError(f"지원하지 않는 압축 코덱입니다: {codec}")
+        self.codec = codec
+        self.name = getattr(stream, 'name', None)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        return self._decoder.readinto(buffer)
+
+    def close(self):
+        if not self.closed:
+            self._decoder.close()
+            self._stream.close()
+        super().close()
+
+
+class CompressingWriter(io.RawIOBase):
+    """
+    쓰여진 데이터를 압축해 하위 스트림(ObjectWriter 등)에 기록하는 스트림.
+
+    bytes_written은 압축 전 크기, compressed_bytes는 실제 업로드된 크기입니다.
+    """
+
+    def __init__(self, stream, codec: str, level: int = None):
+        self._stream = stream
+        level = compression_level(codec) if level is None else level
+        if codec == 'gzip':
+            self._encoder = gzip.GzipFile(fileobj=stream, mode='wb', compresslevel=level, mtime=0)
+        elif codec == 'zstd':
+            self._encoder = _zstandard().ZstdCompressor(level=level).stream_writer(stream, closefd=False)
+        else:
+            raise ValueError(f"지원하지 않는 압축 코덱입니다: {codec}")
+        self.codec = codec
+        self.name = getattr(stream, 'name', None)
+        self.bytes_written = 0
+
+    def __str__(self):
+        return str(self._stream)
+
+    @property
+    def compressed_bytes(self) -> int:
+        return getattr(self._stream, 'bytes_written', 0)
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._encoder.write(data)
+        size = len(data)
+        self.bytes_written += size
+        return size
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            self._encoder.close()
+            self._stream.close()
+        finally:
+            super().close()
+
+    def abort(self):
+        if hasattr(self._stream, 'abort'):
+            self._stream.abort()
+        super().close()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+
+def decompress_file(local_file_path: str, codec: str):
+    """압축된 로컬 파일을 같은 경로에 해제된 내용으로 교체합니다."""
+    compressed_path = local_file_path + '.compressed'
+    os.replace(local_file_path, compressed_path)
+    try:
+        with open(compressed_path, 'rb') as src, open(local_file_path, 'wb') as dst:
+            shutil.copyfileobj(DecompressingReader(src, codec), dst, 1024 * 1024)
+    finally:
+        os.remove(compressed_path)
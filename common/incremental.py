@@ -0,0 +1,373 @@
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+import numpy as np
+import pandas as pd
+from common.compression import detect_codec
+from common.memo import component_version, settings_hash
+from common.storage import MB, create_s3_client, head_object, download_file, get_object, put_object, save_report, delete_object, storage_report_section
+from common.tabular import table_format
+from common.shard import READ_BLOCK_SIZE, RecordScanner, get_object_shard, merge_outputs, shard_mode
+
+# true이면 output1 옆에 워터마크를 저장하고, 다음 실행에서는 워터마크 이후에 추가된 행만 처리하여 기존 결과 뒤에 덧붙임
+INCREMENTAL = os.getenv('INCREMENTAL', 'false').lower() == 'true'
+
+# 지정하면 바이트 위치 대신 이 컬럼의 최댓값을 워터마크로 사용 (입력을 통째로 다시 쓰지만 키가 증가하는 행만 추가되는 경우)
+INCREMENTAL_KEY = os.getenv('INCREMENTAL_KEY', '')
+
+# 덮어쓰기 여부를 확인하기 위해 해시를 비교하는 워터마크 직전 구간 크기
+WATERMARK_WINDOW = 64 * 1024
+
+_state = {'plan': None}
+
+
+def watermark_path(object_path: str) -> str:
+    """
+    결과 객체의 워터마크 경로를 반환합니다 (예: dir/result.csv -> dir/result.csv.watermark.json).
+    """
+    return f'{object_path}.watermark.json'
+
+
+def _delta_path(object_path: str) -> str:
+    filename = os.path.basename(object_path)
+    suffix = '.' + filename.split('.', 1)[1] if '.' in filename else ''
+    return f'{object_path}.incremental/delta{suffix}'
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _read_local(local_file_path: str, start: int, end: int) -> bytes:
+    with open(local_file_path, 'rb') as f:
+        f.seek(start)
+        return f.read(end - start)
+
+
+def _read_range(s3_resource, bucket_name: str, object_path: str, start: int, end: int) -> bytes:
+    if end <= start:
+        return b''
+    response = s3_resource.meta.client.get_object(Bucket=bucket_name, Key=object_path, Range=f'bytes={start}-{end - 1}')
+    return response['Body'].read()
+
+
+def _record_spans(local_file_path: str, start: int):
+    # start(레코드 시작 위치)부터 블록 단위로 따옴표 밖 줄바꿈을 찾아 레코드별 (시작, 끝) 배열을 생성
+    size = os.path.getsize(local_file_path)
+    if size <= start:
+        return
+    data = np.memmap(local_file_path, dtype=np.uint8, mode='r')
+    parity = 0
+    record_start = start
+    for block_start in range(start, size, READ_BLOCK_SIZE):
+        block = data[block_start:block_start + READ_BLOCK_SIZE]
+        # uint8 누적합은 256에서 넘치지만 홀짝은 유지됨
+        quotes = np.cumsum(block == ord('"'), dtype=np.uint8)
+        newlines = np.flatnonzero(block == ord('\n'))
+        ends = newlines[((quotes[newlines] + parity) & 1) == 0] + block_start + 1
+        parity = (parity + int(quotes[-1])) & 1
+        if len(ends):
+            yield np.concatenate(([record_start], ends[:-1])), ends, data
+            record_start = int(ends[-1])
+    if record_start < size:
+        # 마지막 레코드가 줄바꿈 없이 끝나는 경우
+        yield np.array([record_start]), np.array([size]), data
+
+
+def _non_blank(starts: np.ndarray, ends: np.ndarray, data) -> np.ndarray:
+    # pandas가 건너뛰는 빈 줄(\n, \r\n)을 제외
+    lengths = ends - starts
+    blank = (lengths == 1) | ((lengths == 2) & (data[starts] == ord('\r')))
+    return ~blank
+
+
+def _count_records(local_file_path: str, start: int) -> int:
+    return int(sum(_non_blank(starts, ends, data).sum() for starts, ends, data in _record_spans(local_file_path, start)))
+
+
+def _header_end(local_file_path: str) -> int:
+    with open(local_file_path, 'rb') as f:
+        return RecordScanner(f).next_boundary(1)
+
+
+def _key_values(local_file_path: str, key: str, watermark_max=None) -> pd.Series:
+    keys = pd.read_csv(local_file_path, usecols=[key])[key]
+    if isinstance(watermark_max, (int, float)) or (watermark_max is None and pd.api.types.is_numeric_dtype(keys)):
+        return pd.to_numeric(keys, errors='coerce')
+    return keys.astype('string')
+
+
+def _json_value(value):
+    if pd.isna(value):
+        return None
+    return value.item() if hasattr(value, 'item') else str(value)
+
+
+def _describe(local_file_path: str, head: dict, header_end: int) -> dict:
+    # 처리한 입력(로컬 파일)으로 새 워터마크를 계산
+    size = os.path.getsize(local_file_path)
+    watermark = {
+        'mode': 'key' if INCREMENTAL_KEY else 'offset',
+        'input': {'etag': head.get('ETag'), 'size': head['ContentLength']},
+        'header_bytes': header_end,
+        'header_sha256': _sha256(_read_local(local_file_path, 0, header_end)),
+        'offset': size,
+        'rows': _count_records(local_file_path, header_end),
+        'window_sha256': _sha256(_read_local(local_file_path, max(header_end, size - WATERMARK_WINDOW), size)),
+        'ends_with_newline': size == header_end or _read_local(local_file_path, size - 1, size) == b'\n',
+    }
+    if INCREMENTAL_KEY:
+        watermark.update(key=INCREMENTAL_KEY, max=_json_value(_key_values(local_file_path, INCREMENTAL_KEY).max()))
+    return watermark
+
+
+def _load_watermark(s3_resource, output: dict) -> dict:
+    path = watermark_path(output['object_path'])
+    if head_object(s3_resource, output['bucket_name'], path) is None:
+        return None
+    with get_object(s3_resource, output['bucket_name'], path) as f:
+        return json.loads(f.read())
+
+
+def _check_offset(s3_input, source: dict, head: dict, watermark: dict) -> str:
+    # 이전 워터마크까지의 내용이 그대로인지 확인하고, 아니면 전체 재처리 사유를 반환
+    size, offset = head['ContentLength'], watermark['offset']
+    if size < offset:
+        return f'입력이 워터마크보다 작아짐 ({size:,} < {offset:,} bytes, 덮어쓰기)'
+    if size == offset:
+        return '입력 크기는 같지만 ETag가 달라짐 (덮어쓰기)'
+    if not watermark['ends_with_newline']:
+        return '이전 입력이 줄바꿈 없이 끝나 마지막 레코드가 이어졌는지 확인할 수 없음'
+    window = _read_range(s3_input, source['bucket_name'], source['object_path'], max(watermark['header_bytes'], offset - WATERMARK_WINDOW), offset)
+    if _sha256(window) != watermark['window_sha256']:
+        return '워터마크 직전 구간의 내용이 달라짐 (덮어쓰기)'
+    return None
+
+
+def _prepare_offset(s3_input, source: dict, head: dict, watermark: dict, local_file_path: str) -> dict:
+    # 헤더와 워터마크 이후 바이트만 받아 하나의 CSV로 저장
+    header_end = watermark['header_bytes']
+    with open(local_file_path, 'wb') as f:
+        f.write(_read_range(s3_input, source['bucket_name'], source['object_path'], 0, header_end))
+        body = s3_input.meta.client.get_object(Bucket=source['bucket_name'], Key=source['object_path'], Range=f"bytes={watermark['offset']}-{head['ContentLength'] - 1}")['Body']
+        for chunk in iter(lambda: body.read(READ_BLOCK_SIZE), b''):
+            f.write(chunk)
+    new_rows = _count_records(local_file_path, header_end)
+    size = head['ContentLength']
+    return {
+        'new_rows': new_rows,
+        'new_bytes': size - watermark['offset'],
+        'watermark': dict(
+            watermark,
+            input={'etag': head.get('ETag'), 'size': size},
+            offset=size,
+            rows=watermark['rows'] + new_rows,
+            window_sha256=_sha256(_read_range(s3_input, source['bucket_name'], source['object_path'], max(header_end, size - WATERMARK_WINDOW), size)),
+            ends_with_newline=_read_range(s3_input, source['bucket_name'], source['object_path'], size - 1, size) == b'\n',
+        ),
+    }
+
+
+def _prepare_key(full_file_path: str, head: dict, header_end: int, watermark: dict, local_file_path: str):
+    # 키가 워터마크 최댓값보다 큰 레코드의 원래 바이트만 골라 헤더와 함께 저장. 전체 재처리가 필요하면 사유(str)를 반환
+    keys = _key_values(full_file_path, watermark['key'], watermark['max'])
+    new = (keys > watermark['max']).fillna(False).to_numpy(dtype=bool) if watermark['max'] is not None else keys.notna().to_numpy(dtype=bool)
+    old_rows = len(keys) - int(new.sum())
+    if old_rows < watermark['rows']:
+        return f"키가 워터마크 이하인 행이 줄어듦 ({old_rows:,} < {watermark['rows']:,}행)"
+
+    written = 0
+    with open(local_file_path, 'wb') as f:
+        f.write(_read_local(full_file_path, 0, header_end))
+        for starts, ends, data in _record_spans(full_file_path, header_end):
+            rows = _non_blank(starts, ends, data)
+            starts, ends = starts[rows], ends[rows]
+            if written + len(starts) > len(new):
+                return 'pandas가 읽은 행 수와 레코드 경계 수가 다름'
+            selected = new[written:written + len(starts)]
+            written += len(starts)
+            starts, ends = starts[selected], ends[selected]
+            if not len(starts):
+                continue
+            # 연속된 레코드는 한 번에 씀
+            breaks = np.flatnonzero(starts[1:] != ends[:-1]) + 1
+            for run_start, run_end in zip(np.concatenate(([0], breaks)), np.concatenate((breaks, [len(starts)]))):
+                f.write(memoryview(data[starts[run_start]:ends[run_end - 1]]))
+    if written != len(new):
+        return 'pandas가 읽은 행 수와 레코드 경계 수가 다름'
+
+    new_max = keys[new].max() if new.any() else None
+    new_rows = int(new.sum())
+    return {
+        'new_rows': new_rows,
+        'new_bytes': os.path.getsize(local_file_path) - header_end,
+        'watermark': dict(
+            _describe(full_file_path, head, header_end),
+            rows=len(keys),
+            max=watermark['max'] if new_max is None else _json_value(new_max),
+        ),
+    }
+
+
+def _plan(args: dict, input_key: str, output_key: str, workdir: str, settings: str) -> dict:
+    source, output = args[input_key], args[output_key]
+    s3_input = create_s3_client(source['end_point'], source['access_key'], source['secret_key'])
+    s3_output = create_s3_client(output['end_point'], output['access_key'], output['secret_key'])
+    head = head_object(s3_input, source['bucket_name'], source['object_path'])
+    if head is None:
+        raise FileNotFoundError(f"{source['bucket_name']}/{source['object_path']}")
+    plan = {'mode': 'full', 'reason': None, 'source': source, 'output': output, 's3_output': s3_output,
+            'local': None, 'previous': None, 'watermark': None, 'new_rows': None, 'new_bytes': None}
+    if detect_codec(source['object_path'], head.get('ContentEncoding')) or table_format(source['object_path']) != 'csv':
+        plan['reason'] = '비압축 CSV 입력이 아니어서 증분 처리를 사용하지 않음'
+        return plan
+
+    os.makedirs(workdir, exist_ok=True)
+    local_file_path = os.path.abspath(os.path.join(workdir, 'incremental-input.csv'))
+    previous = _load_watermark(s3_output, output)
+    plan['previous'] = previous
+    expected = 'key' if INCREMENTAL_KEY else 'offset'
+    output_head = head_object(s3_output, output['bucket_name'], output['object_path'])
+    if previous is None:
+        reason = '워터마크 없음 (첫 실행)'
+    elif previous['mode'] != expected or previous.get('key', '') != INCREMENTAL_KEY:
+        reason = '워터마크 기준이 바뀜'
+    elif previous.get('settings') != settings:
+        reason = '기존 결과를 만든 설정 또는 컴포넌트 버전과 다름'
+    elif output_head is None or output_head.get('ETag') != previous.get('output_etag'):
+        reason = '이전 결과가 없거나 워터마크 이후에 바뀜'
+    elif head.get('ETag') == previous['input']['etag']:
+        plan.update(mode='skip', reason='입력이 바뀌지 않음', new_rows=0, new_bytes=0, watermark=previous)
+        return plan
+    elif _sha256(_read_range(s3_input, source['bucket_name'], source['object_path'], 0, previous['header_bytes'])) != previous['header_sha256']:
+        reason = '헤더가 바뀜'
+    elif expected == 'offset':
+        reason = _check_offset(s3_input, source, head, previous)
+        if reason is None:
+            plan.update(mode='append', local=local_file_path, **_prepare_offset(s3_input, source, head, previous, local_file_path))
+            return plan
+    else:
+        full_file_path = os.path.abspath(os.path.join(workdir, 'incremental-full.csv'))
+        download_file(s3_input, source['bucket_name'], source['object_path'], full_file_path, decompress=True)
+        result = _prepare_key(full_file_path, head, previous['header_bytes'], previous, local_file_path)
+        os.remove(full_file_path)
+        if isinstance(result, dict):
+            plan.update(mode='append', local=local_file_path, **result)
+            return plan
+        reason = result
+
+    # 전체 재처리: 입력 전체를 로컬로 받아 처리하고 같은 파일로 새 워터마크를 계산
+    download_file(s3_input, source['bucket_name'], source['object_path'], local_file_path, decompress=True)
+    watermark = _describe(local_file_path, head, _header_end(local_file_path))
+    plan.update(reason=reason, local=local_file_path, new_rows=watermark['rows'], new_bytes=watermark['offset'] - watermark['header_bytes'], watermark=watermark)
+    return plan
+
+
+def get_object_incremental(s3_resource, bucket_name: str, object_path: str, mode: str = 'r'):
+    """
+    get_object_shard와 같지만, 증분 처리 중이면 미리 준비한 로컬 파일(헤더 + 처리할 행)을 엽니다.
+    """
+    plan = _state['plan']
+    if plan is None or plan['local'] is None or (plan['source']['bucket_name'], plan['source']['object_path']) != (bucket_name, object_path):
+        return get_object_shard(s3_resource, bucket_name, object_path, mode=mode)
+    stream = open(plan['local'], mode if 'b' in mode else 'r', **({} if 'b' in mode else {'encoding': 'utf-8'}))
+    stream.size = os.path.getsize(plan['local'])
+    return stream
+
+
+def incremental_row_offset() -> int:
+    """
+    증분 처리 중이면 이번에 처리하는 첫 행 앞에 이미 처리된 행 수를, 아니면 0을 반환합니다.
+    행 번호로 결과를 식별하는 컴포넌트가 전체 재처리와 같은 번호를 매기는 데 사용합니다.
+    """
+    plan = _state['plan']
+    if plan is None or plan['mode'] != 'append':
+        return 0
+    return plan['previous']['rows'] if plan['previous']['mode'] == 'offset' else plan['watermark']['rows'] - plan['new_rows']
+
+
+def incremental_report_section() -> str:
+    """
+    증분 처리 중이면 처리 방식(전체/추가분)과 워터마크를 보고서 섹션으로 생성합니다.
+    """
+    plan = _state['plan']
+    if plan is None:
+        return ''
+    mode = {'full': '전체 재처리', 'append': '추가된 행만 처리 후 기존 결과에 덧붙임', 'skip': '새로 추가된 행 없음 (이전 결과 유지)'}[plan['mode']]
+    previous, watermark = plan['previous'], plan['watermark']
+    lines = [f'- **처리 방식**: {mode}']
+    if plan['reason']:
+        lines.append(f"- **사유**: {plan['reason']}")
+    if plan['new_rows'] is not None:
+        lines.append(f"- **이번에 처리한 행**: {plan['new_rows']:,}행 ({plan['new_bytes'] / MB:.2f} MB)")
+    if previous is not None and plan['mode'] == 'append':
+        lines.append(f"- **이전 워터마크**: {previous['offset']:,} bytes / {previous['rows']:,}행" + (f", {previous['key']} = {previous['max']}" if previous.get('key') else ''))
+    if watermark is not None:
+        lines.append(f"- **워터마크**: {watermark['offset']:,} bytes / {watermark['rows']:,}행" + (f", {watermark['key']} = {watermark['max']}" if watermark.get('key') else ''))
+    else:
+        lines.append('- **워터마크**: 저장하지 않음')
+    return '\n## 증분 처리\n' + '\n'.join(lines) + '\n'
+
+
+def run_incremental(run, args: dict, input_key: str = 'input1', output_key: str = 'output1', report_key: str = 'task_report', workdir: str = './tmp',
+                    version_paths: list = None):
+    """
+    INCREMENTAL=true이면 이전 실행의 워터마크 이후에 추가된 입력 행만 처리하여 기존 결과 뒤에 덧붙입니다.
+
+    워터마크(output1 옆의 .watermark.json)에는 처리한 입력의 바이트 위치와 행 수(INCREMENTAL_KEY를
+    지정하면 키 컬럼의 최댓값)를 기록합니다. 다음 실행에서 헤더와 워터마크 직전 구간의 해시가 같고
+    입력이 워터마크보다 길면 그 뒤의 바이트만 받아 run을 실행하고, 결과를 output1 뒤에 이어 붙입니다.
+    입력이 덮어쓰기되었거나 헤더/이전 결과가 바뀌었으면 전체를 다시 처리합니다.
+    워터마크에는 결과 캐시 키(common.memo)와 같은 기준의 설정 해시(자격 증명을 뺀 args, 결과에 영향을 주는 환경 변수, 출력 형식, 컴포넌트 버전)도
+    기록하여, 설정이나 코드가 바뀐 뒤에는 다른 설정으로 만든 기존 결과에 덧붙이지 않고 전체를 다시 처리합니다.
+
+    - 전체 재처리: run(args) 후 새 워터마크 저장
+    - 추가분 처리: output1을 임시 위치로 바꾸어 run 실행 후 기존 output1과 병합
+    - 새 행 없음: run을 실행하지 않고 보고서만 저장
+
+    Parameters:
+    - run (callable): args dict를 받아 작업 하나를 처리하는 함수 (입력은 get_object_incremental로 읽음)
+    - args (dict): config.py production args
+    - input_key (str): 입력 위치가 들어 있는 args 키
+    - output_key (str): 결과 위치가 들어 있는 args 키
+    - report_key (str): 보고서 위치가 들어 있는 args 키
+    - workdir (str): 입력과 병합에 사용할 로컬 작업 디렉터리
+    - version_paths (list): 버전 해시에 이름과 크기를 반영할 추가 경로 (예: ['./model'])
+    """
+    _state['plan'] = None
+    if not INCREMENTAL or shard_mode() != 'single':
+        return run(args)
+
+    settings = settings_hash(args, [input_key], [output_key], component_version(version_paths))
+    plan = _plan(args, input_key, output_key, workdir, settings)
+    _state['plan'] = plan
+    output, s3_output = plan['output'], plan['s3_output']
+    print(f"Incremental mode: {plan['mode']}" + (f" ({plan['reason']})" if plan['reason'] else ''))
+    try:
+        if plan['mode'] == 'skip':
+            task_report = args[report_key]
+            s3_client_task_report = create_s3_client(task_report['end_point'], task_report['access_key'], task_report['secret_key'])
+            report = f"# 증분 처리 보고서\n\n- **입력 파일**: {plan['source']['bucket_name']}/{plan['source']['object_path']}\n- **결과 파일**: {output['bucket_name']}/{output['object_path']}\n"
+            save_report(s3_client_task_report, report + incremental_report_section() + storage_report_section(), task_report['bucket_name'], task_report['object_path'], metrics=True)
+            return
+
+        if plan['mode'] == 'full':
+            run(args)
+        else:
+            delta = dict(output, object_path=_delta_path(output['object_path']))
+            run(dict(args, **{output_key: delta}))
+            merge_outputs([(s3_output, output), (s3_output, delta)], s3_output, output, workdir)
+            delete_object(s3_output, delta['bucket_name'], delta['object_path'])
+
+        if plan['watermark'] is not None:
+            # 결과가 바뀌지 않았는지 다음 실행에서 확인하기 위해 결과의 ETag를 함께 기록 (결과를 먼저 쓰고 워터마크는 마지막에)
+            watermark = dict(plan['watermark'], settings=settings, output_etag=head_object(s3_output, output['bucket_name'], output['object_path']).get('ETag'),
+                             updated=datetime.now(timezone.utc).isoformat(timespec='seconds'))
+            local_file_path = os.path.join(workdir, 'watermark.json')
+            with open(local_file_path, 'w', encoding='utf-8') as f:
+                json.dump(watermark, f, ensure_ascii=False, indent=2)
+            put_object(s3_output, local_file_path, output['bucket_name'], watermark_path(output['object_path']))
+    finally:
+        if plan['local'] is not None and os.path.exists(plan['local']):
+            os.remove(plan['local'])
@@ -0,0 +1,314 @@
+import hashlib
+import json
+import os
+import time
+from datetime import datetime
+from common.compression import S3_OUTPUT_COMPRESSION
+from common.shard import SHARD_INDEX, SHARD_COUNT, shard_mode
+from common.storage import MB, create_s3_client, head_object, copy_object, get_object, save_report
+from common.tabular import CSV_ENGINE, STRING_STORAGE
+
+# 결과 캐시 위치. 다른 args와 같은 형식의 JSON ({"end_point", "access_key", "secret_key", "bucket_name", "object_path"})
+# object_path는 캐시 항목을 저장할 prefix. 지정하지 않으면 캐시를 사용하지 않음
+MEMO_CACHE = json.loads(os.environ['MEMO_CACHE']) if os.getenv('MEMO_CACHE') else None
+
+# 캐시 항목 보관 기간 (일, 마지막 사용 기준). 0이면 기간 제한 없음
+MEMO_MAX_AGE_DAYS = float(os.getenv('MEMO_MAX_AGE_DAYS', '30'))
+
+# 캐시 전체 최대 크기 (bytes). 넘으면 오래 사용하지 않은 항목부터 삭제. 0이면 크기 제한 없음
+MEMO_MAX_BYTES = int(os.getenv('MEMO_MAX_BYTES', '0'))
+
+# 컴포넌트 버전. 지정하지 않으면 컴포넌트와 common 소스 코드의 해시를 사용
+COMPONENT_VERSION = os.getenv('COMPONENT_VERSION')
+
+# 캐시 키에서 제외할 자격 증명 키
+CREDENTIAL_KEYS = {'access_key', 'secret_key', 'refresh_token', 'access_token', 'password', 'token', 'api_key'}
+
+# 결과에 영향을 주지 않아 캐시 키에서 제외할 args 키
+IGNORED_ARGS = {'delete_input'}
+
+MANIFEST = 'manifest.json'
+
+# 소스 해시에 포함할 파일 확장자 (불용어 사전 등 결과에 영향을 주는 데이터 파일 포함)
+_SOURCE_EXTENSIONS = ('.py', '.txt', '.json', '.csv')
+_SKIP_DIRS = {'tmp', '__pycache__', 'model', 'common', '.git'}
+
+_state = {'key': None, 'status': None, 'copied_bytes': 0, 'created': None, 'evicted': 0}
+
+
+def _is_location(value) -> bool:
+    return isinstance(value, dict) and 'bucket_name' in value and 'object_path' in value
+
+
+def _scrub(value):
+    # 자격 증명과 엔드포인트는 결과에 영향을 주지 않으므로 키에서 제외
+    if isinstance(value, dict):
+        return {k: _scrub(v) for k, v in sorted(value.items()) if k not in CREDENTIAL_KEYS and k != 'end_point'}
+    if isinstance(value, list):
+        return [_scrub(v) for v in value]
+    return value
+
+
+def _hash_tree(digest, root: str, sizes_only: bool = False):
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if sizes_only or d not in _SKIP_DIRS)
+        for filename in sorted(filenames):
+            path = os.path.join(dirpath, filename)
+            digest.update(os.path.relpath(path, root).encode('utf-8'))
+            if sizes_only:
+                # 모델 가중치처럼 큰 파일은 이름과 크기만 반영
+                digest.update(str(os.path.getsize(path)).encode('utf-8'))
+            elif filename.endswith(_SOURCE_EXTENSIONS):
+                with open(path, 'rb') as f:
+                    digest.update(f.read())
+
+
+def component_version(extra_paths: list = None) -> str:
+    """
+    캐시 키에 사용할 컴포넌트 버전을 반환합니다.
+
+    COMPONENT_VERSION 환경변수가 있으면 그 값을, 없으면 컴포넌트 디렉터리(현재 작업 디렉터리)와
+    common 패키지 소스의 해시를 사용합니다. extra_paths의 디렉터리(예: ./model)는 파일 이름과 크기만 반영합니다.
+    """
+    if COMPONENT_VERSION:
+        return COMPONENT_VERSION
+    digest = hashlib.sha256()
+    _hash_tree(digest, os.getcwd())
+    _hash_tree(digest, os.path.dirname(os.path.abspath(__file__)))
+    for path in extra_paths or []:
+        if os.path.exists(path):
+            _hash_tree(digest, path, sizes_only=True)
+    return digest.hexdigest()[:16]
+
+
+def _args_material(args: dict, inputs: list, outputs: list) -> dict:
+    # 입력/출력 위치, 결과에 영향을 주지 않는 키, 자격 증명을 뺀 args
+    return {
+        name: _scrub(value) for name, value in args.items()
+        if name not in inputs and name not in outputs and name not in IGNORED_ARGS and not _is_location(value)
+    }
+
+
+def _output_formats(args: dict, outputs: list) -> dict:
+    # 출력 위치는 경로 대신 확장자(.csv, .parquet, .gz 등 출력 형식을 결정)만 반영
+    formats = {}
+    for name in outputs:
+        filename = os.path.basename(args[name]['object_path'])
+        formats[name] = filename.split('.', 1)[1] if '.' in filename else ''
+    return formats
+
+
+def _env_material() -> dict:
+    # args 밖에서 결과에 영향을 주는 환경 변수 (CSV 파서 엔진, 텍스트 컬럼 저장 방식, 출력 압축)
+    return {'CSV_ENGINE': CSV_ENGINE, 'STRING_STORAGE': STRING_STORAGE, 'S3_OUTPUT_COMPRESSION': S3_OUTPUT_COMPRESSION}
+
+
+def _hash_material(material: dict) -> str:
+    return hashlib.sha256(json.dumps(material, sort_keys=True, ensure_ascii=False, default=str).encode('utf-8')).hexdigest()
+
+
+def settings_hash(args: dict, inputs: list, outputs: list, version: str) -> str:
+    """
+    memo_key와 같은 기준(자격 증명을 뺀 args, 결과에 영향을 주는 환경 변수, 출력 형식, 컴포넌트 버전)으로 입력 내용을 뺀 설정의 해시를 계산합니다.
+    증분 처리가 기존 결과를 만든 설정과 지금 설정이 같은지 확인하는 데 사용합니다.
+
+    Parameters:
+    - args (dict): config.py production args
+    - inputs (list): 입력 객체 위치가 들어 있는 args 키 목록
+    - outputs (list): 결과 객체 위치가 들어 있는 args 키 목록
+    - version (str): 컴포넌트 버전 (component_version)
+
+    Returns:
+    - str: 설정 해시
+    """
+    return _hash_material({'version': version, 'outputs': _output_formats(args, outputs), 'args': _args_material(args, inputs, outputs),
+                           'env': _env_material()})
+
+
+def memo_key(component: str, args: dict, inputs: list, outputs: list, version: str) -> tuple:
+    """
+    입력 객체의 ETag, 자격 증명을 뺀 args, 결과에 영향을 주는 환경 변수, 컴포넌트 버전으로 캐시 키를 계산합니다.
+
+    입력 객체는 경로가 아니라 ETag와 크기로 반영하므로 같은 내용이 다른 경로에 있어도 같은 키가 됩니다.
+    출력 위치는 경로 대신 확장자(.csv, .parquet, .gz 등 출력 형식을 결정)만 반영합니다.
+    CSV_ENGINE(날짜 타입 추론), STRING_STORAGE(텍스트 컬럼 타입), S3_OUTPUT_COMPRESSION(출력 압축)이 다르면 다른 키가 됩니다.
+
+    Parameters:
+    - component (str): 컴포넌트 이름
+    - args (dict): config.py production args
+    - inputs (list): 입력 객체 위치가 들어 있는 args 키 목록
+    - outputs (list): 결과 객체 위치가 들어 있는 args 키 목록
+    - version (str): 컴포넌트 버전
+
+    Returns:
+    - tuple: (캐시 키, 키 계산에 사용한 내용 dict)
+    """
+    material = {'component': component, 'version': version, 'inputs': {}, 'outputs': _output_formats(args, outputs),
+                'args': _args_material(args, inputs, outputs), 'env': _env_material()}
+    if shard_mode() == 'shard':
+        # 같은 입력의 샤드마다 다른 결과이므로 샤드 번호를 키에 포함
+        material['shard'] = f'{SHARD_INDEX}/{SHARD_COUNT}'
+    for name in inputs:
+        location = args[name]
+        s3_resource = create_s3_client(location['end_point'], location['access_key'], location['secret_key'])
+        head = head_object(s3_resource, location['bucket_name'], location['object_path'])
+        material['inputs'][name] = {'etag': head['ETag'], 'size': head['ContentLength']} if head else None
+    return _hash_material(material), material
+
+
+def _cache_client():
+    return create_s3_client(MEMO_CACHE['end_point'], MEMO_CACHE['access_key'], MEMO_CACHE['secret_key'])
+
+
+def _entry_prefix(key: str) -> str:
+    return f"{MEMO_CACHE['object_path'].rstrip('/')}/{key}/"
+
+
+def _read_manifest(s3_resource, path: str) -> dict:
+    if head_object(s3_resource, MEMO_CACHE['bucket_name'], path) is None:
+        return None
+    with get_object(s3_resource, MEMO_CACHE['bucket_name'], path) as f:
+        return json.load(f)
+
+
+def _expired(manifest: dict, now: float) -> bool:
+    return MEMO_MAX_AGE_DAYS > 0 and now - manifest['last_used'] > MEMO_MAX_AGE_DAYS * 86400
+
+
+def _restore(key: str, manifest: dict, args: dict, report_key: str):
+    cache = _cache_client()
+    for name, cached in manifest['objects'].items():
+        location = args[name]
+        target = create_s3_client(location['end_point'], location['access_key'], location['secret_key'])
+        if name == report_key:
+            # 보고서는 캐시에서 복사되었음을 덧붙여 저장
+            with get_object(cache, MEMO_CACHE['bucket_name'], cached['path']) as f:
+                report = f.read()
+            _state['copied_bytes'] += len(report.encode('utf-8'))
+            save_report(target, report + memo_report_section(), location['bucket_name'], location['object_path'])
+        else:
+            _state['copied_bytes'] += copy_object(cache, MEMO_CACHE['bucket_name'], cached['path'], target, location['bucket_name'], location['object_path'])
+
+
+def _store(key: str, material: dict, args: dict, outputs: list):
+    cache = _cache_client()
+    prefix = _entry_prefix(key)
+    objects = {}
+    for name in outputs:
+        location = args[name]
+        source = create_s3_client(location['end_point'], location['access_key'], location['secret_key'])
+        if head_object(source, location['bucket_name'], location['object_path']) is None:
+            continue
+        path = prefix + name
+        size = copy_object(source, location['bucket_name'], location['object_path'], cache, MEMO_CACHE['bucket_name'], path)
+        objects[name] = {'path': path, 'bytes': size}
+    now = time.time()
+    manifest = {'key': key, 'created': now, 'last_used': now, 'material': material, 'objects': objects}
+    # manifest는 결과 복사가 모두 끝난 뒤 마지막에 저장 (manifest가 있는 항목만 완전한 캐시로 사용)
+    save_report(cache, json.dumps(manifest, ensure_ascii=False, indent=2), MEMO_CACHE['bucket_name'], prefix + MANIFEST)
+
+
+def evict(now: float = None) -> int:
+    """
+    보관 기간이 지난 캐시 항목을 삭제하고, 전체 크기가 MEMO_MAX_BYTES를 넘으면
+    마지막 사용 시각이 오래된 항목부터 삭제합니다.
+
+    Returns:
+    - int: 삭제한 캐시 항목 수
+    """
+    now = now or time.time()
+    cache = _cache_client()
+    bucket = cache.Bucket(MEMO_CACHE['bucket_name'])
+    root = MEMO_CACHE['object_path'].rstrip('/') + '/'
+    entries = {}
+    for obj in bucket.objects.filter(Prefix=root):
+        key = obj.key[len(root):].split('/', 1)[0]
+        entry = entries.setdefault(key, {'objects': [], 'bytes': 0, 'last_used': 0.0, 'complete': False})
+        entry['objects'].append(obj.key)
+        entry['bytes'] += obj.size
+        # manifest는 적중할 때마다 다시 저장하므로 수정 시각이 마지막 사용 시각
+        modified = obj.last_modified.timestamp()
+        if obj.key.endswith('/' + MANIFEST):
+            entry['complete'] = True
+            entry['last_used'] = modified
+        elif not entry['complete']:
+            entry['last_used'] = max(entry['last_used'], modified)
+
+    # 기간이 지난 항목(manifest 없이 남은 미완성 항목 포함) 먼저, 이후 크기 제한을 넘는 동안 오래된 순으로 삭제
+    expired = [key for key, entry in entries.items() if _expired(entry, now)]
+    remaining = sorted((key for key in entries if key not in expired), key=lambda k: entries[k]['last_used'])
+    total = sum(entries[key]['bytes'] for key in remaining)
+    while MEMO_MAX_BYTES > 0 and total > MEMO_MAX_BYTES and remaining:
+        key = remaining.pop(0)
+        expired.append(key)
+        total -= entries[key]['bytes']
+
+    for key in expired:
+        objects = entries[key]['objects']
+        for i in range(0, len(objects), 1000):
+            bucket.delete_objects(Delete={'Objects': [{'Key': k} for k in objects[i:i + 1000]], 'Quiet': True})
+    if expired:
+        print(f'Evicted {len(expired)} memo cache entries')
+    return len(expired)
+
+
+def run_memoized(run, args: dict, component: str, inputs: list, outputs: list, report_key: str = 'task_report', version_paths: list = None):
+    """
+    입력 객체와 설정이 같은 이전 실행 결과가 캐시에 있으면 run 대신 캐시된 결과와 보고서를 복사합니다.
+
+    MEMO_CACHE가 지정되지 않았으면 run(args)만 실행합니다. 캐시에 없으면 run(args)를 실행한 뒤
+    결과 객체들을 캐시에 복사하고, 보관 기간/크기 제한에 따라 오래된 항목을 정리합니다.
+
+    Parameters:
+    - run (callable): args dict를 받아 작업 하나를 처리하는 함수
+    - args (dict): config.py production args
+    - component (str): 컴포넌트 이름
+    - inputs (list): 입력 객체 위치가 들어 있는 args 키 목록 (예: ['input1'])
+    - outputs (list): 결과 객체 위치가 들어 있는 args 키 목록 (보고서 포함, 예: ['output1', 'task_report'])
+    - report_key (str): outputs 중 작업 보고서 위치 키
+    - version_paths (list): 버전 해시에 이름과 크기를 반영할 추가 경로 (예: ['./model'])
+    """
+    _state.update(key=None, status=None, copied_bytes=0, created=None, evicted=0)
+    if MEMO_CACHE is None:
+        return run(args)
+
+    key, material = memo_key(component, args, inputs, outputs, component_version(version_paths))
+    _state['key'] = key
+    cache = _cache_client()
+    manifest_path = _entry_prefix(key) + MANIFEST
+    manifest = _read_manifest(cache, manifest_path)
+    now = time.time()
+    if manifest is not None and not _expired(manifest, now):
+        print(f'Memo cache hit: {key}')
+        _state.update(status='hit', created=manifest['created'])
+        _restore(key, manifest, args, report_key)
+        manifest['last_used'] = now
+        save_report(cache, json.dumps(manifest, ensure_ascii=False, indent=2), MEMO_CACHE['bucket_name'], manifest_path)
+        return None
+
+    print(f'Memo cache miss: {key}')
+    _state['status'] = 'miss'
+    result = run(args)
+    try:
+        _store(key, material, args, outputs)
+        _state['evicted'] = evict(now)
+    except Exception as e:
+        # 결과는 이미 저장되었으므로 캐시 저장 실패로 작업을 실패시키지 않음
+        print(f'Failed to store memo cache entry {key}: {e}')
+    return result
+
+
+def memo_report_section() -> str:
+    """
+    결과 캐시를 사용한 경우 캐시 키와 적중 여부를 보고서 섹션으로 생성합니다.
+    """
+    if _state['status'] != 'hit':
+        return ''
+    created = datetime.fromtimestamp(_state['created']).strftime('%Y-%m-%d %H:%M:%S')
+    return f"""
+## 결과 캐시
+- **상태**: 적중 (solution을 실행하지 않고 캐시된 결과와 보고서를 복사함)
+- **캐시 키**: {_state['key']}
+- **원래 실행 시각**: {created} (위 보고서의 소요 시간과 Object Storage 통계는 원래 실행 기준)
+- **복사한 크기**: {_state['copied_bytes'] / MB:.2f} MB
+"""
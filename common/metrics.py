@@ -0,0 +1,210 @@
+import json
+import os
+import resource
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from common.startup import process_start_time
+
+MB = 1024 * 1024
+
+# false이면 보고서 옆에 metrics.json을 업로드하지 않음 (보고서의 단계별 처리 시간 섹션은 그대로 표시)
+METRICS_JSON = os.getenv('METRICS_JSON', 'true').lower() == 'true'
+
+# 보고서와 metrics.json에 표시할 단계와 이름 (순서대로 표시)
+STAGES = {
+    'download': '다운로드',
+    'parse': '파싱',
+    'compute': '계산',
+    'serialize': '직렬화',
+    'upload': '업로드',
+}
+
+# metrics.json 형식 버전. 필드 의미가 바뀌면 올림
+METRICS_VERSION = 1
+
+# peak_rss_scope: 'job'이면 최대 RSS가 작업 시작(상주 워커는 reset_metrics) 이후 값,
+# 'process'이면 최대치를 초기화할 수 없어 프로세스 시작 이후 값 (상주 워커에서는 이전 작업의 최대치를 포함)
+_state = {'started': process_start_time(), 'peak_rss_scope': 'job'}
+_stages = {}
+_lock = threading.Lock()
+_local = threading.local()
+
+
+def _vm_hwm() -> int:
+    # 리눅스의 /proc/self/status VmHWM(KB)은 clear_refs로 초기화할 수 있는 최대 RSS. 없으면 None
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def peak_rss() -> int:
+    """
+    이 프로세스의 최대 RSS(bytes)를 반환합니다. 자식 프로세스(csv-tokenize의 형태소 분석 풀 등)는 포함되지 않습니다.
+
+    리눅스에서는 reset_peak_rss()로 초기화되는 VmHWM을, 그 외에는 프로세스 시작 이후의 ru_maxrss
+    (리눅스는 KB, macOS는 bytes 단위)를 사용합니다.
+    """
+    hwm = _vm_hwm()
+    if hwm is not None:
+        return hwm
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def reset_peak_rss():
+    """
+    최대 RSS를 현재 RSS로 초기화합니다 (/proc/self/clear_refs에 5를 씀).
+    초기화할 수 없으면 이후 보고서의 최대 RSS를 프로세스 시작 이후 값으로 표시합니다.
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        scope = 'job' if _vm_hwm() is not None else 'process'
+    except OSError:
+        scope = 'process'
+    _state['peak_rss_scope'] = scope
+
+
+def peak_rss_label() -> str:
+    return '최대 RSS' if _state['peak_rss_scope'] == 'job' else '최대 RSS (프로세스 시작 이후, 이전 작업 포함)'
+
+
+@contextmanager
+def span(stage: str, nbytes: int = 0):
+    """
+    블록 실행 시간을 stage 단계로 기록하는 context manager.
+
+    단계는 중첩될 수 있으며(예: 직렬화 중 multipart 파트 업로드를 기다린 시간), 자체 시간은
+    같은 스레드에서 실행된 하위 단계 시간을 뺀 값입니다. 블록이 끝날 때의 프로세스 최대 RSS와
+    블록 동안 최대 RSS가 늘어난 양을 함께 기록하므로 어느 단계가 메모리 최대치를 만들었는지 알 수 있습니다.
+
+    Parameters:
+    - stage (str): 단계 이름 (STAGES의 키 또는 임의의 이름)
+    - nbytes (int): 단계에서 처리한 바이트 수. 블록 안에서 알게 되면 yield된 dict의 'bytes'에 더함
+
+    Yields:
+    - dict: 'bytes' 키를 가진 기록용 dict
+    """
+    stack = getattr(_local, 'stack', None)
+    if stack is None:
+        stack = _local.stack = []
+    frame = {'children': 0.0, 'bytes': nbytes}
+    stack.append(frame)
+    rss_before = peak_rss()
+    start = time.perf_counter()
+    try:
+        yield frame
+    finally:
+        elapsed = time.perf_counter() - start
+        stack.pop()
+        if stack:
+            stack[-1]['children'] += elapsed
+        rss_after = peak_rss()
+        with _lock:
+            record = _stages.setdefault(stage, {
+                'seconds': 0.0, 'self_seconds': 0.0, 'calls': 0, 'bytes': 0,
+                'peak_rss_bytes': 0, 'rss_growth_bytes': 0,
+            })
+            # 다른 스레드에서 동시에 실행된 같은 단계는 시간이 겹칠 수 있음
+            record['seconds'] += elapsed
+            record['self_seconds'] += elapsed - frame['children']
+            record['calls'] += 1
+            record['bytes'] += frame['bytes']
+            record['peak_rss_bytes'] = max(record['peak_rss_bytes'], rss_after)
+            record['rss_growth_bytes'] += rss_after - rss_before
+
+
+def reset_metrics():
+    """
+    단계별 기록을 비우고 작업 시작 시각과 최대 RSS를 지금으로 맞춥니다. 상주 워커가 작업마다 호출합니다 (reset_storage_stats).
+    """
+    with _lock:
+        _stages.clear()
+        _state['started'] = time.time()
+    reset_peak_rss()
+
+
+def stage_metrics() -> dict:
+    """
+    기록된 단계별 측정값을 STAGES 순서(그 외 단계는 뒤에)로 반환합니다.
+
+    Returns:
+    - dict: 단계 이름 -> seconds(하위 단계 포함 초), self_seconds(자체 초), calls, bytes,
+            peak_rss_bytes(단계가 끝날 때의 프로세스 최대 RSS), rss_growth_bytes(단계 동안 늘어난 최대 RSS)
+    """
+    with _lock:
+        stages = {name: dict(record) for name, record in _stages.items()}
+    order = list(STAGES) + sorted(name for name in stages if name not in STAGES)
+    return {name: stages[name] for name in order if name in stages}
+
+
+def metrics_document(**extra) -> dict:
+    """
+    metrics.json에 저장할 측정값을 생성합니다.
+
+    Parameters:
+    - **extra: 문서에 함께 저장할 값 (예: Object Storage 전송 통계)
+
+    Returns:
+    - dict: 작업 시작/종료 시각, 경과 시간, 최대 RSS(peak_rss_scope: 'job' 또는 'process', 자식 프로세스 제외), 단계별 측정값
+    """
+    finished = time.time()
+    return dict({
+        'version': METRICS_VERSION,
+        'started_at': _state['started'],
+        'finished_at': finished,
+        'elapsed_seconds': finished - _state['started'],
+        'peak_rss_bytes': peak_rss(),
+        'peak_rss_scope': _state['peak_rss_scope'],
+        'stages': stage_metrics(),
+    }, **extra)
+
+
+def metrics_object_path(report_path: str) -> str:
+    """
+    보고서 경로 옆에 저장할 metrics.json 경로를 반환합니다 (예: reports/job.md -> reports/job.metrics.json).
+    """
+    return os.path.splitext(report_path)[0] + '.metrics.json'
+
+
+def dumps_metrics(document: dict) -> bytes:
+    return json.dumps(document, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def metrics_report_section() -> str:
+    """
+    작업 보고서 끝에 덧붙일 단계별 처리 시간과 최대 RSS 섹션을 생성합니다.
+    """
+    stages = stage_metrics()
+    elapsed = time.time() - _state['started']
+    lines = [
+        f'- **작업 시작부터 보고서 작성까지**: {elapsed:.2f}초',
+        f'- **{peak_rss_label()}**: {peak_rss() / MB:.1f} MB',
+    ]
+    if stages:
+        lines += [
+            '',
+            '| 단계 | 시간 (초) | 자체 시간 (초) | 횟수 | 크기 (MB) | 처리량 (MB/s) | 최대 RSS (MB) | RSS 증가 (MB) |',
+            '|---|---|---|---|---|---|---|---|',
+        ]
+        for name, record in stages.items():
+            size = f"{record['bytes'] / MB:.2f}" if record['bytes'] else '-'
+            throughput = (f"{record['bytes'] / MB / record['self_seconds']:.2f}"
+                          if record['bytes'] and record['self_seconds'] > 0 else '-')
+            lines.append(
+                f"| {STAGES.get(name, name)} | {record['seconds']:.2f} | {record['self_seconds']:.2f} | {record['calls']:,} | "
+                f"{size} | {throughput} | {record['peak_rss_bytes'] / MB:.1f} | {record['rss_growth_bytes'] / MB:.1f} |"
+            )
+        lines += [
+            '',
+            '자체 시간은 하위 단계(예: 직렬화 중 업로드 대기) 시간을 뺀 값입니다. 동시 읽기나 출력 스레드에서 실행된 단계는 '
+            '다른 단계와 시간이 겹칠 수 있습니다. 최대 RSS는 이 프로세스의 값이며 자식 프로세스(형태소 분석 풀 등)는 포함되지 않습니다.',
+        ]
+    return '\n## 단계별 처리 시간\n' + '\n'.join(lines) + '\n'
@@ -0,0 +1,171 @@
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+# 계산 스레드와 출력 스레드 사이 대기열에 쌓아 둘 수 있는 최대 결과 조각(청크, 배치) 수.
+# 0이면 출력 스레드 없이 계산 스레드에서 바로 씀
+OUTPUT_QUEUE_SIZE = int(os.getenv('OUTPUT_QUEUE_SIZE', '2'))
+
+_DONE = object()
+
+_local = threading.local()
+
+# 계산 스레드가 출력(직렬화, 업로드)을 기다리느라 멈춘 시간의 합계
+_totals = {'output_wait': 0.0}
+_totals_lock = threading.Lock()
+
+
+@contextmanager
+def output_thread():
+    """
+    이 블록을 실행하는 스레드를 출력 전용 스레드로 표시합니다.
+    출력 전용 스레드에서 발생한 업로드 대기는 계산 스레드의 대기로 집계하지 않습니다.
+    """
+    _local.output_thread = True
+    try:
+        yield
+    finally:
+        _local.output_thread = False
+
+
+def in_output_thread() -> bool:
+    return getattr(_local, 'output_thread', False)
+
+
+def record_output_wait(seconds: float):
+    """
+    계산 스레드가 출력을 기다린 시간을 기록합니다. 출력 전용 스레드에서 호출하면 무시합니다.
+    """
+    if not in_output_thread():
+        with _totals_lock:
+            _totals['output_wait'] += seconds
+
+
+def output_wait() -> float:
+    """
+    이번 실행에서 계산 스레드가 출력을 기다린 시간(초)을 반환합니다.
+    """
+    with _totals_lock:
+        return _totals['output_wait']
+
+
+def reset_output_wait():
+    with _totals_lock:
+        _totals['output_wait'] = 0.0
+
+
+class BackgroundWriter:
+    """
+    계산 스레드가 넘긴 결과 조각을 별도 스레드에서 출력에 쓰는 bounded producer/consumer 대기열.
+
+    계산 스레드는 put으로 조각을 넘기고 바로 다음 조각을 계산하며, 출력 스레드가 앞 조각을
+    직렬화/압축하고 multipart 파트로 업로드합니다. 대기열이 maxsize개로 차면 put이 기다리므로
+    메모리에는 최대 maxsize + 1개 조각만 유지됩니다. 출력 스레드에서 발생한 예외는 다음 put 또는
+    close에서 계산 스레드로 다시 발생합니다.
+
+    Parameters:
+    - write (callable): 조각 하나를 출력에 쓰는 함수 (출력 스레드에서 순서대로 호출)
+    - maxsize (int): 대기열 최대 조각 수. 0이면 put에서 바로 write를 호출
+    """
+
+    def __init__(self, write, maxsize: int = OUTPUT_QUEUE_SIZE):
+        self._write = write
+        self.maxsize = maxsize
+        self.items = 0
+        self.put_wait = 0.0
+        self.drain_wait = 0.0
+        self.write_time = 0.0
+        self._queue = queue.Queue(maxsize=maxsize) if maxsize > 0 else None
+        self._thread = None
+        self._error = None
+        self._closed = False
+
+    def _run(self):
+        with output_thread():
+            while True:
+                item = self._queue.get()
+                if item is _DONE:
+                    return
+                # 오류가 난 뒤에도 대기열은 계속 비워 계산 스레드가 put에서 멈추지 않게 함
+                if self._error is None:
+                    start = time.perf_counter()
+                    try:
+                        self._write(item)
+                    except BaseException as e:
+                        self._error = e
+                    self.write_time += time.perf_counter() - start
+
+    def _raise(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def put(self, item):
+        """
+        결과 조각을 출력 대기열에 넣습니다. 대기열이 가득 차 있으면 자리가 날 때까지 기다립니다.
+        """
+        start = time.perf_counter()
+        if self._queue is None:
+            # 업로드 대기는 ObjectWriter가 직접 기록
+            self._write(item)
+            elapsed = time.perf_counter() - start
+            self.write_time += elapsed
+        else:
+            self._raise()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='output-writer', daemon=True)
+                self._thread.start()
+            self._queue.put(item)
+            elapsed = time.perf_counter() - start
+            record_output_wait(elapsed)
+        self.put_wait += elapsed
+        self.items += 1
+
+    def close(self, discard: bool = False):
+        """
+        남은 조각을 모두 쓸 때까지 기다린 뒤 출력 스레드를 종료합니다.
+
+        Parameters:
+        - discard (bool): True이면 남은 조각을 쓰지 않고 버림 (예외로 중단할 때)
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is None:
+            return
+        start = time.perf_counter()
+        if discard and self._error is None:
+            self._error = RuntimeError('출력이 취소되었습니다.')
+        self._queue.put(_DONE)
+        self._thread.join()
+        self.drain_wait = time.perf_counter() - start
+        record_output_wait(self.drain_wait)
+        if discard:
+            self._error = None
+        self._raise()
+
+    @property
+    def hidden_time(self) -> float:
+        """
+        출력에 걸린 시간 중 계산과 겹쳐 계산 스레드가 기다리지 않은 시간(초).
+        """
+        return max(0.0, self.write_time - self.put_wait - self.drain_wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close(discard=exc_type is not None)
+
+
+def overlap_summary(writer: BackgroundWriter) -> str:
+    """
+    보고서에 표시할 출력 대기열 설정과 숨겨진 출력 시간을 한 줄로 요약합니다.
+    """
+    if writer.maxsize <= 0:
+        return '사용 안 함 (계산 스레드에서 바로 출력)'
+    ratio = writer.hidden_time / writer.write_time * 100 if writer.write_time else 0.0
+    return (f'최대 {writer.maxsize}개 조각, 출력 {writer.write_time:.2f}초 중 {writer.hidden_time:.2f}초({ratio:.1f}%)가 '
+            f'계산과 겹침 (계산 스레드 대기 {writer.put_wait + writer.drain_wait:.2f}초)')
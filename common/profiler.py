@@ -0,0 +1,268 @@
+import collections
+import html
+import os
+import sys
+import threading
+import zlib
+
+# 실행 프로파일 방식. sampling(또는 true)이면 일정 간격으로 모든 스레드의 호출 스택을 수집하고,
+# cprofile이면 cProfile로 메인 스레드의 함수 호출 시간을 측정합니다. 작업 보고서 옆에 collapsed stack과
+# SVG flamegraph를 업로드합니다 (common.storage.save_report).
+PROFILE = os.getenv('PROFILE', 'false').lower()
+
+# sampling 방식의 스택 수집 간격 (밀리초)
+PROFILE_INTERVAL_MS = float(os.getenv('PROFILE_INTERVAL_MS', '10'))
+
+# flamegraph 크기
+FLAMEGRAPH_WIDTH = 1200
+FLAMEGRAPH_ROW_HEIGHT = 16
+
+# 메인 스레드가 아닌 스레드에서 이 함수가 가장 안쪽 프레임이면 일을 기다리는 중으로 보고 수집하지 않음
+# (전송/출력 스레드 풀의 대기가 flamegraph를 덮지 않도록 함. 메인 스레드의 대기는 실제 소요 시간이므로 그대로 수집)
+_IDLE_FRAMES = {
+    ('threading.py', 'wait'),
+    ('threading.py', '_wait_for_tstate_lock'),
+    ('queue.py', 'get'),
+    ('thread.py', '_worker'),
+    ('selectors.py', 'select'),
+}
+
+_state = {'profiler': None}
+_lock = threading.Lock()
+
+
+def profile_mode() -> str:
+    """
+    PROFILE 환경변수에 따른 프로파일 방식('sampling', 'cprofile')을 반환합니다. 사용하지 않으면 None.
+    sys._current_frames가 없는 인터프리터에서는 sampling 대신 cProfile을 사용합니다.
+    """
+    if PROFILE in ('sampling', 'true'):
+        return 'sampling' if hasattr(sys, '_current_frames') else 'cprofile'
+    if PROFILE == 'cprofile':
+        return 'cprofile'
+    return None
+
+
+def _label(filename: str, line: int, name: str) -> str:
+    # 함수 이름과 정의 위치 (경로는 마지막 두 단계만 표시). cProfile의 내장 함수는 위치 없이 이름만
+    if not line:
+        return name
+    path = '/'.join(filename.replace('\\', '/').split('/')[-2:])
+    return f'{name} ({path}:{line})'
+
+
+class SamplingProfiler:
+    """
+    별도 스레드에서 일정 간격으로 sys._current_frames()를 읽어 스레드별 호출 스택을 세는 프로파일러.
+
+    함수 호출마다 훅을 거는 cProfile과 달리 수집 간격마다 한 번만 스택을 읽으므로 부하가 작고,
+    스레드 풀(업로드, 출력 스레드)에서 실행되는 코드도 함께 수집됩니다. 스택의 맨 아래에는 스레드 이름이 붙습니다.
+
+    Parameters:
+    - interval (float): 수집 간격 (초)
+    """
+
+    unit = 'samples'
+
+    def __init__(self, interval: float = PROFILE_INTERVAL_MS / 1000):
+        self.interval = interval
+        self.stacks = collections.Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='profile-sampler', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self) -> collections.Counter:
+        self._stop.set()
+        self._thread.join()
+        return self.stacks
+
+    def _run(self):
+        own = threading.get_ident()
+        main = threading.main_thread().ident
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                code = frame.f_code
+                if ident != main and (os.path.basename(code.co_filename), code.co_name) in _IDLE_FRAMES:
+                    continue
+                labels = []
+                while frame is not None:
+                    labels.append(_label(frame.f_code.co_filename, frame.f_code.co_firstlineno, frame.f_code.co_name))
+                    frame = frame.f_back
+                labels.append(names.get(ident, f'thread-{ident}'))
+                self.stacks[';'.join(reversed(labels))] += 1
+            self.samples += 1
+
+
+class CallProfiler:
+    """
+    cProfile로 메인 스레드의 함수 호출 시간을 측정하고, 호출 관계를 따라 collapsed stack(마이크로초)으로 바꾸는 프로파일러.
+
+    cProfile은 호출자-피호출자 쌍의 시간만 기록하므로, 여러 경로에서 호출되는 함수의 시간은
+    호출자별 누적 시간 비율로 나누어 스택에 배분합니다.
+    """
+
+    unit = 'us'
+
+    # 스택으로 펼칠 최대 깊이와, 이보다 짧은 경로(마이크로초)는 생략
+    MAX_DEPTH = 64
+    MIN_MICROSECONDS = 100
+
+    def __init__(self):
+        import cProfile
+        self._profile = cProfile.Profile()
+
+    def start(self):
+        self._profile.enable()
+
+    def stop(self) -> collections.Counter:
+        import pstats
+        self._profile.disable()
+        stats = pstats.Stats(self._profile).stats
+        callees = collections.defaultdict(list)
+        for func, (_, _, _, _, callers) in stats.items():
+            for caller, (_, _, _, cumulative) in callers.items():
+                callees[caller].append((func, cumulative))
+        stacks = collections.Counter()
+        roots = [func for func, (_, _, _, _, callers) in stats.items() if not callers]
+        for root in roots:
+            self._collapse(stats, callees, root, stats[root][3], [], stacks)
+        return stacks
+
+    def _collapse(self, stats, callees, func, seconds, path, stacks):
+        if seconds * 1e6 < self.MIN_MICROSECONDS or func in path or len(path) >= self.MAX_DEPTH:
+            return
+        path = path + [func]
+        # 이 경로로 들어온 시간의 비율만큼 자체 시간과 하위 호출 시간을 배분
+        total = stats[func][3]
+        scale = seconds / total if total > 0 else 0.0
+        microseconds = int(stats[func][2] * scale * 1e6)
+        if microseconds:
+            stacks[';'.join(_label(*f) for f in path)] += microseconds
+        for callee, cumulative in callees.get(func, []):
+            self._collapse(stats, callees, callee, cumulative * scale, path, stacks)
+
+
+def start_profile():
+    """
+    PROFILE이 설정되어 있으면 프로파일을 시작합니다. 이미 실행 중이면 아무것도 하지 않습니다.
+    common 패키지를 처음 import할 때 호출되므로 입력 다운로드부터 보고서 저장까지 측정됩니다.
+    """
+    mode = profile_mode()
+    if mode is None:
+        return
+    with _lock:
+        if _state['profiler'] is not None:
+            return
+        profiler = SamplingProfiler() if mode == 'sampling' else CallProfiler()
+        profiler.start()
+        _state['profiler'] = profiler
+
+
+def stop_profile() -> tuple:
+    """
+    실행 중인 프로파일을 멈추고 (collapsed stack Counter, 단위)를 반환합니다. 실행 중이 아니면 (None, None).
+    """
+    with _lock:
+        profiler, _state['profiler'] = _state['profiler'], None
+    if profiler is None:
+        return None, None
+    return profiler.stop(), profiler.unit
+
+
+def reset_profile():
+    """
+    지금까지의 프로파일을 버리고 새로 시작합니다. 상주 워커가 작업마다 호출합니다 (reset_storage_stats).
+    """
+    stop_profile()
+    start_profile()
+
+
+def profiling() -> bool:
+    return _state['profiler'] is not None
+
+
+def profile_object_paths(report_path: str) -> dict:
+    """
+    보고서 경로 옆에 저장할 프로파일 결과 경로를 반환합니다
+    (예: reports/job.md -> reports/job.profile.txt, reports/job.profile.svg).
+    """
+    base = os.path.splitext(report_path)[0]
+    return {'collapsed': base + '.profile.txt', 'flamegraph': base + '.profile.svg'}
+
+
+def collapsed_text(stacks: collections.Counter) -> str:
+    """
+    collapsed stack 형식(한 줄에 'frame;frame;frame 값')으로 반환합니다. flamegraph.pl, speedscope에서 열 수 있습니다.
+    """
+    return ''.join(f'{stack} {count}\n' for stack, count in sorted(stacks.items()))
+
+
+def _color(name: str) -> str:
+    # 같은 함수는 같은 색이 되도록 이름의 해시로 따뜻한 계열 색을 정함
+    value = zlib.crc32(name.encode('utf-8'))
+    return f'rgb({205 + value % 50},{(value >> 8) % 180 + 50},{(value >> 16) % 55})'
+
+
+def flamegraph_svg(stacks: collections.Counter, title: str, unit: str = 'samples') -> str:
+    """
+    collapsed stack으로 SVG flamegraph를 생성합니다. 아래쪽이 호출 스택의 바깥(스레드, 진입점)이고,
+    막대 너비는 해당 스택에서 보낸 시간(수집 횟수)에 비례합니다. 막대에 마우스를 올리면 전체 이름과 비율이 표시됩니다.
+
+    Parameters:
+    - stacks (Counter): collapsed stack -> 값
+    - title (str): 그림 제목
+    - unit (str): 값의 단위 ('samples' 또는 'us')
+
+    Returns:
+    - str: SVG 문서
+    """
+    root = {'children': {}, 'value': 0}
+    for stack, count in stacks.items():
+        node = root
+        node['value'] += count
+        for name in stack.split(';'):
+            node = node['children'].setdefault(name, {'children': {}, 'value': 0})
+            node['value'] += count
+
+    total = root['value'] or 1
+    rects = []
+    depth = 0
+
+    def layout(node, x, level):
+        nonlocal depth
+        for name, child in sorted(node['children'].items()):
+            width = child['value'] / total * FLAMEGRAPH_WIDTH
+            if width >= 0.3:
+                depth = max(depth, level + 1)
+                rects.append((name, x, level, width, child['value']))
+                layout(child, x, level + 1)
+            x += width
+
+    layout(root, 0.0, 0)
+    header = 30
+    height = header + depth * FLAMEGRAPH_ROW_HEIGHT + 10
+    lines = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{FLAMEGRAPH_WIDTH}" height="{height}" '
+        f'font-family="monospace" font-size="11">',
+        f'<rect width="100%" height="100%" fill="#fafafa"/>',
+        f'<text x="{FLAMEGRAPH_WIDTH / 2}" y="20" text-anchor="middle" font-size="15">{html.escape(title)}</text>',
+    ]
+    for name, x, level, width, value in rects:
+        y = height - 10 - (level + 1) * FLAMEGRAPH_ROW_HEIGHT
+        label = html.escape(name)
+        tooltip = f'{label} ({value:,} {unit}, {value / total * 100:.2f}%)'
+        lines.append(f'<g><title>{tooltip}</title>'
+                     f'<rect x="{x:.2f}" y="{y}" width="{width:.2f}" height="{FLAMEGRAPH_ROW_HEIGHT - 1}" fill="{_color(name)}" rx="1"/>')
+        chars = int((width - 6) / 6.6)
+        if chars >= 3:
+            text = name if len(name) <= chars else name[:chars - 2] + '..'
+            lines.append(f'<text x="{x + 3:.2f}" y="{y + FLAMEGRAPH_ROW_HEIGHT - 4}">{html.escape(text)}</text>')
+        lines.append('</g>')
+    lines.append('</svg>')
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,87 @@
+import json
+import os
+import sys
+from typing import TYPE_CHECKING
+
+# json-upload처럼 pandas 없이 보고서 미리보기만 쓰는 컴포넌트가 있으므로 pandas는 타입 표기용으로만 import
+if TYPE_CHECKING:
+    import pandas as pd
+
+# 작업 보고서 생성 비용을 입력 크기와 무관하게 유지하기 위한 상한.
+# 보고서에 넣을 JSON 미리보기의 최대 문자 수
+REPORT_PREVIEW_CHARS = int(os.getenv('REPORT_PREVIEW_CHARS', '2000'))
+
+# 보고서에 하나씩 나열할 최대 그룹/카테고리 수 (나머지는 개수만 표시)
+REPORT_MAX_ITEMS = int(os.getenv('REPORT_MAX_ITEMS', '50'))
+
+# 메모리 사용량을 추정할 때 object 컬럼마다 크기를 재는 최대 값 수
+MEMORY_SAMPLE_ROWS = 1000
+
+
+def estimate_memory(df: 'pd.DataFrame') -> int:
+    """
+    DataFrame의 메모리 사용량(bytes)을 표본으로 추정하는 함수.
+
+    memory_usage(deep=True)는 object 컬럼의 모든 Python 객체 크기를 재므로 행 수에 비례해 느려집니다.
+    숫자/Arrow 컬럼은 버퍼 크기를 그대로 쓰고, Python 객체를 담는 컬럼은 일정 간격으로 고른
+    최대 MEMORY_SAMPLE_ROWS개 값의 평균 크기에 행 수를 곱해 더합니다.
+
+    Parameters:
+    - df (pd.DataFrame): 메모리 사용량을 추정할 데이터
+
+    Returns:
+    - int: 추정 메모리 사용량 (bytes)
+    """
+    total = int(df.memory_usage(index=True, deep=False).sum())
+    rows = len(df)
+    if rows == 0:
+        return total
+    step = max(1, rows // MEMORY_SAMPLE_ROWS)
+    for i in range(df.shape[1]):
+        column = df.iloc[:, i]
+        if column.dtype == object or getattr(column.dtype, 'storage', None) == 'python':
+            sample = column.array[::step][:MEMORY_SAMPLE_ROWS]
+            total += int(sum(sys.getsizeof(value) for value in sample) / len(sample) * rows)
+    return total
+
+
+def json_preview(data: object, max_chars: int = REPORT_PREVIEW_CHARS) -> str:
+    """
+    데이터 구조를 보여 주기 위한 JSON 미리보기를 최대 max_chars 문자까지 생성하는 함수.
+
+    전체를 json.dumps하지 않고 인코더가 만드는 조각을 필요한 만큼만 이어 붙이므로,
+    데이터가 커도 보고서 생성 시간과 크기가 늘어나지 않습니다.
+
+    Parameters:
+    - data (object): JSON으로 직렬화할 수 있는 값
+    - max_chars (int): 미리보기 최대 문자 수
+
+    Returns:
+    - str: 들여쓰기 2칸 JSON 문자열. 잘린 경우 끝에 생략 표시
+    """
+    parts, size = [], 0
+    # indent를 지정하면 파이썬 인코더가 조각을 차례로 만들어 내므로 앞부분만 인코딩하고 멈출 수 있음
+    for chunk in json.JSONEncoder(indent=2, ensure_ascii=False).iterencode(data):
+        parts.append(chunk)
+        size += len(chunk)
+        if size > max_chars:
+            return ''.join(parts)[:max_chars] + '\n... (생략)'
+    return ''.join(parts)
+
+
+def capped_lines(lines: list, total: int, max_items: int = REPORT_MAX_ITEMS) -> str:
+    """
+    보고서 항목 목록을 최대 max_items줄까지 이어 붙이고, 나머지는 개수만 표시하는 함수.
+
+    Parameters:
+    - lines (list): 보고서에 표시할 줄 (앞에서부터 max_items개만 사용)
+    - total (int): 전체 항목 수
+    - max_items (int): 표시할 최대 항목 수
+
+    Returns:
+    - str: 줄바꿈으로 이은 항목 목록
+    """
+    shown = list(lines[:max_items])
+    if total > len(shown):
+        shown.append(f'  - ... 외 {total - len(shown):,}개')
+    return '\n'.join(shown)
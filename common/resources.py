@@ -0,0 +1,266 @@
+import os
+
+# cgroup 파일 시스템 위치
+CGROUP_ROOT = '/sys/fs/cgroup'
+
+# 지정하면 cgroup 대신 이 값을 CPU 수/메모리 한도(bytes)로 사용
+CPU_LIMIT = os.getenv('CPU_LIMIT')
+MEMORY_LIMIT = os.getenv('MEMORY_LIMIT')
+
+# I/O 대기 위주의 스레드(S3 전송 등)는 CPU를 적게 쓰므로 CPU 1개당 이 수까지 허용
+IO_THREADS_PER_CPU = 4
+
+# 병렬 작업자와 전송 버퍼가 사용할 수 있는 메모리 한도 비율 (나머지는 DataFrame 등 본 처리용)
+WORKER_MEMORY_FRACTION = 0.5
+
+# CSV 청크 하나가 사용할 수 있는 메모리 한도 비율과, CSV 1바이트가 DataFrame에서 차지하는 대략적인 크기
+CHUNK_MEMORY_FRACTION = 0.1
+DATAFRAME_EXPANSION = 10
+
+# cgroup v1에서 한도가 없을 때 memory.limit_in_bytes에 기록되는 값보다 작은 기준
+_UNLIMITED_BYTES = 1 << 60
+
+_limits = None
+_decisions = {}
+
+
+def _read(path: str) -> str:
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _own_cgroups() -> dict:
+    # /proc/self/cgroup: "계층 ID:컨트롤러:경로" (v2는 "0::경로")
+    groups = {}
+    for line in (_read('/proc/self/cgroup') or '').splitlines():
+        parts = line.split(':', 2)
+        if len(parts) == 3:
+            for controller in parts[1].split(',') if parts[1] else ['']:
+                groups[controller] = parts[2]
+    return groups
+
+
+def _ancestors(root: str, path: str) -> list:
+    # 프로세스의 cgroup 디렉터리부터 루트까지 (중첩된 cgroup은 가장 작은 한도가 적용됨)
+    dirs = []
+    path = (path or '/').strip('/')
+    while True:
+        candidate = os.path.join(root, path) if path else root
+        if os.path.isdir(candidate):
+            dirs.append(candidate)
+        if not path:
+            break
+        path = os.path.dirname(path)
+    return dirs or [root]
+
+
+def _v2_limits(groups: dict) -> tuple:
+    cpu, memory = None, None
+    for directory in _ancestors(CGROUP_ROOT, groups.get('')):
+        quota = (_read(os.path.join(directory, 'cpu.max')) or 'max').split()
+        if quota[0] != 'max':
+            value = int(quota[0]) / int(quota[1] if len(quota) > 1 else 100000)
+            cpu = value if cpu is None else min(cpu, value)
+        limit = _read(os.path.join(directory, 'memory.max'))
+        if limit and limit != 'max':
+            memory = int(limit) if memory is None else min(memory, int(limit))
+    return cpu, memory
+
+
+def _v1_limits(groups: dict) -> tuple:
+    cpu, memory = None, None
+    for controller in ('cpu,cpuacct', 'cpu'):
+        root = os.path.join(CGROUP_ROOT, controller)
+        if not os.path.isdir(root):
+            continue
+        for directory in _ancestors(root, groups.get('cpu')):
+            quota, period = _read(os.path.join(directory, 'cpu.cfs_quota_us')), _read(os.path.join(directory, 'cpu.cfs_period_us'))
+            if quota and period and int(quota) > 0:
+                value = int(quota) / int(period)
+                cpu = value if cpu is None else min(cpu, value)
+        break
+    root = os.path.join(CGROUP_ROOT, 'memory')
+    if os.path.isdir(root):
+        for directory in _ancestors(root, groups.get('memory')):
+            limit = _read(os.path.join(directory, 'memory.limit_in_bytes'))
+            if limit and int(limit) < _UNLIMITED_BYTES:
+                memory = int(limit) if memory is None else min(memory, int(limit))
+    return cpu, memory
+
+
+def _host_memory() -> int:
+    for line in (_read('/proc/meminfo') or '').splitlines():
+        if line.startswith('MemTotal:'):
+            return int(line.split()[1]) * 1024
+    try:
+        return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def cgroup_limits() -> dict:
+    """
+    컨테이너(cgroup v1/v2)의 CPU quota와 메모리 한도, 호스트 CPU/메모리를 읽습니다.
+    결과는 프로세스 안에서 한 번만 계산합니다.
+
+    Returns:
+    - dict: version('v2', 'v1', None), cpu_quota(CPU 수, 없으면 None), memory_limit(bytes, 없으면 None),
+            host_cpus, affinity_cpus(이 프로세스가 사용할 수 있는 CPU 수), host_memory
+    """
+    global _limits
+    if _limits is None:
+        groups = _own_cgroups()
+        if os.path.exists(os.path.join(CGROUP_ROOT, 'cgroup.controllers')):
+            version, (cpu, memory) = 'v2', _v2_limits(groups)
+        elif os.path.isdir(os.path.join(CGROUP_ROOT, 'memory')) or os.path.isdir(os.path.join(CGROUP_ROOT, 'cpu')):
+            version, (cpu, memory) = 'v1', _v1_limits(groups)
+        else:
+            version, cpu, memory = None, None, None
+        host_cpus = os.cpu_count() or 1
+        try:
+            affinity_cpus = len(os.sched_getaffinity(0))
+        except (AttributeError, OSError):
+            affinity_cpus = host_cpus
+        _limits = {
+            'version': version,
+            'cpu_quota': cpu,
+            'memory_limit': memory,
+            'host_cpus': host_cpus,
+            'affinity_cpus': affinity_cpus,
+            'host_memory': _host_memory(),
+        }
+    return _limits
+
+
+def cpu_budget() -> int:
+    """
+    이 프로세스가 실제로 사용할 수 있는 CPU 수를 반환합니다.
+    CPU_LIMIT > cgroup CPU quota > CPU affinity 순으로 적용하며, quota가 소수이면 내림합니다 (최소 1).
+    """
+    if CPU_LIMIT:
+        return max(1, int(float(CPU_LIMIT)))
+    limits = cgroup_limits()
+    cpus = min(limits['host_cpus'], limits['affinity_cpus'])
+    if limits['cpu_quota'] is not None:
+        cpus = min(cpus, int(limits['cpu_quota']))
+    return max(1, cpus)
+
+
+def memory_budget() -> int:
+    """
+    이 프로세스가 사용할 수 있는 메모리(bytes)를 반환합니다.
+    MEMORY_LIMIT > cgroup 메모리 한도와 호스트 메모리 중 작은 값 순으로 적용합니다. 알 수 없으면 None.
+    """
+    if MEMORY_LIMIT:
+        return int(MEMORY_LIMIT)
+    limits = cgroup_limits()
+    candidates = [value for value in (limits['memory_limit'], limits['host_memory']) if value]
+    return min(candidates) if candidates else None
+
+
+def record(name: str, value, basis: str):
+    """
+    보고서에 표시할 병렬도/청크 크기 결정을 기록합니다.
+    """
+    _decisions[name] = (value, basis)
+    return value
+
+
+def process_workers(name: str, per_worker_memory: int = 0, maximum: int = None) -> int:
+    """
+    CPU를 사용하는 병렬 작업자(프로세스, 연산 스레드) 수를 정합니다.
+
+    Parameters:
+    - name (str): 보고서에 표시할 이름
+    - per_worker_memory (int): 작업자 하나가 사용하는 대략적인 메모리 (bytes). 지정하면 메모리 한도로도 제한
+    - maximum (int): 최대 작업자 수
+
+    Returns:
+    - int: 작업자 수 (최소 1)
+    """
+    workers, basis = cpu_budget(), f'CPU {cpu_budget()}개'
+    budget = memory_budget()
+    if per_worker_memory and budget:
+        by_memory = max(1, int(budget * WORKER_MEMORY_FRACTION // per_worker_memory))
+        if by_memory < workers:
+            workers, basis = by_memory, f'메모리 {budget / 1024 ** 2:,.0f} MB / 작업자당 {per_worker_memory / 1024 ** 2:,.0f} MB'
+    if maximum is not None and maximum < workers:
+        workers, basis = max(1, maximum), f'최대 {maximum}'
+    return record(name, workers, basis)
+
+
+def io_workers(name: str, default: int, per_worker_memory: int = 0) -> int:
+    """
+    I/O 대기 위주의 스레드(S3 요청 등) 수를 정합니다. 기본값을 넘지 않는 범위에서
+    CPU 1개당 IO_THREADS_PER_CPU개, 작업자당 버퍼 메모리 기준 한도로 줄입니다.
+
+    Parameters:
+    - name (str): 보고서에 표시할 이름
+    - default (int): CPU/메모리 제한이 없을 때의 스레드 수
+    - per_worker_memory (int): 스레드 하나가 사용하는 버퍼 크기 (bytes)
+
+    Returns:
+    - int: 스레드 수 (최소 1)
+    """
+    workers, basis = default, '기본값'
+    by_cpu = cpu_budget() * IO_THREADS_PER_CPU
+    if by_cpu < workers:
+        workers, basis = by_cpu, f'CPU {cpu_budget()}개 x {IO_THREADS_PER_CPU}'
+    budget = memory_budget()
+    if per_worker_memory and budget:
+        by_memory = max(1, int(budget * WORKER_MEMORY_FRACTION // per_worker_memory))
+        if by_memory < workers:
+            workers, basis = by_memory, f'메모리 {budget / 1024 ** 2:,.0f} MB / 스레드당 {per_worker_memory / 1024 ** 2:,.0f} MB'
+    return record(name, max(1, workers), basis)
+
+
+def chunk_rows(name: str, default: int, row_bytes: float) -> int:
+    """
+    CSV 청크 하나의 행 수를 정합니다. 기본값을 넘지 않는 범위에서, 청크의 DataFrame이
+    메모리 한도의 CHUNK_MEMORY_FRACTION을 넘지 않도록 줄입니다 (최소 1,000행).
+
+    Parameters:
+    - name (str): 보고서에 표시할 이름
+    - default (int): 메모리 제한이 없을 때의 행 수
+    - row_bytes (float): CSV 한 행의 평균 바이트 수
+
+    Returns:
+    - int: 청크당 행 수
+    """
+    budget = memory_budget()
+    if not budget or not row_bytes:
+        return record(name, default, '기본값')
+    by_memory = max(1000, int(budget * CHUNK_MEMORY_FRACTION // (row_bytes * DATAFRAME_EXPANSION)))
+    if by_memory < default:
+        return record(name, by_memory, f'메모리 {budget / 1024 ** 2:,.0f} MB, 행당 약 {row_bytes:,.0f} bytes')
+    return record(name, default, '기본값')
+
+
+def limit_arrow_threads():
+    """
+    pyarrow 연산/IO 스레드 풀 크기를 CPU 예산에 맞춥니다 (기본값은 호스트 코어 수).
+    """
+    if 'pyarrow 스레드 수' in _decisions:
+        return
+    import pyarrow as pa
+    pa.set_cpu_count(process_workers('pyarrow 스레드 수'))
+
+
+def resource_report_section() -> str:
+    """
+    감지한 CPU/메모리 한도와 병렬도/청크 크기 결정을 보고서 섹션으로 생성합니다.
+    """
+    limits = cgroup_limits()
+    quota = f"{limits['cpu_quota']:g}" if limits['cpu_quota'] is not None else '없음'
+    memory_limit = f"{limits['memory_limit'] / 1024 ** 2:,.0f} MB" if limits['memory_limit'] else '없음'
+    budget = memory_budget()
+    lines = [
+        f"- **cgroup**: {limits['version'] or '감지되지 않음'} (CPU quota {quota}, 메모리 한도 {memory_limit})",
+        f"- **CPU 예산**: {cpu_budget()}개 (호스트 {limits['host_cpus']}개, affinity {limits['affinity_cpus']}개{', CPU_LIMIT' if CPU_LIMIT else ''})",
+        f"- **메모리 예산**: {f'{budget / 1024 ** 2:,.0f} MB' if budget else '알 수 없음'}{' (MEMORY_LIMIT)' if MEMORY_LIMIT else ''}",
+    ]
+    lines += [f'- **{name}**: {value:,} ({basis})' for name, (value, basis) in _decisions.items()]
+    return '\n## 실행 자원\n' + '\n'.join(lines) + '\n'
@@ -0,0 +1,445 @@
+import io
+import os
+import shutil
+import numpy as np
+import pandas as pd
+from common.compression import detect_codec
+from common.storage import MB, S3_MIN_PART_SIZE, ObjectWriter, create_s3_client, head_object, get_object, open_object, put_object, save_report, delete_object, storage_report_section
+from common.tabular import table_format, read_table, write_table
+from common.metrics import metrics_object_path, metrics_report_section
+from common.profiler import profile_object_paths
+
+# 샤드 실행 설정. SHARD_COUNT가 2 이상이면 입력 CSV 중 SHARD_INDEX번째(0부터) 구간만 처리하고 part 객체로 저장
+SHARD_INDEX = int(os.getenv('SHARD_INDEX', '0'))
+SHARD_COUNT = int(os.getenv('SHARD_COUNT', '1'))
+
+# true이면 샤드 실행 대신 part 객체들을 output1로 합치고 샤드별 보고서를 병합
+SHARD_FINALIZE = os.getenv('SHARD_FINALIZE', 'false').lower() == 'true'
+
+# true이면 파일 처음부터 따옴표 수를 세어 따옴표 안 줄바꿈이 있어도 정확한 레코드 경계를 찾음.
+# false이면 자기 구간 바로 앞부터 읽고 모든 줄바꿈을 레코드 경계로 취급 (따옴표 안 줄바꿈이 없는 입력 전용)
+SHARD_SCAN_PREFIX = os.getenv('SHARD_SCAN_PREFIX', 'true').lower() == 'true'
+
+# true이면 병합 후에도 part 객체를 삭제하지 않음
+SHARD_KEEP_PARTS = os.getenv('SHARD_KEEP_PARTS', 'false').lower() == 'true'
+
+READ_BLOCK_SIZE = 8 * MB
+
+_state = {'range': None, 'header_bytes': 0, 'scanned_bytes': 0, 'shard_bytes': 0, 'row_offset': 0}
+
+
+def shard_mode() -> str:
+    """
+    현재 실행 방식을 반환합니다.
+
+    Returns:
+    - str: 'single'(샤드 미사용), 'shard'(SHARD_INDEX번째 구간 처리), 'finalize'(part 병합)
+    """
+    if SHARD_FINALIZE:
+        return 'finalize'
+    return 'shard' if SHARD_COUNT > 1 else 'single'
+
+
+class RecordScanner:
+    """
+    CSV 바이트 스트림을 블록 단위로 읽으며 따옴표 밖 줄바꿈(레코드 경계)을 찾는 객체.
+
+    따옴표 상태는 지금까지 읽은 '"' 개수의 홀짝으로 판별합니다 (이스케이프된 ""는 두 번 세어 상쇄).
+    next_boundary는 target 이상인 첫 레코드 시작 위치를 반환하며, 그 사이 바이트를 sink에 씁니다.
+
+    Parameters:
+    - body: read(size)를 지원하는 바이너리 스트림
+    - base (int): 스트림 첫 바이트의 객체 내 위치 (ranged GET으로 중간부터 읽을 때)
+    - quotes (bool): False이면 따옴표 상태를 보지 않고 모든 줄바꿈을 레코드 경계로 취급
+    - count_records (bool): True이면 지나간 레코드 경계(따옴표 밖 줄바꿈) 수를 records에 셈
+    """
+
+    def __init__(self, body, base: int = 0, quotes: bool = True, count_records: bool = False):
+        self.body = body
+        self.quotes = quotes
+        self.count_records = count_records
+        self.records = 0
+        self.buf = b''
+        self.pos = 0
+        self.base = base
+        self.parity = 0
+        self.at_boundary = base == 0
+
+    @property
+    def position(self) -> int:
+        return self.base + self.pos
+
+    def _read(self) -> bool:
+        data = self.body.read(READ_BLOCK_SIZE)
+        if not data:
+            return False
+        self.base += len(self.buf)
+        self.buf = data
+        self.pos = 0
+        return True
+
+    def _advance(self, end: int, sink):
+        if end > self.pos:
+            if self.count_records:
+                self.records += self._count_newlines(end)
+            if self.quotes:
+                self.parity ^= self.buf.count(b'"', self.pos, end) & 1
+            if sink is not None:
+                sink.write(memoryview(self.buf)[self.pos:end])
+            self.pos = end
+            self.at_boundary = False
+
+    def _count_newlines(self, end: int) -> int:
+        if not self.quotes:
+            return self.buf.count(b'\n', self.pos, end)
+        # '"'로 나눈 조각은 따옴표 밖/안이 번갈아 나오므로 따옴표 밖 조각의 줄바꿈만 셈
+        pieces = bytes(self.buf[self.pos:end]).split(b'"')
+        return sum(piece.count(b'\n') for piece in pieces[self.parity::2])
+
+    def next_boundary(self, target: int, sink=None) -> int:
+        if self.at_boundary and target <= self.position:
+            return self.position
+        while True:
+            if self.pos == len(self.buf) and not self._read():
+                # 마지막 레코드가 줄바꿈 없이 끝나는 경우 파일 끝이 경계
+                self.at_boundary = True
+                return self.position
+            # target 바로 앞 바이트부터 줄바꿈을 찾음 (줄바꿈 다음 위치가 레코드 시작)
+            start = max(target - 1 - self.base, self.pos)
+            if start >= len(self.buf):
+                self._advance(len(self.buf), sink)
+                continue
+            self._advance(start, sink)
+            newline = self.buf.find(b'\n', self.pos)
+            if newline < 0:
+                self._advance(len(self.buf), sink)
+                continue
+            quoted = self.quotes and (self.parity ^ self.buf.count(b'"', self.pos, newline)) & 1
+            self._advance(newline + 1, sink)
+            if not quoted:
+                self.at_boundary = True
+                return self.position
+
+
+def _open_range(s3_resource, bucket_name: str, object_path: str, start: int):
+    response = s3_resource.meta.client.get_object(Bucket=bucket_name, Key=object_path, Range=f'bytes={start}-')
+    return response['Body']
+
+
+def download_shard(s3_resource, bucket_name: str, object_path: str, local_file_path: str,
+                   index: int = SHARD_INDEX, count: int = SHARD_COUNT) -> dict:
+    """
+    CSV 객체를 count개 구간으로 나눈 것 중 index번째 구간을 헤더와 함께 로컬 파일로 내려받습니다.
+
+    헤더 뒤 데이터 영역을 바이트 크기로 균등하게 나눈 뒤, 각 경계를 그 이후 첫 레코드 시작 위치로
+    옮기므로 모든 샤드의 구간은 겹치거나 빠지는 레코드 없이 입력 전체를 나눕니다.
+
+    Parameters:
+    - s3_resource: create_s3_client로 생성한 S3 리소스
+    - bucket_name (str): 버킷 이름
+    - object_path (str): 비압축 CSV 객체 경로
+    - local_file_path (str): 저장할 로컬 파일 경로
+    - index (int): 샤드 번호 (0부터)
+    - count (int): 전체 샤드 수
+
+    Returns:
+    - dict: start, end(레코드 경계로 맞춘 바이트 구간), header_bytes, scanned_bytes(경계 확인을 위해 읽은 앞부분 크기),
+            row_offset(구간 앞 레코드 수, 앞부분을 읽지 않아 알 수 없으면 None)
+    """
+    head = head_object(s3_resource, bucket_name, object_path)
+    if head is None:
+        raise FileNotFoundError(f'{bucket_name}/{object_path}')
+    if detect_codec(object_path, head.get('ContentEncoding')) or table_format(object_path) != 'csv':
+        raise ValueError(f'샤드 실행은 비압축 CSV 입력만 지원합니다: {object_path}')
+    size = head['ContentLength']
+
+    os.makedirs(os.path.dirname(os.path.abspath(local_file_path)), exist_ok=True)
+    with open(local_file_path, 'wb') as f:
+        body = _open_range(s3_resource, bucket_name, object_path, 0)
+        scanner = RecordScanner(body, quotes=SHARD_SCAN_PREFIX, count_records=True)
+        header_end = scanner.next_boundary(1, sink=f)
+        header_records = scanner.records
+        data_size = size - header_end
+        nominal_start = header_end + data_size * index // count
+        nominal_end = header_end + data_size * (index + 1) // count
+
+        if not SHARD_SCAN_PREFIX and nominal_start > scanner.position + READ_BLOCK_SIZE:
+            # 앞부분을 건너뛰고 구간 바로 앞부터 읽음 (따옴표 안 줄바꿈이 없다고 보고 모든 줄바꿈을 경계로 사용)
+            body.close()
+            body = _open_range(s3_resource, bucket_name, object_path, nominal_start - 1)
+            scanner = RecordScanner(body, base=nominal_start - 1, quotes=False)
+        start = scanner.next_boundary(nominal_start)
+        # 구간 앞 레코드 수 (앞부분을 건너뛰고 읽은 경우 알 수 없음)
+        row_offset = scanner.records - header_records if scanner.count_records else None
+        end = scanner.next_boundary(nominal_end, sink=f)
+        body.close()
+
+    _state.update(
+        range=(start, end),
+        header_bytes=header_end,
+        scanned_bytes=start - header_end if SHARD_SCAN_PREFIX else 0,
+        shard_bytes=end - start,
+        row_offset=row_offset,
+    )
+    print(f'Downloaded shard {index + 1}/{count} of {bucket_name}/{object_path}: bytes {start}-{end} to {local_file_path}')
+    return {'start': start, 'end': end, 'header_bytes': header_end, 'scanned_bytes': _state['scanned_bytes'], 'row_offset': row_offset}
+
+
+def shard_row_offset() -> int:
+    """
+    샤드 실행 중이면 이 샤드 구간 앞에 있는 레코드 수를 반환합니다 (샤드 미사용 시 0).
+    행 번호로 결과를 식별하는 컴포넌트가 샤드마다 전체 실행과 같은 번호를 매기는 데 사용합니다.
+    SHARD_SCAN_PREFIX=false로 앞부분을 건너뛰어 셀 수 없으면 None.
+    """
+    return _state['row_offset'] if shard_mode() == 'shard' else 0
+
+
+def get_object_shard(s3_resource, bucket_name: str, object_path: str, mode: str = 'r'):
+    """
+    get_object와 같지만, 샤드 실행 중이면 이 샤드 구간(헤더 포함)만 로컬에 받아 파일로 엽니다.
+    """
+    if shard_mode() != 'shard':
+        return get_object(s3_resource, bucket_name, object_path, mode=mode)
+    local_file_path = os.path.abspath(f'./tmp/shard-{SHARD_INDEX:05d}.csv')
+    download_shard(s3_resource, bucket_name, object_path, local_file_path)
+    stream = open(local_file_path, mode if 'b' in mode else 'r', **({} if 'b' in mode else {'encoding': 'utf-8'}))
+    stream.size = os.path.getsize(local_file_path)
+    return stream
+
+
+def part_path(object_path: str, index: int, count: int = SHARD_COUNT) -> str:
+    """
+    샤드 결과를 저장할 part 객체 경로를 반환합니다 (예: dir/result.csv -> dir/result.csv.parts/part-00000-of-00004.csv).
+    확장자를 유지하므로 part 객체도 원래 출력과 같은 형식/압축으로 저장됩니다.
+    """
+    filename = os.path.basename(object_path)
+    suffix = '.' + filename.split('.', 1)[1] if '.' in filename else ''
+    return f'{object_path}.parts/part-{index:05d}-of-{count:05d}{suffix}'
+
+
+def shard_location(location: dict) -> dict:
+    """
+    샤드 실행 중이면 출력 위치(args의 output1, task_report 등)를 이 샤드의 part 객체 위치로 바꿉니다.
+    """
+    if shard_mode() != 'shard' or not location:
+        return location
+    return dict(location, object_path=part_path(location['object_path'], SHARD_INDEX))
+
+
+def shard_report_section() -> str:
+    """
+    샤드 실행 중이면 처리한 입력 구간을 보고서 섹션으로 생성합니다.
+    """
+    if shard_mode() != 'shard' or _state['range'] is None:
+        return ''
+    start, end = _state['range']
+    return f"""
+## 샤드 처리
+- **샤드**: {SHARD_INDEX + 1} / {SHARD_COUNT}
+- **입력 바이트 구간**: {start:,} ~ {end:,} ({_state['shard_bytes'] / MB:.2f} MB)
+- **헤더 크기**: {_state['header_bytes']:,} bytes
+- **경계 확인용으로 읽은 앞부분**: {_state['scanned_bytes'] / MB:.2f} MB ({'따옴표 안 줄바꿈 처리' if SHARD_SCAN_PREFIX else '구간 바로 앞부터 읽음'})
+"""
+
+
+def _read_header(s3_resource, bucket_name: str, object_path: str) -> bytes:
+    body = _open_range(s3_resource, bucket_name, object_path, 0)
+    head = io.BytesIO()
+    RecordScanner(body).next_boundary(1, sink=head)
+    body.close()
+    return head.getvalue()
+
+
+def _can_copy(part_resource, part: dict, s3_resource, output: dict, out) -> bool:
+    # 첫 part가 출력과 같은 엔드포인트의 비압축 객체이고 최소 파트 크기 이상이면 내려받지 않고 서버 측 복사
+    if not isinstance(out, ObjectWriter) or part_resource.meta.client.meta.endpoint_url != s3_resource.meta.client.meta.endpoint_url:
+        return False
+    head = head_object(part_resource, part['bucket_name'], part['object_path'])
+    if head is None or detect_codec(part['object_path'], head.get('ContentEncoding')):
+        return False
+    return head['ContentLength'] >= S3_MIN_PART_SIZE
+
+
+def _merge_csv(parts: list, s3_resource, output: dict) -> int:
+    header = None
+    with open_object(s3_resource, output['bucket_name'], output['object_path'], mode='wb') as out:
+        for i, (part_resource, part) in enumerate(parts):
+            if i == 0 and _can_copy(part_resource, part, s3_resource, output, out):
+                header = _read_header(part_resource, part['bucket_name'], part['object_path'])
+                size = head_object(part_resource, part['bucket_name'], part['object_path'])['ContentLength']
+                out.copy_from(part['bucket_name'], part['object_path'], size)
+                continue
+            with get_object(part_resource, part['bucket_name'], part['object_path'], mode='rb') as f:
+                scanner = RecordScanner(f)
+                head = io.BytesIO()
+                scanner.next_boundary(1, sink=head)
+                part_header = head.getvalue()
+                if header is None:
+                    header = part_header
+                    out.write(header)
+                elif part_header.lstrip(b'\xef\xbb\xbf') != header.lstrip(b'\xef\xbb\xbf'):
+                    raise ValueError(f"part 객체의 헤더가 다릅니다: {part['object_path']}")
+                # 헤더 이후 읽어 둔 블록 나머지와 스트림의 남은 부분을 그대로 이어 씀
+                out.write(memoryview(scanner.buf)[scanner.pos:])
+                shutil.copyfileobj(f, out, READ_BLOCK_SIZE)
+    return len(parts)
+
+
+def _merge_npz(parts: list, s3_resource, output: dict, workdir: str):
+    # 임베딩 결과: part들의 idxs/embeddings를 이어 붙이고 idx 기준 첫 항목만 유지
+    idxs, embeddings = [], []
+    for i, (part_resource, part) in enumerate(parts):
+        local_file_path = os.path.join(workdir, f'merge-{i:05d}.npz')
+        with get_object(part_resource, part['bucket_name'], part['object_path'], mode='rb') as src, open(local_file_path, 'wb') as dst:
+            shutil.copyfileobj(src, dst, READ_BLOCK_SIZE)
+        with np.load(local_file_path, allow_pickle=True) as npz_data:
+            if len(npz_data['idxs']):
+                idxs.append(npz_data['idxs'])
+                embeddings.append(npz_data['embeddings'])
+        os.remove(local_file_path)
+    all_idxs = np.concatenate(idxs) if idxs else np.array([])
+    all_embeddings = np.vstack(embeddings) if embeddings else np.array([])
+    _, first = np.unique(all_idxs, return_index=True)
+    keep = np.sort(first)
+    merged_path = os.path.join(workdir, 'merged.npz')
+    np.savez_compressed(merged_path, embeddings=all_embeddings[keep] if len(keep) else all_embeddings, idxs=all_idxs[keep])
+    put_object(s3_resource, merged_path, output['bucket_name'], output['object_path'])
+
+
+def merge_outputs(parts: list, s3_resource, output: dict, workdir: str = './tmp') -> str:
+    """
+    같은 형식의 결과 객체들을 순서대로 이어 붙여 output 위치에 저장합니다.
+
+    CSV는 첫 객체의 헤더만 남기고 나머지 객체의 헤더를 건너뛰며 바이트를 그대로 이어 붙입니다
+    (첫 객체가 비압축이고 5MiB 이상이면 서버 측 복사). Parquet/Arrow는 이어 붙여 다시 저장하고,
+    .npz(임베딩)는 idx 기준으로 병합하여 앞쪽 객체의 항목을 유지합니다.
+    output 자신을 첫 객체로 넘기면 기존 결과 뒤에 새 결과를 덧붙입니다.
+
+    Parameters:
+    - parts (list): (S3 리소스, 위치 dict) 튜플 목록
+    - s3_resource: output 위치의 S3 리소스
+    - output (dict): 저장할 위치
+    - workdir (str): npz 병합 시 사용할 로컬 작업 디렉터리
+
+    Returns:
+    - str: 보고서에 표시할 병합 방식
+    """
+    os.makedirs(workdir, exist_ok=True)
+    if output['object_path'].lower().endswith('.npz'):
+        _merge_npz(parts, s3_resource, output, workdir)
+        return 'idx 기준 npz 병합 (기존 결과 유지)'
+    if table_format(output['object_path']) == 'csv':
+        _merge_csv(parts, s3_resource, output)
+        return '헤더 1회 + 바이트 연결'
+    frames = []
+    for part_resource, part in parts:
+        with get_object(part_resource, part['bucket_name'], part['object_path'], mode='rb') as f:
+            frames.append(read_table(f))
+    with open_object(s3_resource, output['bucket_name'], output['object_path'], mode='wb') as out:
+        write_table(pd.concat(frames, ignore_index=True), out, index=False)
+    return '테이블 연결 후 다시 저장'
+
+
+def _demote_headings(report: str) -> str:
+    return '\n'.join('#' + line if line.startswith('#') else line for line in report.splitlines())
+
+
+def finalize_shards(output: dict, task_report: dict, count: int = SHARD_COUNT, workdir: str = './tmp') -> str:
+    """
+    샤드별 part 객체를 output 위치에 하나로 합치고, 샤드별 보고서를 병합한 보고서를 반환합니다.
+
+    CSV는 첫 part의 헤더만 남기고 나머지 part의 헤더를 건너뛰며 바이트를 그대로 이어 붙입니다.
+    Parquet/Arrow는 part들을 이어 붙여 다시 저장하고, .npz(임베딩)는 idx 기준으로 병합합니다.
+    병합이 끝나면 SHARD_KEEP_PARTS가 아닌 한 part 객체를 삭제합니다.
+
+    Parameters:
+    - output (dict): 최종 결과 위치 (args['output1'])
+    - task_report (dict): 최종 보고서 위치 (args['task_report']). 샤드별 보고서는 이 경로의 part 객체에서 읽음
+    - count (int): 전체 샤드 수
+    - workdir (str): npz 병합 시 사용할 로컬 작업 디렉터리
+
+    Returns:
+    - str: 병합 보고서 내용 (markdown 형식)
+    """
+    if count < 2:
+        raise ValueError('SHARD_COUNT는 2 이상이어야 합니다.')
+    s3_output = create_s3_client(output['end_point'], output['access_key'], output['secret_key'])
+    s3_report = create_s3_client(task_report['end_point'], task_report['access_key'], task_report['secret_key'])
+    parts, reports, sizes, missing = [], [], [], []
+    for i in range(count):
+        part = dict(output, object_path=part_path(output['object_path'], i, count))
+        report = dict(task_report, object_path=part_path(task_report['object_path'], i, count))
+        head = head_object(s3_output, part['bucket_name'], part['object_path'])
+        if head is None:
+            missing.append(part['object_path'])
+            continue
+        parts.append((s3_output, part))
+        reports.append((s3_report, report))
+        sizes.append(head['ContentLength'])
+    if missing:
+        raise FileNotFoundError(f"part 객체가 없습니다 ({len(missing)}/{count}개): {', '.join(missing)}")
+
+    sources = parts
+    if output['object_path'].lower().endswith('.npz') and head_object(s3_output, output['bucket_name'], output['object_path']) is not None:
+        # 임베딩은 기존 output1의 결과를 유지하고 part의 새 결과만 추가
+        sources = [(s3_output, output)] + parts
+    method = merge_outputs(sources, s3_output, output, workdir)
+    merged_size = head_object(s3_output, output['bucket_name'], output['object_path'])['ContentLength']
+
+    sections = []
+    for i, (report_resource, report) in enumerate(reports):
+        if head_object(report_resource, report['bucket_name'], report['object_path']) is None:
+            sections.append(f'\n## 샤드 {i + 1} 보고서\n- 보고서 없음\n')
+            continue
+        with get_object(report_resource, report['bucket_name'], report['object_path']) as f:
+            sections.append(f'\n## 샤드 {i + 1} 보고서\n\n' + _demote_headings(f.read()))
+
+    if not SHARD_KEEP_PARTS:
+        # 샤드별 보고서 옆에 저장된 metrics.json과 프로파일 결과도 함께 삭제
+        sidecars = [(resource, dict(report, object_path=path)) for resource, report in reports
+                    for path in [metrics_object_path(report['object_path'])] + list(profile_object_paths(report['object_path']).values())]
+        for part_resource, part in parts + reports + sidecars:
+            if head_object(part_resource, part['bucket_name'], part['object_path']) is not None:
+                delete_object(part_resource, part['bucket_name'], part['object_path'])
+
+    rows = '\n'.join(f"| {i + 1} | {part['object_path']} | {size / MB:.2f} |" for i, ((_, part), size) in enumerate(zip(parts, sizes)))
+    return f"""# 샤드 병합 보고서
+
+## 1. 작업 개요
+- **샤드 수**: {count}개
+- **병합 방식**: {method}
+- **결과 파일**: {output['bucket_name']}/{output['object_path']} ({merged_size / MB:.2f} MB)
+- **part 객체**: {'유지' if SHARD_KEEP_PARTS else '병합 후 삭제'}
+
+## 2. part 객체
+| 샤드 | 경로 | 크기 (MB) |
+|---|---|---|
+{rows}
+""" + ''.join(sections)
+
+
+def run_sharded(run, args: dict, output_key: str = 'output1', report_key: str = 'task_report'):
+    """
+    SHARD_* 환경변수에 따라 작업 하나를 실행하거나 샤드 결과를 병합합니다.
+
+    - 샤드 미사용: run(args)
+    - 샤드 실행: 출력/보고서 위치를 part 객체 위치로 바꾸어 run 실행 (입력은 run 안에서 get_object_shard로 읽음)
+    - 병합(SHARD_FINALIZE=true): part 객체를 output1로 합치고 병합 보고서를 task_report에 저장
+
+    Parameters:
+    - run (callable): args dict를 받아 작업 하나를 처리하는 함수
+    - args (dict): config.py production args
+    - output_key (str): 결과 위치가 들어 있는 args 키
+    - report_key (str): 보고서 위치가 들어 있는 args 키
+    """
+    mode = shard_mode()
+    if mode == 'single':
+        return run(args)
+    if mode == 'shard':
+        return run(dict(args, **{output_key: shard_location(args[output_key]), report_key: shard_location(args[report_key])}))
+
+    report = finalize_shards(args[output_key], args[report_key])
+    report += metrics_report_section() + storage_report_section()
+    task_report = args[report_key]
+    s3_client_task_report = create_s3_client(task_report['end_point'], task_report['access_key'], task_report['secret_key'])
+    save_report(s3_client_task_report, report, task_report['bucket_name'], task_report['object_path'], metrics=True)
@@ -0,0 +1,143 @@
+import builtins
+import importlib.util
+import os
+import sys
+import threading
+import time
+
+# true이면 모듈별 import 시간과 프로세스 시작부터 첫 입력 바이트를 읽기까지의 시간을 기록해 보고서에 표시
+STARTUP_PROFILE = os.getenv('STARTUP_PROFILE', 'false').lower() == 'true'
+
+# 보고서에 표시할 import 시간 상위 모듈 수
+STARTUP_PROFILE_TOP = int(os.getenv('STARTUP_PROFILE_TOP', '15'))
+
+
+def process_start_time() -> float:
+    """
+    프로세스 시작 시각을 반환합니다 (리눅스는 /proc에서 읽고, 그 외에는 이 모듈 import 시각 사용).
+    """
+    try:
+        with open('/proc/self/stat') as f:
+            # 두 번째 필드(프로세스 이름)에 공백이 있을 수 있으므로 ')' 뒤부터 나눔
+            fields = f.read().rsplit(')', 1)[1].split()
+        with open('/proc/uptime') as f:
+            uptime = float(f.read().split()[0])
+        return time.time() - (uptime - int(fields[19]) / os.sysconf('SC_CLK_TCK'))
+    except (OSError, ValueError, IndexError):
+        return time.time()
+
+
+_state = {
+    'process_start': process_start_time(),
+    'profile_start': None,
+    'imports': [],
+    'first_read': None,
+    'first_read_object': None,
+}
+_local = threading.local()
+_lock = threading.Lock()
+_original_import = builtins.__import__
+
+
+def _absolute_name(name: str, globals: dict, level: int) -> str:
+    if level == 0:
+        return name
+    try:
+        package = (globals or {}).get('__package__') or (globals or {}).get('__name__', '').rpartition('.')[0]
+        return importlib.util.resolve_name('.' * level + name, package)
+    except (ImportError, ValueError):
+        return name
+
+
+def _profiled_import(name, globals=None, locals=None, fromlist=(), level=0):
+    module_name = _absolute_name(name, globals, level)
+    if module_name in sys.modules:
+        return _original_import(name, globals, locals, fromlist, level)
+
+    # -X importtime과 같이 누적 시간에서 하위 import 시간을 빼 모듈 자체 시간을 계산
+    stack = getattr(_local, 'stack', None)
+    if stack is None:
+        stack = _local.stack = []
+    frame = {'name': module_name, 'children': 0.0}
+    stack.append(frame)
+    start = time.perf_counter()
+    try:
+        return _original_import(name, globals, locals, fromlist, level)
+    finally:
+        elapsed = time.perf_counter() - start
+        stack.pop()
+        if stack:
+            stack[-1]['children'] += elapsed
+        if module_name in sys.modules:
+            with _lock:
+                _state['imports'].append({
+                    'module': module_name,
+                    'cumulative': elapsed,
+                    'self': elapsed - frame['children'],
+                    'depth': len(stack),
+                    'imported_by': stack[0]['name'] if stack else None,
+                })
+
+
+def enable_import_profile():
+    """
+    STARTUP_PROFILE=true이면 이후의 import를 모듈별로 시간 측정합니다.
+    common 패키지를 처음 import할 때 호출되므로 컴포넌트 main.py의 거의 모든 import가 측정됩니다.
+    """
+    if not STARTUP_PROFILE or builtins.__import__ is _profiled_import:
+        return
+    _state['profile_start'] = time.time()
+    builtins.__import__ = _profiled_import
+
+
+def mark_first_read(object_name: str):
+    """
+    Object Storage에서 처음으로 입력 바이트를 받은 시각을 기록합니다 (이후 호출은 무시).
+    """
+    if _state['first_read'] is None:
+        with _lock:
+            if _state['first_read'] is None:
+                _state['first_read'] = time.time()
+                _state['first_read_object'] = object_name
+
+
+def import_times() -> list:
+    """
+    측정된 import 기록을 모듈 자체 시간이 긴 순서로 반환합니다.
+
+    Returns:
+    - list: module, cumulative(하위 import 포함 초), self(모듈 자체 초), depth(중첩 깊이),
+            imported_by(가장 바깥 import 모듈) dict의 리스트
+    """
+    with _lock:
+        records = list(_state['imports'])
+    return sorted(records, key=lambda record: record['self'], reverse=True)
+
+
+def startup_report_section() -> str:
+    """
+    STARTUP_PROFILE=true이면 import 시간과 첫 입력 바이트까지의 시간을 보고서 섹션으로 생성합니다.
+    """
+    if not STARTUP_PROFILE:
+        return ''
+    records = import_times()
+    total = sum(record['cumulative'] for record in records if record['depth'] == 0)
+    first_read = (f"{_state['first_read'] - _state['process_start']:.2f}초 ({_state['first_read_object']})"
+                  if _state['first_read'] else '없음')
+    profile_start = (f"{_state['profile_start'] - _state['process_start']:.2f}초"
+                     if _state['profile_start'] else '측정 안 됨 (common 패키지보다 먼저 import된 모듈만 있음)')
+    lines = [
+        f'- **프로세스 시작부터 import 측정 시작까지**: {profile_start}',
+        f'- **import 시간 합계**: {total:.2f}초 ({len(records):,}개 모듈)',
+        f'- **첫 입력 바이트 수신**: 프로세스 시작 후 {first_read}',
+    ]
+    if records:
+        lines += [
+            '',
+            f'| 모듈 | 자체 (ms) | 누적 (ms) | import한 최상위 모듈 |',
+            '|---|---|---|---|',
+        ]
+        for record in records[:STARTUP_PROFILE_TOP]:
+            lines.append(f"| {record['module']} | {record['self'] * 1000:.1f} | {record['cumulative'] * 1000:.1f} | "
+                         f"{record['imported_by'] or '-'} |")
+    return '\n## 시작 시간\n' + '\n'.join(lines) + '\n'
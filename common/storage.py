@@ -0,0 +1,739 @@
+import io
+import os
+import shutil
+import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from common.compression import (
+    S3_OUTPUT_COMPRESSION, CompressingWriter, DecompressingReader, compression_level,
+    decompress_file, detect_codec, output_codec
+)
+from common.metrics import METRICS_JSON, dumps_metrics, metrics_document, metrics_object_path, reset_metrics, span
+from common.overlap import output_wait, record_output_wait, reset_output_wait
+from common.profiler import collapsed_text, flamegraph_svg, profile_object_paths, profiling, reset_profile, stop_profile
+from common.resources import io_workers
+from common.startup import mark_first_read
+
+MB = 1024 * 1024
+
+# 스트리밍 읽기 시 한 번에 미리 읽어 둘 최대 바이트 수
+DEFAULT_READ_AHEAD = 8 * MB
+
+# multipart 업로드 설정 (S3 최소 파트 크기는 5MiB)
+S3_MULTIPART_THRESHOLD = int(os.getenv('S3_MULTIPART_THRESHOLD', str(8 * MB)))
+S3_MULTIPART_CHUNKSIZE = int(os.getenv('S3_MULTIPART_CHUNKSIZE', str(8 * MB)))
+# 동시 전송/읽기 수를 지정하지 않으면 기본값 안에서 컨테이너의 CPU/메모리 한도에 맞춤 (common.resources)
+S3_MAX_CONCURRENCY = int(os.getenv('S3_MAX_CONCURRENCY') or io_workers('S3 동시 전송 수', 10, per_worker_memory=S3_MULTIPART_CHUNKSIZE))
+
+# S3 multipart 제약: 마지막을 제외한 파트의 최소 크기, UploadPartCopy 한 번의 최대 크기
+S3_MIN_PART_SIZE = 5 * MB
+S3_MAX_COPY_PART_SIZE = 5 * 1024 * MB
+
+# 여러 입력 객체를 동시에 읽을 때 사용할 최대 스레드 수
+S3_MAX_CONCURRENT_READS = int(os.getenv('S3_MAX_CONCURRENT_READS') or io_workers('S3 동시 읽기 수', 4, per_worker_memory=DEFAULT_READ_AHEAD))
+
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=S3_MULTIPART_THRESHOLD,
+    multipart_chunksize=S3_MULTIPART_CHUNKSIZE,
+    max_concurrency=S3_MAX_CONCURRENCY
+)
+
+# 스트리밍 읽기(open_object)에서 큰 객체를 byte range로 나누어 여러 연결로 미리 받아 두는 설정
+S3_RANGED_GET_CHUNKSIZE = int(os.getenv('S3_RANGED_GET_CHUNKSIZE', str(8 * MB)))
+S3_RANGED_GET_CONCURRENCY = int(os.getenv('S3_RANGED_GET_CONCURRENCY') or io_workers('ranged GET 동시 연결 수', 4, per_worker_memory=S3_RANGED_GET_CHUNKSIZE))
+
+# 엔드포인트별 HTTP 연결 풀 크기와 TCP keep-alive 사용 여부
+S3_MAX_POOL_CONNECTIONS = int(os.getenv('S3_MAX_POOL_CONNECTIONS', '10'))
+S3_TCP_KEEPALIVE = os.getenv('S3_TCP_KEEPALIVE', 'true').lower() == 'true'
+
+# (엔드포인트, access key, secret key) -> S3 리소스
+_clients = {}
+_clients_lock = threading.Lock()
+_client_requests = 0
+
+# reset_storage_stats 호출 시점의 (생성된 클라이언트 수, 새로 연 연결 수). 상주 워커에서 작업별 통계를 계산할 때 사용
+_stats_baseline = {'clients': 0, 'connections': 0}
+
+# 이번 실행에서 완료된 전송 기록 ('upload', 'download')
+_transfers = {'upload': [], 'download': []}
+_transfers_lock = threading.Lock()
+
+
+def create_s3_client(rook_ceph_base_url, access_key, secret_key):
+    """
+    S3 리소스를 생성하거나, 같은 엔드포인트/자격 증명으로 이미 생성된 리소스를 반환합니다.
+
+    한 번의 컴포넌트 실행 안에서 모든 읽기/쓰기가 하나의 연결 풀을 공유하므로
+    입력, 출력, 보고서 업로드마다 새로 연결을 맺지 않습니다.
+    """
+    global _client_requests
+    key = (rook_ceph_base_url, access_key, secret_key)
+    with _clients_lock:
+        _client_requests += 1
+        if key not in _clients:
+            session = boto3.session.Session()
+            _clients[key] = session.resource(
+                's3',
+                endpoint_url=rook_ceph_base_url,
+                aws_access_key_id=access_key,
+                aws_secret_access_key=secret_key,
+                use_ssl=False,
+                verify=False,
+                config=Config(
+                    max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+                    tcp_keepalive=S3_TCP_KEEPALIVE
+                )
+            )
+        return _clients[key]
+
+
+def _count_opened_connections(s3_resource):
+    # urllib3 연결 풀이 지금까지 새로 연 연결 수 (botocore 내부 구조에 의존)
+    try:
+        http_session = s3_resource.meta.client._endpoint.http_session
+        managers = [http_session._manager, *http_session._proxy_managers.values()]
+    except AttributeError:
+        return None
+    opened = 0
+    for manager in managers:
+        for pool_key in list(manager.pools.keys()):
+            opened += manager.pools[pool_key].num_connections
+    return opened
+
+
+def connection_stats() -> dict:
+    """
+    이번 실행에서의 S3 클라이언트/연결 사용 현황을 반환합니다.
+
+    Returns:
+    - dict: client_requests(create_s3_client 호출 수), clients_created(실제 생성된 클라이언트 수),
+            connections_opened(새로 연 HTTP 연결 수, 확인할 수 없으면 None)
+    """
+    with _clients_lock:
+        resources = list(_clients.values())
+        client_requests = _client_requests
+    counts = [_count_opened_connections(r) for r in resources]
+    return {
+        'client_requests': client_requests,
+        'clients_created': len(resources) - _stats_baseline['clients'],
+        'connections_opened': None if None in counts else sum(counts) - _stats_baseline['connections'],
+    }
+
+
+def reset_storage_stats():
+    """
+    연결/전송 통계, 단계별 처리 시간, 실행 프로파일을 0부터 다시 셉니다. 생성된 클라이언트와 연결 풀은 그대로 재사용합니다.
+
+    상주 워커가 작업마다 호출하여 보고서의 Object Storage 섹션이 해당 작업의 사용량만 표시하도록 합니다.
+    """
+    global _client_requests
+    with _clients_lock:
+        resources = list(_clients.values())
+        _client_requests = 0
+    counts = [_count_opened_connections(r) for r in resources]
+    _stats_baseline['clients'] = len(resources)
+    _stats_baseline['connections'] = 0 if None in counts else sum(counts)
+    with _transfers_lock:
+        for transfers in _transfers.values():
+            transfers.clear()
+    reset_output_wait()
+    reset_metrics()
+    reset_profile()
+
+
+def _record_transfer(direction: str, object_name: str, size: int, elapsed: float):
+    with _transfers_lock:
+        _transfers[direction].append({'object': object_name, 'bytes': size, 'seconds': elapsed})
+
+
+def transfer_stats(direction: str = 'upload') -> dict:
+    """
+    이번 실행에서 완료된 업로드('upload') 또는 파일 다운로드('download')의
+    건수, 총 바이트, 소요 시간, 처리량을 반환합니다.
+    """
+    with _transfers_lock:
+        transfers = list(_transfers[direction])
+    total_bytes = sum(t['bytes'] for t in transfers)
+    total_seconds = sum(t['seconds'] for t in transfers)
+    return {
+        'count': len(transfers),
+        'bytes': total_bytes,
+        'seconds': total_seconds,
+        'throughput': total_bytes / total_seconds if total_seconds > 0 else 0.0,
+    }
+
+
+def storage_report_section() -> str:
+    """
+    작업 보고서 끝에 덧붙일 Object Storage 사용 현황 섹션을 생성합니다.
+    """
+    stats = connection_stats()
+    uploads = transfer_stats('upload')
+    downloads = transfer_stats('download')
+    connections = stats['connections_opened']
+    # 업로드 시간 중 계산 스레드가 기다리지 않은 시간 (출력 스레드, 병렬 파트 전송으로 계산과 겹친 시간)
+    exposed = min(output_wait(), uploads['seconds'])
+    hidden = uploads['seconds'] - exposed
+    hidden_ratio = hidden / uploads['seconds'] * 100 if uploads['seconds'] > 0 else 0.0
+    return f"""
+## Object Storage 연결
+- **S3 클라이언트 요청 수**: {stats['client_requests']}회
+- **생성된 S3 클라이언트 수**: {stats['clients_created']}개
+- **새로 연 HTTP 연결 수**: {f'{connections}개' if connections is not None else '확인 불가'}
+- **최대 연결 풀 크기**: {S3_MAX_POOL_CONNECTIONS}
+- **TCP keep-alive**: {'사용' if S3_TCP_KEEPALIVE else '미사용'}
+
+## Object Storage 업로드
+- **업로드 수**: {uploads['count']}건
+- **업로드 크기**: {uploads['bytes'] / MB:.2f} MB
+- **업로드 소요 시간**: {uploads['seconds']:.2f}초
+- **계산 스레드의 업로드 대기 시간**: {exposed:.2f}초 (업로드 시간 중 {hidden:.2f}초({hidden_ratio:.1f}%)는 계산과 겹쳐 숨겨짐)
+- **업로드 처리량**: {uploads['throughput'] / MB:.2f} MB/s
+- **multipart 설정**: 임계값 {S3_MULTIPART_THRESHOLD / MB:.0f} MB, 파트 크기 {S3_MULTIPART_CHUNKSIZE / MB:.0f} MB, 동시 전송 {S3_MAX_CONCURRENCY}개
+- **출력 압축**: {f'{S3_OUTPUT_COMPRESSION} (레벨 {compression_level(S3_OUTPUT_COMPRESSION)})' if S3_OUTPUT_COMPRESSION else '미사용 (.gz/.zst 키만 압축)'}
+""" + (f"""
+## Object Storage 다운로드
+- **파일 다운로드 수**: {downloads['count']}건
+- **다운로드 크기**: {downloads['bytes'] / MB:.2f} MB
+- **다운로드 소요 시간**: {downloads['seconds']:.2f}초
+- **다운로드 처리량**: {downloads['throughput'] / MB:.2f} MB/s
+""" if downloads['count'] else '')
+
+
+class ObjectReader(io.RawIOBase):
+    """
+    S3 객체를 파일 객체처럼 순차적으로 읽는 스트림.
+
+    첫 요청은 처음 range_size 바이트만 받고, 객체가 그보다 크면 나머지를 range_size 단위 byte range로 나누어
+    최대 max_concurrency 개의 연결로 미리 받아 둡니다. 메모리에는 받는 중인 범위와 읽고 있는 범위만 유지하므로
+    전체 객체를 메모리에 올리지 않습니다. 뒤 범위는 첫 응답의 ETag로 요청하므로, 읽는 도중 객체가 바뀌면
+    서로 다른 버전을 이어 붙이지 않고 오류가 납니다. S3 리소스에서는 스레드에 안전한 client만 사용합니다.
+    io.BufferedReader로 감싸면 buffer_size 만큼의 제한된 read-ahead가 적용됩니다.
+    """
+
+    def __init__(
+            self,
+            s3_resource,
+            bucket_name: str,
+            object_path: str,
+            range_size: int = S3_RANGED_GET_CHUNKSIZE,
+            max_concurrency: int = S3_RANGED_GET_CONCURRENCY
+        ):
+        self._client = s3_resource.meta.client
+        self._bucket_name = bucket_name
+        self._object_path = object_path
+        self._range_size = range_size
+        self._max_concurrency = max_concurrency
+        self._executor = None
+        self._pending = deque()
+        self.name = f'{bucket_name}/{object_path}'
+        try:
+            response = self._client.get_object(Bucket=bucket_name, Key=object_path, Range=f'bytes=0-{range_size - 1}')
+        except ClientError as e:
+            # 빈 객체는 범위를 요청할 수 없으므로 전체를 요청
+            if e.response.get('Error', {}).get('Code') != 'InvalidRange':
+                raise
+            response = self._client.get_object(Bucket=bucket_name, Key=object_path)
+        # 범위 응답의 ContentLength는 받은 범위의 크기이므로 전체 크기는 ContentRange(bytes 0-N/전체)에서 읽음
+        content_range = response.get('ContentRange')
+        self.size = int(content_range.rsplit('/', 1)[1]) if content_range else response.get('ContentLength')
+        self.content_type = response.get('ContentType')
+        self.content_encoding = response.get('ContentEncoding')
+        self.etag = response.get('ETag')
+        self._current = response['Body']
+        self._next_start = response.get('ContentLength') or 0
+        self._request_ranges()
+
+    def _request_ranges(self):
+        # 받는 중인 범위가 max_concurrency 개가 되도록 다음 범위를 요청
+        while self.size is not None and self._next_start < self.size and len(self._pending) < self._max_concurrency:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_concurrency)
+            end = min(self._next_start + self._range_size, self.size)
+            self._pending.append(self._executor.submit(self._get_range, self._next_start, end))
+            self._next_start = end
+
+    def _get_range(self, start: int, end: int) -> bytes:
+        extra_args = {'IfMatch': self.etag} if self.etag else {}
+        response = self._client.get_object(
+            Bucket=self._bucket_name, Key=self._object_path, Range=f'bytes={start}-{end - 1}', **extra_args
+        )
+        return response['Body'].read()
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        with span('download') as record:
+            data = self._current.read(len(buffer))
+            while not data and self._pending:
+                self._current.close()
+                self._current = io.BytesIO(self._pending.popleft().result())
+                self._request_ranges()
+                data = self._current.read(len(buffer))
+            size = record['bytes'] = len(data)
+        if size:
+            mark_first_read(self.name)
+        buffer[:size] = data
+        return size
+
+    def close(self):
+        if not self.closed:
+            self._current.close()
+            # 끝까지 읽지 않고 닫으면 아직 시작하지 않은 범위 요청은 취소
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+            self._pending.clear()
+        super().close()
+
+
+class ObjectWriter(io.RawIOBase):
+    """
+    쓰여진 데이터를 part_size 단위로 multipart 업로드하는 스트림.
+
+    로컬 임시 파일 없이 결과를 바로 Object Storage에 기록합니다. 파트는 최대
+    max_concurrency 개까지 병렬로 전송되며, 메모리에는 전송 중인 파트와 작성 중인
+    한 파트 분량만 유지합니다. 전체 크기가 한 파트보다 작으면 단일 PUT으로
+    업로드합니다. 예외와 함께 닫히면 진행 중인 multipart 업로드를 취소합니다.
+    """
+
+    def __init__(
+            self,
+            s3_resource,
+            bucket_name: str,
+            object_path: str,
+            part_size: int = S3_MULTIPART_CHUNKSIZE,
+            max_concurrency: int = S3_MAX_CONCURRENCY,
+            content_encoding: str = None
+        ):
+        self._client = s3_resource.meta.client
+        self._extra_args = {'ContentEncoding': content_encoding} if content_encoding else {}
+        self._bucket_name = bucket_name
+        self._object_path = object_path
+        self._part_size = part_size
+        self._max_concurrency = max_concurrency
+        self._buffer = bytearray()
+        self._upload_id = None
+        self._executor = None
+        self._pending = []
+        self._parts = []
+        self._upload_started = None
+        self.name = f'{bucket_name}/{object_path}'
+        self.bytes_written = 0
+
+    def __str__(self):
+        return self.name
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._buffer += data
+        self.bytes_written += len(data)
+        while len(self._buffer) >= self._part_size:
+            self._submit_part(bytes(self._buffer[:self._part_size]))
+            del self._buffer[:self._part_size]
+        return len(data)
+
+    def copy_from(self, bucket_name: str, object_path: str, size: int):
+        """
+        다른 객체의 내용을 서버 측 복사(UploadPartCopy)로 이 업로드의 맨 앞에 추가합니다.
+        내려받지 않고 기존 결과 뒤에 새 데이터를 이어 쓸 때 사용하며, 아직 아무것도 쓰지 않았을 때만
+        호출할 수 있습니다. 마지막 파트가 아니므로 size는 S3 최소 파트 크기(5MiB) 이상이어야 합니다.
+        """
+        if self.bytes_written or self._upload_id is not None:
+            raise ValueError('copy_from은 쓰기 전에만 호출할 수 있습니다.')
+        if size < S3_MIN_PART_SIZE:
+            raise ValueError(f'복사할 객체가 최소 파트 크기보다 작습니다: {size} bytes')
+        # UploadPartCopy 한 번의 최대 크기(5GiB)를 넘지 않도록 같은 크기의 범위로 나눔
+        count = -(-size // S3_MAX_COPY_PART_SIZE)
+        step = -(-size // count)
+        source = {'Bucket': bucket_name, 'Key': object_path}
+        for start in range(0, size, step):
+            self._submit_part(None, copy=(source, f'bytes={start}-{min(start + step, size) - 1}'))
+
+    def _submit_part(self, body: bytes, copy: tuple = None):
+        if self._upload_id is None:
+            self._upload_started = time.time()
+            response = self._client.create_multipart_upload(Bucket=self._bucket_name, Key=self._object_path, **self._extra_args)
+            self._upload_id = response['UploadId']
+            self._executor = ThreadPoolExecutor(max_workers=self._max_concurrency)
+        # 전송 중인 파트 수를 제한하여 메모리 사용량을 일정하게 유지
+        if len(self._pending) >= self._max_concurrency:
+            start = time.perf_counter()
+            with span('upload'):
+                while len(self._pending) >= self._max_concurrency:
+                    self._parts.append(self._pending.pop(0).result())
+            record_output_wait(time.perf_counter() - start)
+        part_number = len(self._parts) + len(self._pending) + 1
+        if copy is not None:
+            self._pending.append(self._executor.submit(self._copy_part, part_number, *copy))
+        else:
+            self._pending.append(self._executor.submit(self._upload_part, part_number, body))
+
+    def _copy_part(self, part_number: int, source: dict, byte_range: str) -> dict:
+        response = self._client.upload_part_copy(
+            Bucket=self._bucket_name,
+            Key=self._object_path,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            CopySource=source,
+            CopySourceRange=byte_range
+        )
+        return {'ETag': response['CopyPartResult']['ETag'], 'PartNumber': part_number}
+
+    def _upload_part(self, part_number: int, body: bytes) -> dict:
+        response = self._client.upload_part(
+            Bucket=self._bucket_name,
+            Key=self._object_path,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=body
+        )
+        return {'ETag': response['ETag'], 'PartNumber': part_number}
+
+    def close(self):
+        if self.closed:
+            return
+        wait_start = time.perf_counter()
+        try:
+            # 한 파트보다 작은 출력의 PUT, 남은 파트 전송과 업로드 완료를 기다린 시간을 업로드 단계로 기록
+            with span('upload', self.bytes_written):
+                if self._upload_id is None:
+                    start = time.time()
+                    self._client.put_object(Bucket=self._bucket_name, Key=self._object_path, Body=bytes(self._buffer), **self._extra_args)
+                    _record_transfer('upload', self.name, self.bytes_written, time.time() - start)
+                else:
+                    if self._buffer:
+                        self._submit_part(bytes(self._buffer))
+                    self._parts.extend(future.result() for future in self._pending)
+                    self._pending = []
+                    self._client.complete_multipart_upload(
+                        Bucket=self._bucket_name,
+                        Key=self._object_path,
+                        UploadId=self._upload_id,
+                        MultipartUpload={'Parts': sorted(self._parts, key=lambda part: part['PartNumber'])}
+                    )
+                    _record_transfer('upload', self.name, self.bytes_written, time.time() - self._upload_started)
+            self._buffer = bytearray()
+        except Exception:
+            self.abort()
+            raise
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+            # 남은 파트 전송과 업로드 완료를 기다린 시간
+            record_output_wait(time.perf_counter() - wait_start)
+            super().close()
+
+    def abort(self):
+        for future in self._pending:
+            future.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        if self._upload_id is not None:
+            self._client.abort_multipart_upload(
+                Bucket=self._bucket_name,
+                Key=self._object_path,
+                UploadId=self._upload_id
+            )
+            self._upload_id = None
+        self._pending = []
+        self._buffer = bytearray()
+        super().close()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+
+def open_object(
+        s3_resource,
+        bucket_name: str,
+        object_path: str,
+        mode: str = 'r',
+        encoding: str = 'utf-8',
+        read_ahead: int = DEFAULT_READ_AHEAD,
+        part_size: int = S3_MULTIPART_CHUNKSIZE
+    ):
+    """
+    Object Storage의 객체를 스트리밍 파일 객체로 엽니다.
+
+    읽기 모드에서는 키 확장자(.gz, .zst) 또는 Content-Encoding으로 압축을 판별해 스트리밍으로
+    해제하고, 쓰기 모드에서는 output_codec 결과에 따라 스트리밍으로 압축합니다.
+
+    Parameters:
+    - s3_resource: create_s3_client로 생성한 S3 리소스
+    - bucket_name (str): 버킷 이름
+    - object_path (str): 객체 경로
+    - mode (str): 'r', 'rb', 'w', 'wb' 중 하나
+    - encoding (str): 텍스트 모드에서 사용할 인코딩
+    - read_ahead (int): 읽기 모드에서 미리 읽어 둘 최대 바이트 수
+    - part_size (int): 쓰기 모드에서 multipart 업로드 파트 크기
+
+    Returns:
+    - 파일 객체 (텍스트 모드는 io.TextIOWrapper, 바이너리 모드는 io.BufferedReader/ObjectWriter/CompressingWriter)
+    """
+    if mode in ('r', 'rb'):
+        raw = ObjectReader(s3_resource, bucket_name, object_path)
+        stream = io.BufferedReader(raw, buffer_size=read_ahead)
+        codec = detect_codec(object_path, raw.content_encoding)
+        if codec:
+            stream = io.BufferedReader(DecompressingReader(stream, codec), buffer_size=read_ahead)
+    elif mode in ('w', 'wb'):
+        codec, content_encoding = output_codec(object_path)
+        stream = raw = ObjectWriter(s3_resource, bucket_name, object_path, part_size=part_size, content_encoding=content_encoding)
+        if codec:
+            stream = CompressingWriter(raw, codec)
+    else:
+        raise ValueError(f"지원하지 않는 mode 입니다: {mode}")
+
+    if 'b' in mode:
+        stream.size = getattr(raw, 'size', None)
+        return stream
+
+    text_stream = io.TextIOWrapper(stream, encoding=encoding, newline='' if mode == 'w' else None)
+    text_stream.size = getattr(raw, 'size', None)
+    return text_stream
+
+
+def get_object(s3_resource, bucket_name: str, object_path: str, mode: str = 'r'):
+    try:
+        stream = open_object(s3_resource, bucket_name, object_path, mode=mode)
+        print(f"Successfully opened object stream: {object_path}")
+        return stream
+    except Exception as e:
+        print(f'Failed to download from {bucket_name}/{object_path}: {e}')
+        raise
+
+class ObjectSource:
+    """
+    아직 열지 않은 입력 객체의 위치.
+
+    여러 입력을 받는 컴포넌트가 read_tables에 전달하면 작업자 스레드가 객체를 열고 같은 스레드에서 바로 파싱하므로,
+    동시에 파싱하는 입력 수(S3_MAX_CONCURRENT_READS)만큼만 GET 응답이 열려 있습니다.
+    객체를 열 때는 S3 리소스 대신 스레드 간에 공유해도 안전한 client(s3_resource.meta.client)만 사용합니다.
+
+    Parameters:
+    - s3_resource: create_s3_client로 생성한 S3 리소스
+    - bucket_name (str): 버킷 이름
+    - object_path (str): 객체 경로
+    - mode (str): get_object에 전달할 모드
+    """
+
+    def __init__(self, s3_resource, bucket_name: str, object_path: str, mode: str = 'rb'):
+        self.s3_resource = s3_resource
+        self.bucket_name = bucket_name
+        self.object_path = object_path
+        self.mode = mode
+        self.name = f'{bucket_name}/{object_path}'
+
+    def __str__(self):
+        return self.name
+
+    def open(self):
+        return get_object(self.s3_resource, self.bucket_name, self.object_path, mode=self.mode)
+
+def download_file(s3_resource, bucket_name: str, object_path: str, local_file_path: str, decompress: bool = False):
+    """
+    객체를 로컬 파일로 내려받습니다.
+
+    전송 설정은 boto3 기본값을 그대로 사용합니다 (8MiB 이상인 객체는 8MiB byte range로 나누어 최대 10개 연결로 동시에 받음).
+    decompress가 참이면 키 확장자(.gz, .zst) 또는 Content-Encoding으로 압축을 판별해 받은 파일을 해제합니다.
+    객체를 그대로 전달하는 컴포넌트(파일 업로드 등)는 저장된 바이트가 바뀌지 않도록 기본값(해제하지 않음)을 사용합니다.
+    """
+    try:
+        obj = s3_resource.Object(bucket_name, object_path)
+        start = time.time()
+        name = f'{bucket_name}/{object_path}'
+        with span('download') as record:
+            obj.download_file(local_file_path, Callback=lambda _: mark_first_read(name))
+            record['bytes'] = os.path.getsize(local_file_path)
+        _record_transfer('download', f'{bucket_name}/{object_path}', record['bytes'], time.time() - start)
+        # 압축된 입력은 내려받은 뒤 같은 경로에 해제 (확장자로 판별되지 않을 때만 Content-Encoding을 조회)
+        codec = (detect_codec(object_path) or detect_codec(object_path, obj.content_encoding)) if decompress else None
+        if codec:
+            decompress_file(local_file_path, codec)
+        print(f"Downloaded {bucket_name}/{object_path} to {local_file_path}")
+    except Exception as e:
+        print(f'Failed to download {bucket_name}/{object_path} to {local_file_path}: {e}')
+        raise
+
+def _upload(obj, source) -> int:
+    # 로컬 파일은 upload_file, 메모리 버퍼/스트림은 upload_fileobj로 같은 TransferConfig를 사용해 전송
+    if isinstance(source, (str, os.PathLike)):
+        size = os.path.getsize(source)
+        obj.upload_file(source, Config=TRANSFER_CONFIG)
+        return size
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
+    size = 0
+    if source.seekable():
+        # 전송 후에는 스트림이 닫힐 수 있으므로 남은 크기를 미리 계산
+        position = source.tell()
+        size = source.seek(0, io.SEEK_END) - position
+        source.seek(position)
+    obj.upload_fileobj(source, Config=TRANSFER_CONFIG)
+    return size
+
+def put_object(s3_resource, local_file_path, bucket_name: str, object_path: str):
+    """
+    로컬 파일 또는 메모리 데이터를 multipart 설정(TRANSFER_CONFIG)에 따라 병렬 업로드합니다.
+
+    local_file_path에 파일 경로 대신 bytes 또는 BytesIO 같은 파일 객체를 주면
+    임시 파일을 거치지 않고 메모리에서 바로 업로드합니다.
+    output_codec에 따라 압축이 필요한 출력은 open_object 스트림으로 압축하며 업로드합니다.
+    """
+    source_name = local_file_path if isinstance(local_file_path, (str, os.PathLike)) else 'memory buffer'
+    try:
+        codec, _ = output_codec(object_path)
+        if codec:
+            with open_object(s3_resource, bucket_name, object_path, mode='wb') as stream:
+                if isinstance(local_file_path, (str, os.PathLike)):
+                    with open(local_file_path, 'rb') as f:
+                        shutil.copyfileobj(f, stream, S3_MULTIPART_CHUNKSIZE)
+                elif isinstance(local_file_path, (bytes, bytearray, memoryview)):
+                    stream.write(local_file_path)
+                else:
+                    shutil.copyfileobj(local_file_path, stream, S3_MULTIPART_CHUNKSIZE)
+        else:
+            obj = s3_resource.Object(bucket_name, object_path)
+            start = time.time()
+            with span('upload') as record:
+                size = record['bytes'] = _upload(obj, local_file_path)
+            _record_transfer('upload', f'{bucket_name}/{object_path}', size, time.time() - start)
+            record_output_wait(time.time() - start)
+        print(f'Successfully uploaded {source_name} to {bucket_name}/{object_path}')
+    except Exception as e:
+        print(f'Failed to upload {source_name} to {bucket_name}/{object_path}: {e}')
+        raise
+
+def save_report(s3_resource, report_content: str, bucket_name: str, object_path: str, metrics: bool = False):
+    """
+    보고서를 업로드합니다.
+
+    작업 보고서(metrics=True)이면 METRICS_JSON=false가 아닌 한 단계별 처리 시간, 최대 RSS, 전송 통계를
+    보고서 옆의 metrics.json(예: reports/job.md -> reports/job.metrics.json)으로 함께 업로드하고,
+    PROFILE이 설정되어 있으면 프로파일을 멈추고 collapsed stack과 flamegraph를 보고서 옆에 업로드합니다.
+    """
+    try:
+        obj = s3_resource.Object(bucket_name, object_path)
+        start = time.time()
+        with span('upload') as record:
+            size = record['bytes'] = _upload(obj, report_content.encode('utf-8'))
+        _record_transfer('upload', f'{bucket_name}/{object_path}', size, time.time() - start)
+        print(f'Successfully uploaded report to {bucket_name}/{object_path}')
+    except Exception as e:
+        print(f'Failed to upload report to {bucket_name}/{object_path}: {e}')
+        raise
+    if not metrics:
+        return
+    profile = save_profile(s3_resource, bucket_name, object_path) if profiling() else None
+    if METRICS_JSON:
+        save_metrics(s3_resource, bucket_name, object_path, profile=profile)
+
+def save_metrics(s3_resource, bucket_name: str, report_path: str, profile: dict = None):
+    """
+    이번 실행의 단계별 측정값과 Object Storage 전송 통계를 보고서 옆의 metrics.json으로 업로드합니다.
+    profile에 save_profile 결과를 주면 프로파일 결과 위치도 함께 기록합니다.
+    """
+    metrics_path = metrics_object_path(report_path)
+    document = metrics_document(
+        report=f'{bucket_name}/{report_path}',
+        transfers={direction: transfer_stats(direction) for direction in ('download', 'upload')},
+        output_wait_seconds=output_wait(),
+        profile=profile,
+    )
+    try:
+        s3_resource.Object(bucket_name, metrics_path).put(Body=dumps_metrics(document), ContentType='application/json')
+        print(f'Successfully uploaded metrics to {bucket_name}/{metrics_path}')
+    except Exception as e:
+        print(f'Failed to upload metrics to {bucket_name}/{metrics_path}: {e}')
+        raise
+
+def save_profile(s3_resource, bucket_name: str, report_path: str) -> dict:
+    """
+    실행 중인 프로파일을 멈추고 collapsed stack(.profile.txt)과 SVG flamegraph(.profile.svg)를 보고서 옆에 업로드합니다.
+
+    Returns:
+    - dict: 업로드한 객체 위치 ('collapsed', 'flamegraph')
+    """
+    stacks, unit = stop_profile()
+    paths = profile_object_paths(report_path)
+    title = f"{report_path} ({sum(stacks.values()):,} {unit})"
+    artifacts = {
+        'collapsed': (collapsed_text(stacks), 'text/plain; charset=utf-8'),
+        'flamegraph': (flamegraph_svg(stacks, title, unit), 'image/svg+xml'),
+    }
+    try:
+        for name, (content, content_type) in artifacts.items():
+            s3_resource.Object(bucket_name, paths[name]).put(Body=content.encode('utf-8'), ContentType=content_type)
+        print(f"Successfully uploaded profile to {bucket_name}/{paths['flamegraph']}")
+    except Exception as e:
+        print(f"Failed to upload profile to {bucket_name}/{paths['flamegraph']}: {e}")
+        raise
+    return {name: f'{bucket_name}/{path}' for name, path in paths.items()}
+
+def head_object(s3_resource, bucket_name: str, object_path: str) -> dict:
+    """
+    객체의 메타데이터(ETag, 크기 등)를 조회합니다.
+
+    Returns:
+    - dict: HeadObject 응답. 객체가 없으면 None
+    """
+    try:
+        return s3_resource.meta.client.head_object(Bucket=bucket_name, Key=object_path)
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+            return None
+        raise
+
+
+def copy_object(src_resource, src_bucket: str, src_path: str, dst_resource, dst_bucket: str, dst_path: str) -> int:
+    """
+    객체를 다른 경로로 복사합니다. 압축 여부(Content-Encoding)를 포함해 바이트를 그대로 복사합니다.
+
+    같은 엔드포인트이면 서버 측 복사(CopyObject, 큰 객체는 UploadPartCopy)를 사용하고,
+    엔드포인트가 다르거나 대상 자격 증명으로 원본을 읽을 수 없으면 스트림으로 내려받으며 업로드합니다.
+
+    Returns:
+    - int: 복사한 바이트 수
+    """
+    src_client = src_resource.meta.client
+    dst_client = dst_resource.meta.client
+    try:
+        if src_client.meta.endpoint_url == dst_client.meta.endpoint_url:
+            size = src_client.head_object(Bucket=src_bucket, Key=src_path)['ContentLength']
+            dst_client.copy(
+                {'Bucket': src_bucket, 'Key': src_path}, dst_bucket, dst_path,
+                SourceClient=src_client, Config=TRANSFER_CONFIG
+            )
+            print(f'Copied {src_bucket}/{src_path} to {dst_bucket}/{dst_path}')
+            return size
+    except ClientError as e:
+        print(f'Server-side copy failed, streaming instead: {e}')
+    response = src_client.get_object(Bucket=src_bucket, Key=src_path)
+    extra_args = {'ContentEncoding': response['ContentEncoding']} if response.get('ContentEncoding') else None
+    start = time.time()
+    with span('upload', response['ContentLength']):
+        dst_client.upload_fileobj(response['Body'], dst_bucket, dst_path, ExtraArgs=extra_args, Config=TRANSFER_CONFIG)
+    _record_transfer('upload', f'{dst_bucket}/{dst_path}', response['ContentLength'], time.time() - start)
+    print(f'Copied {src_bucket}/{src_path} to {dst_bucket}/{dst_path}')
+    return response['ContentLength']
+
+
+def delete_object(s3_resource, bucket_name: str, object_path: str):
+    try:
+        obj = s3_resource.Object(bucket_name, object_path)
+        obj.delete()
+        print(f"Successfully deleted object: {bucket_name}/{object_path}")
+    except Exception as e:
+        print(f'Failed to delete {bucket_name}/{object_path}: {e}')
+        raise
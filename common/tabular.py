@@ -0,0 +1,378 @@
+import contextlib
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import pandas as pd
+from common.compression import EXTENSIONS as COMPRESSION_EXTENSIONS
+from common.metrics import span
+from common.storage import S3_MAX_CONCURRENT_READS, ObjectSource
+from common.resources import limit_arrow_threads
+
+# CSV 파서 엔진 ('c' 또는 'pyarrow')
+# pyarrow 엔진은 멀티스레드로 빠르지만 날짜 컬럼 등을 자동으로 타입 추론하므로 선택적으로 사용합니다.
+CSV_ENGINE = os.getenv('CSV_ENGINE', 'c')
+
+# pyarrow 엔진이 지원하지 않는 read_csv 옵션
+_PYARROW_UNSUPPORTED_OPTIONS = {'chunksize', 'iterator', 'nrows', 'skipfooter', 'low_memory', 'memory_map'}
+
+# 텍스트 컬럼 저장 방식 ('python' 또는 'pyarrow')
+# pyarrow는 텍스트 컬럼을 string[pyarrow]로 읽어 셀마다 Python 문자열 객체를 만들지 않습니다.
+STRING_STORAGE = os.getenv('STRING_STORAGE', 'python')
+ARROW_STRING_DTYPE = 'string[pyarrow]'
+
+# 확장자별 테이블 형식. 그 외 확장자는 CSV로 처리
+TABLE_FORMATS = {
+    '.parquet': 'parquet',
+    '.pq': 'parquet',
+    '.arrow': 'arrow',
+    '.feather': 'arrow',
+    '.ipc': 'arrow',
+}
+
+
+def read_csv(data: object, engine: str = None, **kwargs) -> pd.DataFrame:
+    """
+    CSV 데이터를 DataFrame으로 읽는 함수.
+
+    바이너리 스트림(get_object(..., mode='rb'))을 받으면 bytes -> str -> StringIO
+    변환 없이 파서가 바이트를 직접 읽습니다.
+
+    Parameters:
+    - data (object): 파일 경로, 바이너리/텍스트 스트림
+    - engine (str): 파서 엔진. 지정하지 않으면 CSV_ENGINE 환경변수 값 사용
+    - **kwargs: pd.read_csv에 전달할 추가 옵션
+
+    Returns:
+    - pd.DataFrame: 읽어들인 데이터
+    """
+    engine = engine or CSV_ENGINE
+    if engine == 'pyarrow':
+        # pyarrow 엔진은 바이트 입력만 받고 일부 옵션을 지원하지 않으므로 C 엔진으로 대체
+        is_text_stream = hasattr(data, 'read') and not hasattr(data, 'readinto')
+        if is_text_stream or _PYARROW_UNSUPPORTED_OPTIONS.intersection(kwargs) or callable(kwargs.get('usecols')):
+            engine = 'c'
+        else:
+            # pyarrow 스레드 풀은 기본적으로 호스트 코어 수만큼 만들어지므로 CPU 예산에 맞춤
+            limit_arrow_threads()
+    return pd.read_csv(data, engine=engine, **kwargs)
+
+
+def arrow_strings_enabled() -> bool:
+    return STRING_STORAGE == 'pyarrow'
+
+
+def as_string_storage(values: object) -> object:
+    """
+    STRING_STORAGE=pyarrow일 때 문자열 값(Series, list)을 string[pyarrow]로 변환합니다.
+    문자열이 아닌 값이 섞여 있거나 모드가 꺼져 있으면 그대로 반환합니다.
+    """
+    if not arrow_strings_enabled():
+        return values
+    if isinstance(values, pd.Series) and values.dtype == ARROW_STRING_DTYPE:
+        return values
+    if pd.api.types.infer_dtype(values, skipna=True) not in ('string', 'empty'):
+        return values
+    if isinstance(values, pd.Series):
+        return values.astype(ARROW_STRING_DTYPE)
+    return pd.array(values, dtype=ARROW_STRING_DTYPE)
+
+
+def _infer_string_context():
+    # pandas 2.1 미만에는 future.infer_string 옵션이 없으므로 읽은 뒤 변환만 수행
+    try:
+        pd.get_option('future.infer_string')
+    except (KeyError, pd.errors.OptionError):
+        return contextlib.nullcontext()
+    return pd.option_context('future.infer_string', True)
+
+
+def _apply_string_storage(df: pd.DataFrame) -> pd.DataFrame:
+    for column in df.columns:
+        dtype = df[column].dtype
+        if dtype == object or isinstance(dtype, pd.StringDtype):
+            df[column] = as_string_storage(df[column])
+    return df
+
+
+class TableBuffer:
+    """
+    단계 사이에서 DataFrame을 직접 주고받기 위한 메모리 입출력 대상.
+
+    여러 컴포넌트를 한 프로세스에서 이어 실행할 때 출력 경로 대신 넘기면 write_table이
+    CSV로 직렬화하지 않고 DataFrame을 보관하며, 다음 단계의 입력으로 넘기면 read_table이
+    파싱 없이 그대로 반환합니다. pyarrow.Table을 보관하면 읽을 때 DataFrame으로 변환합니다.
+
+    Parameters:
+    - name (str): 보고서 등에 표시할 이름
+    - df (object): 보관할 DataFrame 또는 pyarrow.Table
+    """
+
+    def __init__(self, name: str, df: object = None):
+        self.name = name
+        self.df = df
+
+    def __str__(self):
+        return self.name
+
+    def __repr__(self):
+        return f'TableBuffer({self.name!r})'
+
+
+def _buffer_frame(data: object) -> pd.DataFrame:
+    df = data.df if isinstance(data, TableBuffer) else data
+    if df is None:
+        raise ValueError(f'{data}에 저장된 테이블이 없습니다.')
+    if not isinstance(df, pd.DataFrame):
+        # pyarrow.Table
+        if arrow_strings_enabled():
+            import pyarrow as pa
+            string_dtype = pd.StringDtype('pyarrow')
+            return df.to_pandas(types_mapper={pa.string(): string_dtype, pa.large_string(): string_dtype}.get)
+        return df.to_pandas()
+    return df
+
+
+def table_format(data: object) -> str:
+    """
+    파일 경로 또는 스트림 이름(bucket/object_path)의 확장자로 테이블 형식을 판별합니다.
+    압축 확장자(.gz, .zst)는 무시합니다.
+
+    Returns:
+    - str: 'csv', 'parquet', 'arrow' 중 하나
+    """
+    name = data if isinstance(data, (str, os.PathLike)) else getattr(data, 'name', '')
+    name = str(name).lower() if isinstance(name, (str, os.PathLike)) else ''
+    root, ext = os.path.splitext(name)
+    if ext in COMPRESSION_EXTENSIONS:
+        ext = os.path.splitext(root)[1]
+    return TABLE_FORMATS.get(ext, 'csv')
+
+
+def _arrow_source(data: object):
+    # Parquet/Arrow 파일은 footer를 먼저 읽어야 하므로 순차 스트림은 메모리 버퍼로 받음
+    import pyarrow as pa
+    if isinstance(data, (str, os.PathLike)):
+        return data
+    return pa.py_buffer(data.read())
+
+
+def read_table(data: object, columns: list = None, **kwargs) -> pd.DataFrame:
+    """
+    CSV, Parquet, Arrow IPC 데이터를 확장자에 따라 DataFrame으로 읽는 함수.
+
+    Parquet/Arrow 입력은 컬럼 타입이 보존되므로 단계마다 CSV 파싱과 타입 추론을
+    반복하지 않습니다. CSV 입력은 read_csv로 읽습니다.
+
+    columns를 지정하면 해당 컬럼만 파싱합니다 (CSV는 usecols, Parquet/Arrow는 컬럼 선택).
+    입력에 없는 컬럼은 무시되므로 컬럼 존재 여부는 호출하는 쪽에서 검증합니다.
+    읽지 않은 컬럼 목록은 df.attrs['skipped_columns']에 기록됩니다.
+
+    Parameters:
+    - data (object): 파일 경로, 바이너리 스트림, TableBuffer
+    - columns (list): 읽을 컬럼 목록. None이면 모든 컬럼
+    - **kwargs: read_csv에 전달할 추가 옵션 (CSV 입력에만 적용)
+
+    Returns:
+    - pd.DataFrame: 읽어들인 데이터
+    """
+    fmt = table_format(data)
+    wanted = None if columns is None else set(columns)
+    skipped = []
+
+    # 메모리로 넘겨받은 테이블은 파싱하지 않으므로 파싱 단계로 기록하지 않음
+    in_memory = isinstance(data, (TableBuffer, pd.DataFrame))
+    with contextlib.nullcontext() if in_memory else span('parse', _source_size(data)):
+        if in_memory:
+            df = _buffer_frame(data)
+            if wanted is not None:
+                skipped = [name for name in df.columns if name not in wanted]
+                df = df[[name for name in df.columns if name in wanted]]
+        elif fmt == 'csv':
+            if wanted is not None:
+                # 헤더의 컬럼명을 하나씩 확인하면서 읽지 않는 컬럼을 기록
+                def usecols(name):
+                    if name in wanted:
+                        return True
+                    if name not in skipped:
+                        skipped.append(name)
+                    return False
+                kwargs['usecols'] = usecols
+            if arrow_strings_enabled():
+                # 파서가 텍스트 컬럼을 Python 문자열 객체 대신 Arrow 문자열로 만들도록 설정
+                with _infer_string_context():
+                    df = read_csv(data, **kwargs)
+            else:
+                df = read_csv(data, **kwargs)
+        else:
+            import pyarrow.parquet as pq
+            import pyarrow.ipc as ipc
+            source = _arrow_source(data)
+            if fmt == 'parquet':
+                parquet_file = pq.ParquetFile(source)
+                names = parquet_file.schema_arrow.names
+                selected = None if wanted is None else [name for name in names if name in wanted]
+                table = parquet_file.read(columns=selected)
+            else:
+                table = ipc.open_file(source).read_all()
+                names = table.column_names
+                if wanted is not None:
+                    table = table.select([name for name in names if name in wanted])
+            if wanted is not None:
+                skipped = [name for name in names if name not in wanted]
+            if arrow_strings_enabled():
+                import pyarrow as pa
+                string_dtype = pd.StringDtype('pyarrow')
+                df = table.to_pandas(types_mapper={pa.string(): string_dtype, pa.large_string(): string_dtype}.get)
+            else:
+                df = table.to_pandas()
+
+        if arrow_strings_enabled():
+            df = _apply_string_storage(df)
+
+    if wanted is not None:
+        df.attrs['skipped_columns'] = skipped
+    return df
+
+
+def projection_report_section(df: pd.DataFrame) -> str:
+    """
+    read_table(columns=...)로 읽은 DataFrame의 컬럼 선택 결과를 보고서 섹션으로 생성합니다.
+    """
+    skipped = df.attrs.get('skipped_columns')
+    if skipped is None:
+        return ''
+    return f"""
+## 컬럼 선택
+- **읽은 컬럼 ({len(df.columns)}개)**: {', '.join(map(str, df.columns))}
+- **건너뛴 컬럼 ({len(skipped)}개)**: {', '.join(map(str, skipped)) if skipped else '없음'}
+"""
+
+
+def write_table(df: pd.DataFrame, output: object, index: bool = False, **kwargs):
+    """
+    DataFrame을 출력 경로/스트림의 확장자에 따라 CSV, Parquet, Arrow IPC로 저장하는 함수.
+
+    Parameters:
+    - df (pd.DataFrame): 저장할 데이터
+    - output (object): 로컬 파일 경로, open_object(..., mode='wb') 스트림 또는 TableBuffer
+    - index (bool): 인덱스 저장 여부
+    - **kwargs: to_csv에 전달할 추가 옵션 (CSV 출력에만 적용)
+    """
+    if isinstance(output, TableBuffer):
+        output.df = df
+        return
+
+    fmt = table_format(output)
+    written = get_output_size(output) if not isinstance(output, (str, os.PathLike)) else 0
+    with span('serialize') as record:
+        if fmt == 'csv':
+            df.to_csv(output, index=index, **kwargs)
+        else:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            import pyarrow.ipc as ipc
+            table = pa.Table.from_pandas(df, preserve_index=index)
+            if fmt == 'parquet':
+                pq.write_table(table, output)
+            else:
+                with ipc.new_file(output, table.schema) as writer:
+                    writer.write_table(table)
+        # 압축/텍스트 스트림처럼 기록한 크기를 알 수 없는 출력은 0
+        record['bytes'] = get_output_size(output) - written
+
+
+def _read_input(data, **kwargs) -> pd.DataFrame:
+    # 아직 열지 않은 객체는 이 스레드에서 열어 읽은 뒤 바로 닫음
+    if isinstance(data, ObjectSource):
+        with data.open() as stream:
+            return read_table(stream, **kwargs)
+    return read_table(data, **kwargs)
+
+
+def read_tables(inputs: list, max_workers: int = S3_MAX_CONCURRENT_READS, **kwargs) -> list:
+    """
+    여러 테이블 입력을 스레드 풀에서 동시에 읽는 함수.
+
+    ObjectSource 입력은 작업자 스레드가 객체를 열고 같은 스레드에서 바로 파싱하므로, 각 입력의
+    다운로드와 파싱이 동시에 진행되어 전체 소요 시간이 가장 느린 입력 하나에 가까워집니다.
+    차례를 기다리는 입력은 아직 열지 않으므로 GET 응답이 열린 채 대기하지 않습니다.
+
+    Parameters:
+    - inputs (list): 파일 경로, 바이너리/텍스트 스트림 또는 ObjectSource의 리스트
+    - max_workers (int): 동시에 읽을 최대 입력 수
+    - **kwargs: read_table에 전달할 추가 옵션
+
+    Returns:
+    - list: inputs와 같은 순서의 DataFrame 리스트
+    """
+    if len(inputs) <= 1:
+        return [_read_input(data, **kwargs) for data in inputs]
+
+    data_frames = [None] * len(inputs)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(inputs)))) as executor:
+        futures = {executor.submit(_read_input, data, **kwargs): i for i, data in enumerate(inputs)}
+        for future in as_completed(futures):
+            data_frames[futures[future]] = future.result()
+    return data_frames
+
+
+def get_input_size(data: object) -> int:
+    """
+    입력 데이터의 바이트 크기를 반환하는 함수.
+
+    Object Storage 스트림은 ContentLength를 사용하므로 데이터를 다시 복사하지 않습니다.
+
+    Parameters:
+    - data (object): 파일 경로, get_object 스트림, BytesIO/StringIO, TableBuffer
+
+    Returns:
+    - int: 입력 데이터 크기 (bytes)
+    """
+    if isinstance(data, (TableBuffer, pd.DataFrame)):
+        return _frame_size(data)
+    size = getattr(data, 'size', None)
+    if size is not None:
+        return size
+    if isinstance(data, (str, os.PathLike)):
+        return os.path.getsize(data)
+    if hasattr(data, 'getbuffer'):
+        return data.getbuffer().nbytes
+    if hasattr(data, 'getvalue'):
+        return len(data.getvalue().encode('utf-8'))
+    return 0
+
+
+def get_output_size(output: object) -> int:
+    """
+    출력 데이터의 바이트 크기를 반환하는 함수.
+
+    Parameters:
+    - output (object): 로컬 파일 경로 또는 open_object(..., mode='wb') 스트림
+
+    Returns:
+    - int: 기록된 데이터 크기 (bytes)
+    """
+    if isinstance(output, TableBuffer):
+        return _frame_size(output)
+    if isinstance(output, (str, os.PathLike)):
+        return os.path.getsize(output)
+    return getattr(output, 'bytes_written', 0)
+
+
+def _source_size(data: object) -> int:
+    # 파싱 단계 처리량 계산용. 내용을 다시 읽거나 복사해야 알 수 있는 크기는 0
+    size = getattr(data, 'size', None)
+    if size is not None:
+        return size
+    if isinstance(data, (str, os.PathLike)) and os.path.isfile(data):
+        return os.path.getsize(data)
+    return 0
+
+
+def _frame_size(data: object) -> int:
+    # 메모리로 주고받는 테이블은 직렬화된 크기가 없으므로 컬럼 버퍼 크기를 사용
+    df = data.df if isinstance(data, TableBuffer) else data
+    if df is None:
+        return 0
+    if isinstance(df, pd.DataFrame):
+        return int(df.memory_usage(index=False).sum())
+    return df.nbytes
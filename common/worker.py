@@ -0,0 +1,181 @@
+import gc
+import json
+import os
+import time
+import traceback
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from common.startup import process_start_time
+from common.storage import reset_storage_stats
+
+# 지정하면 한 번 실행하고 종료하는 대신 이 포트에서 작업 요청을 받는 상주 워커로 실행
+WORKER_PORT = int(os.getenv('WORKER_PORT', '0'))
+WORKER_HOST = os.getenv('WORKER_HOST', '127.0.0.1')
+
+# 작업 요청 본문 최대 크기 (args JSON만 받으므로 작게 제한)
+MAX_REQUEST_BYTES = 1024 * 1024
+
+
+_state = {
+    'mode': 'single',
+    'address': None,
+    'process_start': process_start_time(),
+    'cold_start': None,
+    'jobs': 0,
+    'failed': 0,
+    'job_start': None,
+    'latencies': [],
+}
+
+
+def worker_stats() -> dict:
+    """
+    콜드 스타트 시간과 작업별 처리 시간 통계를 반환합니다.
+
+    Returns:
+    - dict: mode('single' 또는 'worker'), cold_start(프로세스 시작부터 첫 작업을 받을 준비가
+            될 때까지의 초), jobs(처리한 작업 수), failed(실패한 작업 수), last_latency,
+            mean_latency(작업 요청 수신부터 응답까지의 초)
+    """
+    latencies = _state['latencies']
+    return {
+        'mode': _state['mode'],
+        'cold_start': _state['cold_start'],
+        'jobs': _state['jobs'],
+        'failed': _state['failed'],
+        'last_latency': latencies[-1] if latencies else None,
+        'mean_latency': sum(latencies) / len(latencies) if latencies else None,
+    }
+
+
+def worker_report_section() -> str:
+    """
+    작업 보고서 끝에 덧붙일 실행 방식(단일 실행/상주 워커)과 콜드 스타트 섹션을 생성합니다.
+
+    콜드 스타트(인터프리터 시작, 라이브러리 import, 모델 로드)는 작업 처리 시간과 분리하여 표시합니다.
+    상주 워커에서는 첫 작업 전에 한 번만 발생하므로 이후 작업의 처리 시간에는 포함되지 않습니다.
+    """
+    elapsed = time.time() - _state['job_start'] if _state['job_start'] else 0.0
+    if _state['mode'] == 'worker':
+        mode = f"상주 워커 ({_state['address']}, {_state['jobs']}번째 작업)"
+        cold_start = f"{_state['cold_start']:.2f}초 (워커 시작 시 1회, 이 작업에는 미포함)"
+    else:
+        mode = '단일 실행'
+        cold_start = f"{_state['cold_start']:.2f}초 (이 실행에 포함)"
+    return f"""
+## 실행 방식
+- **실행 방식**: {mode}
+- **콜드 스타트 시간**: {cold_start}
+- **작업 처리 시간**: {elapsed:.2f}초 (작업 시작부터 보고서 작성까지)
+"""
+
+
+def _run_job(run, args: dict) -> dict:
+    _state['jobs'] += 1
+    _state['job_start'] = time.time()
+    reset_storage_stats()
+    try:
+        run(args)
+        status = 'succeeded'
+        error = None
+    except Exception as e:
+        traceback.print_exc()
+        _state['failed'] += 1
+        status = 'failed'
+        error = f'{type(e).__name__}: {e}'
+    finally:
+        # 작업 사이에 남은 DataFrame 등을 해제하여 상주 프로세스의 메모리 증가를 막음
+        gc.collect()
+    latency = time.time() - _state['job_start']
+    _state['latencies'].append(latency)
+    _state['job_start'] = None
+    print(f"Job {_state['jobs']} {status} in {latency:.2f}s (cold start {_state['cold_start']:.2f}s, not included)")
+    return {'job': _state['jobs'], 'status': status, 'error': error, 'latency': latency, 'cold_start': _state['cold_start']}
+
+
+def _make_handler(run, default_args: dict):
+    class JobHandler(BaseHTTPRequestHandler):
+        def _send(self, code: int, body: dict):
+            payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+            self.send_response(code)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_GET(self):
+            if self.path != '/health':
+                return self._send(404, {'error': f'unknown path: {self.path}'})
+            self._send(200, dict(worker_stats(), status='ready'))
+
+        def do_POST(self):
+            if self.path != '/jobs':
+                return self._send(404, {'error': f'unknown path: {self.path}'})
+            length = int(self.headers.get('Content-Length') or 0)
+            if length > MAX_REQUEST_BYTES:
+                return self._send(413, {'error': 'request body too large'})
+            try:
+                job_args = json.loads(self.rfile.read(length) or b'{}')
+            except ValueError as e:
+                return self._send(400, {'error': f'invalid JSON: {e}'})
+            if not isinstance(job_args, dict):
+                return self._send(400, {'error': 'job body must be a JSON object of component args'})
+            # 요청에 없는 키는 프로세스 시작 시의 args(config.py production 값)를 사용
+            result = _run_job(run, dict(default_args, **job_args))
+            self._send(200 if result['status'] == 'succeeded' else 500, result)
+
+        def log_message(self, format, *args):
+            print(f'Worker {self.address_string()} - {format % args}')
+
+    return JobHandler
+
+
+def serve(run, args: dict, warmup=None, host: str = WORKER_HOST, port: int = WORKER_PORT):
+    """
+    컴포넌트를 상주 워커로 실행하여 로컬 HTTP로 작업을 받습니다.
+
+    무거운 라이브러리 import와 warmup(모델 로드 등)은 시작 시 한 번만 수행하고,
+    이후 요청마다 run(args)만 실행합니다. 컴포넌트는 고정된 ./tmp 경로와 전역 상태
+    (matplotlib 등)를 사용하므로 작업은 한 번에 하나씩 순서대로 처리합니다.
+
+    - POST /jobs: 본문은 config.py production args와 같은 형식의 JSON
+      (예: {"input1": {...}, "settings": {...}, "output1": {...}, "task_report": {...}})
+    - GET /health: 콜드 스타트 시간, 처리한 작업 수, 작업별 처리 시간 통계
+
+    Parameters:
+    - run (callable): args dict를 받아 작업 하나를 처리하는 함수
+    - args (dict): 요청에 없는 키에 사용할 기본 args
+    - warmup (callable): 첫 작업 전에 무거운 객체를 미리 로드하는 함수
+    - host (str): 바인딩할 주소 (기본값은 로컬 전용)
+    - port (int): 바인딩할 포트
+    """
+    _state['mode'] = 'worker'
+    if warmup is not None:
+        warmup()
+    server = HTTPServer((host, port), _make_handler(run, args))
+    _state['address'] = f'{host}:{server.server_port}'
+    _state['cold_start'] = time.time() - _state['process_start']
+    print(f"Worker ready on {_state['address']} (cold start {_state['cold_start']:.2f}s)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def run_or_serve(run, args: dict, warmup=None):
+    """
+    WORKER_PORT가 지정되어 있으면 상주 워커로 실행하고, 아니면 args로 작업 하나를 실행합니다.
+
+    Parameters:
+    - run (callable): args dict를 받아 작업 하나를 처리하는 함수
+    - args (dict): config.py에서 읽은 args
+    - warmup (callable): 상주 워커 시작 시 무거운 객체를 미리 로드하는 함수
+    """
+    if WORKER_PORT:
+        serve(run, args, warmup=warmup)
+        return
+    _state['cold_start'] = time.time() - _state['process_start']
+    _state['jobs'] = 1
+    _state['job_start'] = time.time()
+    run(args)
@@ -3,18 +3,21 @@ import time
 from datetime import datetime
 from config.config import args
 import pandas as pd
+from common.chunked import read_chunks, ChunkWriter, chunk_report_section
+from common.tabular import get_input_size, get_output_size
 
 env = 'development' if not 'APP_ENV' in os.environ else os.environ['APP_ENV']
 args = args[env]
 
-def generate_report(df: pd.DataFrame, input_cols: list, output_cols: list,
+def generate_report(columns: list, total_rows: int, input_cols: list, output_cols: list,
                   input_filename: str, output_filename: str, input_size: int, output_size: int,
                   elapsed_time: float) -> str:
     """
     작업 보고서를 생성하는 함수.
     
     Parameters:
-    - df (pd.DataFrame): 처리된 DataFrame
+    - columns (list): 처리된 컬럼 목록
+    - total_rows (int): 처리된 행 수
     - input_cols (list): 변경 전 컬럼 목록
     - output_cols (list): 변경 후 컬럼 목록
     - input_filename (str): 입력 파일 경로
@@ -36,9 +39,9 @@ def generate_report(df: pd.DataFrame, input_cols: list, output_cols: list,
 ## 2. 입력 데이터
 - **입력 파일**: {input_filename}
 - **파일 크기**: {input_size / 1024:.2f} KB
-- **행 수**: {len(df)}
-- **기존 컬럼 수**: {len(df.columns)}
-- **기존 컬럼**: {', '.join(df.columns)}
+- **행 수**: {total_rows}
+- **기존 컬럼 수**: {len(columns)}
+- **기존 컬럼**: {', '.join(columns)}
 
 ## 3. 변경 설정
 - **변경된 컬럼 수**: {len(input_cols)}
@@ -48,13 +51,13 @@ def generate_report(df: pd.DataFrame, input_cols: list, output_cols: list,
 ## 4. 처리 결과
 - **출력 파일**: {output_filename}
 - **파일 크기**: {output_size / 1024:.2f} KB
-- **새 컬럼 수**: {len(df.columns)}
-- **새 컬럼**: {', '.join(df.columns)}
+- **새 컬럼 수**: {len(columns)}
+- **새 컬럼**: {', '.join(columns)}
 
 ## 5. 성능 지표
 - **처리 속도**: {input_size / elapsed_time / 1024:.2f} KB/s
 - **압축률**: {(1 - output_size / input_size) * 100:.2f}%
-- **처리 효율**: {len(df) / elapsed_time:.2f} 행/초
+- **처리 효율**: {total_rows / elapsed_time:.2f} 행/초
 
 ## 6. 작업 상태
 - **상태**: 성공
@@ -78,44 +81,45 @@ def solution(data, input_cols, output_cols, output_filename):
     start_time = time.time()
     print(f"\n[시작] CSV 컬럼 이름 변경 작업을 시작합니다.")
     
-    # CSV 파일 읽기
-    print("\n[1/3] CSV 파일을 로드합니다...")
-    df = pd.read_csv(data)
-    print(f"- 총 {len(df)}개의 행이 로드되었습니다.")
-    print(f"- 기존 컬럼: {', '.join(df.columns)}")
-    
     # 입력 파일 크기 확인
-    input_size = len(data.getvalue().encode('utf-8'))
+    input_size = get_input_size(data)
     print(f"- 입력 파일 크기: {input_size / 1024:.2f} KB")
     
     # 컬럼 이름 변경
-    print("\n[2/3] 컬럼 이름을 변경합니다...")
+    print("\n[1/2] 컬럼 이름 변경 설정을 확인합니다...")
     for input_col, output_col in zip(input_cols, output_cols):
-        df.rename(columns={input_col: output_col}, inplace=True)
         print(f"- {input_col} → {output_col}")
     
-    # 변경된 데이터프레임을 CSV 파일로 저장
-    print("\n[3/3] 결과를 CSV로 저장합니다...")
-    df.to_csv(output_filename, index=False)
-    print(f"- CSV 저장 완료: {output_filename}")
+    # CSV 파일을 청크 단위로 읽어 컬럼 이름을 변경한 뒤 바로 저장
+    print("\n[2/2] CSV 파일을 청크 단위로 읽어 저장합니다...")
+    chunks = read_chunks(data)
+    columns = []
+    with ChunkWriter(output_filename) as writer:
+        for df in chunks:
+            for input_col, output_col in zip(input_cols, output_cols):
+                df.rename(columns={input_col: output_col}, inplace=True)
+            writer.write(df)
+            columns = list(df.columns)
+    print(f"- CSV 저장 완료: {output_filename} ({chunks.chunks}개 청크)")
     
     # 출력 파일 크기 확인
-    output_size = os.path.getsize(output_filename)
+    output_size = get_output_size(output_filename)
     print(f"- 출력 파일 크기: {output_size / 1024:.2f} KB")
     
     end_time = time.time()
     elapsed_time = end_time - start_time
     
     print(f"\n[요약]")
-    print(f"- 처리된 행 수: {len(df)}")
+    print(f"- 처리된 행 수: {chunks.rows}")
     print(f"- 변경된 컬럼 수: {len(input_cols)}")
     print(f"- 소요 시간: {elapsed_time:.2f}초")
     print(f"- 저장 경로: {output_filename}")
     
     # 보고서 생성
-    report = generate_report(df, input_cols, output_cols,
+    report = generate_report(columns, chunks.rows, input_cols, output_cols,
                            data.name if hasattr(data, 'name') else data,
                            output_filename, input_size, output_size,
                            elapsed_time)
+    report += chunk_report_section(chunks, writer)
     
     return output_filename, report
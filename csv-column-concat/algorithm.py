@@ -1,16 +1,19 @@
 import pandas as pd
+from common.chunked import read_chunks, ChunkWriter, chunk_report_section
+from common.tabular import get_input_size, get_output_size
 import time
 import os
 from datetime import datetime
 
-def generate_report(df: pd.DataFrame, target_cols: list, optional_cols: list, delimiter: str, 
+def generate_report(columns: list, total_rows: int, target_cols: list, optional_cols: list, delimiter: str, 
                   new_col_name: str, input_filename: str, output_filename: str, 
                   input_size: int, output_size: int, elapsed_time: float) -> str:
     """
     작업 보고서를 생성하는 함수.
     
     Parameters:
-    - df (pd.DataFrame): 처리된 DataFrame
+    - columns (list): 처리된 컬럼 목록
+    - total_rows (int): 처리된 행 수
     - target_cols (list): 연결 대상 컬럼 목록
     - optional_cols (list): 선택적 컬럼 목록
     - delimiter (str): 구분자
@@ -34,9 +37,9 @@ def generate_report(df: pd.DataFrame, target_cols: list, optional_cols: list, de
 ## 2. 입력 데이터
 - **입력 파일**: {input_filename}
 - **파일 크기**: {input_size / 1024:.2f} KB
-- **행 수**: {len(df)}
-- **기존 컬럼 수**: {len(df.columns)}
-- **기존 컬럼**: {', '.join(df.columns)}
+- **행 수**: {total_rows}
+- **기존 컬럼 수**: {len(columns)}
+- **기존 컬럼**: {', '.join(columns)}
 
 ## 3. 연결 설정
 - **대상 컬럼**: {', '.join(target_cols)}
@@ -47,13 +50,13 @@ def generate_report(df: pd.DataFrame, target_cols: list, optional_cols: list, de
 ## 4. 처리 결과
 - **출력 파일**: {output_filename}
 - **파일 크기**: {output_size / 1024:.2f} KB
-- **새 컬럼 수**: {len(df.columns)}
-- **새 컬럼**: {', '.join(df.columns)}
+- **새 컬럼 수**: {len(columns)}
+- **새 컬럼**: {', '.join(columns)}
 
 ## 5. 성능 지표
 - **처리 속도**: {input_size / elapsed_time / 1024:.2f} KB/s
 - **압축률**: {(1 - output_size / input_size) * 100:.2f}%
-- **처리 효율**: {len(df) / elapsed_time:.2f} 행/초
+- **처리 효율**: {total_rows / elapsed_time:.2f} 행/초
 
 ## 6. 작업 상태
 - **상태**: 성공
@@ -80,45 +83,43 @@ def solution(input_filename: str, output_filename: str, target_cols: list, optio
     start_time = time.time()
     print(f"\n[시작] CSV 컬럼 연결 작업을 시작합니다.")
     
-    # CSV 파일 로드
-    print("\n[1/3] CSV 파일을 로드합니다...")
-    try:
-        df = pd.read_csv(input_filename)
-        print(f"- CSV 데이터 로드 완료: {len(df)}행 x {len(df.columns)}열")
-    except Exception as e:
-        raise ValueError(f"CSV 파일 로드 실패: {str(e)}")
-    
     # 입력 파일 크기 확인
-    input_size = os.path.getsize(input_filename)
+    input_size = get_input_size(input_filename)
     print(f"- 입력 파일 크기: {input_size / 1024:.2f} KB")
     
-    # 컬럼 검증
-    print("\n[2/3] 컬럼을 검증하고 연결합니다...")
-    missing_cols = [col for col in target_cols if col not in df.columns]
-    if missing_cols:
-        raise ValueError(f"필수 컬럼이 누락되었습니다: {', '.join(missing_cols)}")
-    
-    # 선택적 컬럼 처리
-    if optional_cols:
-        available_optional_cols = [col for col in optional_cols if col in df.columns]
-        print(f"- 사용 가능한 선택적 컬럼: {', '.join(available_optional_cols)}")
-        target_cols.extend(available_optional_cols)
-    
-    # 컬럼 연결
-    print(f"- 연결할 컬럼: {', '.join(target_cols)}")
-    df[new_col_name] = df[target_cols].astype(str).agg(delimiter.join, axis=1)
+    # CSV 파일을 청크 단위로 읽어 컬럼 연결 후 바로 저장
+    print("\n[1/3] CSV 파일을 청크 단위로 읽습니다...")
+    chunks = read_chunks(input_filename)
+    columns = []
+    with ChunkWriter(output_filename) as writer:
+        for df in chunks:
+            if chunks.chunks == 1:
+                print(f"- 컬럼 수: {len(df.columns)}열")
+                
+                # 컬럼 검증
+                print("\n[2/3] 컬럼을 검증하고 연결합니다...")
+                missing_cols = [col for col in target_cols if col not in df.columns]
+                if missing_cols:
+                    raise ValueError(f"필수 컬럼이 누락되었습니다: {', '.join(missing_cols)}")
+                
+                # 선택적 컬럼 처리
+                if optional_cols:
+                    available_optional_cols = [col for col in optional_cols if col in df.columns]
+                    print(f"- 사용 가능한 선택적 컬럼: {', '.join(available_optional_cols)}")
+                    target_cols.extend(available_optional_cols)
+                print(f"- 연결할 컬럼: {', '.join(target_cols)}")
+            
+            # 컬럼 연결
+            df[new_col_name] = df[target_cols].astype(str).agg(delimiter.join, axis=1)
+            writer.write(df)
+            columns = list(df.columns)
     print(f"- 새 컬럼 '{new_col_name}' 생성 완료")
     
-    # CSV로 저장
-    print("\n[3/3] 결과를 CSV로 저장합니다...")
-    try:
-        df.to_csv(output_filename, index=False)
-        print(f"- CSV 저장 완료: {output_filename}")
-    except Exception as e:
-        raise IOError(f"CSV 저장 실패: {str(e)}")
+    print("\n[3/3] 결과를 CSV로 저장했습니다.")
+    print(f"- CSV 저장 완료: {output_filename} ({chunks.rows}행, {chunks.chunks}개 청크)")
     
     # 출력 파일 크기 확인
-    output_size = os.path.getsize(output_filename)
+    output_size = get_output_size(output_filename)
     print(f"- 출력 파일 크기: {output_size / 1024:.2f} KB")
     
     end_time = time.time()
@@ -127,12 +128,13 @@ def solution(input_filename: str, output_filename: str, target_cols: list, optio
     print(f"\n[요약]")
     print(f"- 입력 파일: {input_filename}")
     print(f"- 출력 파일: {output_filename}")
-    print(f"- 처리된 행 수: {len(df)}")
+    print(f"- 처리된 행 수: {chunks.rows}")
     print(f"- 연결된 컬럼 수: {len(target_cols)}")
     print(f"- 소요 시간: {elapsed_time:.2f}초")
     
     # 보고서 생성
-    report = generate_report(df, target_cols, optional_cols or [], delimiter, new_col_name,
+    report = generate_report(columns, chunks.rows, target_cols, optional_cols or [], delimiter, new_col_name,
                            input_filename, output_filename, input_size, output_size, elapsed_time)
+    report += chunk_report_section(chunks, writer)
     
-    return output_filename, report
\ No newline at end of file
+    return output_filename, report
@@ -1,15 +1,15 @@
 import numpy as np
 import json
-from sklearn.metrics.pairwise import cosine_similarity
 import time
 import math
 import os
 from datetime import datetime
+from common.overlap import BackgroundWriter, overlap_summary
 
 def generate_report(query_count: int, candidate_count: int, matched_count: int, 
                   avg_recommendations: float, input_files: dict, output_filename: str,
                   input_sizes: dict, output_size: int, elapsed_time: float,
-                  top_n: int, threshold: float, batch_size: int) -> str:
+                  top_n: int, threshold: float, batch_size: int, output_overlap: str) -> str:
     """
     작업 보고서를 생성하는 함수.
     
@@ -26,6 +26,7 @@ def generate_report(query_count: int, candidate_count: int, matched_count: int,
     - top_n (int): 최대 추천 개수
     - threshold (float): 유사도 임계값
     - batch_size (int): 배치 크기
+    - output_overlap (str): 출력 대기열 사용 현황 요약
     
     Returns:
     - str: 생성된 보고서 내용 (markdown 형식)
@@ -63,6 +64,7 @@ def generate_report(query_count: int, candidate_count: int, matched_count: int,
 - **처리 속도**: {(input_sizes['query'] + input_sizes['candidate']) / elapsed_time / 1024:.2f} KB/s
 - **쿼리 처리 속도**: {query_count / elapsed_time:.2f} 쿼리/초
 - **추천 처리 속도**: {matched_count / elapsed_time:.2f} 추천/초
+- **출력 대기열**: {output_overlap}
 
 ## 6. 작업 상태
 - **상태**: 성공
@@ -70,11 +72,23 @@ def generate_report(query_count: int, candidate_count: int, matched_count: int,
 """
     return report
 
+def normalize_rows(embeddings, dtype=np.float64):
+    """
+    각 행을 L2 노름으로 나눕니다 (sklearn.preprocessing.normalize와 같이 노름이 0인 행은 그대로 둠).
+    두 행렬을 정규화한 뒤 곱하면 sklearn.metrics.pairwise.cosine_similarity와 같은 값이 되므로,
+    유사도 계산 하나를 위해 scikit-learn 전체를 import하지 않습니다.
+    """
+    embeddings = np.asarray(embeddings, dtype=dtype)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return embeddings / norms
+
 def process_batch(query_embeddings, candidate_embeddings, query_ids, candidate_ids, 
                  batch_start, batch_end, top_n, threshold):
-    """배치 단위로 유사도 계산 및 결과 생성"""
+    """배치 단위로 유사도 계산 및 결과 생성 (candidate_embeddings는 normalize_rows로 정규화된 값)"""
     batch_results = []
-    batch_sim_matrix = cosine_similarity(query_embeddings[batch_start:batch_end], candidate_embeddings)
+    batch_queries = normalize_rows(query_embeddings[batch_start:batch_end], candidate_embeddings.dtype)
+    batch_sim_matrix = batch_queries @ candidate_embeddings.T
     
     for i, sim_vector in enumerate(batch_sim_matrix):
         sim_scores = list(enumerate(sim_vector))
@@ -97,20 +111,46 @@ def process_batch(query_embeddings, candidate_embeddings, query_ids, candidate_i
     
     return batch_results
 
-def solution(query_npz: object, candidate_npz: object, output_filename: str, top_n: int, threshold: float, batch_size: int = 1000):
+class JsonArrayWriter:
+    """
+    json.dump(results, indent=2)와 같은 형식의 JSON 배열을 항목 단위로 이어 쓰는 객체.
+    배치 결과를 모두 모으지 않고 계산이 끝난 배치부터 출력할 때 사용합니다.
+    """
+
+    def __init__(self, output):
+        self.output = output
+        self.items = 0
+        self.bytes_written = 0
+
+    def _write(self, text: str):
+        data = text.encode('utf-8')
+        self.output.write(data)
+        self.bytes_written += len(data)
+
+    def write(self, batch_results: list):
+        for result in batch_results:
+            # 배열 항목은 한 단계 더 들여쓰므로 항목의 각 줄 앞에 2칸을 더함 (문자열 안 줄바꿈은 \n으로 이스케이프됨)
+            item = json.dumps(result, ensure_ascii=False, indent=2).replace('\n', '\n  ')
+            self._write(('[\n  ' if self.items == 0 else ',\n  ') + item)
+            self.items += 1
+
+    def close(self):
+        self._write('\n]' if self.items else '[]')
+
+def solution(query_npz: object, candidate_npz: object, output_filename: object, top_n: int, threshold: float, batch_size: int = 1000):
     """
     코사인 유사도를 기반으로 피 추천 대상(query)와 추천 대상(candidate) 간 매칭 결과 생성
 
     Parameters:
     - query_npz (object): 쿼리 임베딩 npz 파일
     - candidate_npz (object): 추천 후보 임베딩 npz 파일
-    - output_filename (str): 추천 결과 저장할 JSON 파일 경로
+    - output_filename (object): 추천 결과를 저장할 JSON 파일 경로 또는 open_object(..., mode='wb') 스트림
     - top_n (int): 최대 추천 개수
     - threshold (float): 유사도 임계값
     - batch_size (int): 배치 처리 크기 (기본값: 1000)
 
     Returns:
-    - tuple: (추천 결과, 보고서 내용)
+    - tuple: (저장된 파일 경로 또는 스트림, 보고서 내용)
     """
     start_time = time.time()
     print(f"\n[시작] 코사인 유사도 기반 추천 작업을 시작합니다.")
@@ -131,6 +171,10 @@ def solution(query_npz: object, candidate_npz: object, output_filename: str, top
     candidate_ids = candidate_data['idxs'] if 'idxs' in candidate_data else np.arange(len(candidate_embeddings)).astype(str)
     print(f"- 후보 데이터: {len(candidate_embeddings)}개")
 
+    # 후보 임베딩은 배치마다 다시 정규화하지 않도록 한 번만 정규화 (둘 다 float32이면 float32로 계산)
+    dtype = np.float32 if query_embeddings.dtype == np.float32 and candidate_embeddings.dtype == np.float32 else np.float64
+    candidate_normalized = normalize_rows(candidate_embeddings, dtype)
+
     # 입력 파일 크기 확인
     input_sizes = {
         'query': os.path.getsize(query_npz.name if hasattr(query_npz, 'name') else query_npz),
@@ -139,40 +183,49 @@ def solution(query_npz: object, candidate_npz: object, output_filename: str, top
     print(f"- 쿼리 파일 크기: {input_sizes['query'] / 1024:.2f} KB")
     print(f"- 후보 파일 크기: {input_sizes['candidate'] / 1024:.2f} KB")
 
-    # 배치 처리
+    # 배치 처리: 계산이 끝난 배치의 결과는 출력 스레드가 JSON으로 직렬화해 저장하고,
+    # 그동안 다음 배치의 유사도를 계산 (결과 전체를 메모리에 모으지 않음)
     print("\n[2/4] 배치 단위로 유사도를 계산합니다...")
-    results = []
     total_queries = len(query_embeddings)
     num_batches = math.ceil(total_queries / batch_size)
     matched_count = 0
+    recommendation_count = 0
+
+    is_path = isinstance(output_filename, (str, os.PathLike))
+    output = open(output_filename, 'wb') if is_path else output_filename
+    json_writer = JsonArrayWriter(output)
+    try:
+        with BackgroundWriter(json_writer.write) as background:
+            for batch_idx in range(num_batches):
+                batch_start = batch_idx * batch_size
+                batch_end = min((batch_idx + 1) * batch_size, total_queries)
+
+                print(f"- 배치 {batch_idx + 1}/{num_batches} 처리 중... ({batch_start + 1}~{batch_end}번째 쿼리)")
+
+                batch_results = process_batch(
+                    query_embeddings, candidate_normalized,
+                    query_ids, candidate_ids,
+                    batch_start, batch_end, top_n, threshold
+                )
+
+                matched_count += len(batch_results)
+                recommendation_count += sum(len(r['recommendations']) for r in batch_results)
+                background.put(batch_results)
+
+                # 메모리 해제
+                del batch_results
+                if batch_idx < num_batches - 1:
+                    print(f"  - 현재까지 매칭된 쿼리 수: {matched_count}")
+
+        # 결과 저장
+        print("\n[3/4] 추천 결과를 저장합니다...")
+        json_writer.close()
+    finally:
+        if is_path:
+            output.close()
 
-    for batch_idx in range(num_batches):
-        batch_start = batch_idx * batch_size
-        batch_end = min((batch_idx + 1) * batch_size, total_queries)
-        
-        print(f"- 배치 {batch_idx + 1}/{num_batches} 처리 중... ({batch_start + 1}~{batch_end}번째 쿼리)")
-        
-        batch_results = process_batch(
-            query_embeddings, candidate_embeddings, 
-            query_ids, candidate_ids,
-            batch_start, batch_end, top_n, threshold
-        )
-        
-        matched_count += len(batch_results)
-        results.extend(batch_results)
-        
-        # 메모리 해제
-        del batch_results
-        if batch_idx < num_batches - 1:
-            print(f"  - 현재까지 매칭된 쿼리 수: {matched_count}")
-
-    # 결과 저장
-    print("\n[3/4] 추천 결과를 저장합니다...")
-    with open(output_filename, 'w', encoding='utf-8') as f:
-        json.dump(results, f, ensure_ascii=False, indent=2)
-    
     # 출력 파일 크기 확인
-    output_size = os.path.getsize(output_filename)
+    output_size = json_writer.bytes_written
     print(f"- 출력 파일 크기: {output_size / 1024:.2f} KB")
     
     end_time = time.time()
@@ -181,20 +234,20 @@ def solution(query_npz: object, candidate_npz: object, output_filename: str, top
     print(f"\n[요약]")
     print(f"- 처리된 쿼리 수: {total_queries}")
     print(f"- 매칭된 쿼리 수: {matched_count}")
-    print(f"- 평균 추천 개수: {sum(len(r['recommendations']) for r in results) / len(results) if results else 0:.2f}")
+    print(f"- 평균 추천 개수: {recommendation_count / matched_count if matched_count else 0:.2f}")
     print(f"- 소요 시간: {elapsed_time:.2f}초")
     print(f"- 저장 경로: {output_filename}")
     
     # 보고서 생성
     report = generate_report(
         total_queries, len(candidate_embeddings), matched_count,
-        sum(len(r['recommendations']) for r in results) / len(results) if results else 0,
+        recommendation_count / matched_count if matched_count else 0,
         {
             'query': query_npz.name if hasattr(query_npz, 'name') else query_npz,
             'candidate': candidate_npz.name if hasattr(candidate_npz, 'name') else candidate_npz
         },
-        output_filename, input_sizes, output_size, elapsed_time,
-        top_n, threshold, batch_size
+        str(output_filename), input_sizes, output_size, elapsed_time,
+        top_n, threshold, batch_size, overlap_summary(background)
     )
     
-    return results, report
\ No newline at end of file
+    return output_filename, report
\ No newline at end of file
@@ -1,9 +1,11 @@
 import pandas as pd
+from common.chunked import read_chunks, ChunkWriter, chunk_report_section
+from common.tabular import get_input_size, get_output_size
 import time
 import os
 from datetime import datetime
 
-def generate_report(df: pd.DataFrame, input_cols: list, display_mode: str, suffix: str,
+def generate_report(columns: list, total_rows: int, input_cols: list, display_mode: str, suffix: str,
                   in_format: str, out_format: str, input_filename: str, output_filename: str,
                   input_size: int, output_size: int, elapsed_time: float,
                   success_counts: dict, fail_counts: dict) -> str:
@@ -11,7 +13,8 @@ def generate_report(df: pd.DataFrame, input_cols: list, display_mode: str, suffi
     작업 보고서를 생성하는 함수.
     
     Parameters:
-    - df (pd.DataFrame): 처리된 DataFrame
+    - columns (list): 처리된 컬럼 목록
+    - total_rows (int): 처리된 행 수
     - input_cols (list): 처리된 컬럼 목록
     - display_mode (str): 표시 모드 ('append' 또는 'replace')
     - suffix (str): 새 컬럼 접미사
@@ -38,9 +41,9 @@ def generate_report(df: pd.DataFrame, input_cols: list, display_mode: str, suffi
 ## 2. 입력 데이터
 - **입력 파일**: {input_filename}
 - **파일 크기**: {input_size / 1024:.2f} KB
-- **행 수**: {len(df)}
-- **기존 컬럼 수**: {len(df.columns)}
-- **기존 컬럼**: {', '.join(df.columns)}
+- **행 수**: {total_rows}
+- **기존 컬럼 수**: {len(columns)}
+- **기존 컬럼**: {', '.join(columns)}
 
 ## 3. 포맷 변경 설정
 - **표시 모드**: {display_mode}
@@ -53,15 +56,15 @@ def generate_report(df: pd.DataFrame, input_cols: list, display_mode: str, suffi
 ## 4. 처리 결과
 - **출력 파일**: {output_filename}
 - **파일 크기**: {output_size / 1024:.2f} KB
-- **새 컬럼 수**: {len(df.columns)}
-- **새 컬럼**: {', '.join(df.columns)}
+- **새 컬럼 수**: {len(columns)}
+- **새 컬럼**: {', '.join(columns)}
 - **변환 결과**:
 {chr(10).join([f"- {col}: {success_counts[col]}개 성공, {fail_counts[col]}개 실패" for col in input_cols])}
 
 ## 5. 성능 지표
 - **처리 속도**: {input_size / elapsed_time / 1024:.2f} KB/s
 - **압축률**: {(1 - output_size / input_size) * 100:.2f}%
-- **처리 효율**: {len(df) / elapsed_time:.2f} 행/초
+- **처리 효율**: {total_rows / elapsed_time:.2f} 행/초
 
 ## 6. 작업 상태
 - **상태**: 성공
@@ -94,76 +97,70 @@ def solution(data: object, output_filename: str, input_cols, display_mode='repla
     if display_mode == 'append':
         print(f"- 새 컬럼 접미사: {suffix}")
     
-    # CSV 파일 읽기
-    print("\n[1/4] CSV 파일을 로드합니다...")
-    df = pd.read_csv(data)
-    print(f"- 총 {len(df)}개의 행이 로드되었습니다.")
-    print(f"- 기존 컬럼: {', '.join(df.columns)}")
+    if display_mode not in ('append', 'replace'):
+        raise ValueError("잘못된 display_mode입니다. 'append' 또는 'replace'를 사용하세요.")
     
     # 입력 파일 크기 확인
-    input_size = len(data.getvalue().encode('utf-8'))
+    input_size = get_input_size(data)
     print(f"- 입력 파일 크기: {input_size / 1024:.2f} KB")
     
-    # 입력 컬럼 검증
-    print("\n[2/4] 입력 컬럼을 검증합니다...")
-    missing_cols = [col for col in input_cols if col not in df.columns]
-    if missing_cols:
-        raise ValueError(f"다음 컬럼이 존재하지 않습니다: {missing_cols}")
-    print(f"- 처리할 컬럼: {', '.join(input_cols)}")
-    
-    # 날짜/시간 포맷 변경
-    print("\n[3/4] 날짜/시간 포맷을 변경합니다...")
+    # CSV 파일을 청크 단위로 읽어 포맷 변경 후 바로 저장
+    print("\n[1/4] CSV 파일을 청크 단위로 읽습니다...")
+    chunks = read_chunks(data)
     total_cols = len(input_cols)
-    success_counts = {}
-    fail_counts = {}
+    success_counts = {col: 0 for col in input_cols}
+    fail_counts = {col: 0 for col in input_cols}
+    columns = []
     
-    if display_mode == 'append':
-        for i, col in enumerate(input_cols, 1):
-            new_col_name = col + suffix
-            print(f"- {i}/{total_cols}번째 컬럼 처리: {col} -> {new_col_name}")
-            df[new_col_name] = df[col]
-            df[new_col_name] = pd.to_datetime(df[new_col_name], format=in_format, errors='coerce')
-            df[new_col_name] = df[new_col_name].dt.strftime(out_format)
-            success_count = len(df[new_col_name].dropna())
-            fail_count = df[new_col_name].isna().sum()
-            success_counts[col] = success_count
-            fail_counts[col] = fail_count
-            print(f"  - 변환 완료: {success_count}개 행 성공, {fail_count}개 행 실패")
-    elif display_mode == 'replace':
-        for i, col in enumerate(input_cols, 1):
-            print(f"- {i}/{total_cols}번째 컬럼 처리: {col}")
-            df[col] = pd.to_datetime(df[col], format=in_format, errors='coerce')
-            df[col] = df[col].dt.strftime(out_format)
-            success_count = len(df[col].dropna())
-            fail_count = df[col].isna().sum()
-            success_counts[col] = success_count
-            fail_counts[col] = fail_count
-            print(f"  - 변환 완료: {success_count}개 행 성공, {fail_count}개 행 실패")
-    else:
-        raise ValueError("잘못된 display_mode입니다. 'append' 또는 'replace'를 사용하세요.")
+    with ChunkWriter(output_filename) as writer:
+        for df in chunks:
+            if chunks.chunks == 1:
+                print(f"- 기존 컬럼: {', '.join(df.columns)}")
+                # 입력 컬럼 검증
+                print("\n[2/4] 입력 컬럼을 검증합니다...")
+                missing_cols = [col for col in input_cols if col not in df.columns]
+                if missing_cols:
+                    raise ValueError(f"다음 컬럼이 존재하지 않습니다: {missing_cols}")
+                print(f"- 처리할 컬럼: {', '.join(input_cols)}")
+                print("\n[3/4] 날짜/시간 포맷을 변경합니다...")
+            
+            # 날짜/시간 포맷 변경
+            for col in input_cols:
+                new_col_name = col + suffix if display_mode == 'append' else col
+                df[new_col_name] = pd.to_datetime(df[col], format=in_format, errors='coerce')
+                df[new_col_name] = df[new_col_name].dt.strftime(out_format)
+                success_counts[col] += len(df[new_col_name].dropna())
+                fail_counts[col] += int(df[new_col_name].isna().sum())
+            writer.write(df)
+            columns = list(df.columns)
+    
+    for i, col in enumerate(input_cols, 1):
+        target = f"{col} -> {col + suffix}" if display_mode == 'append' else col
+        print(f"- {i}/{total_cols}번째 컬럼 처리: {target}")
+        print(f"  - 변환 완료: {success_counts[col]}개 행 성공, {fail_counts[col]}개 행 실패")
     
     # 결과 저장
-    print(f"\n[4/4] 결과를 저장합니다...")
-    df.to_csv(output_filename, index=False)
+    print(f"\n[4/4] 결과를 저장했습니다. ({chunks.chunks}개 청크)")
     
     # 출력 파일 크기 확인
-    output_size = os.path.getsize(output_filename)
+    output_size = get_output_size(output_filename)
     print(f"- 출력 파일 크기: {output_size / 1024:.2f} KB")
     
     end_time = time.time()
     elapsed_time = end_time - start_time
     
     print(f"\n[요약]")
-    print(f"- 처리된 행 수: {len(df)}")
+    print(f"- 처리된 행 수: {chunks.rows}")
     print(f"- 처리된 컬럼 수: {total_cols}")
     print(f"- 소요 시간: {elapsed_time:.2f}초")
     print(f"- 저장 경로: {output_filename}")
     
     # 보고서 생성
-    report = generate_report(df, input_cols, display_mode, suffix,
+    report = generate_report(columns, chunks.rows, input_cols, display_mode, suffix,
                            in_format, out_format,
                            data.name if hasattr(data, 'name') else data,
                            output_filename, input_size, output_size,
                            elapsed_time, success_counts, fail_counts)
+    report += chunk_report_section(chunks, writer)
     
-    return output_filename, report
\ No newline at end of file
+    return output_filename, report
@@ -5,15 +5,18 @@ from datetime import datetime
 import library which you need
 '''
 import pandas as pd
+from common.chunked import read_chunks, ChunkWriter, chunk_report_section
+from common.tabular import get_input_size, get_output_size
 
-def generate_report(df: pd.DataFrame, subset: list, input_filename: str, output_filename: str,
+def generate_report(columns: list, kept_rows: int, subset: list, input_filename: str, output_filename: str,
                   input_size: int, output_size: int, elapsed_time: float,
                   missing_counts: dict, removed_rows: int) -> str:
     """
     작업 보고서를 생성하는 함수.
     
     Parameters:
-    - df (pd.DataFrame): 처리된 DataFrame
+    - columns (list): 처리된 컬럼 목록
+    - kept_rows (int): 결측값 제거 후 남은 행 수
     - subset (list): 처리된 컬럼 목록
     - input_filename (str): 입력 파일 경로
     - output_filename (str): 출력 파일 경로
@@ -36,27 +39,27 @@ def generate_report(df: pd.DataFrame, subset: list, input_filename: str, output_
 ## 2. 입력 데이터
 - **입력 파일**: {input_filename}
 - **파일 크기**: {input_size / 1024:.2f} KB
-- **행 수**: {len(df) + removed_rows:,}행
-- **컬럼 수**: {len(df.columns)}개
-- **컬럼 목록**: {', '.join(df.columns)}
+- **행 수**: {kept_rows + removed_rows:,}행
+- **컬럼 수**: {len(columns)}개
+- **컬럼 목록**: {', '.join(columns)}
 
 ## 3. 결측값 분석
 - **처리 모드**: {'전체 컬럼' if not subset else '선택 컬럼'}
 - **처리된 컬럼**: {', '.join(subset) if subset else '모든 컬럼'}
 - **결측값 현황**:
-{chr(10).join([f"- {col}: {count:,}개 ({count/(len(df) + removed_rows)*100:.1f}%)" for col, count in missing_counts.items() if count > 0])}
+{chr(10).join([f"- {col}: {count:,}개 ({count/(kept_rows + removed_rows)*100:.1f}%)" for col, count in missing_counts.items() if count > 0])}
 
 ## 4. 처리 결과
 - **출력 파일**: {output_filename}
 - **파일 크기**: {output_size / 1024:.2f} KB
 - **제거된 행 수**: {removed_rows:,}행
-- **남은 행 수**: {len(df):,}행
-- **제거 비율**: {removed_rows/(len(df) + removed_rows)*100:.1f}%
+- **남은 행 수**: {kept_rows:,}행
+- **제거 비율**: {removed_rows/(kept_rows + removed_rows)*100:.1f}%
 
 ## 5. 성능 지표
 - **처리 속도**: {input_size / elapsed_time / 1024:.2f} KB/s
 - **압축률**: {(1 - output_size / input_size) * 100:.2f}%
-- **처리 효율**: {(len(df) + removed_rows) / elapsed_time:.2f} 행/초
+- **처리 효율**: {(kept_rows + removed_rows) / elapsed_time:.2f} 행/초
 
 ## 6. 작업 상태
 - **상태**: 성공
@@ -83,66 +86,62 @@ def solution(data: object, output_filename: str, subset):
     else:
         print("- 모든 컬럼의 결측값을 제거합니다.")
     
-    # CSV 파일 로드
-    print("\n[1/3] CSV 파일을 로드합니다...")
-    df = pd.read_csv(data)
-    print(f"- 총 행 수: {len(df):,}행")
-    print(f"- 컬럼 수: {len(df.columns)}개")
-    print(f"- 컬럼 목록: {', '.join(df.columns)}")
-    
     # 입력 파일 크기 확인
-    input_size = len(data.getvalue().encode('utf-8'))
+    input_size = get_input_size(data)
     print(f"- 입력 파일 크기: {input_size / 1024:.2f} KB")
     
-    # 결측값 분석
-    print("\n[2/3] 결측값을 분석합니다...")
-    if subset:
-        missing_counts = df[subset].isnull().sum()
-        print("- 각 컬럼별 결측값 수:")
-        for col, count in missing_counts.items():
-            print(f"  - {col}: {count:,}개 ({count/len(df)*100:.1f}%)")
-    else:
-        missing_counts = df.isnull().sum()
-        print("- 각 컬럼별 결측값 수:")
-        for col, count in missing_counts.items():
-            if count > 0:
-                print(f"  - {col}: {count:,}개 ({count/len(df)*100:.1f}%)")
+    # CSV 파일을 청크 단위로 읽어 결측값 분석/제거 후 바로 저장
+    print("\n[1/3] CSV 파일을 청크 단위로 읽습니다...")
+    chunks = read_chunks(data)
+    missing_counts = None
+    kept_rows = 0
+    columns = []
+    with ChunkWriter(output_filename) as writer:
+        for df in chunks:
+            # 결측값 분석
+            counts = df[subset].isnull().sum() if subset else df.isnull().sum()
+            missing_counts = counts if missing_counts is None else missing_counts + counts
+            
+            # 결측값 제거
+            df = df.dropna(subset=subset) if subset else df.dropna()
+            writer.write(df)
+            kept_rows += len(df)
+            columns = list(df.columns)
+    total_rows = chunks.rows
+    print(f"- 총 행 수: {total_rows:,}행 ({chunks.chunks}개 청크)")
+    print(f"- 컬럼 수: {len(columns)}개")
+    print(f"- 컬럼 목록: {', '.join(columns)}")
     
-    # 결측값 제거
-    print("\n[3/3] 결측값을 제거합니다...")
-    if not subset:
-        print("- 모든 컬럼의 결측값을 제거합니다...")
-        df = df.dropna()
-    else:
-        print(f"- 지정된 컬럼({', '.join(subset)})의 결측값을 제거합니다...")
-        df = df.dropna(subset=subset)
+    print("\n[2/3] 결측값 분석 결과")
+    print("- 각 컬럼별 결측값 수:")
+    for col, count in missing_counts.items():
+        if subset or count > 0:
+            print(f"  - {col}: {count:,}개 ({count/total_rows*100:.1f}%)")
     
-    removed_rows = len(df) - len(df)
+    print("\n[3/3] 결측값을 제거했습니다.")
+    removed_rows = total_rows - kept_rows
     print(f"- 제거된 행 수: {removed_rows:,}행")
-    print(f"- 남은 행 수: {len(df):,}행")
-    
-    # 결과 저장
-    print(f"\n[저장] 결과를 저장합니다...")
-    df.to_csv(output_filename, index=False, mode='w')
+    print(f"- 남은 행 수: {kept_rows:,}행")
     
     # 출력 파일 크기 확인
-    output_size = os.path.getsize(output_filename)
+    output_size = get_output_size(output_filename)
     print(f"- 출력 파일 크기: {output_size / 1024:.2f} KB")
     
     end_time = time.time()
     elapsed_time = end_time - start_time
     
     print(f"\n[요약]")
-    print(f"- 처리 전 행 수: {len(df) + removed_rows:,}행")
-    print(f"- 처리 후 행 수: {len(df):,}행")
-    print(f"- 제거된 행 비율: {removed_rows/(len(df) + removed_rows)*100:.1f}%")
+    print(f"- 처리 전 행 수: {total_rows:,}행")
+    print(f"- 처리 후 행 수: {kept_rows:,}행")
+    print(f"- 제거된 행 비율: {removed_rows/total_rows*100:.1f}%")
     print(f"- 소요 시간: {elapsed_time:.2f}초")
     print(f"- 저장 경로: {output_filename}")
     
     # 보고서 생성
-    report = generate_report(df, subset,
+    report = generate_report(columns, kept_rows, subset,
                            data.name if hasattr(data, 'name') else data,
                            output_filename, input_size, output_size,
                            elapsed_time, missing_counts, removed_rows)
+    report += chunk_report_section(chunks, writer)
     
-    return output_filename, report
\ No newline at end of file
+    return output_filename, report
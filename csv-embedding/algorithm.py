@@ -1,11 +1,41 @@
 import pandas as pd
+from common.tabular import read_table, projection_report_section, arrow_strings_enabled, ARROW_STRING_DTYPE
+from common.resources import process_workers
 import numpy as np
-import torch
-from transformers import AutoTokenizer, AutoModel
 import math
+import os
+from itertools import islice
 from datetime import datetime
 import time
 
+# 모델 경로 -> (tokenizer, model). 상주 워커에서 작업마다 ./model을 다시 읽지 않도록 보관
+_models = {}
+
+
+def load_model(model_path: str = './model') -> tuple:
+    """
+    임베딩 모델을 로드하거나, 이 프로세스에서 이미 로드한 모델을 반환합니다.
+
+    Parameters:
+    - model_path (str): transformers 모델 디렉터리 경로
+
+    Returns:
+    - tuple: (tokenizer, model)
+    """
+    model_path = os.path.abspath(model_path)
+    if model_path not in _models:
+        # torch/transformers는 import에만 수 초가 걸리므로 모델이 필요할 때 불러옴 (결과 캐시 적중, 증분 skip 시 생략)
+        import torch
+        from transformers import AutoTokenizer, AutoModel
+        # torch는 기본적으로 호스트 코어 수만큼 연산 스레드를 만들므로 pod의 CPU quota에 맞춤
+        torch.set_num_threads(process_workers('torch 연산 스레드 수'))
+        tokenizer = AutoTokenizer.from_pretrained(model_path, local_files_only=True)
+        model = AutoModel.from_pretrained(model_path, local_files_only=True)
+        model.eval()
+        _models[model_path] = (tokenizer, model)
+    return _models[model_path]
+
+
 def generate_report(
     df: pd.DataFrame,
     target_column: str,
@@ -76,7 +106,9 @@ def solution(
     target_column: str,
     idx_column: str,
     model_name: str,
-    existing_embeddings: dict = None
+    existing_embeddings: dict = None,
+    idx_offset: int = 0,
+    checkpoint=None
 ) -> tuple:
     """
     CSV 파일에서 지정된 컬럼의 텍스트를 임베딩하고, 결과를 npz 파일로 저장합니다.
@@ -89,6 +121,9 @@ def solution(
     - idx_column (str): 임베딩 결과와 매칭할 인덱스용 컬럼 이름
     - model_name (str): SentenceTransformer에서 사용할 모델 이름
     - existing_embeddings (dict): 기존 임베딩 결과 {'idxs': [...], 'embeddings': [...]}
+    - idx_offset (int): 인덱스 컬럼이 없을 때 인덱스 번호의 시작 값 (입력 뒷부분만 처리할 때 사용).
+                        None이면 시작 번호를 알 수 없으므로 인덱스 컬럼이 없을 때 오류
+    - checkpoint (Checkpoint): 지정하면 주기적으로 새 임베딩을 저장하고, 저장된 위치부터 이어서 처리
 
     Returns:
     - tuple: (저장된 파일 경로, 보고서 내용)
@@ -96,7 +131,7 @@ def solution(
     start_time = time.time()
     
     # CSV 데이터 로드
-    df = pd.read_csv(data)
+    df = read_table(data, columns=[target_column, idx_column])
 
     # 대상 컬럼 확인
     if target_column not in df.columns:
@@ -104,13 +139,20 @@ def solution(
 
     # 인덱스 컬럼 처리
     if idx_column not in df.columns:
+        if idx_offset is None:
+            raise ValueError(f"'{idx_column}' 컬럼이 없고 입력 구간의 시작 행 번호를 알 수 없습니다. "
+                             "SHARD_SCAN_PREFIX=true로 실행하거나 인덱스 컬럼을 지정하세요.")
         print(f"'{idx_column}' 컬럼이 없어 인덱스 번호를 사용합니다.")
-        idxs = np.arange(len(df)).astype(str)
+        idxs = np.arange(idx_offset, idx_offset + len(df)).astype(str)
     else:
         idxs = df[idx_column].fillna('').astype(str).values
 
     # 임베딩 대상 텍스트 준비
-    texts = df[target_column].fillna('').astype(str).tolist()
+    if arrow_strings_enabled():
+        # string[pyarrow]를 유지한 채 순회하여 전체 텍스트의 Python 문자열 목록을 만들지 않음
+        texts = df[target_column].astype(ARROW_STRING_DTYPE).fillna('')
+    else:
+        texts = df[target_column].fillna('').astype(str).tolist()
 
     # 기존 임베딩 결과 처리
     existing_idxs = set()
@@ -119,11 +161,9 @@ def solution(
         existing_idxs = set(existing_embeddings['idxs'])
         existing_embeddings_list = existing_embeddings['embeddings']
 
-    # 모델 로드 (transformers + torch)
-    model_path = "./model"
-    tokenizer = AutoTokenizer.from_pretrained(model_path, local_files_only=True)
-    model = AutoModel.from_pretrained(model_path, local_files_only=True)
-    model.eval()
+    # 모델 로드 (transformers + torch, 상주 워커에서는 첫 작업 이후 재사용)
+    tokenizer, model = load_model()
+    import torch
 
     # 임베딩 생성
     embeddings = []
@@ -132,7 +172,17 @@ def solution(
     next_percent = 1
     skipped_count = 0
 
-    for idx, (text, idx_val) in enumerate(zip(texts, idxs), 1):
+    # 이전 실행의 체크포인트가 있으면 저장된 임베딩을 복원하고 다음 행부터 처리
+    start_row = 0
+    if checkpoint is not None:
+        for segment in checkpoint.load():
+            embeddings.extend(segment['embeddings'])
+            new_idxs.extend(segment['idxs'].tolist())
+        start_row = checkpoint.position
+        skipped_count = checkpoint.state.get('skipped_count', 0)
+    saved = len(new_idxs)
+
+    for idx, (text, idx_val) in enumerate(islice(zip(texts, idxs), start_row, None), start_row + 1):
         # 기존 임베딩이 있는 경우 스킵
         if idx_val in existing_idxs:
             skipped_count += 1
@@ -152,6 +202,15 @@ def solution(
             print(f"Progress: {percent_complete}% (Skipped: {skipped_count})")
             next_percent = percent_complete + 1
 
+        if checkpoint is not None and checkpoint.due():
+            checkpoint.save(
+                idx,
+                {'skipped_count': skipped_count},
+                idxs=np.array(new_idxs[saved:], dtype=str),
+                embeddings=np.vstack(embeddings[saved:]) if len(embeddings) > saved else np.empty((0,))
+            )
+            saved = len(new_idxs)
+
     # 새로운 임베딩과 기존 임베딩 병합
     if embeddings:
         new_embeddings = np.vstack(embeddings)
@@ -187,4 +246,6 @@ def solution(
         skipped_count=skipped_count
     )
     
+    report += projection_report_section(df)
+
     return output_filename, report
\ No newline at end of file
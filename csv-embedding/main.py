@@ -1,80 +1,37 @@
 import os
-import boto3
+from functools import partial
 import numpy as np
-from io import StringIO
 from config.config import args
+from common.storage import create_s3_client, download_file, get_object, put_object, save_report, storage_report_section
+from common.resources import resource_report_section
+from common.startup import startup_report_section
+from common.metrics import metrics_report_section, span
+from common.memo import run_memoized
+from common.shard import run_sharded, shard_report_section, shard_row_offset
+from common.incremental import get_object_incremental, incremental_report_section, incremental_row_offset, run_incremental
+from common.checkpoint import open_checkpoint, checkpoint_report_section
+from common.worker import run_or_serve, worker_report_section
 import algorithm
 
 env = 'development' if not 'APP_ENV' in os.environ else os.environ['APP_ENV']
 args = args[env]
     
 
-def create_s3_client(rook_ceph_base_url, access_key, secret_key):
-    return boto3.resource(
-        's3',
-        endpoint_url=rook_ceph_base_url,
-        aws_access_key_id=access_key,
-        aws_secret_access_key=secret_key,
-        use_ssl=False,
-        verify=False
-    )
-
-def get_object(
-        s3_resource,
-        bucket_name: str,
-        object_path: str,
-        is_npz: bool = False
-    ):
+def get_embeddings(s3_resource, bucket_name: str, object_path: str, local_file_path: str = './tmp/existing_embeddings.npz') -> dict:
     try:
-        obj = s3_resource.Object(bucket_name, object_path)
-        data = obj.get()
-        content = data['Body'].read()
-        
-        if is_npz:
-            # npz 파일을 메모리에서 직접 로드
-            import io
-            npz_data = np.load(io.BytesIO(content), allow_pickle=True)
-            return {'idxs': npz_data['idxs'], 'embeddings': npz_data['embeddings']}
-        else:
-            return StringIO(content.decode('utf-8'))
-            
+        # npz(zip)는 임의 접근이 필요하므로 로컬 파일로 받은 뒤 로드 (큰 객체는 ranged GET으로 병렬 다운로드)
+        os.makedirs(os.path.dirname(local_file_path), exist_ok=True)
+        download_file(s3_resource, bucket_name, object_path, local_file_path, decompress=True)
+        with np.load(local_file_path, allow_pickle=True) as npz_data:
+            embeddings = {'idxs': npz_data['idxs'], 'embeddings': npz_data['embeddings']}
         print(f"Successfully retrieved object: {object_path}")
+        return embeddings
     except Exception as e:
         print(f'Failed to download from {bucket_name}/{object_path}: {e}')
         raise
 
-def put_object(
-        s3_resource,
-        local_file_path: str,
-        bucket_name: str,
-        object_path: str
-    ):
-    try:
-        obj = s3_resource.Object(bucket_name, object_path)
-        obj.upload_file(local_file_path)
-        
-        print(f'Successfully uploaded {local_file_path} to {bucket_name}/{object_path}')
-    except Exception as e:
-        print(f'Failed to upload {local_file_path} to {bucket_name}/{object_path}: {e}')
-        raise
-
-def save_report(
-        s3_resource,
-        report_content: str,
-        bucket_name: str,
-        object_path: str
-    ):
-    try:
-        obj = s3_resource.Object(bucket_name, object_path)
-        obj.put(Body=report_content.encode('utf-8'))
-        
-        print(f'Successfully uploaded report to {bucket_name}/{object_path}')
-    except Exception as e:
-        print(f'Failed to upload report to {bucket_name}/{object_path}: {e}')
-        raise
 
-if __name__ == '__main__' :
-    print('CSV Embedding Generator')
+def run(args: dict):
     print('args:', args)
     local_file_path = './tmp/embeddings.npz'
 
@@ -83,11 +40,10 @@ if __name__ == '__main__' :
     try:
         output1 = args['output1']
         s3_client_output1 = create_s3_client(output1['end_point'], output1['access_key'], output1['secret_key'])
-        existing_embeddings = get_object(
+        existing_embeddings = get_embeddings(
             s3_resource=s3_client_output1,
             bucket_name=output1['bucket_name'],
-            object_path=output1['object_path'],
-            is_npz=True
+            object_path=output1['object_path']
         )
         print("기존 임베딩 결과를 찾았습니다.")
     except Exception as e:
@@ -96,21 +52,33 @@ if __name__ == '__main__' :
     # 입력 데이터 처리
     input1 = args['input1']
     s3_client_input1 = create_s3_client(input1['end_point'], input1['access_key'], input1['secret_key'])
-    input1_obj = get_object(
+    input1_obj = get_object_incremental(
         s3_resource=s3_client_input1,
         bucket_name=input1['bucket_name'],
-        object_path=input1['object_path']
+        object_path=input1['object_path'],
+        mode='rb'
     )
     
+    # CHECKPOINT=true이면 주기적으로 진행 상황을 저장하고, 이전 실행이 중단된 위치부터 이어서 처리
+    checkpoint = open_checkpoint(args, 'csv-embedding', inputs=['input1', 'output1'], version_paths=['./model'])
+
+    # 인덱스 컬럼이 없을 때 전체 실행과 같은 번호를 매기도록 이 입력 구간 앞의 행 수를 시작 번호로 사용
+    # (샤드 구간 앞 행 수를 알 수 없으면 None)
+    shard_offset = shard_row_offset()
+    idx_offset = None if shard_offset is None else incremental_row_offset() + shard_offset
+
     # 임베딩 실행
-    output_filename, report = algorithm.solution(
-        input1_obj, 
-        local_file_path, 
-        args['settings']['target_column'],
-        args['settings']['idx_column'],
-        args['settings']['model_name'],
-        existing_embeddings
-    )
+    with span('compute'):
+        output_filename, report = algorithm.solution(
+            input1_obj, 
+            local_file_path, 
+            args['settings']['target_column'],
+            args['settings']['idx_column'],
+            args['settings']['model_name'],
+            existing_embeddings,
+            idx_offset=idx_offset,
+            checkpoint=checkpoint
+        )
 
     # 결과 저장
     output1 = args['output1']
@@ -123,11 +91,34 @@ if __name__ == '__main__' :
     )
 
     # 보고서 저장
+    report += shard_report_section() + incremental_report_section() + checkpoint_report_section() + startup_report_section() + metrics_report_section() + resource_report_section() + storage_report_section() + worker_report_section()
     task_report = args['task_report']
     s3_client_task_report = create_s3_client(task_report['end_point'], task_report['access_key'], task_report['secret_key'])
     save_report(
         s3_resource=s3_client_task_report,
         report_content=report,
         bucket_name=task_report['bucket_name'],
-        object_path=task_report['object_path']
-    )
\ No newline at end of file
+        object_path=task_report['object_path'],
+        metrics=True
+    )
+
+    # 결과와 보고서를 저장했으므로 체크포인트 삭제
+    if checkpoint is not None:
+        checkpoint.clear()
+
+
+def run_cached(args: dict):
+    # MEMO_CACHE가 지정되어 있으면 입력과 설정이 같은 이전 결과를 재사용
+    # (기존 임베딩을 이어서 만들므로 output1의 현재 객체도 입력으로 취급)
+    # INCREMENTAL=true이면 워터마크 이후에 추가된 행만 임베딩하여 기존 결과에 병합
+    run_memoized(partial(run_incremental, run, version_paths=['./model']), args, 'csv-embedding', inputs=['input1', 'output1'], outputs=['output1', 'task_report'], version_paths=['./model'])
+
+
+def run_job(args: dict):
+    # SHARD_COUNT가 지정되어 있으면 입력의 SHARD_INDEX번째 구간만 처리하여 part 객체로 저장 (SHARD_FINALIZE=true이면 병합)
+    run_sharded(run_cached, args)
+
+
+if __name__ == '__main__':
+    print('CSV Embedding Generator')
+    run_or_serve(run_job, args, warmup=algorithm.load_model)
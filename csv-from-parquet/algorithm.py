@@ -1,5 +1,6 @@
 from io import BytesIO
 import pandas as pd
+from common.tabular import write_table
 import time
 from datetime import datetime
 
@@ -48,12 +49,12 @@ def generate_report(
 """
     return report
 
-def solution(input_data: BytesIO, output_csv_path: str) -> tuple:
+def solution(input_data: object, output_csv_path: str) -> tuple:
     """
     Parquet 데이터를 CSV로 변환하는 함수.
 
     Parameters:
-    - input_data: BytesIO 객체로, Parquet 데이터.
+    - input_data: Parquet 파일 경로 또는 BytesIO 객체.
     - output_csv_path: 변환된 CSV 파일의 저장 경로.
     
     Returns:
@@ -66,7 +67,7 @@ def solution(input_data: BytesIO, output_csv_path: str) -> tuple:
         parquet_df = pd.read_parquet(input_data)
 
         # CSV 파일로 저장
-        parquet_df.to_csv(output_csv_path, index=False)
+        write_table(parquet_df, output_csv_path, index=False)
         print(f"Parquet data successfully converted to CSV and saved to {output_csv_path}")
         
         end_time = time.time()
@@ -1,4 +1,6 @@
 import pandas as pd
+import numpy as np
+from common.tabular import read_table, write_table
 import requests
 import urllib3
 import random
@@ -144,7 +146,7 @@ def get_coordinates_vworld(address):
     print(f"[{address}] 사용 가능한 모든 API 키 실패")
     return None, None
 
-def solution(data: object, address_column: str, latitude_column_name: str = 'latitude', longitude_column_name: str = 'longitude', output_file: str = 'output_with_coordinates.csv') -> tuple:
+def solution(data: object, address_column: str, latitude_column_name: str = 'latitude', longitude_column_name: str = 'longitude', output_file: str = 'output_with_coordinates.csv', checkpoint=None) -> tuple:
     """
     CSV 파일에서 한국 도로명 주소로부터 위도와 경도를 추출하여 새로운 컬럼에 저장하는 함수.
 
@@ -154,6 +156,7 @@ def solution(data: object, address_column: str, latitude_column_name: str = 'lat
     - latitude_column_name: 위도를 저장하는 컬럼명 (기본값 'latitude')
     - longitude_column_name: 경도를 저장하는 컬럼명 (기본값 'longitude')
     - output_file: 위도와 경도 정보를 포함한 CSV 파일의 저장 경로 (기본값 'output_with_coordinates.csv')
+    - checkpoint: 지정하면 주기적으로 변환한 좌표를 저장하고, 저장된 위치부터 이어서 처리 (Checkpoint 객체)
     
     Returns:
     - tuple: (저장된 파일 경로, 보고서 내용)
@@ -161,7 +164,7 @@ def solution(data: object, address_column: str, latitude_column_name: str = 'lat
     start_time = time.time()
     
     # CSV 데이터 로드
-    dataFile = pd.read_csv(data)
+    dataFile = read_table(data)
 
     # 위도와 경도 컬럼 추가
     dataFile[latitude_column_name] = None
@@ -175,14 +178,55 @@ def solution(data: object, address_column: str, latitude_column_name: str = 'lat
         for _, row in cache_df.iterrows():
             address_cache[row['work_location']] = (row['latitude'], row['longitude'])
 
+    # 변환에 실패한 주소. 같은 주소가 다시 나오면 API를 다시 호출하지 않고 실패로 처리
+    failed_addresses = set()
+
     # 통계 변수 초기화
     total_addresses = 0
     successful_conversions = 0
     failed_conversions = 0
     cache_hits = 0
 
+    # 이전 실행의 체크포인트가 있으면 변환한 좌표와 통계를 복원하고, 변환한 주소는 성공/실패 캐시에 다시 넣음
+    # (좌표가 NaN인 행은 주소가 비어 있으면 건너뛴 행, 아니면 변환에 실패한 행)
+    start_row = 0
+    if checkpoint is not None:
+        latitudes, longitudes = [], []
+        for segment in checkpoint.load():
+            latitudes.extend(segment['latitude'].tolist())
+            longitudes.extend(segment['longitude'].tolist())
+        start_row = checkpoint.position
+        lat_index, lon_index = dataFile.columns.get_loc(latitude_column_name), dataFile.columns.get_loc(longitude_column_name)
+        for position, (address, lat, lon) in enumerate(zip(dataFile[address_column].iloc[:start_row], latitudes, longitudes)):
+            if np.isnan(lat) or np.isnan(lon):
+                if address and not pd.isna(address):
+                    failed_addresses.add(address)
+                continue
+            dataFile.iat[position, lat_index] = lat
+            dataFile.iat[position, lon_index] = lon
+            address_cache[address] = (lat, lon)
+        total_addresses = checkpoint.state.get('total_addresses', 0)
+        successful_conversions = checkpoint.state.get('successful_conversions', 0)
+        failed_conversions = checkpoint.state.get('failed_conversions', 0)
+        cache_hits = checkpoint.state.get('cache_hits', 0)
+    saved = start_row
+
     # 각 주소에 대해 위도와 경도 추출
-    for idx, row in dataFile.iterrows():
+    for position, (idx, row) in enumerate(dataFile.iterrows()):
+        if position < start_row:
+            continue
+
+        if checkpoint is not None and checkpoint.due():
+            # 이 행 앞까지 처리한 좌표를 저장 (변환하지 않은 행은 NaN)
+            checkpoint.save(
+                position,
+                {'total_addresses': total_addresses, 'successful_conversions': successful_conversions,
+                 'failed_conversions': failed_conversions, 'cache_hits': cache_hits},
+                latitude=pd.to_numeric(dataFile[latitude_column_name].iloc[saved:position]).to_numpy(dtype=float),
+                longitude=pd.to_numeric(dataFile[longitude_column_name].iloc[saved:position]).to_numpy(dtype=float)
+            )
+            saved = position
+
         address = row[address_column]
         if not address or pd.isna(address):
             continue
@@ -193,6 +237,9 @@ def solution(data: object, address_column: str, latitude_column_name: str = 'lat
             lat, lon = address_cache[address]
             cache_hits += 1
             successful_conversions += 1
+        elif address in failed_addresses:
+            lat, lon = None, None
+            failed_conversions += 1
         else:
             lat, lon = get_coordinates_vworld(address)
             if lat is not None and lon is not None:
@@ -200,6 +247,7 @@ def solution(data: object, address_column: str, latitude_column_name: str = 'lat
                 successful_conversions += 1
                 print(f"[API] {address} -> ({lat}, {lon})")
             else:
+                failed_addresses.add(address)
                 failed_conversions += 1
                 print(f"[FAIL] {address} -> None")
 
@@ -207,7 +255,7 @@ def solution(data: object, address_column: str, latitude_column_name: str = 'lat
         dataFile.at[idx, longitude_column_name] = lon
 
     # 결과를 CSV 파일로 저장
-    dataFile.to_csv(output_file, index=False)
+    write_table(dataFile, output_file, index=False)
     
     end_time = time.time()
     elapsed_time = end_time - start_time
@@ -6,6 +6,8 @@ from datetime import datetime
 import library which you need
 '''
 import pandas as pd
+from common.tabular import read_tables, write_table
+from common.report import estimate_memory
 
 env = 'development' if not 'APP_ENV' in os.environ else os.environ['APP_ENV']
 args = args[env]
@@ -81,7 +83,7 @@ def generate_report(
 
 ## 5. 성능 지표
 - **처리 속도**: {len(result_df) / elapsed_time:.2f} 행/초
-- **메모리 사용량**: {result_df.memory_usage(deep=True).sum() / 1024 / 1024:.2f} MB
+- **메모리 사용량**: {estimate_memory(result_df) / 1024 / 1024:.2f} MB
 
 ## 6. 작업 상태
 - **상태**: 성공
@@ -119,13 +121,13 @@ def solution(left_table: object, right_table: object, output_filename: str, left
     
     # 테이블 로드
     print("\n[1/4] 테이블을 로드합니다...")
-    print("- 왼쪽 테이블을 로드합니다...")
-    left_df = pd.read_csv(left_table)
+    print("- 왼쪽/오른쪽 테이블을 동시에 로드합니다...")
+    left_df, right_df = read_tables([left_table, right_table])
+    print("- 왼쪽 테이블")
     print(f"  - 행 수: {len(left_df)}")
     print(f"  - 컬럼: {', '.join(left_df.columns)}")
     
-    print("- 오른쪽 테이블을 로드합니다...")
-    right_df = pd.read_csv(right_table)
+    print("- 오른쪽 테이블")
     print(f"  - 행 수: {len(right_df)}")
     print(f"  - 컬럼: {', '.join(right_df.columns)}")
 
@@ -156,7 +158,7 @@ def solution(left_table: object, right_table: object, output_filename: str, left
     
     # 결과 저장
     print(f"\n[4/4] 결과를 저장합니다...")
-    result_table.to_csv(output_filename, index=False, mode='w')
+    write_table(result_table, output_filename, index=False, mode='w')
     
     end_time = time.time()
     elapsed_time = end_time - start_time
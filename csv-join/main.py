@@ -1,117 +1,51 @@
 import os
-import boto3
-from io import StringIO
 from config.config import args
+from common.storage import create_s3_client, ObjectSource, save_report, storage_report_section, open_object
+from common.resources import resource_report_section
+from common.startup import startup_report_section
+from common.metrics import metrics_report_section, span
 import algorithm
 
 env = 'development' if not 'APP_ENV' in os.environ else os.environ['APP_ENV']
 args = args[env]
     
 
-def create_s3_client(rook_ceph_base_url, access_key, secret_key):
-    return boto3.resource(
-        's3',
-        endpoint_url=rook_ceph_base_url,
-        aws_access_key_id=access_key,
-        aws_secret_access_key=secret_key,
-        use_ssl=False,
-        verify=False
-    )
-
-def get_object(
-        s3_resource,
-        bucket_name: str,
-        object_path: str
-    ) -> bytes:
-    try:
-        obj = s3_resource.Object(bucket_name, object_path)
-        data = obj.get()
-        content = data['Body'].read().decode('utf-8')
-
-        print(f"Successfully retrieved object: {object_path}")
-        return StringIO(content)
-    except Exception as e:
-        print(f'Failed to download from {bucket_name}/{object_path}: {e}')
-        raise
-
-def put_object(
-        s3_resource,
-        local_file_path: str,
-        bucket_name: str,
-        object_path: str
-    ):
-    try:
-        obj = s3_resource.Object(bucket_name, object_path)
-        obj.upload_file(local_file_path)
-        
-        print(f'Successfully uploaded {local_file_path} to {bucket_name}/{object_path}')
-    except Exception as e:
-        print(f'Failed to upload {local_file_path} to {bucket_name}/{object_path}: {e}')
-        raise
-
-def save_report(
-        s3_resource,
-        report_content: str,
-        bucket_name: str,
-        object_path: str
-    ):
-    try:
-        obj = s3_resource.Object(bucket_name, object_path)
-        obj.put(Body=report_content.encode('utf-8'))
-        
-        print(f'Successfully uploaded report to {bucket_name}/{object_path}')
-    except Exception as e:
-        print(f'Failed to upload report to {bucket_name}/{object_path}: {e}')
-        raise
-
 if __name__ == '__main__' :
     print('CSV Join')
     print('args:', args)
-    local_file_path = './tmp/result.csv'
 
     input_left_table = args['left_table']
     s3_client_input_left_table = create_s3_client(input_left_table['end_point'], input_left_table['access_key'], input_left_table['secret_key'])
-    left_table = get_object(
-        s3_resource=s3_client_input_left_table,
-        bucket_name=input_left_table['bucket_name'],
-        object_path=input_left_table['object_path']
-    ) # data read
-
     input_right_table = args['right_table']
     s3_client_input_right_table = create_s3_client(input_right_table['end_point'], input_right_table['access_key'], input_right_table['secret_key'])
-    right_table = get_object(
-        s3_resource=s3_client_input_right_table,
-        bucket_name=input_right_table['bucket_name'],
-        object_path=input_right_table['object_path']
-    ) # data read
-    
-    output_filename, report = algorithm.solution(
-        left_table, 
-        right_table, 
-        local_file_path,
-        args['left_on'], 
-        args['right_on'], 
-        args['how'], 
-        args['lsuffix'], 
-        args['rsuffix'], 
-        args['sort']
-    )
-    
+    # 두 테이블은 solution에서 동시에 열고 파싱 (read_tables)
+    left_table = ObjectSource(s3_client_input_left_table, input_left_table['bucket_name'], input_left_table['object_path'], mode='rb')
+    right_table = ObjectSource(s3_client_input_right_table, input_right_table['bucket_name'], input_right_table['object_path'], mode='rb') # data read
+
     output_result_table = args['result_table']
     s3_client_result_table = create_s3_client(output_result_table['end_point'], output_result_table['access_key'], output_result_table['secret_key'])
-    put_object(
-        s3_resource=s3_client_result_table,
-        local_file_path=local_file_path,
-        bucket_name=output_result_table['bucket_name'], 
-        object_path=output_result_table['object_path']
-    ) # data write
-
+    with open_object(s3_client_result_table, output_result_table['bucket_name'], output_result_table['object_path'], mode='wb') as result_table_stream:
+        with span('compute'):
+            output_filename, report = algorithm.solution(
+                left_table, 
+                right_table, 
+                result_table_stream,
+                args['left_on'], 
+                args['right_on'], 
+                args['how'], 
+                args['lsuffix'], 
+                args['rsuffix'], 
+                args['sort']
+            ) # data write
+    
     # 보고서 저장
+    report += startup_report_section() + metrics_report_section() + resource_report_section() + storage_report_section()
     task_report = args['task_report']
     s3_client_task_report = create_s3_client(task_report['end_point'], task_report['access_key'], task_report['secret_key'])
     save_report(
         s3_resource=s3_client_task_report,
         report_content=report,
         bucket_name=task_report['bucket_name'],
-        object_path=task_report['object_path']
-    )
\ No newline at end of file
+        object_path=task_report['object_path'],
+        metrics=True
+    )
@@ -1,5 +1,7 @@
 from io import StringIO
 import pandas as pd
+from common.tabular import read_tables, write_table
+from common.report import estimate_memory
 import time
 from datetime import datetime
 
@@ -63,7 +65,7 @@ def generate_report(
 
 ## 4. 성능 지표
 - **처리 속도**: {total_input_rows / elapsed_time:.2f} 행/초
-- **메모리 사용량**: {result_df.memory_usage(deep=True).sum() / 1024 / 1024:.2f} MB
+- **메모리 사용량**: {estimate_memory(result_df) / 1024 / 1024:.2f} MB
 
 ## 5. 작업 상태
 - **상태**: 성공
@@ -85,17 +87,15 @@ def solution(input_data: list, output_csv_path: str) -> tuple:
     """
     start_time = time.time()
     
-    # CSV 데이터 로드
-    data_frames = []
-    for data in input_data:
-        data_frames.append(pd.read_csv(data))
+    # CSV 데이터 로드 (입력별 다운로드와 파싱을 동시에 진행)
+    data_frames = read_tables(input_data)
     if not data_frames:
         raise ValueError("No data frames provided for merging.")
 
     df = pd.concat(data_frames, ignore_index=True, sort=False)
 
     # 결과 저장
-    df.to_csv(output_csv_path, index=False)
+    write_table(df, output_csv_path, index=False)
     print(f"Data saved to {output_csv_path}")
     
     end_time = time.time()
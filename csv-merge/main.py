@@ -1,111 +1,49 @@
 import os
-import boto3
-from io import StringIO
 from config.config import args
+from common.storage import create_s3_client, ObjectSource, save_report, delete_object, storage_report_section, open_object
+from common.resources import resource_report_section
+from common.startup import startup_report_section
+from common.metrics import metrics_report_section, span
 import algorithm
 
 env = 'development' if not 'APP_ENV' in os.environ else os.environ['APP_ENV']
 args = args[env]
 
-def create_s3_client(rook_ceph_base_url, access_key, secret_key):
-    return boto3.resource(
-        's3',
-        endpoint_url=rook_ceph_base_url,
-        aws_access_key_id=access_key,
-        aws_secret_access_key=secret_key,
-        use_ssl=False,
-        verify=False
-    )
-
-def get_object(s3_resource, bucket_name: str, object_path: str) -> StringIO:
-    try:
-        obj = s3_resource.Object(bucket_name, object_path)
-        data = obj.get()
-        content = data['Body'].read().decode('utf-8')
-        print(f"Successfully retrieved object: {object_path}")
-        return StringIO(content)
-    except Exception as e:
-        print(f'Failed to download from {bucket_name}/{object_path}: {e}')
-        raise
-
-def put_object(s3_resource, local_file_path: str, bucket_name: str, object_path: str):
-    try:
-        obj = s3_resource.Object(bucket_name, object_path)
-        obj.upload_file(local_file_path)
-        print(f'Successfully uploaded {local_file_path} to {bucket_name}/{object_path}')
-    except Exception as e:
-        print(f'Failed to upload {local_file_path} to {bucket_name}/{object_path}: {e}')
-        raise
-
-def save_report(
-        s3_resource,
-        report_content: str,
-        bucket_name: str,
-        object_path: str
-    ):
-    try:
-        obj = s3_resource.Object(bucket_name, object_path)
-        obj.put(Body=report_content.encode('utf-8'))
-        
-        print(f'Successfully uploaded report to {bucket_name}/{object_path}')
-    except Exception as e:
-        print(f'Failed to upload report to {bucket_name}/{object_path}: {e}')
-        raise
-
-def delete_object(s3_resource, bucket_name: str, object_path: str):
-    try:
-        obj = s3_resource.Object(bucket_name, object_path)
-        obj.delete()
-        print(f"Successfully deleted object: {bucket_name}/{object_path}")
-    except Exception as e:
-        print(f'Failed to delete {bucket_name}/{object_path}: {e}')
-        raise
-
 if __name__ == '__main__':
     print('CSV Merge')
     print('args:', args)
-    local_file_path = './tmp/output.csv'
 
-    # Step 1: Read input CSV
+    # Step 1: Read input CSV (solution에서 입력을 동시에 열고 파싱)
     input_data_frames = []
     number_of_input = args['number_of_input']
     for i in range(number_of_input):
         input = args['input{}'.format(i+1)]
         s3_client_input = create_s3_client(input['end_point'], input['access_key'], input['secret_key'])
-        input_data = get_object(
-            s3_resource=s3_client_input,
-            bucket_name=input['bucket_name'],
-            object_path=input['object_path']
-        )  # data read
-        input_data_frames.append(input_data)
+        input_data_frames.append(ObjectSource(s3_client_input, input['bucket_name'], input['object_path'], mode='rb'))  # data read
     
     # Step 2: Apply regex transformation
-    output_filename, report = algorithm.solution(
-        input_data_frames,
-        local_file_path
-    )
-
-    # Step 3: Save output CSV
     output1 = args['output1']
     s3_client_output1 = create_s3_client(output1['end_point'], output1['access_key'], output1['secret_key'])
-    put_object(
-        s3_resource=s3_client_output1,
-        local_file_path=local_file_path,
-        bucket_name=output1['bucket_name'],
-        object_path=output1['object_path']
-    )  # data write
-
-    # Step 4: Save report
+    with open_object(s3_client_output1, output1['bucket_name'], output1['object_path'], mode='wb') as output1_stream:
+        with span('compute'):
+            output_filename, report = algorithm.solution(
+                input_data_frames,
+                output1_stream
+            ) # data write
+
+    # Step 3: Save report
+    report += startup_report_section() + metrics_report_section() + resource_report_section() + storage_report_section()
     task_report = args['task_report']
     s3_client_task_report = create_s3_client(task_report['end_point'], task_report['access_key'], task_report['secret_key'])
     save_report(
         s3_resource=s3_client_task_report,
         report_content=report,
         bucket_name=task_report['bucket_name'],
-        object_path=task_report['object_path']
+        object_path=task_report['object_path'],
+        metrics=True
     )
 
-    # Step 5: Optionally delete input file
+    # Step 4: Optionally delete input file
     if args['delete_input']:
         for i in range(number_of_input):
             input = args['input{}'.format(i)]
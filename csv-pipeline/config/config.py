@@ -0,0 +1,57 @@
+import os
+import json
+
+args =\
+    {
+        'development': {
+            'input1': {
+                'type': 'ceph',
+                'end_point': 'http://object-storage.rook.xxx.xxx.xxx.xxx.traefik.me:xxxxx',
+                'access_key': '',
+                'secret_key': '',
+                'bucket_name': 'bucket01',
+                'object_path': 'dir01/job_postings.parquet',
+            },
+            # 각 단계의 args는 해당 컴포넌트 config.py의 production args에서 input1/output1/task_report를 뺀 것과 같음
+            'steps': [
+                {'component': 'csv-from-parquet', 'args': {}},
+                {'component': 'csv-delete-missing-value', 'args': {'subset': ['상세내용']}},
+                {'component': 'csv-regex', 'args': {'settings': {'target_column': '상세내용', 'regex_pattern': '[가-힣]+', 'output_column': '키워드'}}, 'checkpoint': True},
+                {'component': 'csv-tokenize', 'args': {'settings': {'text_column': '키워드', 'new_column': 'tokens', 'ignore_words': [], 'remove_stopwords': True, 'keep_tokenized_column_only': True}}},
+                {'component': 'csv-wordcount', 'args': {'settings': {'columns': ['tokens'], 'separator': ' '}}},
+                {'component': 'csv-visualization-wordcloud', 'args': {'settings': {'word_column': 'word', 'count_column': 'count', 'max_words': 200}}},
+            ],
+            'output1': {
+                'type': 'ceph',
+                'end_point': 'http://object-storage.rook.xxx.xxx.xxx.xxx.traefik.me:xxxxx',
+                'access_key': '',
+                'secret_key': '',
+                'bucket_name': 'bucket01',
+                'object_path': 'dir01/job_postings_wordcloud.png',
+            },
+            'checkpoint': {
+                'type': 'ceph',
+                'end_point': 'http://object-storage.rook.xxx.xxx.xxx.xxx.traefik.me:xxxxx',
+                'access_key': '',
+                'secret_key': '',
+                'bucket_name': 'bucket01',
+                'object_path': 'dir01/checkpoints',
+                'format': 'csv',
+            },
+            'task_report': {
+                'type': 'ceph',
+                'end_point': 'http://object-storage.rook.xxx.xxx.xxx.xxx.traefik.me:xxxxx',
+                'access_key': '',
+                'secret_key': '',
+                'bucket_name': 'bucket01',
+                'object_path': 'dir01/pipeline_report.md',
+            },
+        },
+        'production': {
+            'input1': json.loads(os.environ['INPUT1']) if 'INPUT1' in os.environ else {},
+            'steps': json.loads(os.environ['STEPS']) if 'STEPS' in os.environ else [],
+            'output1': json.loads(os.environ['OUTPUT1']) if 'OUTPUT1' in os.environ else {},
+            'checkpoint': json.loads(os.environ['CHECKPOINT']) if 'CHECKPOINT' in os.environ else {},
+            'task_report': json.loads(os.environ['TASK_REPORT']) if 'TASK_REPORT' in os.environ else {},
+        }
+    }
@@ -0,0 +1,67 @@
+import contextlib
+import os
+import time
+from config.config import args
+from common.storage import create_s3_client, save_report, storage_report_section, open_object
+from common.resources import resource_report_section
+from common.startup import startup_report_section
+from common.metrics import metrics_report_section, span
+from common.worker import run_or_serve, worker_report_section
+import pipeline
+
+env = 'development' if not 'APP_ENV' in os.environ else os.environ['APP_ENV']
+args = args[env]
+
+
+def run(args: dict):
+    print('args:', args)
+    start_time = time.time()
+    workdir = os.path.abspath('./tmp')
+    os.makedirs(workdir, exist_ok=True)
+
+    steps = args['steps']
+    pipeline.validate_steps(steps)
+
+    # Step 1: 첫 단계 입력 열기
+    input1 = args['input1']
+    s3_client_input1 = create_s3_client(input1['end_point'], input1['access_key'], input1['secret_key'])
+    input1_data = pipeline.open_input(steps[0], s3_client_input1, input1, workdir) # data read
+
+    # Step 2: 단계 실행 (마지막 단계 결과만 output1에 저장)
+    output1 = args['output1']
+    task_report = args['task_report']
+    checkpoint = args['checkpoint'] or {}
+    s3_clients = {
+        'output1': create_s3_client(output1['end_point'], output1['access_key'], output1['secret_key']),
+        'task_report': create_s3_client(task_report['end_point'], task_report['access_key'], task_report['secret_key']),
+    }
+    if any(step.get('checkpoint') for step in steps):
+        if not checkpoint:
+            raise ValueError("checkpoint 단계가 있으면 CHECKPOINT 저장 위치를 지정해야 합니다.")
+        s3_clients['checkpoint'] = create_s3_client(checkpoint['end_point'], checkpoint['access_key'], checkpoint['secret_key'])
+    locations = {'output1': output1, 'task_report': task_report, 'checkpoint': checkpoint}
+
+    if 'output' in pipeline.STEPS[steps[-1]['component']]:
+        # 마지막 단계가 이미지/HTML 등 파일을 출력하면 run_pipeline이 결과 파일을 업로드
+        output1_stream = contextlib.nullcontext()
+    else:
+        output1_stream = open_object(s3_clients['output1'], output1['bucket_name'], output1['object_path'], mode='wb')
+    with output1_stream as output1_stream:
+        with span('compute'):
+            results, _ = pipeline.run_pipeline(steps, input1_data, output1_stream, s3_clients, locations, workdir) # data write
+
+    # Step 3: 파이프라인 보고서 저장
+    report = pipeline.generate_report(results, input1, output1, time.time() - start_time)
+    report += startup_report_section() + metrics_report_section() + resource_report_section() + storage_report_section() + worker_report_section()
+    save_report(
+        s3_resource=s3_clients['task_report'],
+        report_content=report,
+        bucket_name=task_report['bucket_name'],
+        object_path=task_report['object_path'],
+        metrics=True
+    )
+
+
+if __name__ == '__main__':
+    print('CSV Pipeline Runner')
+    run_or_serve(run, args, warmup=lambda: pipeline.preload_solutions(args['steps']))
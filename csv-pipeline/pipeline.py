@@ -0,0 +1,377 @@
+"""
+여러 컴포넌트의 algorithm.solution을 한 프로세스에서 이어 실행하는 파이프라인 실행기.
+
+단계 사이의 중간 결과는 TableBuffer로 DataFrame을 그대로 넘기므로 Object Storage
+업로드/다운로드와 CSV 직렬화/파싱을 반복하지 않습니다. 마지막 단계의 결과와
+체크포인트로 지정한 단계의 결과만 Object Storage에 저장합니다.
+"""
+import contextlib
+import importlib.util
+import os
+import sys
+import time
+from datetime import datetime
+from common.storage import get_object, download_file, open_object, put_object, save_report
+from common.tabular import TableBuffer, write_table, get_output_size
+
+# 컴포넌트 디렉터리들이 있는 경로 (저장소에서는 상위 디렉터리, 이미지에서는 ./components)
+COMPONENTS_ROOT = os.getenv('COMPONENTS_ROOT', os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _settings(args: dict) -> dict:
+    return args['settings']
+
+
+# 컴포넌트별 solution 호출 방식. 각 컴포넌트 main.py와 같은 인자 구성을 사용하며,
+# args는 컴포넌트 config.py의 production args에서 input1/output1/task_report를 뺀 것과 같습니다.
+# - input: 첫 단계일 때 입력을 받는 방식 (기본값 'stream', 확장자면 해당 확장자의 로컬 파일로 다운로드)
+# - source: 테이블이 아닌 입력(Parquet 파일, JSON)을 읽으므로 첫 단계에서만 사용 가능
+# - output: None이면 테이블 출력, 확장자면 로컬 파일 출력 (마지막 단계에서만 사용 가능)
+STEPS = {
+    'csv-from-parquet': {
+        'call': lambda solve, data, output, args: solve(data, output),
+        'input': '.parquet',
+        'source': True,
+    },
+    'json-to-csv': {
+        'call': lambda solve, data, output, args: solve(data, output),
+        'input': '.json',
+        'source': True,
+    },
+    'csv-arithmetic-operation': {
+        'call': lambda solve, data, output, args: solve(data, output, args['operands'], args['operators'], args['column_name']),
+    },
+    'csv-change-column-name': {
+        'call': lambda solve, data, output, args: solve(data, _settings(args)['input_cols'], _settings(args)['output_cols'], output),
+    },
+    'csv-column-concat': {
+        'call': lambda solve, data, output, args: solve(
+            data, output,
+            target_cols=_settings(args)['target_cols'],
+            optional_cols=_settings(args).get('optional_cols'),
+            delimiter=_settings(args).get('delimiter', ','),
+            new_col_name=_settings(args).get('new_col_name', 'concatenated')
+        ),
+        'input': '.csv',
+    },
+    'csv-date-time-formatter': {
+        'call': lambda solve, data, output, args: solve(
+            data, output, args['input_cols'], args['display_mode'], args['suffix'], args['in_format'], args['out_format']
+        ),
+    },
+    'csv-delete-missing-value': {
+        'call': lambda solve, data, output, args: solve(data, output, args['subset']),
+    },
+    'csv-get-latlon': {
+        'call': lambda solve, data, output, args: solve(
+            data, _settings(args)['address_column'], _settings(args)['latitude_column'], _settings(args)['longitude_column'], output
+        ),
+    },
+    'csv-regex': {
+        'call': lambda solve, data, output, args: solve(
+            data, _settings(args)['target_column'], _settings(args)['regex_pattern'], _settings(args)['output_column'], output
+        ),
+    },
+    'csv-sort': {
+        'call': lambda solve, data, output, args: solve(data, output, args['input_cols'], args['is_asc']),
+    },
+    'csv-statistic-summary': {
+        'call': lambda solve, data, output, args: solve(
+            data, output, args['input_cols'], args['group_by'], args['statistics'],
+            args['percentile_amounts'], args['trimmed_mean_amounts']
+        ),
+    },
+    'csv-tokenize': {
+        'call': lambda solve, data, output, args: solve(
+            data, _settings(args)['text_column'], output,
+            new_column=_settings(args).get('new_column'),
+            ignore_words=_settings(args)['ignore_words'],
+            remove_stopwords=_settings(args)['remove_stopwords'],
+            keep_tokenized_column_only=_settings(args)['keep_tokenized_column_only']
+        ),
+    },
+    'csv-transform': {
+        'call': lambda solve, data, output, args: solve(
+            data, _settings(args)['target_column'], _settings(args)['lambda_function'], _settings(args)['output_column'], output
+        ),
+    },
+    'csv-wordcount': {
+        'call': lambda solve, data, output, args: solve(data, _settings(args)['columns'], _settings(args)['separator'], output),
+    },
+    'csv-to-json': {
+        'call': lambda solve, data, output, args: solve(data, output),
+        'output': '.json',
+    },
+    'csv-visualization-barchart': {
+        'call': lambda solve, data, output, args: solve(data, _settings(args)['feature_name'], output),
+        'output': '.png',
+    },
+    'csv-visualization-boxplot': {
+        'call': lambda solve, data, output, args: solve(
+            data, _settings(args)['group_by_column'], _settings(args)['value_column'], output,
+            _settings(args)['title'], _settings(args)['ylabel']
+        ),
+        'output': '.png',
+    },
+    'csv-visualization-histogram': {
+        'call': lambda solve, data, output, args: solve(data, _settings(args)['feature_name'], output),
+        'output': '.png',
+    },
+    'csv-visualization-map': {
+        'call': lambda solve, data, output, args: solve(
+            data, _settings(args)['label_column'], _settings(args)['lat_column'], _settings(args)['lon_column'], output
+        ),
+        'output': '.html',
+    },
+    'csv-visualization-piechart': {
+        'call': lambda solve, data, output, args: solve(data, _settings(args)['feature_name'], output, chart_title=_settings(args)['chart_title']),
+        'output': '.png',
+    },
+    'csv-visualization-wordcloud': {
+        'call': lambda solve, data, output, args: solve(
+            data, _settings(args)['word_column'], _settings(args)['count_column'], output, max_words=_settings(args)['max_words']
+        ),
+        'output': '.png',
+    },
+}
+
+
+@contextlib.contextmanager
+def _component_dir(component_dir: str):
+    # 컴포넌트는 불용어 사전, 주소 캐시 등을 작업 디렉터리 기준 상대 경로로 읽으므로 실행 중에만 이동
+    cwd = os.getcwd()
+    os.chdir(component_dir)
+    try:
+        yield
+    finally:
+        os.chdir(cwd)
+
+
+# (컴포넌트 디렉터리 경로) -> solution. 같은 컴포넌트를 여러 단계나 상주 워커의 여러 작업에서 다시 import 하지 않음
+_solutions = {}
+
+
+def load_solution(component: str, root: str = COMPONENTS_ROOT):
+    """
+    컴포넌트 디렉터리의 algorithm.solution을 모듈 이름 충돌 없이 불러옵니다.
+    이미 불러온 컴포넌트는 이 프로세스에서 로드한 solution을 그대로 반환합니다.
+
+    Parameters:
+    - component (str): 컴포넌트 디렉터리 이름 (예: csv-regex)
+    - root (str): 컴포넌트 디렉터리들이 있는 경로
+
+    Returns:
+    - callable: 컴포넌트의 solution 함수
+    """
+    component_dir = os.path.join(root, component)
+    if component_dir in _solutions:
+        return _solutions[component_dir]
+    # 일부 algorithm.py는 컴포넌트의 config 패키지를 import 하므로 해당 디렉터리를 경로에 추가
+    for name in [m for m in sys.modules if m == 'config' or m.startswith('config.')]:
+        del sys.modules[name]
+    sys.path.insert(0, component_dir)
+    try:
+        with _component_dir(component_dir):
+            spec = importlib.util.spec_from_file_location(f'{component.replace("-", "_")}_algorithm', os.path.join(component_dir, 'algorithm.py'))
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(component_dir)
+    _solutions[component_dir] = module.solution
+    return module.solution
+
+
+def preload_solutions(steps: list, root: str = COMPONENTS_ROOT):
+    """
+    상주 워커 시작 시 단계 목록의 컴포넌트를 미리 import 합니다.
+
+    Parameters:
+    - steps (list): [{'component': str, 'args': dict}, ...] 형식의 단계 목록 (비어 있으면 아무것도 하지 않음)
+    - root (str): 컴포넌트 디렉터리들이 있는 경로
+    """
+    for step in steps or []:
+        load_solution(step['component'], root)
+
+
+def validate_steps(steps: list):
+    """
+    단계 목록의 컴포넌트 이름과 출력 형식을 검증합니다.
+    """
+    if not steps:
+        raise ValueError("실행할 단계가 없습니다.")
+    for i, step in enumerate(steps, 1):
+        component = step.get('component')
+        if component not in STEPS:
+            raise ValueError(f"{i}번째 단계: 지원하지 않는 컴포넌트입니다: {component}. 지원 컴포넌트: {', '.join(STEPS)}")
+        if i > 1 and STEPS[component].get('source'):
+            raise ValueError(f"{i}번째 단계: {component}는 첫 번째 단계에서만 사용할 수 있습니다.")
+        if i < len(steps) and 'output' in STEPS[component]:
+            raise ValueError(f"{i}번째 단계: {component}는 파일을 출력하므로 마지막 단계에서만 사용할 수 있습니다.")
+
+
+def step_report_path(report_path: str, index: int, component: str) -> str:
+    """
+    파이프라인 보고서 경로를 기준으로 단계별 보고서 경로를 만듭니다.
+    예: dir01/pipeline_report.md -> dir01/pipeline_report_01_csv-regex.md
+    """
+    root, ext = os.path.splitext(report_path)
+    return f'{root}_{index:02d}_{component}{ext or ".md"}'
+
+
+def checkpoint_path(prefix: str, index: int, component: str, fmt: str = 'csv') -> str:
+    return f'{prefix.rstrip("/")}/{index:02d}_{component}.{fmt}'
+
+
+def open_input(step: dict, s3_client, location: dict, workdir: str):
+    """
+    첫 단계의 입력을 해당 컴포넌트 main.py와 같은 방식으로 엽니다.
+    """
+    suffix = STEPS[step['component']].get('input', 'stream')
+    if suffix == 'stream':
+        return get_object(
+            s3_resource=s3_client,
+            bucket_name=location['bucket_name'],
+            object_path=location['object_path'],
+            mode='rb'
+        )
+    # Parquet/JSON 등 임의 접근이 필요한 입력은 로컬 파일로 스트리밍 다운로드
+    local_input_path = os.path.join(workdir, f'input{suffix}')
+    download_file(
+        s3_resource=s3_client,
+        bucket_name=location['bucket_name'],
+        object_path=location['object_path'],
+        local_file_path=local_input_path,
+        decompress=True
+    )
+    return local_input_path
+
+
+def run_pipeline(steps: list, input_data: object, output_stream: object, s3_clients: dict, locations: dict, workdir: str,
+                 root: str = COMPONENTS_ROOT) -> tuple:
+    """
+    단계 목록을 순서대로 실행하고 단계별 보고서를 저장하는 함수.
+
+    Parameters:
+    - steps (list): {'component', 'args', 'checkpoint'} 형식의 단계 목록
+    - input_data (object): 첫 단계의 입력 (open_input의 반환값)
+    - output_stream (object): 마지막 단계가 테이블을 출력할 때 사용할 open_object(..., mode='wb') 스트림
+    - s3_clients (dict): 'output1', 'task_report', 'checkpoint' 별 S3 클라이언트
+    - locations (dict): 'output1', 'task_report', 'checkpoint' 별 저장 위치 설정
+    - workdir (str): 로컬 파일 출력 경로
+    - root (str): 컴포넌트 디렉터리들이 있는 경로
+
+    Returns:
+    - tuple: (단계별 실행 결과 리스트, 마지막 단계 출력)
+    """
+    validate_steps(steps)
+    results = []
+    current = input_data
+    for i, step in enumerate(steps, 1):
+        component = step['component']
+        spec = STEPS[component]
+        is_last = i == len(steps)
+        print(f"\n[{i}/{len(steps)}] {component}")
+
+        if 'output' in spec:
+            output = os.path.abspath(os.path.join(workdir, f'result{spec["output"]}'))
+        elif is_last:
+            output = output_stream
+        else:
+            output = TableBuffer(f'{component}:{i}')
+
+        load_start = time.time()
+        solve = load_solution(component, root)
+        start_time = time.time()
+        with _component_dir(os.path.join(root, component)):
+            result = spec['call'](solve, current, output, step.get('args', {}))
+        elapsed_time = time.time() - start_time
+        report = result[1] if isinstance(result, tuple) else None
+
+        rows = len(output.df) if isinstance(output, TableBuffer) else None
+        checkpoint = None
+        if step.get('checkpoint') and isinstance(output, TableBuffer):
+            # 디버깅용 중간 결과 저장
+            location = locations['checkpoint']
+            checkpoint = checkpoint_path(location['object_path'], i, component, location.get('format', 'csv'))
+            with open_object(s3_clients['checkpoint'], location['bucket_name'], checkpoint, mode='wb') as checkpoint_stream:
+                write_table(output.df, checkpoint_stream, index=False)
+            checkpoint = f"{location['bucket_name']}/{checkpoint}"
+
+        report_path = None
+        if report:
+            location = locations['task_report']
+            report_path = step_report_path(location['object_path'], i, component)
+            save_report(
+                s3_resource=s3_clients['task_report'],
+                report_content=report,
+                bucket_name=location['bucket_name'],
+                object_path=report_path
+            )
+            report_path = f"{location['bucket_name']}/{report_path}"
+
+        results.append({
+            'index': i,
+            'component': component,
+            'load_time': start_time - load_start,
+            'elapsed_time': elapsed_time,
+            'rows': rows,
+            'output_size': get_output_size(output),
+            'checkpoint': checkpoint,
+            'report': report_path,
+        })
+        current = output
+
+    if isinstance(current, str):
+        # 파일을 출력하는 마지막 단계는 main.py와 같이 결과 파일을 업로드
+        location = locations['output1']
+        put_object(
+            s3_resource=s3_clients['output1'],
+            local_file_path=current,
+            bucket_name=location['bucket_name'],
+            object_path=location['object_path']
+        )
+    return results, current
+
+
+def generate_report(results: list, input_location: dict, output_location: dict, elapsed_time: float) -> str:
+    """
+    파이프라인 실행 보고서를 생성하는 함수.
+
+    Parameters:
+    - results (list): run_pipeline이 반환한 단계별 실행 결과
+    - input_location (dict): 입력 위치 설정
+    - output_location (dict): 출력 위치 설정
+    - elapsed_time (float): 전체 소요 시간 (초)
+
+    Returns:
+    - str: 생성된 보고서 내용 (markdown 형식)
+    """
+    rows = '\n'.join(
+        f"| {r['index']} | {r['component']} | {r['load_time']:.2f} | {r['elapsed_time']:.2f} | "
+        f"{'-' if r['rows'] is None else format(r['rows'], ',')} | {r['output_size'] / 1024 / 1024:.2f} | "
+        f"{r['checkpoint'] or '-'} | {r['report'] or '-'} |"
+        for r in results
+    )
+    report = f"""# CSV 파이프라인 실행 보고서
+
+## 1. 작업 개요
+- **작업 유형**: 컴포넌트 연결 실행 (단일 프로세스)
+- **실행 시간**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+- **소요 시간**: {elapsed_time:.2f}초
+- **단계 수**: {len(results)}개
+
+## 2. 입출력
+- **입력**: {input_location['bucket_name']}/{input_location['object_path']}
+- **출력**: {output_location['bucket_name']}/{output_location['object_path']}
+- **중간 결과**: Object Storage를 거치지 않고 메모리에서 DataFrame으로 전달
+
+## 3. 단계별 실행 결과
+| 단계 | 컴포넌트 | 로드 (초) | 실행 (초) | 출력 행 수 | 출력 크기 (MB) | 체크포인트 | 보고서 |
+|---|---|---|---|---|---|---|---|
+{rows}
+
+## 4. 작업 상태
+- **상태**: 성공
+- **처리 결과**: 모든 단계가 성공적으로 실행됨
+"""
+    return report
@@ -0,0 +1,10 @@
+import pipeline
+from common.tabular import TableBuffer
+
+if __name__ == '__main__' :
+    # Object Storage 없이 로컬 CSV로 두 단계를 이어 실행
+    solve_regex = pipeline.load_solution('csv-regex')
+    solve_wordcount = pipeline.load_solution('csv-wordcount')
+    regex_output = TableBuffer('csv-regex')
+    solve_regex('./tmp/job_postings.csv', '상세내용', '[가-힣]+', '키워드', regex_output)
+    solve_wordcount(regex_output, ['키워드'], ' ', './tmp/wordcount.csv')
@@ -1,11 +1,13 @@
 from io import StringIO
 import pandas as pd
+from common.chunked import read_chunks, ChunkWriter, chunk_report_section
+from common.report import estimate_memory
 import re
 import time
 from datetime import datetime
 
 def generate_report(
-    df: pd.DataFrame,
+    columns: list,
     target_column: str,
     regex_pattern: str,
     output_column: str,
@@ -13,13 +15,14 @@ def generate_report(
     output_filename: str,
     elapsed_time: float,
     total_rows: int,
-    matched_rows: int
+    matched_rows: int,
+    peak_memory: int
 ) -> str:
     """
     정규식 처리 작업 보고서를 생성하는 함수.
     
     Parameters:
-    - df (pd.DataFrame): 처리된 DataFrame
+    - columns (list): 처리된 컬럼 목록
     - target_column (str): 대상 컬럼명
     - regex_pattern (str): 적용된 정규식 패턴
     - output_column (str): 출력 컬럼명
@@ -28,6 +31,7 @@ def generate_report(
     - elapsed_time (float): 소요 시간 (초)
     - total_rows (int): 총 처리된 행 수
     - matched_rows (int): 정규식 매칭된 행 수
+    - peak_memory (int): 청크 하나의 최대 메모리 사용량 (bytes, object 컬럼은 표본으로 추정)
     
     Returns:
     - str: 생성된 보고서 내용 (markdown 형식)
@@ -42,8 +46,8 @@ def generate_report(
 ## 2. 입력 데이터
 - **입력 파일**: {input_filename}
 - **행 수**: {total_rows:,}행
-- **컬럼 수**: {len(df.columns)}개
-- **컬럼 목록**: {', '.join(df.columns)}
+- **컬럼 수**: {len(columns)}개
+- **컬럼 목록**: {', '.join(columns)}
 
 ## 3. 정규식 설정
 - **대상 컬럼**: {target_column}
@@ -58,7 +62,7 @@ def generate_report(
 
 ## 5. 성능 지표
 - **처리 속도**: {total_rows / elapsed_time:.2f} 행/초
-- **메모리 사용량**: {df.memory_usage(deep=True).sum() / 1024 / 1024:.2f} MB
+- **메모리 사용량 (청크 최대)**: {peak_memory / 1024 / 1024:.2f} MB
 
 ## 6. 작업 상태
 - **상태**: 성공
@@ -83,9 +87,6 @@ def solution(input_data: StringIO, target_column: str, regex_pattern: str, outpu
     start_time = time.time()
     
     try:
-        # CSV 데이터 로드
-        df = pd.read_csv(input_data)
-
         # 정규식 적용
         def apply_regex(value):
             if pd.isna(value):
@@ -93,30 +94,39 @@ def solution(input_data: StringIO, target_column: str, regex_pattern: str, outpu
             match = re.search(regex_pattern, str(value))
             return match.group(0) if match else None
 
-        df[output_column] = df[target_column].apply(apply_regex)
+        # CSV 데이터를 청크 단위로 읽어 정규식 적용 후 바로 저장
+        chunks = read_chunks(input_data)
+        matched_rows = 0
+        peak_memory = 0
+        columns = []
+        with ChunkWriter(output_csv_path) as writer:
+            for df in chunks:
+                df[output_column] = df[target_column].apply(apply_regex)
+                writer.write(df)
 
-        # 결과 저장
-        df.to_csv(output_csv_path, index=False)
+                # 매칭된 행 수 계산
+                matched_rows += int(df[output_column].notna().sum())
+                peak_memory = max(peak_memory, estimate_memory(df))
+                columns = list(df.columns)
         print(f"Regex applied and data saved to {output_csv_path}")
         
         end_time = time.time()
         elapsed_time = end_time - start_time
         
-        # 매칭된 행 수 계산
-        matched_rows = df[output_column].notna().sum()
-        
         # 보고서 생성
         report = generate_report(
-            df=df,
+            columns=columns,
             target_column=target_column,
             regex_pattern=regex_pattern,
             output_column=output_column,
             input_filename=input_data.name if hasattr(input_data, 'name') else str(input_data),
             output_filename=output_csv_path,
             elapsed_time=elapsed_time,
-            total_rows=len(df),
-            matched_rows=matched_rows
+            total_rows=chunks.rows,
+            matched_rows=matched_rows,
+            peak_memory=peak_memory
         )
+        report += chunk_report_section(chunks, writer)
         
         return output_csv_path, report
         
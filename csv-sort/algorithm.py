@@ -1,4 +1,6 @@
 import pandas as pd
+from common.tabular import read_table, write_table
+from common.report import estimate_memory
 import time
 from datetime import datetime
 
@@ -48,7 +50,7 @@ def generate_report(
 
 ## 5. 성능 지표
 - **처리 속도**: {len(df) / elapsed_time:.2f} 행/초
-- **메모리 사용량**: {df.memory_usage(deep=True).sum() / 1024 / 1024:.2f} MB
+- **메모리 사용량**: {estimate_memory(df) / 1024 / 1024:.2f} MB
 
 ## 6. 작업 상태
 - **상태**: 성공
@@ -76,7 +78,7 @@ def solution(data: object, output_filename: str, input_cols: list, is_asc=True)
     
     # CSV 파일 로드
     print("\n[1/3] CSV 파일을 로드합니다...")
-    df = pd.read_csv(data)
+    df = read_table(data)
     print(f"- 총 행 수: {len(df):,}행")
     print(f"- 컬럼 수: {len(df.columns)}개")
     print(f"- 컬럼 목록: {', '.join(df.columns)}")
@@ -96,7 +98,7 @@ def solution(data: object, output_filename: str, input_cols: list, is_asc=True)
     
     # 결과 저장
     print(f"\n[저장] 정렬된 결과를 저장합니다...")
-    df.to_csv(output_filename, index=False, mode='w')
+    write_table(df, output_filename, index=False, mode='w')
     
     end_time = time.time()
     elapsed_time = end_time - start_time
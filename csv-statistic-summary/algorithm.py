@@ -1,4 +1,6 @@
 import pandas as pd
+from common.tabular import read_table, write_table, projection_report_section
+from common.report import estimate_memory
 import time
 from datetime import datetime
 
@@ -65,7 +67,7 @@ def generate_report(
 
 ## 5. 성능 지표
 - **처리 속도**: {len(df) / elapsed_time:.2f} 행/초
-- **메모리 사용량**: {df.memory_usage(deep=True).sum() / 1024 / 1024:.2f} MB
+- **메모리 사용량**: {estimate_memory(df) / 1024 / 1024:.2f} MB
 
 ## 6. 작업 상태
 - **상태**: 성공
@@ -102,7 +104,7 @@ def solution(data: object, output_filename: str, input_cols, group_by, statistic
     
     # CSV 파일 읽기
     print("\n[1/4] CSV 파일을 로드합니다...")
-    df = pd.read_csv(data)
+    df = read_table(data, columns=input_cols + group_by)
     print(f"- 총 {len(df)}개의 행이 로드되었습니다.")
     print(f"- 기존 컬럼: {', '.join(df.columns)}")
     
@@ -140,7 +142,7 @@ def solution(data: object, output_filename: str, input_cols, group_by, statistic
     
     # 결과 저장
     print(f"\n[4/4] 결과를 저장합니다...")
-    summary_df.reset_index().to_csv(output_filename, index=False)
+    write_table(summary_df.reset_index(), output_filename, index=False)
     
     end_time = time.time()
     elapsed_time = end_time - start_time
@@ -166,4 +168,6 @@ def solution(data: object, output_filename: str, input_cols, group_by, statistic
         elapsed_time=elapsed_time
     )
     
+    report += projection_report_section(df)
+
     return output_filename, report
\ No newline at end of file
@@ -1,24 +1,31 @@
-import pandas as pd
+import os
+from common.chunked import read_chunks, chunk_report_section
+from common.overlap import BackgroundWriter, overlap_summary
+from common.report import estimate_memory
 import json
 import time
 from datetime import datetime
 
 def generate_report(
-    df: pd.DataFrame,
-    json_data: list,
+    total_rows: int,
+    columns: list,
+    record_count: int,
     input_filename: str,
     output_filename: str,
-    elapsed_time: float
+    elapsed_time: float,
+    peak_memory: int
 ) -> str:
     """
     CSV to JSON 변환 작업 보고서를 생성하는 함수.
     
     Parameters:
-    - df (pd.DataFrame): 입력 DataFrame
-    - json_data (list): 변환된 JSON 데이터
+    - total_rows (int): 입력 행 수
+    - columns (list): 입력 컬럼 목록
+    - record_count (int): 변환된 JSON 레코드 수
     - input_filename (str): 입력 파일 경로
     - output_filename (str): 출력 파일 경로
     - elapsed_time (float): 소요 시간 (초)
+    - peak_memory (int): 청크 하나의 최대 메모리 사용량 (bytes, object 컬럼은 표본으로 추정)
     
     Returns:
     - str: 생성된 보고서 내용 (markdown 형식)
@@ -32,19 +39,19 @@ def generate_report(
 
 ## 2. 입력 데이터
 - **입력 파일**: {input_filename}
-- **행 수**: {len(df):,}행
-- **컬럼 수**: {len(df.columns)}개
-- **컬럼 목록**: {', '.join(df.columns)}
+- **행 수**: {total_rows:,}행
+- **컬럼 수**: {len(columns)}개
+- **컬럼 목록**: {', '.join(map(str, columns))}
 
 ## 3. 변환 결과
 - **출력 파일**: {output_filename}
-- **JSON 레코드 수**: {len(json_data):,}개
-- **JSON 키 수**: {len(df.columns)}개
-- **JSON 키 목록**: {', '.join(df.columns)}
+- **JSON 레코드 수**: {record_count:,}개
+- **JSON 키 수**: {len(columns)}개
+- **JSON 키 목록**: {', '.join(map(str, columns))}
 
 ## 4. 성능 지표
-- **처리 속도**: {len(df) / elapsed_time:.2f} 행/초
-- **메모리 사용량**: {df.memory_usage(deep=True).sum() / 1024 / 1024:.2f} MB
+- **처리 속도**: {total_rows / elapsed_time:.2f} 행/초
+- **메모리 사용량 (청크 최대)**: {peak_memory / 1024 / 1024:.2f} MB
 
 ## 5. 작업 상태
 - **상태**: 성공
@@ -52,28 +59,58 @@ def generate_report(
 """
     return report
 
-def solution(input_data: object, output_file: str) -> tuple:
+class JsonRecordsWriter:
+    """
+    json.dump(records, indent=4)와 같은 형식의 JSON 배열을 청크 단위로 이어 쓰는 객체.
+    """
+
+    def __init__(self, output):
+        self.output = output
+        self.records = 0
+
+    def write(self, records: list):
+        parts = []
+        for record in records:
+            # 배열 항목은 한 단계 더 들여쓰므로 항목의 각 줄 앞에 4칸을 더함 (문자열 안 줄바꿈은 \n으로 이스케이프됨)
+            item = json.dumps(record, ensure_ascii=False, indent=4).replace('\n', '\n    ')
+            parts.append(('[\n    ' if self.records == 0 else ',\n    ') + item)
+            self.records += 1
+        self.output.write(''.join(parts).encode('utf-8'))
+
+    def close(self):
+        self.output.write(('\n]' if self.records else '[]').encode('utf-8'))
+
+def solution(input_data: object, output_file: object) -> tuple:
     """
     CSV 파일을 JSON 파일로 변환하여 저장하는 함수.
 
+    입력을 청크 단위로 읽어 레코드로 변환하고, 변환된 청크는 출력 스레드가 직렬화해 저장하는
+    동안 다음 청크를 읽습니다. 결과는 전체를 한 번에 json.dump한 것과 같습니다.
+
     Parameters:
-    - input_data: CSV 데이터 (파일 경로 또는 Pandas DataFrame)
-    - output_file: 저장할 JSON 파일 경로
+    - input_data: CSV 데이터 (파일 경로 또는 스트림)
+    - output_file: 저장할 JSON 파일 경로 또는 open_object(..., mode='wb') 스트림
     
     Returns:
-    - tuple: (저장된 파일 경로, 보고서 내용)
+    - tuple: (저장된 파일 경로 또는 스트림, 보고서 내용)
     """
     start_time = time.time()
-    
-    # CSV 데이터 로드
-    data = pd.read_csv(input_data)
-
-    # JSON으로 변환
-    json_data = data.to_dict(orient='records')
 
-    # JSON 파일 저장
-    with open(output_file, 'w', encoding='utf-8') as json_file:
-        json.dump(json_data, json_file, ensure_ascii=False, indent=4)
+    # CSV 데이터를 청크 단위로 읽어 JSON 레코드로 변환한 뒤 바로 저장
+    chunks = read_chunks(input_data)
+    peak_memory = 0
+    is_path = isinstance(output_file, (str, os.PathLike))
+    output = open(output_file, 'wb') if is_path else output_file
+    json_writer = JsonRecordsWriter(output)
+    try:
+        with BackgroundWriter(json_writer.write) as background:
+            for data in chunks:
+                peak_memory = max(peak_memory, estimate_memory(data))
+                background.put(data.to_dict(orient='records'))
+        json_writer.close()
+    finally:
+        if is_path:
+            output.close()
 
     print(f'Converted JSON saved to {output_file}')
     
@@ -82,11 +119,15 @@ def solution(input_data: object, output_file: str) -> tuple:
     
     # 보고서 생성
     report = generate_report(
-        df=data,
-        json_data=json_data,
+        total_rows=chunks.rows,
+        columns=chunks.columns,
+        record_count=json_writer.records,
         input_filename=input_data.name if hasattr(input_data, 'name') else str(input_data),
-        output_filename=output_file,
-        elapsed_time=elapsed_time
+        output_filename=str(output_file),
+        elapsed_time=elapsed_time,
+        peak_memory=peak_memory
     )
+    report += chunk_report_section(chunks)
+    report += f'- **출력 대기열**: {overlap_summary(background)}\n'
     
     return output_file, report
\ No newline at end of file
@@ -1,18 +1,70 @@
 import pandas as pd
-from konlpy.tag import Okt
-from multiprocessing import Pool, cpu_count
+import numpy as np
+from common.tabular import read_table, write_table, projection_report_section, as_string_storage
+from common.resources import process_workers
+from common.report import estimate_memory
+from multiprocessing import Pool
+from functools import lru_cache, partial
 import os
 import time
 from datetime import datetime
 
 
+# 토큰화 프로세스 풀과 각 풀 프로세스의 Okt 인스턴스.
+# Okt는 처음 생성할 때 JVM을 띄우므로, 풀을 프로세스 안에서 재사용하여 상주 워커의 작업마다 JVM을 다시 띄우지 않음
+_pool = None
+_okt = None
+
+# 체크포인트 사용 시 풀 프로세스에 한 번에 넘기는 행 수
+CHECKPOINT_CHUNK_SIZE = 256
+
+# 풀 프로세스 하나(Okt JVM 포함)가 사용하는 대략적인 메모리. 풀 크기를 컨테이너 메모리 한도로도 제한
+OKT_WORKER_MEMORY = 512 * 1024 * 1024
+
+
+def pool_size() -> int:
+    # 호스트 코어 수 대신 pod의 CPU quota와 메모리 한도로 정함
+    return process_workers('토큰화 프로세스 수', per_worker_memory=OKT_WORKER_MEMORY)
+
+
+@lru_cache(maxsize=None)
 def load_korean_stopwords(filepath: str):
     with open(filepath, 'r', encoding='utf-8') as f:
-        return set(line.strip() for line in f)
+        return frozenset(line.strip() for line in f)
+
+
+def _okt_class():
+    # konlpy는 JPype(JVM 연동)를 함께 불러오므로 형태소 분석을 실제로 할 때만 import
+    from konlpy.tag import Okt
+    return Okt
+
+
+def _init_okt():
+    global _okt
+    _okt = _okt_class()()
+
+
+def get_pool():
+    """
+    토큰화에 사용할 프로세스 풀을 생성하거나, 이미 생성된 풀을 반환합니다.
+    풀 프로세스는 시작 시 Okt(JVM)를 한 번 로드합니다.
+    """
+    global _pool
+    if _pool is None:
+        # 풀 프로세스 initializer에서 import가 실패하면 Pool이 프로세스를 계속 다시 띄우므로 먼저 import해 확인
+        # (fork한 풀 프로세스는 이미 import된 모듈을 그대로 사용)
+        _okt_class()
+        _pool = Pool(processes=pool_size(), initializer=_init_okt)
+    return _pool
+
+
+def warmup():
+    # 상주 워커 시작 시 풀 프로세스와 JVM을 미리 띄움
+    parallel_tokenize(['형태소 분석기 준비'] * pool_size(), set(), None, False)
 
 
 def tokenize_and_clean(text, stopwords, ignore_words, remove_stopwords):
-    okt = Okt()
+    okt = _okt if _okt is not None else _okt_class()()
     tokens = okt.nouns(str(text))
 
     if remove_stopwords and stopwords:
@@ -24,12 +76,23 @@ def tokenize_and_clean(text, stopwords, ignore_words, remove_stopwords):
     return " ".join(tokens)
 
 
-def parallel_tokenize(texts, stopwords, ignore_words, remove_stopwords):
+def parallel_tokenize(texts, stopwords, ignore_words, remove_stopwords, checkpoint=None):
     # 멀티프로세싱용 래퍼 함수
-    from functools import partial
-    with Pool(processes=cpu_count()) as pool:
-        func = partial(tokenize_and_clean, stopwords=stopwords, ignore_words=ignore_words, remove_stopwords=remove_stopwords)
-        return pool.map(func, texts)
+    func = partial(tokenize_and_clean, stopwords=stopwords, ignore_words=ignore_words, remove_stopwords=remove_stopwords)
+    if checkpoint is None:
+        return get_pool().map(func, texts)
+
+    # 체크포인트 사용 시: 저장된 결과를 복원하고 나머지 행을 순서대로 받아 주기적으로 저장
+    results = []
+    for segment in checkpoint.load():
+        results.extend(segment['tokens'].tolist())
+    saved = len(results)
+    for tokens in get_pool().imap(func, texts[saved:], chunksize=CHECKPOINT_CHUNK_SIZE):
+        results.append(tokens)
+        if checkpoint.due():
+            checkpoint.save(len(results), tokens=np.array(results[saved:], dtype=str))
+            saved = len(results)
+    return results
 
 
 def generate_report(
@@ -83,7 +146,7 @@ def generate_report(
 - **불용어 제거**: {'예' if remove_stopwords else '아니오'}
 - **무시할 단어 수**: {len(ignore_words) if ignore_words else 0}개
 - **토큰화된 컬럼만 유지**: {'예' if keep_tokenized_column_only else '아니오'}
-- **사용된 CPU 코어 수**: {cpu_count()}개
+- **사용된 프로세스 수**: {pool_size()}개
 
 ## 4. 처리 결과
 - **출력 파일**: {output_filename}
@@ -94,7 +157,7 @@ def generate_report(
 ## 5. 성능 지표
 - **처리 속도**: {len(df) / elapsed_time:.2f} 행/초
 - **토큰화 속도**: {total_tokens / elapsed_time:.2f} 토큰/초
-- **메모리 사용량**: {df.memory_usage(deep=True).sum() / 1024 / 1024:.2f} MB
+- **메모리 사용량**: {estimate_memory(df) / 1024 / 1024:.2f} MB
 
 ## 6. 작업 상태
 - **상태**: 성공
@@ -103,7 +166,7 @@ def generate_report(
     return report
 
 
-def solution(data: object, text_column: str, output_filename: str, new_column: str = 'tokenized_text', ignore_words: list = None, remove_stopwords: bool = True, keep_tokenized_column_only: bool = False) -> tuple:
+def solution(data: object, text_column: str, output_filename: str, new_column: str = 'tokenized_text', ignore_words: list = None, remove_stopwords: bool = True, keep_tokenized_column_only: bool = False, checkpoint=None) -> tuple:
     """
     대용량 CSV의 특정 텍스트 컬럼을 한국어 토큰화 + 불용어 제거하여 새 컬럼으로 추가하는 고성능 버전.
     
@@ -112,8 +175,8 @@ def solution(data: object, text_column: str, output_filename: str, new_column: s
     """
     start_time = time.time()
     
-    # CSV 로드 최적화
-    dataFile = pd.read_csv(data, low_memory=False)
+    # CSV 로드 최적화 (토큰화 컬럼만 남기는 경우 대상 컬럼만 읽음)
+    dataFile = read_table(data, columns=[text_column] if keep_tokenized_column_only else None, low_memory=False)
     dataFile[text_column] = dataFile[text_column].fillna("")
 
     stopwords = set()
@@ -126,25 +189,29 @@ def solution(data: object, text_column: str, output_filename: str, new_column: s
     # 병렬 토큰화 처리
     texts = dataFile[text_column].tolist()
     logger = print  # 필요 시 로거로 대체 가능
-    logger(f"🔁 Tokenizing {len(texts)} rows using {cpu_count()} cores...")
+    logger(f"🔁 Tokenizing {len(texts)} rows using {pool_size()} processes...")
 
-    tokenized_results = parallel_tokenize(texts, stopwords, ignore_words, remove_stopwords)
-    dataFile[new_column] = tokenized_results
+    tokenized_results = parallel_tokenize(texts, stopwords, ignore_words, remove_stopwords, checkpoint=checkpoint)
+    dataFile[new_column] = as_string_storage(tokenized_results)
 
     if keep_tokenized_column_only:
         dataFile = dataFile[[new_column]]
 
     # CSV 저장
-    dataFile.to_csv(output_filename, index=False, encoding='utf-8-sig')
+    write_table(dataFile, output_filename, index=False, encoding='utf-8-sig')
     logger(f"✅ Saved tokenized result to {output_filename}")
     
     end_time = time.time()
     elapsed_time = end_time - start_time
     
-    # 토큰 통계 계산
-    all_tokens = " ".join(tokenized_results).split()
-    total_tokens = len(all_tokens)
-    unique_tokens = len(set(all_tokens))
+    # 토큰 통계 계산 (전체 말뭉치를 하나의 문자열로 합치지 않고 행마다 세어 고유 토큰 집합만 유지)
+    total_tokens = 0
+    vocabulary = set()
+    for tokens in tokenized_results:
+        tokens = tokens.split()
+        total_tokens += len(tokens)
+        vocabulary.update(tokens)
+    unique_tokens = len(vocabulary)
     
     # 보고서 생성
     report = generate_report(
@@ -161,4 +228,6 @@ def solution(data: object, text_column: str, output_filename: str, new_column: s
         unique_tokens=unique_tokens
     )
     
+    report += projection_report_section(dataFile)
+
     return output_filename, report
\ No newline at end of file
@@ -1,108 +1,80 @@
 import os
-import boto3
-from io import StringIO
+from functools import partial
 from config.config import args
+from common.storage import create_s3_client, get_object, save_report, storage_report_section, open_object
+from common.resources import resource_report_section
+from common.startup import startup_report_section
+from common.metrics import metrics_report_section, span
+from common.memo import run_memoized
+from common.shard import run_sharded, shard_report_section
+from common.incremental import get_object_incremental, incremental_report_section, run_incremental
+from common.checkpoint import open_checkpoint, checkpoint_report_section
+from common.worker import run_or_serve, worker_report_section
 import algorithm
 
 env = 'development' if not 'APP_ENV' in os.environ else os.environ['APP_ENV']
 args = args[env]
-    
-
-def create_s3_client(rook_ceph_base_url, access_key, secret_key):
-    return boto3.resource(
-        's3',
-        endpoint_url=rook_ceph_base_url,
-        aws_access_key_id=access_key,
-        aws_secret_access_key=secret_key,
-        use_ssl=False,
-        verify=False
-    )
-
-def get_object(
-        s3_resource,
-        bucket_name: str,
-        object_path: str
-    ) -> bytes:
-    try:
-        obj = s3_resource.Object(bucket_name, object_path)
-        data = obj.get()
-        content = data['Body'].read().decode('utf-8')
-
-        print(f"Successfully retrieved object: {object_path}")
-        return StringIO(content)
-    except Exception as e:
-        print(f'Failed to download from {bucket_name}/{object_path}: {e}')
-        raise
 
-def put_object(
-        s3_resource,
-        local_file_path: str,
-        bucket_name: str,
-        object_path: str
-    ):
-    try:
-        obj = s3_resource.Object(bucket_name, object_path)
-        obj.upload_file(local_file_path)
-        
-        print(f'Successfully uploaded {local_file_path} to {bucket_name}/{object_path}')
-    except Exception as e:
-        print(f'Failed to upload {local_file_path} to {bucket_name}/{object_path}: {e}')
-        raise
 
-def save_report(
-        s3_resource,
-        report_content: str,
-        bucket_name: str,
-        object_path: str
-    ):
-    try:
-        obj = s3_resource.Object(bucket_name, object_path)
-        obj.put(Body=report_content.encode('utf-8'))
-        
-        print(f'Successfully uploaded report to {bucket_name}/{object_path}')
-    except Exception as e:
-        print(f'Failed to upload report to {bucket_name}/{object_path}: {e}')
-        raise
-
-if __name__ == '__main__' :
-    print('CSV Tokenize')
+def run(args: dict):
     print('args:', args)
-    local_file_path = './tmp/result.csv'
 
     input1 = args['input1']
     s3_client_input1 = create_s3_client(input1['end_point'], input1['access_key'], input1['secret_key'])
-    input1_data = get_object(
+    input1_data = get_object_incremental(
         s3_resource=s3_client_input1,
         bucket_name=input1['bucket_name'],
-        object_path=input1['object_path']
+        object_path=input1['object_path'],
+        mode='rb'
     ) # data read
     
-    settings = args['settings']
-    output_filename, report = algorithm.solution(
-        input1_data,
-        settings['text_column'],
-        local_file_path, 
-        new_column=settings.get('new_column'),
-        ignore_words=settings['ignore_words'],
-        remove_stopwords=settings['remove_stopwords'], 
-        keep_tokenized_column_only=settings['keep_tokenized_column_only']
-    )
+    # CHECKPOINT=true이면 주기적으로 토큰화 결과를 저장하고, 이전 실행이 중단된 위치부터 이어서 처리
+    checkpoint = open_checkpoint(args, 'csv-tokenize', inputs=['input1'])
 
+    settings = args['settings']
     output1 = args['output1']
     s3_client_output1 = create_s3_client(output1['end_point'], output1['access_key'], output1['secret_key'])
-    put_object(
-        s3_resource=s3_client_output1,
-        local_file_path=local_file_path,
-        bucket_name=output1['bucket_name'], 
-        object_path=output1['object_path']
-    ) # data write
+    with open_object(s3_client_output1, output1['bucket_name'], output1['object_path'], mode='wb') as output1_stream:
+        with span('compute'):
+            output_filename, report = algorithm.solution(
+                input1_data,
+                settings['text_column'],
+                output1_stream, 
+                new_column=settings.get('new_column'),
+                ignore_words=settings['ignore_words'],
+                remove_stopwords=settings['remove_stopwords'], 
+                keep_tokenized_column_only=settings['keep_tokenized_column_only'],
+                checkpoint=checkpoint
+            ) # data write
 
     # 보고서 저장
+    report += shard_report_section() + incremental_report_section() + checkpoint_report_section() + startup_report_section() + metrics_report_section() + resource_report_section() + storage_report_section() + worker_report_section()
     task_report = args['task_report']
     s3_client_task_report = create_s3_client(task_report['end_point'], task_report['access_key'], task_report['secret_key'])
     save_report(
         s3_resource=s3_client_task_report,
         report_content=report,
         bucket_name=task_report['bucket_name'],
-        object_path=task_report['object_path']
-    )
\ No newline at end of file
+        object_path=task_report['object_path'],
+        metrics=True
+    )
+
+    # 결과와 보고서를 저장했으므로 체크포인트 삭제
+    if checkpoint is not None:
+        checkpoint.clear()
+
+
+def run_cached(args: dict):
+    # MEMO_CACHE가 지정되어 있으면 입력과 설정이 같은 이전 결과를 재사용
+    # INCREMENTAL=true이면 워터마크 이후에 추가된 행만 토큰화하여 기존 결과 뒤에 덧붙임
+    run_memoized(partial(run_incremental, run), args, 'csv-tokenize', inputs=['input1'], outputs=['output1', 'task_report'])
+
+
+def run_job(args: dict):
+    # SHARD_COUNT가 지정되어 있으면 입력의 SHARD_INDEX번째 구간만 처리하여 part 객체로 저장 (SHARD_FINALIZE=true이면 병합)
+    run_sharded(run_cached, args)
+
+
+if __name__ == '__main__':
+    print('CSV Tokenize')
+    run_or_serve(run_job, args, warmup=algorithm.warmup)
@@ -1,10 +1,14 @@
 from io import StringIO
 import pandas as pd
+from common.chunked import read_chunks, ChunkWriter, chunk_report_section
+from common.tabular import arrow_strings_enabled, as_string_storage, ARROW_STRING_DTYPE
+from common.report import estimate_memory
 import time
 from datetime import datetime
 
 def generate_report(
-    df: pd.DataFrame,
+    columns: list,
+    total_rows: int,
     target_column: str,
     transform_function_str: str,
     output_column: str,
@@ -12,13 +16,15 @@ def generate_report(
     output_filename: str,
     elapsed_time: float,
     transformed_rows: int,
-    null_rows: int
+    null_rows: int,
+    peak_memory: int
 ) -> str:
     """
     CSV 변환 작업 보고서를 생성하는 함수.
     
     Parameters:
-    - df (pd.DataFrame): 처리된 DataFrame
+    - columns (list): 처리된 컬럼 목록
+    - total_rows (int): 총 처리된 행 수
     - target_column (str): 대상 컬럼명
     - transform_function_str (str): 적용된 람다 함수 문자열
     - output_column (str): 출력 컬럼명
@@ -27,6 +33,7 @@ def generate_report(
     - elapsed_time (float): 소요 시간 (초)
     - transformed_rows (int): 변환된 행 수
     - null_rows (int): NULL 값이 된 행 수
+    - peak_memory (int): 청크 하나의 최대 메모리 사용량 (bytes, object 컬럼은 표본으로 추정)
     
     Returns:
     - str: 생성된 보고서 내용 (markdown 형식)
@@ -40,9 +47,9 @@ def generate_report(
 
 ## 2. 입력 데이터
 - **입력 파일**: {input_filename}
-- **행 수**: {len(df):,}행
-- **컬럼 수**: {len(df.columns)}개
-- **컬럼 목록**: {', '.join(df.columns)}
+- **행 수**: {total_rows:,}행
+- **컬럼 수**: {len(columns)}개
+- **컬럼 목록**: {', '.join(columns)}
 
 ## 3. 변환 설정
 - **대상 컬럼**: {target_column}
@@ -51,13 +58,13 @@ def generate_report(
 
 ## 4. 처리 결과
 - **출력 파일**: {output_filename}
-- **총 처리 행**: {len(df):,}행
-- **변환된 행**: {transformed_rows:,}행 ({transformed_rows/len(df)*100:.1f}%)
-- **NULL 값 행**: {null_rows:,}행 ({null_rows/len(df)*100:.1f}%)
+- **총 처리 행**: {total_rows:,}행
+- **변환된 행**: {transformed_rows:,}행 ({transformed_rows/total_rows*100:.1f}%)
+- **NULL 값 행**: {null_rows:,}행 ({null_rows/total_rows*100:.1f}%)
 
 ## 5. 성능 지표
-- **처리 속도**: {len(df) / elapsed_time:.2f} 행/초
-- **메모리 사용량**: {df.memory_usage(deep=True).sum() / 1024 / 1024:.2f} MB
+- **처리 속도**: {total_rows / elapsed_time:.2f} 행/초
+- **메모리 사용량 (청크 최대)**: {peak_memory / 1024 / 1024:.2f} MB
 
 ## 6. 작업 상태
     Parameters:
@@ -86,9 +93,6 @@ def solution(input_data: StringIO, target_column: str, transform_function_str: s
     start_time = time.time()
     
     try:
-        # CSV 데이터 로드
-        df = pd.read_csv(input_data)
-
         try:
             transform_function = eval(transform_function_str)
             if not callable(transform_function):
@@ -96,18 +100,29 @@ def solution(input_data: StringIO, target_column: str, transform_function_str: s
         except Exception as e:
             raise ValueError(f"Failed to parse lambda function: {e}")
         
-        # 대상 컬럼을 문자열로 변환
-        df[target_column] = df[target_column].fillna('').astype(str)
-
-        # 람다 함수 적용
-        df[output_column] = df[target_column].apply(transform_function)
-
-        # 통계 계산
-        transformed_rows = df[output_column].notna().sum()
-        null_rows = df[output_column].isna().sum()
-
-        # 결과 저장
-        df.to_csv(output_csv_path, index=False)
+        # CSV 데이터를 청크 단위로 읽어 변환 후 바로 저장
+        chunks = read_chunks(input_data)
+        transformed_rows = 0
+        null_rows = 0
+        peak_memory = 0
+        columns = []
+        with ChunkWriter(output_csv_path) as writer:
+            for df in chunks:
+                # 대상 컬럼을 문자열로 변환
+                if arrow_strings_enabled():
+                    df[target_column] = df[target_column].astype(ARROW_STRING_DTYPE).fillna('')
+                else:
+                    df[target_column] = df[target_column].fillna('').astype(str)
+
+                # 람다 함수 적용 (STRING_STORAGE=pyarrow면 문자열 결과를 다시 string[pyarrow]로 보관)
+                df[output_column] = as_string_storage(df[target_column].apply(transform_function))
+                writer.write(df)
+
+                # 통계 계산
+                transformed_rows += int(df[output_column].notna().sum())
+                null_rows += int(df[output_column].isna().sum())
+                peak_memory = max(peak_memory, estimate_memory(df))
+                columns = list(df.columns)
         print(f"Lambda function applied and data saved to {output_csv_path}")
 
         # 소요 시간 계산
@@ -116,7 +131,8 @@ def solution(input_data: StringIO, target_column: str, transform_function_str: s
 
         # 보고서 생성
         report = generate_report(
-            df=df,
+            columns=columns,
+            total_rows=chunks.rows,
             target_column=target_column,
             transform_function_str=transform_function_str,
             output_column=output_column,
@@ -124,8 +140,10 @@ def solution(input_data: StringIO, target_column: str, transform_function_str: s
             output_filename=output_csv_path,
             elapsed_time=elapsed_time,
             transformed_rows=transformed_rows,
-            null_rows=null_rows
+            null_rows=null_rows,
+            peak_memory=peak_memory
         )
+        report += chunk_report_section(chunks, writer)
 
         return output_csv_path, report
 
@@ -1,112 +1,66 @@
 import os
-import boto3
-from io import StringIO
 from config.config import args
+from common.storage import create_s3_client, get_object, save_report, delete_object, storage_report_section, open_object
+from common.resources import resource_report_section
+from common.startup import startup_report_section
+from common.metrics import metrics_report_section, span
+from common.shard import get_object_shard, run_sharded, shard_mode, shard_report_section
 import algorithm
 
 env = 'development' if not 'APP_ENV' in os.environ else os.environ['APP_ENV']
 args = args[env]
 
-def create_s3_client(rook_ceph_base_url, access_key, secret_key):
-    return boto3.resource(
-        's3',
-        endpoint_url=rook_ceph_base_url,
-        aws_access_key_id=access_key,
-        aws_secret_access_key=secret_key,
-        use_ssl=False,
-        verify=False
-    )
-
-def get_object(s3_resource, bucket_name: str, object_path: str) -> StringIO:
-    try:
-        obj = s3_resource.Object(bucket_name, object_path)
-        data = obj.get()
-        content = data['Body'].read().decode('utf-8')
-        print(f"Successfully retrieved object: {object_path}")
-        return StringIO(content)
-    except Exception as e:
-        print(f'Failed to download from {bucket_name}/{object_path}: {e}')
-        raise
-
-def put_object(s3_resource, local_file_path: str, bucket_name: str, object_path: str):
-    try:
-        obj = s3_resource.Object(bucket_name, object_path)
-        obj.upload_file(local_file_path)
-        print(f'Successfully uploaded {local_file_path} to {bucket_name}/{object_path}')
-    except Exception as e:
-        print(f'Failed to upload {local_file_path} to {bucket_name}/{object_path}: {e}')
-        raise
-
-def save_report(
-        s3_resource,
-        report_content: str,
-        bucket_name: str,
-        object_path: str
-    ):
-    try:
-        obj = s3_resource.Object(bucket_name, object_path)
-        obj.put(Body=report_content.encode('utf-8'))
-        
-        print(f'Successfully uploaded report to {bucket_name}/{object_path}')
-    except Exception as e:
-        print(f'Failed to upload report to {bucket_name}/{object_path}: {e}')
-        raise
 
-def delete_object(s3_resource, bucket_name: str, object_path: str):
-    try:
-        obj = s3_resource.Object(bucket_name, object_path)
-        obj.delete()
-        print(f"Successfully deleted object: {bucket_name}/{object_path}")
-    except Exception as e:
-        print(f'Failed to delete {bucket_name}/{object_path}: {e}')
-        raise
-
-if __name__ == '__main__':
-    print('CSV Transform Processor')
+def run(args: dict):
     print('args:', args)
-    local_file_path = './tmp/output.csv'
 
     # Step 1: Read input CSV
     input1 = args['input1']
     s3_client_input1 = create_s3_client(input1['end_point'], input1['access_key'], input1['secret_key'])
-    input1_data = get_object(
+    input1_data = get_object_shard(
         s3_resource=s3_client_input1,
         bucket_name=input1['bucket_name'],
-        object_path=input1['object_path']
+        object_path=input1['object_path'],
+        mode='rb'
     )  # data read
 
     # Step 2: Apply lambda transformation
     settings = args['settings']
-    output_filename, report = algorithm.solution(
-        input1_data,
-        settings['target_column'],
-        settings['lambda_function'],
-        settings['output_column'],
-        local_file_path
-    )
-
-    # Step 3: Save output CSV
     output1 = args['output1']
     s3_client_output1 = create_s3_client(output1['end_point'], output1['access_key'], output1['secret_key'])
-    put_object(
-        s3_resource=s3_client_output1,
-        local_file_path=local_file_path,
-        bucket_name=output1['bucket_name'],
-        object_path=output1['object_path']
-    )  # data write
+    with open_object(s3_client_output1, output1['bucket_name'], output1['object_path'], mode='wb') as output1_stream:
+        with span('compute'):
+            output_filename, report = algorithm.solution(
+                input1_data,
+                settings['target_column'],
+                settings['lambda_function'],
+                settings['output_column'],
+                output1_stream
+            ) # data write
 
-    # Step 4: Save report
+    # Step 3: Save report
+    report += shard_report_section() + startup_report_section() + metrics_report_section() + resource_report_section() + storage_report_section()
     task_report = args['task_report']
     s3_client_task_report = create_s3_client(task_report['end_point'], task_report['access_key'], task_report['secret_key'])
     save_report(
         s3_resource=s3_client_task_report,
         report_content=report,
         bucket_name=task_report['bucket_name'],
-        object_path=task_report['object_path']
+        object_path=task_report['object_path'],
+        metrics=True
     )
 
-    # Step 5: Optionally delete input file
-    if args['delete_input']:
+
+if __name__ == '__main__':
+    print('CSV Transform Processor')
+    # SHARD_COUNT가 지정되어 있으면 입력의 SHARD_INDEX번째 구간만 처리하여 part 객체로 저장 (SHARD_FINALIZE=true이면 병합)
+    run_sharded(run, args)
+
+    # Step 4: Optionally delete input file
+    # (샤드 실행 중에는 다른 샤드가 입력을 읽어야 하므로 병합 단계에서만 삭제)
+    if args['delete_input'] and shard_mode() != 'shard':
+        input1 = args['input1']
+        s3_client_input1 = create_s3_client(input1['end_point'], input1['access_key'], input1['secret_key'])
         delete_object(
             s3_resource=s3_client_input1,
             bucket_name=input1['bucket_name'],
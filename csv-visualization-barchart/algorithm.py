@@ -1,8 +1,17 @@
 import pandas as pd
-import matplotlib.pyplot as plt
+from common.tabular import read_table, projection_report_section
+from common.report import estimate_memory
 import time
 from datetime import datetime
 
+def load_pyplot():
+    """
+    matplotlib.pyplot을 불러옵니다. import에 수백 ms가 걸리므로 입력을 읽은 뒤 그림을 그릴 때 호출하며,
+    상주 워커는 시작 시 warmup으로 미리 불러옵니다.
+    """
+    import matplotlib.pyplot as plt
+    return plt
+
 def generate_report(
     df: pd.DataFrame,
     feature_names: str,
@@ -56,7 +65,7 @@ def generate_report(
 
 ## 5. 성능 지표
 - **처리 속도**: {len(df) / elapsed_time:.2f} 행/초
-- **메모리 사용량**: {df.memory_usage(deep=True).sum() / 1024 / 1024:.2f} MB
+- **메모리 사용량**: {estimate_memory(df) / 1024 / 1024:.2f} MB
 
 ## 6. 작업 상태
 - **상태**: 성공
@@ -83,7 +92,8 @@ def solution(data: object, feature_names: str, image_file_name: str, bins: int =
     start_time = time.time()
     
     # CSV 데이터 로드
-    dataFile = pd.read_csv(data)
+    dataFile = read_table(data, columns=[feature_names])
+    plt = load_pyplot()
     
     # 막대 그래프 생성
     plt.figure(figsize=(10, 6))
@@ -113,4 +123,6 @@ def solution(data: object, feature_names: str, image_file_name: str, bins: int =
         elapsed_time=elapsed_time
     )
 
+    report += projection_report_section(dataFile)
+
     return image_file_name, report
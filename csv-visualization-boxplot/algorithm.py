@@ -1,11 +1,18 @@
 import pandas as pd
-import matplotlib.pyplot as plt
+from common.tabular import read_table, projection_report_section
+from common.report import REPORT_MAX_ITEMS, estimate_memory, capped_lines
 import platform
-from matplotlib import rcParams
-from matplotlib import font_manager
 import time
 from datetime import datetime
 
+def load_pyplot():
+    """
+    matplotlib.pyplot을 불러옵니다. import에 수백 ms가 걸리므로 입력을 읽은 뒤 그림을 그릴 때 호출하며,
+    상주 워커는 시작 시 warmup으로 미리 불러옵니다.
+    """
+    import matplotlib.pyplot as plt
+    return plt
+
 def get_font_path():
     """
     OS에 따라 기본적인 한글 폰트를 반환하는 함수.
@@ -22,6 +29,7 @@ def get_font_path():
 
 def generate_report(
     df: pd.DataFrame,
+    stats: pd.DataFrame,
     group_by_column: str,
     value_column: str,
     image_file_name: str,
@@ -34,6 +42,7 @@ def generate_report(
     
     Parameters:
     - df (pd.DataFrame): 처리된 DataFrame
+    - stats (pd.DataFrame): 박스플롯을 그리면서 계산한 그룹별 통계 (count, mean, median, std, min, max)
     - group_by_column (str): 그룹화 기준 컬럼명
     - value_column (str): 값 컬럼명
     - image_file_name (str): 저장된 이미지 파일 경로
@@ -44,19 +53,15 @@ def generate_report(
     Returns:
     - str: 생성된 보고서 내용 (markdown 형식)
     """
-    # 그룹별 통계 계산
-    stats = {}
-    for group in df[group_by_column].unique():
-        group_data = df[df[group_by_column] == group][value_column]
-        stats[group] = {
-            'count': len(group_data),
-            'mean': group_data.mean(),
-            'median': group_data.median(),
-            'std': group_data.std(),
-            'min': group_data.min(),
-            'max': group_data.max()
-        }
-    
+    # 그룹별 통계는 앞의 REPORT_MAX_ITEMS개 그룹만 나열
+    group_lines = [f'  - {group}:' + chr(10) +
+                   f'    - 데이터 수: {int(row["count"]):,}개' + chr(10) +
+                   f'    - 평균: {row["mean"]:.2f}' + chr(10) +
+                   f'    - 중앙값: {row["median"]:.2f}' + chr(10) +
+                   f'    - 표준편차: {row["std"]:.2f}' + chr(10) +
+                   f'    - 범위: {row["min"]:.2f} ~ {row["max"]:.2f}'
+                   for group, row in stats.head(REPORT_MAX_ITEMS).iterrows()]
+
     report = f"""# 박스플롯 생성 작업 보고서
 
 ## 1. 작업 개요
@@ -79,17 +84,11 @@ def generate_report(
 - **출력 파일**: {image_file_name}
 - **그룹 수**: {len(stats)}개
 - **그룹별 통계**:
-{chr(10).join([f'  - {group}:' + chr(10) + 
-              f'    - 데이터 수: {stats[group]["count"]:,}개' + chr(10) +
-              f'    - 평균: {stats[group]["mean"]:.2f}' + chr(10) +
-              f'    - 중앙값: {stats[group]["median"]:.2f}' + chr(10) +
-              f'    - 표준편차: {stats[group]["std"]:.2f}' + chr(10) +
-              f'    - 범위: {stats[group]["min"]:.2f} ~ {stats[group]["max"]:.2f}'
-              for group in stats])}
+{capped_lines(group_lines, len(stats))}
 
 ## 5. 성능 지표
 - **처리 속도**: {len(df) / elapsed_time:.2f} 행/초
-- **메모리 사용량**: {df.memory_usage(deep=True).sum() / 1024 / 1024:.2f} MB
+- **메모리 사용량**: {estimate_memory(df) / 1024 / 1024:.2f} MB
 
 ## 6. 작업 상태
 - **상태**: 성공
@@ -116,9 +115,11 @@ def solution(data: object, group_by_column: str, value_column: str, image_file_n
     start_time = time.time()
     
     # CSV 데이터 로드
-    dataFile = pd.read_csv(data, low_memory=False)
+    dataFile = read_table(data, columns=[group_by_column, value_column], low_memory=False)
 
     # 시스템 기본 폰트 설정
+    plt = load_pyplot()
+    from matplotlib import rcParams, font_manager
     font_path = get_font_path()
     font = font_manager.FontProperties(fname=font_path).get_name()
     rcParams['font.family'] = font
@@ -129,13 +130,15 @@ def solution(data: object, group_by_column: str, value_column: str, image_file_n
     # 결측값 제거
     dataFile = dataFile.dropna(subset=[group_by_column, value_column])
 
-    # 그룹화
-    grouped_data = [dataFile.loc[dataFile[group_by_column] == group, value_column].values
-                    for group in dataFile[group_by_column].unique()]
+    # 그룹화 (그룹마다 전체 DataFrame을 다시 필터링하지 않도록 한 번만 나눔, 처음 나온 순서 유지)
+    groups = dataFile.groupby(group_by_column, sort=False)[value_column]
+    labels, grouped_data = zip(*[(group, values.values) for group, values in groups]) if len(dataFile) else ((), ())
+    # 보고서용 그룹별 통계도 같은 groupby로 한 번에 계산
+    stats = groups.agg(['count', 'mean', 'median', 'std', 'min', 'max'])
 
     # 박스 플롯 생성
     plt.figure(figsize=(10, 8))
-    plt.boxplot(grouped_data, labels=dataFile[group_by_column].unique())
+    plt.boxplot(grouped_data, labels=labels)
     
     # 제목과 축 레이블 설정
     plt.title(title if title else 'Box Plot of Selected Features', fontsize=40)
@@ -155,6 +158,7 @@ def solution(data: object, group_by_column: str, value_column: str, image_file_n
     # 보고서 생성
     report = generate_report(
         df=dataFile,
+        stats=stats,
         group_by_column=group_by_column,
         value_column=value_column,
         image_file_name=image_file_name,
@@ -163,4 +167,6 @@ def solution(data: object, group_by_column: str, value_column: str, image_file_n
         elapsed_time=elapsed_time
     )
 
+    report += projection_report_section(dataFile)
+
     return image_file_name, report
\ No newline at end of file
@@ -1,74 +1,17 @@
 import os
-import boto3
-from io import StringIO
 from config.config import args
+from common.storage import create_s3_client, get_object, put_object, save_report, delete_object, storage_report_section
+from common.resources import resource_report_section
+from common.startup import startup_report_section
+from common.metrics import metrics_report_section, span
+from common.worker import run_or_serve, worker_report_section
 import algorithm
 
 env = 'development' if not 'APP_ENV' in os.environ else os.environ['APP_ENV']
 args = args[env]
-    
 
-def create_s3_client(rook_ceph_base_url, access_key, secret_key):
-    return boto3.resource(
-        's3',
-        endpoint_url=rook_ceph_base_url,
-        aws_access_key_id=access_key,
-        aws_secret_access_key=secret_key,
-        use_ssl=False,
-        verify=False
-    )
-
-def get_object(
-        s3_resource,
-        bucket_name: str,
-        object_path: str
-    ) -> bytes:
-    try:
-        obj = s3_resource.Object(bucket_name, object_path)
-        data = obj.get()
-        content = data['Body'].read().decode('utf-8')
-
-        print(f"Successfully retrieved object: {object_path}")
-        return StringIO(content)
-    except Exception as e:
-        print(f'Failed to download from {bucket_name}/{object_path}: {e}')
-        raise
-
-def put_object(
-        s3_resource,
-        local_file_path: str,
-        bucket_name: str,
-        object_path: str
-    ):
-    try:
-        obj = s3_resource.Object(bucket_name, object_path)
-        obj.upload_file(local_file_path)
-        
-        print(f'Successfully uploaded {local_file_path} to {bucket_name}/{object_path}')
-    except Exception as e:
-        print(f'Failed to upload {local_file_path} to {bucket_name}/{object_path}: {e}')
-        raise
-
-def save_report(s3_resource, report_content: str, bucket_name: str, object_path: str):
-    try:
-        obj = s3_resource.Object(bucket_name, object_path)
-        obj.put(Body=report_content.encode('utf-8'))
-        print(f'Successfully uploaded report to {bucket_name}/{object_path}')
-    except Exception as e:
-        print(f'Failed to upload report to {bucket_name}/{object_path}: {e}')
-        raise
-
-def delete_object(s3_resource, bucket_name: str, object_path: str):
-    try:
-        obj = s3_resource.Object(bucket_name, object_path)
-        obj.delete()
-        print(f"Successfully deleted object: {bucket_name}/{object_path}")
-    except Exception as e:
-        print(f'Failed to delete {bucket_name}/{object_path}: {e}')
-        raise
 
-if __name__ == '__main__' :
-    print('CSV Visualization Boxplot')
+def run(args: dict):
     print('args:', args)
     local_file_path = './tmp/result.png'
 
@@ -77,18 +20,20 @@ if __name__ == '__main__' :
     input1_data = get_object(
         s3_resource=s3_client_input1,
         bucket_name=input1['bucket_name'],
-        object_path=input1['object_path']
+        object_path=input1['object_path'],
+        mode='rb'
     ) # data read
 
     settings = args['settings']
-    image_file_path, report = algorithm.solution(
-        input1_data,
-        settings['group_by_column'],
-        settings['value_column'],
-        local_file_path, 
-        settings['title'],
-        settings['ylabel']
-    )
+    with span('compute'):
+        image_file_path, report = algorithm.solution(
+            input1_data,
+            settings['group_by_column'],
+            settings['value_column'],
+            local_file_path, 
+            settings['title'],
+            settings['ylabel']
+        )
 
     output1 = args['output1']
     s3_client_output1 = create_s3_client(output1['end_point'], output1['access_key'], output1['secret_key'])
@@ -100,13 +45,15 @@ if __name__ == '__main__' :
     ) # data write
 
     # Save report
+    report += startup_report_section() + metrics_report_section() + resource_report_section() + storage_report_section() + worker_report_section()
     task_report = args['task_report']
     s3_client_task_report = create_s3_client(task_report['end_point'], task_report['access_key'], task_report['secret_key'])
     save_report(
         s3_resource=s3_client_task_report,
         report_content=report,
         bucket_name=task_report['bucket_name'],
-        object_path=task_report['object_path']
+        object_path=task_report['object_path'],
+        metrics=True
     )
 
     # Optionally delete input file
@@ -115,4 +62,9 @@ if __name__ == '__main__' :
             s3_resource=s3_client_input1,
             bucket_name=input1['bucket_name'],
             object_path=input1['object_path']
-        )
\ No newline at end of file
+        )
+
+
+if __name__ == '__main__':
+    print('CSV Visualization Boxplot')
+    run_or_serve(run, args, warmup=algorithm.load_pyplot)
@@ -1,9 +1,18 @@
 import pandas as pd
-import folium
-from folium.plugins import MarkerCluster
+from common.tabular import read_table, projection_report_section
+from common.report import estimate_memory
 import time
 from datetime import datetime
 
+def load_folium():
+    """
+    folium을 불러옵니다. import에 수백 ms가 걸리므로 입력을 읽은 뒤 지도를 만들 때 호출하며,
+    상주 워커는 시작 시 warmup으로 미리 불러옵니다.
+    """
+    import folium
+    import folium.plugins
+    return folium
+
 def generate_report(
     df: pd.DataFrame,
     label_column: str,
@@ -58,7 +67,7 @@ def generate_report(
 
 ## 5. 성능 지표
 - **처리 속도**: {total_locations / elapsed_time:.2f} 위치/초
-- **메모리 사용량**: {df.memory_usage(deep=True).sum() / 1024 / 1024:.2f} MB
+- **메모리 사용량**: {estimate_memory(df) / 1024 / 1024:.2f} MB
 
 ## 6. 작업 상태
 - **상태**: 성공
@@ -83,15 +92,16 @@ def solution(data: str, label_column: str, lat_column: str, lon_column: str, out
     start_time = time.time()
     
     # CSV 파일 로드
-    df = pd.read_csv(data)
+    df = read_table(data, columns=[label_column, lat_column, lon_column])
     
     # 지도의 중심을 평균 위도와 경도로 설정
     center_lat = df[lat_column].mean()
     center_lon = df[lon_column].mean()
+    folium = load_folium()
     map_ = folium.Map(location=[center_lat, center_lon], tiles='openstreetmap', zoom_start=8)
 
     # MarkerCluster 객체 생성
-    marker_cluster = MarkerCluster()
+    marker_cluster = folium.plugins.MarkerCluster()
 
     # CSV의 각 위치에 마커 추가
     for _, row in df.iterrows():
@@ -136,6 +146,8 @@ def solution(data: str, label_column: str, lat_column: str, lon_column: str, out
         elapsed_time=elapsed_time
     )
 
+    report += projection_report_section(df)
+
     return output_html, report
 
 
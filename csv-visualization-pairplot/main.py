@@ -7,8 +7,6 @@ from config.config import args
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 
 env = 'development' if not 'APP_ENV' in os.environ else os.environ['APP_ENV']
 args = args[env]
@@ -85,6 +83,10 @@ df['target'] = dataFile[[target_name]]
 x_data = df.iloc[:, :-1]
 y_data = df.iloc[:, [-1]]
 
+# seaborn/matplotlib은 import가 오래 걸리므로 데이터를 받은 뒤 불러옴
+import matplotlib.pyplot as plt
+import seaborn as sns
+
 sns.pairplot(df, hue="target", height=3)
 plt.savefig('.tmp/' + image_file_name, dpi=300)
 
@@ -1,11 +1,18 @@
 import pandas as pd
-import matplotlib.pyplot as plt
+from common.tabular import read_table, projection_report_section
+from common.report import REPORT_MAX_ITEMS, estimate_memory, capped_lines
 import platform
-from matplotlib import rcParams
-from matplotlib import font_manager
 import time
 from datetime import datetime
 
+def load_pyplot():
+    """
+    matplotlib.pyplot을 불러옵니다. import에 수백 ms가 걸리므로 입력을 읽은 뒤 그림을 그릴 때 호출하며,
+    상주 워커는 시작 시 warmup으로 미리 불러옵니다.
+    """
+    import matplotlib.pyplot as plt
+    return plt
+
 def get_font_path():
     """
     OS에 따라 기본적인 한글 폰트를 반환하는 함수.
@@ -22,6 +29,7 @@ def get_font_path():
 
 def generate_report(
     df: pd.DataFrame,
+    feature_counts: pd.Series,
     feature_name: str,
     image_file_name: str,
     chart_title: str,
@@ -35,6 +43,7 @@ def generate_report(
     
     Parameters:
     - df (pd.DataFrame): 처리된 DataFrame
+    - feature_counts (pd.Series): 차트를 그리면서 계산한 카테고리별 개수 (value_counts 결과)
     - feature_name (str): 시각화한 feature의 컬럼명
     - image_file_name (str): 저장된 이미지 파일 경로
     - chart_title (str): 차트 제목
@@ -46,10 +55,11 @@ def generate_report(
     Returns:
     - str: 생성된 보고서 내용 (markdown 형식)
     """
-    # 카테고리별 통계 계산
-    feature_counts = df[feature_name].value_counts()
+    # 카테고리별 비율 (카테고리는 개수가 많은 순서로 앞의 REPORT_MAX_ITEMS개만 나열)
     total = feature_counts.sum()
-    percentages = (feature_counts / total * 100).round(2)
+    top = feature_counts.head(REPORT_MAX_ITEMS)
+    percentages = (top / total * 100).round(2)
+    category_lines = [f'  - {category}: {percentage}% ({count:,}개)' for category, count, percentage in zip(top.index, top.values, percentages)]
     
     report = f"""# 파이 차트 생성 작업 보고서
 
@@ -74,11 +84,11 @@ def generate_report(
 - **카테고리 수**: {len(feature_counts)}개
 - **총 데이터 수**: {total:,}개
 - **카테고리별 비율**:
-{chr(10).join([f'  - {category}: {percentage}% ({count:,}개)' for category, (count, percentage) in zip(feature_counts.index, zip(feature_counts.values, percentages))])}
+{capped_lines(category_lines, len(feature_counts))}
 
 ## 5. 성능 지표
 - **처리 속도**: {len(df) / elapsed_time:.2f} 행/초
-- **메모리 사용량**: {df.memory_usage(deep=True).sum() / 1024 / 1024:.2f} MB
+- **메모리 사용량**: {estimate_memory(df) / 1024 / 1024:.2f} MB
 
 ## 6. 작업 상태
 - **상태**: 성공
@@ -107,9 +117,11 @@ def solution(data: object, feature_name: str, image_file_name: str,
     start_time = time.time()
     
     # CSV 데이터 로드
-    dataFile = pd.read_csv(data)
+    dataFile = read_table(data, columns=[feature_name])
 
     # 시스템 기본 폰트 설정
+    plt = load_pyplot()
+    from matplotlib import rcParams, font_manager
     font_path = get_font_path()
     font = font_manager.FontProperties(fname=font_path).get_name()
     rcParams['font.family'] = font
@@ -176,6 +188,7 @@ def solution(data: object, feature_name: str, image_file_name: str,
     # 보고서 생성
     report = generate_report(
         df=dataFile,
+        feature_counts=feature_counts,
         feature_name=feature_name,
         image_file_name=image_file_name,
         chart_title=chart_title,
@@ -185,4 +198,6 @@ def solution(data: object, feature_name: str, image_file_name: str,
         elapsed_time=elapsed_time
     )
 
+    report += projection_report_section(dataFile)
+
     return image_file_name, report
\ No newline at end of file
@@ -1,8 +1,19 @@
 import pandas as pd
-from wordcloud import WordCloud
-import matplotlib.pyplot as plt
+from common.tabular import read_table
 import platform
 
+def load_wordcloud():
+    """
+    wordcloud와 matplotlib.pyplot을 불러옵니다. import에 수백 ms가 걸리므로 입력을 읽은 뒤 그림을 그릴 때
+    호출하며, 상주 워커는 시작 시 warmup으로 미리 불러옵니다.
+
+    Returns:
+    - tuple: (WordCloud 클래스, matplotlib.pyplot 모듈)
+    """
+    from wordcloud import WordCloud
+    import matplotlib.pyplot as plt
+    return WordCloud, plt
+
 def get_font_path():
     """
     OS에 따라 기본적인 한글 폰트를 반환하는 함수.
@@ -33,7 +44,7 @@ def solution(data: object, word_column: str, count_column: str, image_file_name:
     """
     try:
         # CSV 데이터 로드
-        dataFile = pd.read_csv(data)
+        dataFile = read_table(data, columns=[word_column, count_column])
         print(dataFile)
         
         # 컬럼 존재 여부 검증
@@ -58,6 +69,7 @@ def solution(data: object, word_column: str, count_column: str, image_file_name:
 
         # 시스템 기본 폰트 설정
         font_path = get_font_path()
+        WordCloud, plt = load_wordcloud()
 
         # 워드클라우드 생성
         wordcloud = WordCloud(
@@ -79,6 +91,9 @@ def solution(data: object, word_column: str, count_column: str, image_file_name:
         plt.close()
         print(f"Word cloud successfully saved to {image_file_name}")
 
+    except ImportError:
+        # wordcloud/matplotlib이 없으면 모듈 최상단에서 불러올 때처럼 실행을 실패시킴
+        raise
     except Exception as e:
         # 에러 메시지 출력
         print(f"An error occurred: {e}")
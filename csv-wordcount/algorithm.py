@@ -1,8 +1,13 @@
 import pandas as pd
+from common.tabular import read_table, write_table, projection_report_section, arrow_strings_enabled, ARROW_STRING_DTYPE
+from common.report import estimate_memory
 from collections import Counter
 import time
 from datetime import datetime
 
+# STRING_STORAGE=pyarrow에서 한 번에 분리/집계할 행 수
+WORDCOUNT_BATCH_ROWS = 100000
+
 def generate_report(
     df: pd.DataFrame,
     columns: list,
@@ -54,7 +59,7 @@ def generate_report(
 
 ## 5. 성능 지표
 - **처리 속도**: {total_words / elapsed_time:.2f} 단어/초
-- **메모리 사용량**: {df.memory_usage(deep=True).sum() / 1024 / 1024:.2f} MB
+- **메모리 사용량**: {estimate_memory(df) / 1024 / 1024:.2f} MB
 
 ## 6. 작업 상태
 - **상태**: 성공
@@ -78,7 +83,7 @@ def solution(input_data: object, columns: list, separator: str, output_file: str
     start_time = time.time()
     
     # CSV 데이터 로드
-    data = pd.read_csv(input_data)
+    data = read_table(input_data, columns=columns)
 
     # 단어 카운트를 위한 Counter 객체 초기화
     word_counter = Counter()
@@ -86,15 +91,23 @@ def solution(input_data: object, columns: list, separator: str, output_file: str
     # 지정된 컬럼에서 단어 추출 및 카운트
     for column in columns:
         if column in data.columns:
-            for entry in data[column].dropna():
-                words = str(entry).split(separator)
-                word_counter.update(words)
+            if arrow_strings_enabled():
+                # string[pyarrow] 그대로 분리/집계 (처음 등장한 순서 유지)
+                # 분리된 단어 목록이 한 번에 커지지 않도록 행 단위 묶음으로 처리
+                entries = data[column].dropna().astype(ARROW_STRING_DTYPE)
+                for start in range(0, len(entries), WORDCOUNT_BATCH_ROWS):
+                    words = entries.iloc[start:start + WORDCOUNT_BATCH_ROWS].str.split(separator, regex=False).explode()
+                    word_counter.update(words.value_counts(sort=False).to_dict())
+            else:
+                for entry in data[column].dropna():
+                    words = str(entry).split(separator)
+                    word_counter.update(words)
 
     # 결과를 데이터프레임으로 변환
     result_df = pd.DataFrame(word_counter.items(), columns=['word', 'count'])
 
     # 결과 저장
-    result_df.to_csv(output_file, index=False)
+    write_table(result_df, output_file, index=False)
     print(f'Word count result saved to {output_file}')
 
     # 소요 시간 계산
@@ -113,4 +126,6 @@ def solution(input_data: object, columns: list, separator: str, output_file: str
         unique_words=len(word_counter)
     )
 
+    report += projection_report_section(data)
+
     return output_file, report
@@ -1,9 +1,12 @@
 import os
-import boto3
 import json
 import time
-from io import StringIO
 from config.config import args
+from common.storage import create_s3_client, put_object
+from common.compression import DecompressingReader, detect_codec
+from common.resources import io_workers, resource_report_section
+from common.startup import startup_report_section
+from common.metrics import metrics_report_section, span
 import algorithm
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from threading import Lock
@@ -17,16 +20,7 @@ total_files = 0
 processed_files = 0
 last_progress_time = 0
 PROGRESS_INTERVAL = 2  # 진행률 출력 간격(초)
-
-def create_s3_client(rook_ceph_base_url, access_key, secret_key):
-    return boto3.resource(
-        's3',
-        endpoint_url=rook_ceph_base_url,
-        aws_access_key_id=access_key,
-        aws_secret_access_key=secret_key,
-        use_ssl=False,
-        verify=False
-    )
+JSON_EXTENSIONS = ('.json', '.json.gz', '.json.zst')  # 압축된 JSON도 함께 병합
 
 def print_progress(force=False):
     """진행률을 출력합니다. PROGRESS_INTERVAL 간격으로만 출력됩니다."""
@@ -46,8 +40,12 @@ def process_json_file(args):
     obj, bucket_name = args
     
     try:
-        content = obj.get()['Body'].read().decode('utf-8')
-        json_data = json.loads(content)
+        response = obj.get()
+        body = response['Body']
+        codec = detect_codec(obj.key, response.get('ContentEncoding'))
+        if codec:
+            body = DecompressingReader(body, codec)
+        json_data = json.loads(body.read().decode('utf-8'))
         
         # 진행률 업데이트
         with print_lock:
@@ -87,7 +85,7 @@ def get_objects_from_directory(s3_resource, bucket_name: str, directory_path: st
         
         # JSON 파일 목록 수집
         json_objects = [(obj, bucket_name) for obj in bucket.objects.filter(Prefix=directory_path)
-                       if obj.key.endswith('.json')]
+                       if obj.key.endswith(JSON_EXTENSIONS)]
         total_files = len(json_objects)
         
         if not json_objects:
@@ -96,9 +94,11 @@ def get_objects_from_directory(s3_resource, bucket_name: str, directory_path: st
             
         print(f"- {total_files}개의 JSON 파일을 발견했습니다.")
         
-        # 병렬로 파일 처리
+        # 병렬로 파일 처리 (스레드 수는 pod의 CPU quota/메모리 한도에 맞춤)
         json_data_list = []
-        with ThreadPoolExecutor(max_workers=10) as executor:
+        max_workers = io_workers('JSON 동시 읽기 수', 10)
+        print(f"- {max_workers}개 스레드로 읽습니다.")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
             future_to_json = {executor.submit(process_json_file, args): args for args in json_objects}
             
             for future in as_completed(future_to_json):
@@ -121,15 +121,6 @@ def get_objects_from_directory(s3_resource, bucket_name: str, directory_path: st
         print(f'\n- 오류: {bucket_name}/{directory_path} 처리 중 실패: {e}')
         raise
 
-def put_object(s3_resource, local_file_path: str, bucket_name: str, object_path: str):
-    try:
-        obj = s3_resource.Object(bucket_name, object_path)
-        obj.upload_file(local_file_path)
-        print(f'- 파일 업로드 완료: {bucket_name}/{object_path}')
-    except Exception as e:
-        print(f'- 오류: {local_file_path} 업로드 실패: {e}')
-        raise
-
 if __name__ == '__main__':
     print('JSON Merge from Directory')
     start_time = time.time()
@@ -149,10 +140,11 @@ if __name__ == '__main__':
             raise ValueError("처리할 JSON 데이터가 없습니다.")
         
         # Step 2: Merge JSON files
-        algorithm.solution(
-            input_data_list,
-            local_file_path
-        )
+        with span('compute'):
+            algorithm.solution(
+                input_data_list,
+                local_file_path
+            )
         
         # Step 3: Save output JSON
         output1 = args['output1']
@@ -164,6 +156,9 @@ if __name__ == '__main__':
             object_path=output1['object_path']
         )
         
+        # 실행 자원과 병렬도 출력 (이 컴포넌트는 task_report를 받지 않으므로 로그로 남김)
+        print(startup_report_section() + metrics_report_section() + resource_report_section())
+
         # 전체 처리 시간 출력
         total_time = time.time() - start_time
         print(f"\n[완료] 전체 처리 시간: {total_time:.2f}초")
@@ -1,57 +1,27 @@
 import os
-import boto3
 import json
-from io import StringIO
 from config.config import args
+from common.storage import create_s3_client, open_object, put_object, delete_object
 import algorithm
 
 env = 'development' if not 'APP_ENV' in os.environ else os.environ['APP_ENV']
 args = args[env]
 
-def create_s3_client(rook_ceph_base_url, access_key, secret_key):
-    return boto3.resource(
-        's3',
-        endpoint_url=rook_ceph_base_url,
-        aws_access_key_id=access_key,
-        aws_secret_access_key=secret_key,
-        use_ssl=False,
-        verify=False
-    )
-
-def get_object(s3_resource, bucket_name: str, object_path: str) -> list:
+def get_json_object(s3_resource, bucket_name: str, object_path: str) -> list:
     try:
-        obj = s3_resource.Object(bucket_name, object_path)
-        data = obj.get()
-        content = data['Body'].read().decode('utf-8')
-        json_data = json.loads(content)
+        with open_object(s3_resource, bucket_name, object_path, mode='rb') as stream:
+            json_data = json.load(stream)
         print(f"Successfully retrieved and parsed JSON object: {object_path}")
         return json_data
     except Exception as e:
         print(f'Failed to download or parse JSON from {bucket_name}/{object_path}: {e}')
         raise
 
-def put_object(s3_resource, local_file_path: str, bucket_name: str, object_path: str):
-    try:
-        obj = s3_resource.Object(bucket_name, object_path)
-        obj.upload_file(local_file_path)
-        print(f'Successfully uploaded {local_file_path} to {bucket_name}/{object_path}')
-    except Exception as e:
-        print(f'Failed to upload {local_file_path} to {bucket_name}/{object_path}: {e}')
-        raise
-
-def delete_object(s3_resource, bucket_name: str, object_path: str):
-    try:
-        obj = s3_resource.Object(bucket_name, object_path)
-        obj.delete()
-        print(f"Successfully deleted object: {bucket_name}/{object_path}")
-    except Exception as e:
-        print(f'Failed to delete {bucket_name}/{object_path}: {e}')
-        raise
-
 if __name__ == '__main__':
     print('JSON Merge')
     print('args:', args)
     local_file_path = './tmp/output.json'
+    os.makedirs(os.path.dirname(local_file_path), exist_ok=True)
 
     # Step 1: Read input JSON
     input_data_frames = []
@@ -59,7 +29,7 @@ if __name__ == '__main__':
     for i in range(number_of_input):
         input = args['input{}'.format(i+1)]
         s3_client_input = create_s3_client(input['end_point'], input['access_key'], input['secret_key'])
-        input_data = get_object(
+        input_data = get_json_object(
             s3_resource=s3_client_input,
             bucket_name=input['bucket_name'],
             object_path=input['object_path']
@@ -3,6 +3,8 @@ import csv
 import re
 import time
 import pandas as pd
+from common.tabular import write_table, get_output_size
+from common.report import json_preview
 import os
 from datetime import datetime
 
@@ -57,7 +59,7 @@ def generate_report(json_data: list, csv_data: pd.DataFrame, input_filename: str
 - **데이터 크기**: {json_size / 1024:.2f} KB
 - **데이터 구조**: 
 ```json
-{json.dumps(json_data[0] if json_data else {}, indent=2, ensure_ascii=False)}
+{json_preview(json_data[0] if json_data else {})}
 ```
 
 ## 3. 변환 결과
@@ -116,13 +118,13 @@ def solution(input_filename: str, output_filename: str):
     # CSV로 저장
     print("\n[3/3] DataFrame을 CSV로 저장합니다...")
     try:
-        df.to_csv(output_filename, index=False, encoding='utf-8')
+        write_table(df, output_filename, index=False, encoding='utf-8')
         print(f"- CSV 저장 완료: {output_filename}")
     except Exception as e:
         raise IOError(f"CSV 저장 실패: {str(e)}")
     
     # CSV 파일 크기 확인
-    csv_size = os.path.getsize(output_filename)
+    csv_size = get_output_size(output_filename)
     print(f"- CSV 파일 크기: {csv_size / 1024:.2f} KB")
     
     end_time = time.time()
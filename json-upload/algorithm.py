@@ -2,6 +2,27 @@ import json
 import time
 import os
 from datetime import datetime
+from common.report import json_preview
+
+def json_size(json_data: object) -> int:
+    """
+    json.dumps(json_data)의 크기(bytes)를 최상위 항목 단위로 나누어 계산하는 함수.
+
+    전체 문자열을 한 번에 만들지 않으므로 데이터 전체 크기의 복사본이 메모리에 생기지 않습니다.
+    """
+    if isinstance(json_data, list):
+        parts = (len(json.dumps(item)) for item in json_data)
+    elif isinstance(json_data, dict):
+        # {key: value}를 직렬화하면 키 변환(숫자/None 키 등)까지 json.dumps와 같음. 앞뒤 중괄호는 제외
+        parts = (len(json.dumps({key: value})) - 2 for key, value in json_data.items())
+    else:
+        return len(json.dumps(json_data))
+    # 여는/닫는 괄호와 항목 사이 구분자(', ')
+    count, total = 0, 2
+    for size in parts:
+        total += size
+        count += 1
+    return total + 2 * max(count - 1, 0)
 
 def generate_report(json_data: dict, output_filename: str, data_size: int, file_size: int, elapsed_time: float) -> str:
     """
@@ -28,7 +49,7 @@ def generate_report(json_data: dict, output_filename: str, data_size: int, file_
 - **데이터 크기**: {data_size / 1024:.2f} KB
 - **데이터 구조**: 
 ```json
-{json.dumps(json_data, indent=2, ensure_ascii=False)}
+{json_preview(json_data)}
 ```
 
 ## 3. 처리 결과
@@ -62,8 +83,7 @@ def solution(json_data: dict, output_filename: str):
     
     # 데이터 크기 확인
     print("\n[1/3] JSON 데이터 크기를 확인합니다...")
-    json_str = json.dumps(json_data)
-    data_size = len(json_str.encode('utf-8'))
+    data_size = json_size(json_data)
     print(f"- JSON 데이터 크기: {data_size / 1024:.2f} KB")
     
     # 임시 파일로 저장
@@ -1,54 +1,15 @@
 import os
-import boto3
-from io import StringIO
 from config.config import args
+from common.storage import create_s3_client, download_file, save_report, delete_object, storage_report_section
+from common.resources import resource_report_section
+from common.startup import startup_report_section
+from common.metrics import metrics_report_section, span
 import algorithm
 
 env = 'development' if not 'APP_ENV' in os.environ else os.environ['APP_ENV']
 args = args[env]
     
 
-def create_s3_client(rook_ceph_base_url, access_key, secret_key):
-    return boto3.resource(
-        's3',
-        endpoint_url=rook_ceph_base_url,
-        aws_access_key_id=access_key,
-        aws_secret_access_key=secret_key,
-        use_ssl=False,
-        verify=False
-    )
-
-
-def download_file(s3_resource, bucket_name, object_path, local_file_path):
-    """
-    Download a file from object storage to a local path.
-    """
-    try:
-        obj = s3_resource.Object(bucket_name, object_path)
-        obj.download_file(local_file_path)
-        print(f"Downloaded {object_path} to {local_file_path}")
-    except Exception as e:
-        print(f"Failed to download file: {e}")
-        raise
-
-def save_report(s3_resource, report_content: str, bucket_name: str, object_path: str):
-    try:
-        obj = s3_resource.Object(bucket_name, object_path)
-        obj.put(Body=report_content.encode('utf-8'))
-        print(f'Successfully uploaded report to {bucket_name}/{object_path}')
-    except Exception as e:
-        print(f'Failed to upload report to {bucket_name}/{object_path}: {e}')
-        raise
-
-def delete_object(s3_resource, bucket_name: str, object_path: str):
-    try:
-        obj = s3_resource.Object(bucket_name, object_path)
-        obj.delete()
-        print(f"Successfully deleted object: {bucket_name}/{object_path}")
-    except Exception as e:
-        print(f'Failed to delete {bucket_name}/{object_path}: {e}')
-        raise
-
 if __name__ == '__main__' :
     print('CSV Word Count Program')
     print('args:', args)
@@ -65,20 +26,23 @@ if __name__ == '__main__' :
     )
     
     settings = args['settings']
-    local_file_path, report = algorithm.solution(
-        api_url=settings['api_url'],
-        file_path_query=settings['file_path_query'],
-        local_file_path=local_file_path
-    )
+    with span('compute'):
+        local_file_path, report = algorithm.solution(
+            api_url=settings['api_url'],
+            file_path_query=settings['file_path_query'],
+            local_file_path=local_file_path
+        )
 
     # Save report
+    report += startup_report_section() + metrics_report_section() + resource_report_section() + storage_report_section()
     task_report = args['task_report']
     s3_client_task_report = create_s3_client(task_report['end_point'], task_report['access_key'], task_report['secret_key'])
     save_report(
         s3_resource=s3_client_task_report,
         report_content=report,
         bucket_name=task_report['bucket_name'],
-        object_path=task_report['object_path']
+        object_path=task_report['object_path'],
+        metrics=True
     )
 
     # Optionally delete input file